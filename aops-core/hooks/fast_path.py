@@ -0,0 +1,224 @@
+"""
+Hook Router Fast Path.
+
+Answers hook events whose outcome is fixed by the (event, tool category)
+pair, without importing pydantic, the gate engine or the unified logger.
+
+For every pair in FAST_PATH_TABLE, no gate trigger or policy can match, so
+the full pipeline would:
+- allow the tool call,
+- leave the session state unchanged (only re-saving it), and
+- report the gate status strip plus an optional custodiet countdown.
+
+The fast path reproduces exactly that from the raw state JSON. Whenever it
+can't be sure the result would be identical, evaluate() returns None and the
+router runs the full pipeline. Cases that fall back:
+- no state file yet, or the state is missing a gate;
+- the custodiet countdown window is active.
+
+This module must only import the standard library and stdlib-only aops
+modules (lib.session_paths, hooks.gate_config, hooks.hook_log).
+"""
+
+import json
+import sys
+from datetime import datetime
+from typing import Any
+
+from lib.session_paths import find_session_file, get_hook_log_path
+
+from hooks import hook_log
+from hooks.gate_config import (
+    CUSTODIET_COUNTDOWN_START_BEFORE,
+    CUSTODIET_TOOL_CALL_THRESHOLD,
+    extract_subagent_type,
+    get_tool_category,
+)
+
+# Names of the gates in lib/gates/definitions.py. The gate engine creates a
+# missing gate's state on first evaluation; the fast path can't, so it
+# requires all of them to be present.
+GATE_NAMES = ("hydration", "custodiet", "qa", "handover", "commit")
+
+# (event, tool category) pairs that never need the gate engine.
+# Every policy for these events excludes the category, and every trigger
+# requires a subagent_type (spawn tools are categorised as "spawn" below).
+FAST_PATH_TABLE: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("PreToolUse", "always_available"),
+        ("PreToolUse", "infrastructure"),
+    }
+)
+
+FAST_PATH_EVENTS = frozenset(event for event, _category in FAST_PATH_TABLE)
+
+
+def tool_category(tool_name: str | None, tool_input: dict[str, Any]) -> str | None:
+    """Categorise a tool for the fast-path table.
+
+    Spawn tools (Agent, Skill, delegate_to_agent, ...) and compliance agent
+    names get the pseudo-category "spawn": they can fire gate triggers even
+    when get_tool_category() treats them as infrastructure.
+    """
+    if not tool_name:
+        return None
+    if extract_subagent_type(tool_name, tool_input)[0]:
+        return "spawn"
+    return get_tool_category(tool_name, tool_input)
+
+
+def gate_status_strip(
+    hydration_status: str | None,
+    custodiet_ops: int | None,
+    custodiet_countdown: tuple[int, int] | None,
+    handover_complete: bool,
+    current_task: str | None,
+) -> str:
+    """Build the gate status icon strip shown after every hook.
+
+    Shared by router.format_gate_status_icons() and the fast path.
+
+    Args:
+        hydration_status: Hydration gate status, or None if the gate has no state.
+        custodiet_ops: Custodiet ops_since_open, or None if the gate has no state.
+        custodiet_countdown: (threshold, start_before) of the custodiet countdown.
+        handover_complete: Handover gate is open and the handover skill was invoked.
+        current_task: Task bound to the main agent, if any.
+
+    Returns:
+        Space-separated icons, or "" when nothing needs attention.
+    """
+    parts: list[str] = []
+
+    # Hydration: show only when CLOSED (needs hydration)
+    if hydration_status is None or hydration_status == "closed":
+        parts.append("💧")
+
+    # Custodiet: countdown or overdue
+    if custodiet_ops is not None and custodiet_countdown:
+        threshold, start_before = custodiet_countdown
+        if custodiet_ops >= threshold:
+            parts.append("◇")
+        elif custodiet_ops >= threshold - start_before:
+            parts.append(f"◇ {threshold - custodiet_ops}")
+
+    # Handover: show only AFTER completion (gate OPEN + skill invoked)
+    if handover_complete:
+        parts.append("≡")
+
+    # Active task
+    if current_task:
+        parts.append(f"▶ {current_task}")
+
+    return " ".join(parts)
+
+
+def load_raw_state(session_id: str) -> dict[str, Any] | None:
+    """Read a session's state file as plain JSON (no validation)."""
+    path = find_session_file(session_id)
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def evaluate(fields: dict[str, Any]) -> dict[str, Any] | None:
+    """Evaluate a normalized hook invocation on the fast path.
+
+    Args:
+        fields: HookContext fields, as built by router.resolve_context_fields().
+
+    Returns:
+        The CanonicalHookOutput the full pipeline would produce, as a dict,
+        or None if the invocation needs the full pipeline.
+    """
+    category = tool_category(fields["tool_name"], fields["tool_input"])
+    if (fields["hook_event"], category) not in FAST_PATH_TABLE:
+        return None
+
+    state = load_raw_state(fields["session_id"])
+    if state is None:
+        return None
+
+    gates = state.get("gates")
+    if not isinstance(gates, dict):
+        return None
+    for name in GATE_NAMES:
+        gate = gates.get(name)
+        if not isinstance(gate, dict) or gate.get("status") not in ("open", "closed"):
+            return None
+
+    custodiet_ops = gates["custodiet"].get("ops_since_open", 0)
+    if not isinstance(custodiet_ops, int):
+        return None
+    threshold = CUSTODIET_TOOL_CALL_THRESHOLD
+    start_before = CUSTODIET_COUNTDOWN_START_BEFORE
+    if threshold - start_before <= custodiet_ops < threshold:
+        # The countdown message is rendered from a template by the gate engine
+        return None
+
+    legacy_state = state.get("state")
+    main_agent = state.get("main_agent")
+    strip = gate_status_strip(
+        hydration_status=gates["hydration"]["status"],
+        custodiet_ops=custodiet_ops,
+        custodiet_countdown=(threshold, start_before),
+        handover_complete=(
+            gates["handover"]["status"] == "open"
+            and isinstance(legacy_state, dict)
+            and bool(legacy_state.get("handover_skill_invoked"))
+        ),
+        current_task=main_agent.get("current_task") if isinstance(main_agent, dict) else None,
+    )
+
+    return {
+        "system_message": strip or None,
+        "verdict": "allow",
+        "context_injection": None,
+        "updated_input": None,
+        "metadata": {},
+    }
+
+
+def format_output(output: dict[str, Any], client: str, event: str) -> str:
+    """Serialize a fast-path result exactly as output_for_claude/output_for_gemini would."""
+    reply: dict[str, Any] = {}
+    if output["system_message"]:
+        reply["systemMessage"] = output["system_message"]
+    if client == "gemini":
+        reply["decision"] = "allow"
+        reply["metadata"] = output["metadata"]
+    else:
+        reply["hookSpecificOutput"] = {"hookEventName": event, "permissionDecision": "allow"}
+    return json.dumps(reply, separators=(",", ":"), ensure_ascii=False)
+
+
+def log_hook_event(fields: dict[str, Any], output: dict[str, Any], exit_code: int = 0) -> None:
+    """Append the fast-path event to the per-session hooks log.
+
+    Writes the same record shape as unified_logger.log_hook_event().
+    """
+    session_id = fields["session_id"]
+    if not session_id or session_id == "unknown":
+        return
+
+    try:
+        input_data = fields["raw_input"]
+        date = input_data.get("date")
+        if date is None:
+            date = datetime.now().astimezone().strftime("%Y-%m-%d")
+        log_path = get_hook_log_path(session_id, input_data, date)
+
+        record = {
+            **fields,
+            "logged_at": datetime.now().astimezone().replace(microsecond=0).isoformat(),
+            "exit_code": exit_code,
+            "output": output,
+            "debug": hook_log.process_metrics(),
+        }
+        hook_log.write_record(log_path, record)
+    except Exception as e:
+        print(f"[unified_logger] Error logging hook event: {e}", file=sys.stderr)
@@ -385,6 +385,8 @@ HANDOVER_GATE_MODE = _gate_mode("HANDOVER_GATE_MODE")
 QA_GATE_MODE = _gate_mode("QA_GATE_MODE")
 CUSTODIET_GATE_MODE = _gate_mode("CUSTODIET_GATE_MODE")
 CUSTODIET_TOOL_CALL_THRESHOLD = int(os.environ.get("CUSTODIET_TOOL_CALL_THRESHOLD", "50"))
+# Countdown warnings start this many ops before the custodiet threshold
+CUSTODIET_COUNTDOWN_START_BEFORE = 7
 HYDRATION_GATE_MODE = _gate_mode("HYDRATION_GATE_MODE")
 COMMIT_GATE_MODE = _gate_mode("COMMIT_GATE_MODE")
 
@@ -0,0 +1,157 @@
+"""
+Per-session hook log writer.
+
+Every hook invocation appends one record to the session's hooks JSONL log
+(lib.session_paths.get_hook_log_path), on the critical path of every tool
+call. Writing a record costs:
+- process debug metrics read from /proc (resource on other platforms),
+- one compact json.dumps of the record, and
+- one O_APPEND write of the encoded line. The kernel appends a single write
+  atomically, so records from concurrent hook processes never interleave
+  and no lock is needed.
+
+In the router daemon, start_background_writer() moves the write off the
+request: records are queued and a writer thread appends each log's queued
+records with one write. The writer thread never reads os.environ, the cwd
+or sys.stderr, which the daemon swaps for each request: log paths are made
+absolute when queued and errors go to the stderr it was started with.
+
+This module must only import the standard library, so the router fast path
+can use it (see hooks/fast_path.py).
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+_MB = 1024 * 1024
+
+_writer: "BackgroundWriter | None" = None
+
+
+def process_metrics() -> dict[str, Any]:
+    """Process debug metrics for the hook log.
+
+    Memory and uptime come from /proc. Where /proc isn't available (macOS),
+    only the peak RSS from resource is reported.
+    """
+    metrics: dict[str, Any] = {"pid": os.getpid(), "ppid": os.getppid()}
+    try:
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        with open("/proc/self/statm") as f:
+            vms_pages, rss_pages = (int(v) for v in f.read().split()[:2])
+        metrics["mem_rss_mb"] = rss_pages * page_size / _MB
+        metrics["mem_vms_mb"] = vms_pages * page_size / _MB
+
+        with open("/proc/uptime") as f:
+            system_uptime = float(f.read().split()[0])
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime); fields after the ")" of comm start at field 3
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        metrics["process_uptime"] = system_uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        if resource is not None and "mem_rss_mb" not in metrics:
+            # ru_maxrss is in bytes on macOS, KiB elsewhere
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            metrics["mem_rss_mb"] = max_rss / (_MB if sys.platform == "darwin" else 1024)
+    return metrics
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    """Encode a record as one compact JSONL line (non-JSON values as str)."""
+    return (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode()
+
+
+def append_lines(log_path: Path, data: bytes) -> None:
+    """Append encoded lines to a log with a single O_APPEND write."""
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        written = os.write(fd, data)
+        # Regular files take the whole write; finish it if one ever doesn't
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+def write_record(log_path: Path, record: dict[str, Any]) -> None:
+    """Append a record to a hook log, through the background writer if running."""
+    data = encode_record(record)
+    writer = _writer
+    if writer is not None:
+        writer.put(log_path, data)
+    else:
+        append_lines(log_path, data)
+
+
+class BackgroundWriter:
+    """Thread appending queued hook log records, batched per log file."""
+
+    def __init__(self):
+        self._queue: queue.Queue[tuple[Path, bytes] | None] = queue.Queue()
+        self._stderr = sys.stderr
+        self._thread = threading.Thread(target=self._run, name="hook-log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, log_path: Path, data: bytes) -> None:
+        self._queue.put((log_path.absolute(), data))
+
+    def flush(self) -> None:
+        """Wait until every queued record is written."""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write the queued records and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            # Take whatever else queued up meanwhile, to batch it
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            batches: dict[Path, list[bytes]] = defaultdict(list)
+            for item in items:
+                if item is not None:
+                    batches[item[0]].append(item[1])
+            for log_path, lines in batches.items():
+                try:
+                    append_lines(log_path, b"".join(lines))
+                except OSError as e:
+                    print(f"[hook_log] Error writing {log_path}: {e}", file=self._stderr)
+            for _ in items:
+                self._queue.task_done()
+            if None in items:
+                return
+
+
+def start_background_writer() -> BackgroundWriter:
+    """Write hook log records from a background thread (for the router daemon)."""
+    global _writer
+    if _writer is None:
+        _writer = BackgroundWriter()
+        atexit.register(stop_background_writer)
+    return _writer
+
+
+def stop_background_writer() -> None:
+    """Write any queued records and go back to writing them inline."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
@@ -11,13 +11,17 @@ Architecture:
 - Passes SessionState to all gates via gate_registry.
 - Saves SessionState at end.
 - GateResult objects used internally, converted to JSON only at final output.
+
+This is the full pipeline. The hook entry point is hooks/router_entry.py,
+which answers fast-path invocations with stdlib-only modules and imports
+this module only when a gate has to run.
 """
 
+from __future__ import annotations
+
 import json
 import os
 import sys
-import tempfile
-import uuid
 from collections import deque
 from datetime import datetime
 from pathlib import Path
@@ -34,11 +38,21 @@ if str(AOPS_CORE_DIR) not in sys.path:
 try:
     from lib.gate_model import GateResult, GateVerdict
     from lib.gates.registry import GateRegistry
-    from lib.hook_utils import is_subagent_session
-    from lib.session_paths import get_pid_session_map_path, get_session_short_hash
     from lib.session_state import SessionState
 
+    from hooks import fast_path
     from hooks.gate_config import SPAWN_TOOLS, extract_subagent_type
+    from hooks.router_entry import (  # noqa: F401 - GEMINI_EVENT_MAP etc. re-exported
+        GEMINI_EVENT_MAP,
+        _debug_log_input,
+        _normalize_json_field,
+        get_session_data,
+        main,
+        parse_args,
+        persist_session_data,
+        resolve_context_fields,
+        run_fast_path,
+    )
     from hooks.schemas import (
         CanonicalHookOutput,
         ClaudeGeneralHookOutput,
@@ -55,55 +69,6 @@ except ImportError as e:
     sys.exit(1)
 
 
-# --- Configuration ---
-
-DEBUG_LOG_DIR = Path("/tmp")
-
-
-def _debug_log_path(session_id: str | None) -> Path:
-    """Return per-session debug log path."""
-    slug = session_id if session_id else "unknown"
-    aops_sessions = os.environ.get("AOPS_SESSIONS")
-    if aops_sessions:
-        log_dir = Path(aops_sessions).resolve() / "hooks"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        return log_dir / f"cc_hooks_{slug}.jsonl"
-    return DEBUG_LOG_DIR / f"cc_hooks_{slug}.jsonl"
-
-
-def _debug_log_input(raw_input: dict[str, Any], args: Any) -> None:
-    """Append raw hook input to debug JSONL file if DEBUG_HOOKS=1."""
-    if not os.environ.get("DEBUG_HOOKS"):
-        return
-    try:
-        session_id = raw_input.get("session_id") or os.environ.get("CLAUDE_SESSION_ID")
-        entry = {
-            "ts": datetime.now().isoformat(),
-            "session_id": session_id,
-            "client": getattr(args, "client", None),
-            "event": getattr(args, "event", None),
-            "input": raw_input,
-        }
-        with _debug_log_path(session_id).open("a") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as e:
-        print(f"DEBUG_LOG error: {e}", file=sys.stderr)
-
-
-# Event mapping: Gemini -> Claude (internal normalization)
-GEMINI_EVENT_MAP = {
-    "SessionStart": "SessionStart",
-    "BeforeTool": "PreToolUse",
-    "AfterTool": "PostToolUse",
-    "BeforeAgent": "UserPromptSubmit",  # Mapped to UPS for unified handling
-    "AfterAgent": "Stop",  # This is the event after the agent returns their final response for a turn.
-    "SessionEnd": "SessionEnd",
-    "Notification": "Notification",
-    "PreCompress": "PreCompact",
-    "SubagentStart": "SubagentStart",  # Explicit mapping if Gemini sends it
-    "SubagentStop": "SubagentStop",  # Explicit mapping if Gemini sends it
-}
-
 # --- Gate Status Display ---
 
 
@@ -118,281 +83,65 @@ def format_gate_status_icons(state: SessionState) -> str:
     - ▶ T-id  active task bound
     - ✓    nothing needs attention
     """
-    from lib.gates.registry import GateRegistry
-
-    parts: list[str] = []
-
-    # Hydration: show only when CLOSED (needs hydration)
-    hydration = state.gates.get("hydration")
-    if not hydration or hydration.status == "closed":
-        parts.append("💧")
-
-    # Custodiet: countdown or overdue
+    countdown = None
     custodiet = state.gates.get("custodiet")
     if custodiet:
         custodiet_gate = GateRegistry.get_gate("custodiet")
         if custodiet_gate and custodiet_gate.config.countdown:
-            threshold = custodiet_gate.config.countdown.threshold
-            start_before = custodiet_gate.config.countdown.start_before
-            countdown_start = threshold - start_before
-            ops = custodiet.ops_since_open
-            if ops >= threshold:
-                parts.append("◇")
-            elif ops >= countdown_start:
-                remaining = threshold - ops
-                parts.append(f"◇ {remaining}")
-
-    # Handover: show only AFTER completion (gate OPEN + skill invoked)
-    handover = state.gates.get("handover")
-    if handover and handover.status == "open" and state.state.get("handover_skill_invoked"):
-        parts.append("≡")
-
-    # Active task
-    if state.main_agent.current_task:
-        parts.append(f"▶ {state.main_agent.current_task}")
-
-    return " ".join(parts) if parts else ""
-
-
-# --- Session Management ---
-
-
-def get_parent_pid(pid: int) -> int | None:
-    """Get parent PID from /proc/[pid]/stat."""
-    try:
-        with open(f"/proc/{pid}/stat") as f:
-            return int(f.read().split()[3])
-    except (OSError, IndexError, ValueError):
-        return None
-
-
-def get_session_data() -> dict[str, Any]:
-    """Read session metadata, traversing up process tree if necessary."""
-    try:
-        # Try direct PPID first (fast path)
-        session_file = get_pid_session_map_path()
-        if session_file.exists():
-            return json.loads(session_file.read_text().strip())
-
-        # Fallback: walk up process tree
-        pid = os.getppid()
-        while pid and pid > 1:
-            session_file = Path("/tmp") / f"session-{pid}.json"
-            if session_file.exists():
-                try:
-                    data = json.loads(session_file.read_text().strip())
-                    if data:
-                        return data
-                except json.JSONDecodeError:
-                    pass
-            pid = get_parent_pid(pid)
-    except Exception as e:
-        print(f"WARNING: Failed to read session data: {e}", file=sys.stderr)
-    return {}
-
-
-def persist_session_data(data: dict[str, Any]) -> None:
-    """Write session metadata atomically."""
-    try:
-        session_file = get_pid_session_map_path()
-        existing = get_session_data()
-        existing.update(data)
+            countdown = (
+                custodiet_gate.config.countdown.threshold,
+                custodiet_gate.config.countdown.start_before,
+            )
 
-        # Atomic write
-        fd, temp_path = tempfile.mkstemp(dir=str(session_file.parent), text=True)
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(existing, f)
-            Path(temp_path).rename(session_file)
-        except Exception as e:
-            Path(temp_path).unlink(missing_ok=True)
-            print(f"CRITICAL: Failed to persist session data: {e}", file=sys.stderr)
-            raise
-    except OSError as e:
-        print(f"WARNING: OSError in persist_session_data: {e}", file=sys.stderr)
+    hydration = state.gates.get("hydration")
+    handover = state.gates.get("handover")
+    return fast_path.gate_status_strip(
+        hydration_status=hydration.status if hydration else None,
+        custodiet_ops=custodiet.ops_since_open if custodiet else None,
+        custodiet_countdown=countdown,
+        handover_complete=bool(
+            handover and handover.status == "open" and state.state.get("handover_skill_invoked")
+        ),
+        current_task=state.main_agent.current_task,
+    )
 
 
 # --- Router Logic ---
 
 
 class HookRouter:
-    def __init__(self):
-        self.session_data = get_session_data()
+    # Class default so a router built with HookRouter.__new__ (as some tests
+    # do) still has a ppid.
+    ppid: int | None = None
+
+    def __init__(self, ppid: int | None = None):
+        # ppid identifies the CLI process that fired the hook. It is os.getppid()
+        # in-process; the router daemon passes the thin client's parent instead.
+        self.ppid = ppid
+        self.session_data = get_session_data(ppid)
         self._execution_timestamps = deque(maxlen=20)  # Store last 20 timestamps
 
-    @staticmethod
-    def _normalize_json_field(value: Any) -> Any:
-        """Normalize a field that may be a JSON string to its parsed form."""
-        if isinstance(value, str):
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
-        return value
+    _normalize_json_field = staticmethod(_normalize_json_field)
 
     def normalize_input(
         self, raw_input: dict[str, Any], gemini_event: str | None = None
     ) -> HookContext:
         """Create a normalized HookContext from raw input."""
+        fields = resolve_context_fields(raw_input, gemini_event, self.session_data)
 
-        # 1. Determine Event Name
-        if gemini_event:
-            hook_event = GEMINI_EVENT_MAP.get(gemini_event, gemini_event)
-        else:
-            raw_event = raw_input.get("hook_event_name") or ""
-            hook_event = GEMINI_EVENT_MAP.get(raw_event, raw_event)
-
-        # 2. Determine Session ID
-        session_id = raw_input.get("session_id")
-        if not session_id:
-            session_id = self.session_data.get("session_id") or os.environ.get("CLAUDE_SESSION_ID")
-
-        if not session_id and hook_event == "SessionStart":
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            short_uuid = str(uuid.uuid4())[:8]
-            session_id = f"gemini-{timestamp}-{short_uuid}"
-
-        if not session_id:
-            session_id = f"unknown-{str(uuid.uuid4())[:8]}"
-
-        # 3. Determine Agent ID and Subagent Type
-        # Check both payload and persisted session data (for subagent tool calls)
-        agent_id = (
-            raw_input.get("agent_id")
-            or raw_input.get("agentId")
-            or self.session_data.get("agent_id")
-        )
-        subagent_type = (
-            raw_input.get("subagent_type")
-            or raw_input.get("agent_type")
-            or self.session_data.get("subagent_type")
-        )
-
-        # Prefer explicit env var if set
-        if not subagent_type:
-            subagent_type = os.environ.get("CLAUDE_SUBAGENT_TYPE")
-
-        # 4. Transcript Path / Temp Root
-        transcript_path = raw_input.get("transcript_path")
-
-        # Request Tracing (aops-32068a2e)
-        trace_id = raw_input.get("trace_id") or str(uuid.uuid4())
-
-        # 5. Tool Data
-        tool_name = raw_input.get("tool_name")
-        tool_input = self._normalize_json_field(raw_input.get("tool_input", {}))
-        if not isinstance(tool_input, dict):
-            tool_input = {}
-
-        # Normalize tool_result and toolResult in raw_input (for PostToolUse/SubagentStop)
-        tool_output = {}
-        raw_tool_output = (
-            raw_input.get("tool_result")
-            or raw_input.get("toolResult")
-            or raw_input.get("tool_response")
-            or raw_input.get("subagent_result")
-        )
-        if raw_tool_output:
-            tool_output = self._normalize_json_field(raw_tool_output)
-
-        # 6. Extract subagent_type from spawning tools
-        # Uses the SPAWN_TOOLS table in gate_config for cross-platform detection
-        # (Claude Task/Skill, Gemini delegate_to_agent/activate_skill, extensible
-        # to Codex/Copilot). _subagent_type_from_skill prevents Skill invocations
-        # from being misclassified as subagent sessions.
-        _subagent_type_from_spawn_tool = False
-        _subagent_type_from_skill = False
-        if not subagent_type and isinstance(tool_input, dict):
-            extracted, is_skill = extract_subagent_type(tool_name, tool_input)
-            if extracted:
-                subagent_type = extracted
-                _subagent_type_from_skill = is_skill
-                _subagent_type_from_spawn_tool = not is_skill
-
-        # 7. Detect Subagent Session
-        # Call is_subagent_session BEFORE popping fields from raw_input
-        is_subagent = is_subagent_session(raw_input)
-
-        # If we have subagent info from PID map or explicit flags, treat as subagent.
-        # Skip the override for:
-        #  - Skill/activate_skill calls (run in main session)
-        #  - Spawn tool calls like Agent(...) (main session dispatching a subagent)
-        #  - SubagentStart/SubagentStop events (main session events about subagents)
-        if (
-            not is_subagent
-            and not _subagent_type_from_skill
-            and not _subagent_type_from_spawn_tool
-            and (
-                subagent_type
-                or agent_id
-                or raw_input.get("is_sidechain")
-                or raw_input.get("isSidechain")
-            )
-        ):
-            is_subagent = True
-
-        # SubagentStart/SubagentStop fire in the MAIN agent's context ABOUT a
-        # subagent. They carry agent_id/agent_type metadata which causes false
-        # positives above. Override: these are never subagent events.
-        if hook_event in ("SubagentStart", "SubagentStop"):
-            is_subagent = False
-
-        # 8. Persist session data on session start only (not subagent start, as multiple
+        # Persist session data on session start only (not subagent start, as multiple
         # subagents may run simultaneously and would clobber each other's entries)
-        if hook_event == "SessionStart":
+        if fields["hook_event"] == "SessionStart":
             persist_session_data(
-                {"session_id": session_id, "agent_id": agent_id, "subagent_type": subagent_type}
+                {
+                    "session_id": fields["session_id"],
+                    "agent_id": fields["agent_id"],
+                    "subagent_type": fields["subagent_type"],
+                },
+                self.ppid,
             )
 
-        # 9. Precompute values
-        short_hash = get_session_short_hash(session_id)
-
-        # 10. Build Context and POP processed fields from raw_input
-        # We pop now so the remainder in ctx.raw_input is "extra" data
-        processed_fields = [
-            "hook_event_name",
-            "session_id",
-            "transcript_path",
-            "trace_id",
-            "tool_name",
-            "tool_input",
-            "tool_result",
-            "toolResult",
-            "tool_response",
-            "subagent_result",
-            "agent_id",
-            "agentId",
-            "slug",
-            "cwd",
-            "is_sidechain",
-            "isSidechain",
-            "subagent_type",
-            "agent_type",
-        ]
-        slug = raw_input.get("slug")
-        cwd = raw_input.get("cwd")
-
-        for field in processed_fields:
-            raw_input.pop(field, None)
-
-        return HookContext(
-            session_id=session_id,
-            trace_id=trace_id,
-            hook_event=hook_event,
-            agent_id=agent_id,
-            slug=slug,
-            is_subagent=is_subagent,
-            subagent_type=subagent_type,
-            # Precomputed values
-            session_short_hash=short_hash,
-            # Event Data
-            tool_name=tool_name,
-            tool_input=tool_input,
-            tool_output=tool_output,
-            transcript_path=transcript_path,
-            cwd=cwd,
-            raw_input=raw_input,
-        )
+        return HookContext(**fields)
 
     @staticmethod
     def _is_task_notification(ctx: HookContext) -> bool:
@@ -424,7 +173,7 @@ class HookRouter:
 
         # Load Session State ONCE
         try:
-            state = SessionState.load(ctx.session_id)
+            state = self.load_state(ctx.session_id)
         except Exception as e:
             print(f"WARNING: Failed to load session state: {e}", file=sys.stderr)
             state = SessionState.create(ctx.session_id)
@@ -479,7 +228,7 @@ class HookRouter:
 
         # Save Session State ONCE
         try:
-            state.save()
+            self.save_state(state)
         except Exception as e:
             print(f"CRITICAL: Failed to save session state: {e}", file=sys.stderr)
 
@@ -491,6 +240,14 @@ class HookRouter:
 
         return merged_result
 
+    def load_state(self, session_id: str) -> SessionState:
+        """Load the session state for this invocation (overridden by the daemon cache)."""
+        return SessionState.load(session_id)
+
+    def save_state(self, state: SessionState) -> None:
+        """Persist the session state for this invocation."""
+        state.save()
+
     def _run_special_handlers(
         self, ctx: HookContext, state: SessionState, merged_result: CanonicalHookOutput
     ) -> None:
@@ -907,32 +664,22 @@ class HookRouter:
         return output
 
 
-# --- Main Entry Point ---
+def run_router(router: HookRouter, args: Any, input_data: str) -> str:
+    """Run the full hook pipeline for one invocation and return the JSON reply.
 
+    Args:
+        router: HookRouter bound to the invoking CLI process.
+        args: Parsed CLI arguments (see parse_args).
+        input_data: Raw stdin payload from the CLI.
 
-def main():
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Universal Hook Router")
-    parser.add_argument(
-        "--client", choices=["gemini", "claude"], help="Client type (gemini or claude)"
-    )
-    parser.add_argument(
-        "event", nargs="?", help="Event name (required for Gemini if not in payload)"
-    )
-
-    # Parse known args to avoid issues if extra flags are passed
-    args, unknown = parser.parse_known_args()
-
-    router = HookRouter()
-
+    Returns:
+        JSON string to print on stdout.
+    """
     # Read Input First (needed for detection)
     raw_input = {}
     try:
-        if not sys.stdin.isatty():
-            input_data = sys.stdin.read()
-            if input_data.strip():
-                raw_input = json.loads(input_data)
+        if input_data.strip():
+            raw_input = json.loads(input_data)
     except Exception as e:
         print(f"WARNING: Failed to read stdin: {e}", file=sys.stderr)
 
@@ -953,10 +700,9 @@ def main():
     # Output (JSON conversion happens only here)
     if client_type == "gemini":
         output = router.output_for_gemini(result, ctx.hook_event)
-        print(output.model_dump_json(exclude_none=True))
     else:
         output = router.output_for_claude(result, ctx.hook_event)
-        print(output.model_dump_json(exclude_none=True))
+    return output.model_dump_json(exclude_none=True)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,25 @@
 # Bootstraps the environment to ensure 'uv' and 'python' are available
 # before delegating to the Python router.
 
-# 1. Detect uv binary
+HOOK_DIR="$(cd "$(dirname "$(dirname "$0")")" && pwd)"
+
+# 1. Fast path: forward to the router daemon if one is listening.
+# The daemon (hooks/router_daemon.py) keeps gates, templates and session state
+# warm. router_client.py is stdlib-only, so the system python3 is enough.
+# Exit code 75 means no daemon answered: fall through to in-process execution.
+ROUTER_SOCKET="${AOPS_ROUTER_SOCKET:-${XDG_RUNTIME_DIR:+$XDG_RUNTIME_DIR/aops-router.sock}}"
+ROUTER_SOCKET="${ROUTER_SOCKET:-/tmp/aops-router-$UID.sock}"
+if [[ -S "$ROUTER_SOCKET" ]] && command -v python3 &> /dev/null; then
+    PAYLOAD="$(cat)"
+    python3 "$HOOK_DIR/hooks/router_client.py" "$@" <<< "$PAYLOAD"
+    rc=$?
+    if [[ $rc -ne 75 ]]; then
+        exit $rc
+    fi
+    exec 0<<< "$PAYLOAD"
+fi
+
+# 2. Detect uv binary
 if ! command -v uv &> /dev/null; then
     # Try common installation paths
     COMMON_PATHS=(
@@ -22,18 +40,17 @@ if ! command -v uv &> /dev/null; then
     done
 fi
 
-# 2. Final check
+# 3. Final check
 if ! command -v uv &> /dev/null; then
     echo "CRITICAL: 'uv' not found on PATH and not in common locations." >&2
     exit 1
 fi
 
-# 3. Delegate to the Python router
+# 4. Delegate to the Python router
 # Use 'uv --directory' with PLUGIN_DIR to ensure
 # correct environment resolution within the extension runtime.
-HOOK_DIR="$(cd "$(dirname "$(dirname "$0")")" && pwd)"
 
 # Set UV_CACHE_DIR to avoid Seatbelt permission errors outside the extension path
 export UV_CACHE_DIR="$HOOK_DIR/.uv-cache"
 
-exec uv --directory "$HOOK_DIR" run python "$HOOK_DIR/hooks/router.py" "$@"
+exec uv --directory "$HOOK_DIR" run python "$HOOK_DIR/hooks/router_entry.py" "$@"
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Thin client for the hook router daemon.
+
+Forwards one hook invocation (argv, stdin payload, environment, cwd and the
+invoking CLI's PID) to a running router daemon over its Unix socket, then
+replays the daemon's stdout/stderr/exit code.
+
+This script is executed with the system python3 on every tool call, so it
+must only import the standard library: the whole point is to skip the
+`uv run` resolution and the pydantic/gate imports paid by router.py.
+
+Exit codes:
+- EXIT_FALLBACK (75): the request never reached a daemon (no daemon, or the
+  request couldn't be sent), or the daemon declined it; router.sh then runs
+  router.py in-process with the same payload.
+- Anything else: the daemon's exit code for the hook.
+
+The client waits for the reply as long as the hook's own timeout in
+hooks.json allows (see response_timeout), and tells the daemon that budget
+so a request it can't start in time is declined rather than run late.
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+# EX_TEMPFAIL - tells router.sh to fall back to in-process execution
+EXIT_FALLBACK = 75
+
+# Seconds to wait for the daemon's reply to an event without a timeout in
+# hooks.json: below the shortest hook timeout there (5s)
+RESPONSE_TIMEOUT = 4.5
+
+# Seconds of an event's hooks.json timeout left for router.sh and this
+# client's own startup and output
+TIMEOUT_MARGIN = 0.5
+
+HOOKS_JSON = Path(__file__).resolve().parent / "hooks.json"
+
+
+def get_router_socket_path() -> Path:
+    """Return the per-user router daemon socket path.
+
+    AOPS_ROUTER_SOCKET overrides the default of
+    $XDG_RUNTIME_DIR/aops-router.sock (or /tmp/aops-router-<uid>.sock).
+    """
+    if override := os.environ.get("AOPS_ROUTER_SOCKET"):
+        return Path(override)
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "aops-router.sock"
+    return Path("/tmp") / f"aops-router-{os.getuid()}.sock"
+
+
+def get_event_name(argv: list[str], payload: str) -> str | None:
+    """Get the hook event: the positional argument (Gemini) or the payload's."""
+    args = iter(argv)
+    for arg in args:
+        if arg == "--client":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return None
+    event = data.get("hook_event_name") if isinstance(data, dict) else None
+    return event if isinstance(event, str) else None
+
+
+def response_timeout(event: str | None, hooks_json: Path = HOOKS_JSON) -> float:
+    """Seconds to wait for the daemon: the event's hooks.json timeout, less a margin."""
+    try:
+        config = json.loads(hooks_json.read_text())
+        timeouts = [
+            hook["timeout"]
+            for matcher in config["hooks"][event]
+            for hook in matcher["hooks"]
+            if "timeout" in hook
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return RESPONSE_TIMEOUT
+    if not timeouts:
+        return RESPONSE_TIMEOUT
+    # hooks.json timeouts are in milliseconds
+    return max(min(timeouts) / 1000 - TIMEOUT_MARGIN, TIMEOUT_MARGIN)
+
+
+def build_request(argv: list[str], payload: str, timeout: float = RESPONSE_TIMEOUT) -> dict:
+    """Build the request document sent to the daemon."""
+    return {
+        "argv": argv,
+        "stdin": payload,
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+        # router.sh runs us as a child, so our parent is the process that
+        # router.py would otherwise see as its parent (uv is exec'd).
+        "ppid": os.getppid(),
+        "hook_dir": str(Path(__file__).resolve().parent),
+        # Seconds the client waits for the reply
+        "timeout": timeout,
+    }
+
+
+def send_request(request: dict, socket_path: Path) -> dict | None:
+    """Send a request to the daemon.
+
+    Returns:
+        None if the request didn't reach a daemon: none is listening, or
+        sending failed (the daemon only runs a request it read in full).
+
+    Raises:
+        OSError, ValueError: If the reply failed after the request was sent
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(request.get("timeout", RESPONSE_TIMEOUT))
+        try:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode())
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            # Missing socket file, stale socket (ECONNREFUSED), permissions,
+            # or the daemon went away mid-request
+            return None
+
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    finally:
+        sock.close()
+
+    return json.loads(b"".join(chunks))
+
+
+def main() -> int:
+    payload = "" if sys.stdin.isatty() else sys.stdin.read()
+    argv = sys.argv[1:]
+    timeout = response_timeout(get_event_name(argv, payload))
+
+    try:
+        response = send_request(build_request(argv, payload, timeout), get_router_socket_path())
+    except (OSError, ValueError) as e:
+        # The daemon accepted the request, so it may already have run the hook.
+        # Falling back could apply gate transitions twice; report and stop.
+        print(f"WARNING: router daemon request failed: {e}", file=sys.stderr)
+        return 1
+
+    if response is None or response.get("fallback"):
+        return EXIT_FALLBACK
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
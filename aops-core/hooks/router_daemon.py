@@ -0,0 +1,378 @@
+#!/usr/bin/env -S uv run python
+"""
+Hook Router Daemon.
+
+Optional long-lived, per-user hook router listening on a Unix socket.
+
+Every hook invocation normally pays `uv run` resolution plus the import of
+pydantic, the gate engine and the template registry before any gate
+runs. The daemon keeps all of that warm:
+
+- GateRegistry: initialized once at startup.
+- TemplateRegistry: singleton instance created at startup.
+- SessionState: recently saved states are reused while their file on disk
+  is unchanged (see SessionStateCache).
+- Hook log: records are appended by a background thread (see
+  hooks/hook_log.py), so the reply doesn't wait for the write.
+
+router.sh sends the stdin payload to the daemon through hooks/router_client.py
+(stdlib-only, run with the system python3) and falls back to in-process
+execution of router.py whenever no daemon is listening.
+
+Requests run one at a time: the hook pipeline reads os.environ and the cwd
+and prints to sys.stdout/sys.stderr, which belong to the process, so they are
+swapped to the request's values while it runs and restored afterwards. A
+request that can't start within half of the client's timeout is declined,
+and router.sh runs it in-process instead.
+
+Usage:
+    uv --directory aops-core run python hooks/router_daemon.py
+    uv --directory aops-core run python hooks/router_daemon.py --idle-timeout 3600
+"""
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+# --- Path Setup ---
+HOOK_DIR = Path(__file__).parent  # aops-core/hooks
+AOPS_CORE_DIR = HOOK_DIR.parent  # aops-core
+
+if str(AOPS_CORE_DIR) not in sys.path:
+    sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from lib.gates.registry import GateRegistry
+from lib.session_paths import get_session_file_path, get_session_status_dir
+from lib.session_state import SessionState
+from lib.template_registry import TemplateRegistry
+
+from hooks import hook_log
+from hooks.router import HookRouter, parse_args, run_router
+from hooks.router_client import RESPONSE_TIMEOUT, get_router_socket_path
+
+# Env vars that gate_config reads once at import time. A request whose values
+# differ from the daemon's would get the wrong gate modes, so it is declined
+# and router.sh runs it in-process instead.
+IMPORT_TIME_ENV_VARS = (
+    "HANDOVER_GATE_MODE",
+    "QA_GATE_MODE",
+    "CUSTODIET_GATE_MODE",
+    "CUSTODIET_TOOL_CALL_THRESHOLD",
+    "HYDRATION_GATE_MODE",
+    "COMMIT_GATE_MODE",
+)
+
+# Modules imported lazily by the router on common paths; preloaded at startup
+# so the first request of each kind doesn't pay for them.
+WARM_MODULES = (
+    "hooks.session_env_setup",
+    "hooks.autocommit_state",
+    "lib.gates.custom_actions",
+    "lib.gates.custom_conditions",
+    "lib.hydration",
+    "lib.session_reader",
+)
+
+# Fraction of the client's timeout a request may wait to start behind the
+# requests queued before it
+START_WAIT_FRACTION = 0.5
+
+
+class SessionStateCache:
+    """Warm SessionState objects keyed by session_id.
+
+    An entry is only reused while the file the daemon last wrote is unchanged
+    on disk (same mtime and size) and still inside SessionState.load()'s
+    today/yesterday window. Writes by in-process fallbacks or external scripts
+    (e.g. custodiet_block.py) therefore invalidate the entry.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[Path, int, int, SessionState]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> SessionState | None:
+        """Return a private copy of the cached state, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+
+        path, mtime_ns, size, state = entry
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+
+        now = datetime.now()
+        valid_dates = {now.strftime("%Y%m%d"), (now - timedelta(days=1)).strftime("%Y%m%d")}
+        if (
+            st is None
+            or st.st_mtime_ns != mtime_ns
+            or st.st_size != size
+            or path.name[:8] not in valid_dates
+            or path.parent != get_session_status_dir(session_id)
+        ):
+            with self._lock:
+                if self._entries.get(session_id) is entry:
+                    del self._entries[session_id]
+            return None
+
+        return state.model_copy(deep=True)
+
+    def put(self, state: SessionState) -> None:
+        """Record a state that has just been saved to disk."""
+        path = get_session_file_path(state.session_id, state.date)
+        try:
+            st = path.stat()
+        except OSError:
+            with self._lock:
+                self._entries.pop(state.session_id, None)
+            return
+
+        entry = (path, st.st_mtime_ns, st.st_size, state.model_copy(deep=True))
+        with self._lock:
+            self._entries.pop(state.session_id, None)
+            if len(self._entries) >= self.max_entries:
+                # Evict the oldest insertion (dicts preserve insertion order)
+                del self._entries[next(iter(self._entries))]
+            self._entries[state.session_id] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DaemonHookRouter(HookRouter):
+    """HookRouter that loads and saves SessionState through the daemon cache."""
+
+    def __init__(self, cache: SessionStateCache, ppid: int | None = None):
+        super().__init__(ppid)
+        self._cache = cache
+
+    def load_state(self, session_id: str) -> SessionState:
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            return cached
+        return SessionState.load(session_id)
+
+    def save_state(self, state: SessionState) -> None:
+        state.save()
+        self._cache.put(state)
+
+
+@contextmanager
+def _request_context(
+    env: dict[str, str], cwd: str, stdout: io.StringIO, stderr: io.StringIO
+) -> Iterator[None]:
+    """Run the block in a request's environment and cwd, capturing its output.
+
+    All four belong to the process, which is why RouterDaemon runs one request
+    at a time. The hook log writer thread uses none of them (see hook_log).
+
+    Raises:
+        OSError: If cwd can't be entered
+    """
+    saved_env, saved_cwd = dict(os.environ), os.getcwd()
+    saved_stdout, saved_stderr = sys.stdout, sys.stderr
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        os.chdir(cwd)
+        sys.stdout, sys.stderr = stdout, stderr
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved_stdout, saved_stderr
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def _exit_code(e: SystemExit) -> int:
+    """The process exit status sys.exit(e.code) would give."""
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+class RouterDaemon:
+    """Executes forwarded hook requests against warm registries and state."""
+
+    def __init__(self, hook_dir: Path = HOOK_DIR):
+        self.hook_dir = str(hook_dir.resolve())
+        self.state_cache = SessionStateCache()
+        self.requests_served = 0
+        self._run_lock = threading.Lock()
+        self._import_time_env = {var: os.environ.get(var) for var in IMPORT_TIME_ENV_VARS}
+
+    def warm_up(self) -> None:
+        """Initialize registries and preload lazily imported modules."""
+        import importlib
+
+        GateRegistry.initialize()
+        TemplateRegistry.instance()
+        for module in WARM_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                print(f"WARNING: router daemon could not preload {module}: {e}", file=sys.stderr)
+
+    def should_fallback(self, request: dict[str, Any]) -> str | None:
+        """Return the reason a request must run in-process, or None."""
+        if request.get("hook_dir") != self.hook_dir:
+            return "plugin directory differs from the daemon's"
+        env = request.get("env") or {}
+        for var, value in self._import_time_env.items():
+            if env.get(var) != value:
+                return f"{var} differs from the daemon's value"
+        if not Path(request.get("cwd") or "/").is_dir():
+            return "cwd does not exist"
+        return None
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one hook request and return the client response document."""
+        if reason := self.should_fallback(request):
+            return {"fallback": True, "reason": reason}
+
+        wait = float(request.get("timeout") or RESPONSE_TIMEOUT) * START_WAIT_FRACTION
+        if not self._run_lock.acquire(timeout=wait):
+            return {"fallback": True, "reason": "daemon busy"}
+        try:
+            response = self._run(request)
+            self.requests_served += 1
+        finally:
+            self._run_lock.release()
+        return response
+
+    def _run(self, request: dict[str, Any]) -> dict[str, Any]:
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+
+        with _request_context(request.get("env") or {}, request["cwd"], stdout, stderr):
+            try:
+                args = parse_args(request.get("argv") or [])
+                router = DaemonHookRouter(self.state_cache, ppid=request.get("ppid"))
+                print(run_router(router, args, request.get("stdin") or ""))
+            except SystemExit as e:
+                exit_code = _exit_code(e)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        chunks = []
+        while chunk := self.request.recv(65536):
+            chunks.append(chunk)
+
+        try:
+            request = json.loads(b"".join(chunks))
+            response = self.server.router_daemon.handle(request)  # type: ignore[attr-defined]
+        except Exception as e:
+            response = {"fallback": True, "reason": f"bad request: {e}"}
+
+        self.request.sendall(json.dumps(response).encode())
+
+
+class RouterServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that hands each connection to a RouterDaemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, daemon: RouterDaemon, idle_timeout: float | None = None):
+        self.socket_path = socket_path
+        self.router_daemon = daemon
+        self.timeout = idle_timeout
+        self.idle = False
+        _remove_stale_socket(socket_path)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(socket_path), _RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def handle_timeout(self) -> None:
+        self.idle = True
+
+    def serve_until_idle(self) -> None:
+        """Serve requests until idle_timeout passes without one (forever if None)."""
+        while not self.idle:
+            self.handle_request()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a leftover socket file, refusing to clobber a live daemon."""
+    if not socket_path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A router daemon is already listening on {socket_path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hook Router Daemon")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Unix socket path (default: AOPS_ROUTER_SOCKET or per-user runtime path)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many seconds without a request (default: never)",
+    )
+    args = parser.parse_args()
+
+    socket_path = args.socket or get_router_socket_path()
+    daemon = RouterDaemon()
+    daemon.warm_up()
+
+    server = RouterServer(socket_path, daemon, idle_timeout=args.idle_timeout)
+    hook_log.start_background_writer()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"Router daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        hook_log.stop_background_writer()
+        print(
+            f"Router daemon stopped after {daemon.requests_served} requests",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
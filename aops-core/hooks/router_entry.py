@@ -0,0 +1,418 @@
+#!/usr/bin/env -S uv run python
+"""
+Hook Router entry point.
+
+Handles hook events from both Claude Code and Gemini CLI (see router.sh).
+Only stdlib-only modules are imported here: invocations listed in the
+fast-path table (hooks/fast_path.py) are answered by run_fast_path() without
+loading pydantic, the gate engine or the unified logger. Everything else is
+handed to the full pipeline in hooks/router.py, which is imported on demand.
+Set AOPS_HOOK_FAST_PATH=0 to always run the full pipeline.
+
+Also holds the pydantic-free pieces the pipeline shares: session map access
+and HookContext field resolution.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# --- Path Setup ---
+HOOK_DIR = Path(__file__).parent  # aops-core/hooks
+AOPS_CORE_DIR = HOOK_DIR.parent  # aops-core
+
+# Add aops-core to path for imports
+if str(AOPS_CORE_DIR) not in sys.path:
+    sys.path.insert(0, str(AOPS_CORE_DIR))
+
+try:
+    from lib.hook_utils import is_subagent_session
+    from lib.session_paths import get_pid_session_map_path, get_session_short_hash
+
+    from hooks import fast_path
+    from hooks.gate_config import extract_subagent_type
+except ImportError as e:
+    # Fail fast if schemas missing
+    print(f"CRITICAL: Failed to import: {e}", file=sys.stderr)
+    sys.exit(1)
+
+
+# --- Configuration ---
+
+DEBUG_LOG_DIR = Path("/tmp")
+
+
+def _debug_log_path(session_id: str | None) -> Path:
+    """Return per-session debug log path."""
+    slug = session_id if session_id else "unknown"
+    aops_sessions = os.environ.get("AOPS_SESSIONS")
+    if aops_sessions:
+        log_dir = Path(aops_sessions).resolve() / "hooks"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return log_dir / f"cc_hooks_{slug}.jsonl"
+    return DEBUG_LOG_DIR / f"cc_hooks_{slug}.jsonl"
+
+
+def _debug_log_input(raw_input: dict[str, Any], args: Any) -> None:
+    """Append raw hook input to debug JSONL file if DEBUG_HOOKS=1."""
+    if not os.environ.get("DEBUG_HOOKS"):
+        return
+    try:
+        session_id = raw_input.get("session_id") or os.environ.get("CLAUDE_SESSION_ID")
+        entry = {
+            "ts": datetime.now().isoformat(),
+            "session_id": session_id,
+            "client": getattr(args, "client", None),
+            "event": getattr(args, "event", None),
+            "input": raw_input,
+        }
+        with _debug_log_path(session_id).open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+    except Exception as e:
+        print(f"DEBUG_LOG error: {e}", file=sys.stderr)
+
+
+# Event mapping: Gemini -> Claude (internal normalization)
+GEMINI_EVENT_MAP = {
+    "SessionStart": "SessionStart",
+    "BeforeTool": "PreToolUse",
+    "AfterTool": "PostToolUse",
+    "BeforeAgent": "UserPromptSubmit",  # Mapped to UPS for unified handling
+    "AfterAgent": "Stop",  # This is the event after the agent returns their final response for a turn.
+    "SessionEnd": "SessionEnd",
+    "Notification": "Notification",
+    "PreCompress": "PreCompact",
+    "SubagentStart": "SubagentStart",  # Explicit mapping if Gemini sends it
+    "SubagentStop": "SubagentStop",  # Explicit mapping if Gemini sends it
+}
+
+
+# --- Session Management ---
+
+
+def get_parent_pid(pid: int) -> int | None:
+    """Get parent PID from /proc/[pid]/stat."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return int(f.read().split()[3])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def get_session_data(ppid: int | None = None) -> dict[str, Any]:
+    """Read session metadata, traversing up process tree if necessary.
+
+    Args:
+        ppid: Parent PID of the hook invocation (defaults to os.getppid()).
+    """
+    try:
+        # Try direct PPID first (fast path)
+        session_file = get_pid_session_map_path(ppid)
+        if session_file.exists():
+            return json.loads(session_file.read_text().strip())
+
+        # Fallback: walk up process tree
+        pid = ppid if ppid is not None else os.getppid()
+        while pid and pid > 1:
+            session_file = Path("/tmp") / f"session-{pid}.json"
+            if session_file.exists():
+                try:
+                    data = json.loads(session_file.read_text().strip())
+                    if data:
+                        return data
+                except json.JSONDecodeError:
+                    pass
+            pid = get_parent_pid(pid)
+    except Exception as e:
+        print(f"WARNING: Failed to read session data: {e}", file=sys.stderr)
+    return {}
+
+
+def persist_session_data(data: dict[str, Any], ppid: int | None = None) -> None:
+    """Write session metadata atomically."""
+    try:
+        session_file = get_pid_session_map_path(ppid)
+        existing = get_session_data(ppid)
+        existing.update(data)
+
+        # Atomic write
+        fd, temp_path = tempfile.mkstemp(dir=str(session_file.parent), text=True)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(existing, f)
+            Path(temp_path).rename(session_file)
+        except Exception as e:
+            Path(temp_path).unlink(missing_ok=True)
+            print(f"CRITICAL: Failed to persist session data: {e}", file=sys.stderr)
+            raise
+    except OSError as e:
+        print(f"WARNING: OSError in persist_session_data: {e}", file=sys.stderr)
+
+
+def _normalize_json_field(value: Any) -> Any:
+    """Normalize a field that may be a JSON string to its parsed form."""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+    return value
+
+
+def resolve_context_fields(
+    raw_input: dict[str, Any],
+    gemini_event: str | None,
+    session_data: dict[str, Any],
+) -> dict[str, Any]:
+    """Resolve the HookContext fields for one invocation, without pydantic.
+
+    Shared by HookRouter.normalize_input() and run_fast_path(). Processed
+    fields are popped from raw_input; the remainder ends up in "raw_input".
+
+    Args:
+        raw_input: Parsed hook payload (modified in place).
+        gemini_event: Event name passed on the command line, if any.
+        session_data: Session metadata from the PID session map.
+
+    Returns:
+        Keyword arguments for HookContext.
+    """
+    # 1. Determine Event Name
+    if gemini_event:
+        hook_event = GEMINI_EVENT_MAP.get(gemini_event, gemini_event)
+    else:
+        raw_event = raw_input.get("hook_event_name") or ""
+        hook_event = GEMINI_EVENT_MAP.get(raw_event, raw_event)
+
+    # 2. Determine Session ID
+    session_id = raw_input.get("session_id")
+    if not session_id:
+        session_id = session_data.get("session_id") or os.environ.get("CLAUDE_SESSION_ID")
+
+    if not session_id and hook_event == "SessionStart":
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        short_uuid = str(uuid.uuid4())[:8]
+        session_id = f"gemini-{timestamp}-{short_uuid}"
+
+    if not session_id:
+        session_id = f"unknown-{str(uuid.uuid4())[:8]}"
+
+    # 3. Determine Agent ID and Subagent Type
+    # Check both payload and persisted session data (for subagent tool calls)
+    agent_id = raw_input.get("agent_id") or raw_input.get("agentId") or session_data.get("agent_id")
+    subagent_type = (
+        raw_input.get("subagent_type")
+        or raw_input.get("agent_type")
+        or session_data.get("subagent_type")
+    )
+
+    # Prefer explicit env var if set
+    if not subagent_type:
+        subagent_type = os.environ.get("CLAUDE_SUBAGENT_TYPE")
+
+    # 4. Transcript Path / Temp Root
+    transcript_path = raw_input.get("transcript_path")
+
+    # Request Tracing (aops-32068a2e)
+    trace_id = raw_input.get("trace_id") or str(uuid.uuid4())
+
+    # 5. Tool Data
+    tool_name = raw_input.get("tool_name")
+    tool_input = _normalize_json_field(raw_input.get("tool_input", {}))
+    if not isinstance(tool_input, dict):
+        tool_input = {}
+
+    # Normalize tool_result and toolResult in raw_input (for PostToolUse/SubagentStop)
+    tool_output = {}
+    raw_tool_output = (
+        raw_input.get("tool_result")
+        or raw_input.get("toolResult")
+        or raw_input.get("tool_response")
+        or raw_input.get("subagent_result")
+    )
+    if raw_tool_output:
+        tool_output = _normalize_json_field(raw_tool_output)
+
+    # 6. Extract subagent_type from spawning tools
+    # Uses the SPAWN_TOOLS table in gate_config for cross-platform detection
+    # (Claude Task/Skill, Gemini delegate_to_agent/activate_skill, extensible
+    # to Codex/Copilot). _subagent_type_from_skill prevents Skill invocations
+    # from being misclassified as subagent sessions.
+    _subagent_type_from_spawn_tool = False
+    _subagent_type_from_skill = False
+    if not subagent_type and isinstance(tool_input, dict):
+        extracted, is_skill = extract_subagent_type(tool_name, tool_input)
+        if extracted:
+            subagent_type = extracted
+            _subagent_type_from_skill = is_skill
+            _subagent_type_from_spawn_tool = not is_skill
+
+    # 7. Detect Subagent Session
+    # Call is_subagent_session BEFORE popping fields from raw_input
+    is_subagent = is_subagent_session(raw_input)
+
+    # If we have subagent info from PID map or explicit flags, treat as subagent.
+    # Skip the override for:
+    #  - Skill/activate_skill calls (run in main session)
+    #  - Spawn tool calls like Agent(...) (main session dispatching a subagent)
+    #  - SubagentStart/SubagentStop events (main session events about subagents)
+    if (
+        not is_subagent
+        and not _subagent_type_from_skill
+        and not _subagent_type_from_spawn_tool
+        and (
+            subagent_type
+            or agent_id
+            or raw_input.get("is_sidechain")
+            or raw_input.get("isSidechain")
+        )
+    ):
+        is_subagent = True
+
+    # SubagentStart/SubagentStop fire in the MAIN agent's context ABOUT a
+    # subagent. They carry agent_id/agent_type metadata which causes false
+    # positives above. Override: these are never subagent events.
+    if hook_event in ("SubagentStart", "SubagentStop"):
+        is_subagent = False
+
+    # 8. Precompute values
+    short_hash = get_session_short_hash(session_id)
+
+    # 9. Build Context and POP processed fields from raw_input
+    # We pop now so the remainder in ctx.raw_input is "extra" data
+    processed_fields = [
+        "hook_event_name",
+        "session_id",
+        "transcript_path",
+        "trace_id",
+        "tool_name",
+        "tool_input",
+        "tool_result",
+        "toolResult",
+        "tool_response",
+        "subagent_result",
+        "agent_id",
+        "agentId",
+        "slug",
+        "cwd",
+        "is_sidechain",
+        "isSidechain",
+        "subagent_type",
+        "agent_type",
+    ]
+    slug = raw_input.get("slug")
+    cwd = raw_input.get("cwd")
+
+    for field in processed_fields:
+        raw_input.pop(field, None)
+
+    # Same order as the HookContext fields, so fast-path log records match
+    # unified_logger's field for field
+    return dict(
+        session_id=session_id,
+        trace_id=trace_id,
+        hook_event=hook_event,
+        agent_id=agent_id,
+        slug=slug,
+        # Precomputed values
+        session_short_hash=short_hash,
+        is_subagent=is_subagent,
+        # Event Data
+        tool_name=tool_name,
+        tool_input=tool_input,
+        tool_output=tool_output,
+        transcript_path=transcript_path,
+        cwd=cwd,
+        subagent_type=subagent_type,
+        raw_input=raw_input,
+    )
+
+
+# --- Main Entry Point ---
+
+
+def parse_args(argv: list[str] | None = None) -> Any:
+    """Parse router CLI arguments (shared with the router daemon)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Universal Hook Router")
+    parser.add_argument(
+        "--client", choices=["gemini", "claude"], help="Client type (gemini or claude)"
+    )
+    parser.add_argument(
+        "event", nargs="?", help="Event name (required for Gemini if not in payload)"
+    )
+
+    # Parse known args to avoid issues if extra flags are passed
+    args, _unknown = parser.parse_known_args(argv)
+    return args
+
+
+def run_fast_path(args: Any, input_data: str, ppid: int | None = None) -> str | None:
+    """Answer an invocation from the fast-path table, without the gate pipeline.
+
+    Only stdlib-only modules are used, so a hit never imports pydantic, the
+    gate engine or the unified logger (see hooks/fast_path.py).
+
+    Args:
+        args: Parsed CLI arguments (see parse_args).
+        input_data: Raw stdin payload from the CLI.
+        ppid: PID of the CLI process that fired the hook (None: os.getppid()).
+
+    Returns:
+        JSON string to print on stdout, or None if the full pipeline must run.
+    """
+    if not args.client or os.environ.get("AOPS_HOOK_FAST_PATH") == "0":
+        return None
+
+    try:
+        raw_input = json.loads(input_data) if input_data.strip() else {}
+    except json.JSONDecodeError:
+        return None  # run_router reports the bad payload
+    if not isinstance(raw_input, dict):
+        return None
+
+    # Cheap pre-check before touching the PID session map or state files
+    gemini_event = args.event
+    raw_event = gemini_event or raw_input.get("hook_event_name") or ""
+    if GEMINI_EVENT_MAP.get(raw_event, raw_event) not in fast_path.FAST_PATH_EVENTS:
+        return None
+
+    session_data = get_session_data(ppid)
+    fields = resolve_context_fields(dict(raw_input), gemini_event, session_data)
+    output = fast_path.evaluate(fields)
+    if output is None:
+        return None
+
+    _debug_log_input(raw_input, args)
+    fast_path.log_hook_event(fields, output)
+    return fast_path.format_output(output, args.client, fields["hook_event"])
+
+
+def main():
+    args = parse_args()
+
+    input_data = ""
+    try:
+        if not sys.stdin.isatty():
+            input_data = sys.stdin.read()
+    except Exception as e:
+        print(f"WARNING: Failed to read stdin: {e}", file=sys.stderr)
+
+    output = run_fast_path(args, input_data)
+    if output is None:
+        from hooks.router import HookRouter, run_router
+
+        output = run_router(HookRouter(), args, input_data)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,20 +7,16 @@ Logs ALL hook events to:
 2. Per-session JSONL hook log (audit trail)
 """
 
-import json
 import logging
-import os
 import sys
-import time
 from datetime import datetime
 from typing import Any
 
-import psutil
 from lib.gate_model import GateResult
 from lib.session_paths import get_hook_log_path
 from lib.session_state import SessionState
 
-from hooks.internal_models import HookLogEntry
+from hooks import hook_log
 from hooks.schemas import CanonicalHookOutput, HookContext
 
 # Set up logging
@@ -30,11 +26,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _json_serializer(obj: Any) -> str:
-    """Convert non-serializable objects to strings for JSON serialization."""
-    return str(obj)
-
-
 def log_hook_event(
     ctx: HookContext,
     output: CanonicalHookOutput | None = None,
@@ -57,38 +48,14 @@ def log_hook_event(
 
         log_path = get_hook_log_path(session_id, input_data, date)
 
-        # Gather process metrics
-        process = psutil.Process(os.getpid())
-        mem_info = process.memory_info()
-
-        # Create log entry from superclass fields + new metadata
-        log_entry = HookLogEntry(
-            session_id=session_id,
-            logged_at=datetime.now().astimezone().replace(microsecond=0).isoformat(),
-            exit_code=exit_code,
-            output=output.model_dump() if output else None,
-            **ctx.model_dump(exclude={"framework_content", "session_id"}),
-        )
-
-        # Add debug metrics to metadata
-        log_dict = log_entry.model_dump()
-        log_dict["debug"] = {
-            "pid": os.getpid(),
-            "ppid": os.getppid(),
-            "mem_rss_mb": mem_info.rss / (1024 * 1024),
-            "mem_vms_mb": mem_info.vms / (1024 * 1024),
-            "process_uptime": time.time() - process.create_time(),
-        }
-
-        # Append to JSONL file
-        with log_path.open("a") as f:
-            json.dump(
-                log_dict,
-                f,
-                separators=(",", ":"),
-                default=_json_serializer,
-            )
-            f.write("\n")
+        # Same shape as a HookLogEntry dump, without building and re-dumping one
+        record = ctx.model_dump(exclude={"framework_content"})
+        record["logged_at"] = datetime.now().astimezone().replace(microsecond=0).isoformat()
+        record["exit_code"] = exit_code
+        record["output"] = output.model_dump() if output else None
+        record["debug"] = hook_log.process_metrics()
+
+        hook_log.write_record(log_path, record)
 
     except Exception as e:
         # Log error to stderr but don't crash the hook
@@ -0,0 +1,78 @@
+"""
+Cache Utils - where persisted caches live and how they are written.
+
+Each cache keeps its files in its own directory under the cache root:
+
+    $AOPS_CACHE_DIR, else ${XDG_CACHE_HOME:-~/.cache}/aops
+
+Set AOPS_CACHE=0 to turn every persisted cache off (see caches_enabled()).
+
+Files are replaced atomically: written to a temp file in the same directory
+(named ".<name>.*.tmp", so directory scans skip it) and renamed over the
+target, so readers never see a partial file.
+
+Usage:
+    from lib.cache_utils import caches_enabled, get_cache_dir, write_cache_file
+
+    path = get_cache_dir("file-index") / "index.pickle"
+    if caches_enabled():
+        write_cache_file(path, data)
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def get_cache_root() -> Path:
+    """Get the root directory for persisted caches (not created)."""
+    cache_dir = os.environ.get("AOPS_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "aops"
+
+
+def get_cache_dir(name: str) -> Path:
+    """Get the directory for one cache under the cache root (not created)."""
+    return get_cache_root() / name
+
+
+def caches_enabled() -> bool:
+    """Check whether persisted caches may be used (AOPS_CACHE=0 turns them off)."""
+    return os.environ.get("AOPS_CACHE") != "0"
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Replace path with data via a temp file renamed over it.
+
+    Creates the parent directory if needed.
+
+    Raises:
+        OSError: If the file couldn't be written (path is left unchanged)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_cache_file(path: Path, data: bytes) -> bool:
+    """Atomically replace a cache file with data, as atomic_write does.
+
+    Returns:
+        False if the file couldn't be written; the next reader rebuilds it
+    """
+    try:
+        atomic_write(path, data)
+    except OSError:
+        return False
+    return True
@@ -19,7 +19,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from lib.transcript_parser import Entry, SessionProcessor
+from lib.transcript_parser import Entry, SessionProcessor, ToolCallIndex
 
 
 @dataclass
@@ -41,6 +41,7 @@ class WorkUnit:
     )
     skills_invoked: list[str] = field(default_factory=list)  # Skills triggered in this unit
     commands_invoked: list[str] = field(default_factory=list)  # Slash commands (/skill, etc)
+    subagent_id: str | None = None  # For delegations: agentId of the spawned subagent
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -82,6 +83,7 @@ class LaborExtractor:
     def __init__(self, processor: SessionProcessor | None = None):
         self.processor = processor or SessionProcessor()
         self.line_counter = 0
+        self.tool_index = ToolCallIndex()
 
     def extract_session_labor(
         self,
@@ -132,6 +134,7 @@ class LaborExtractor:
 
         # Extract work units from entries
         self.line_counter = 0
+        self.tool_index = self.processor.tool_call_index(entries)
         subagent_ids = set()
 
         # Process entries chronologically
@@ -241,9 +244,11 @@ class LaborExtractor:
                 tool_description,
                 is_delegation,
                 delegation_prompt,
+                tool_use_id,
             ) in tool_calls:
                 if is_delegation:
                     # Create delegation work unit with prompt captured
+                    tool_call = self.tool_index.get(tool_use_id) if tool_use_id else None
                     unit = WorkUnit(
                         line_number=self.line_counter,
                         timestamp=entry.timestamp,
@@ -253,6 +258,7 @@ class LaborExtractor:
                         delegation_prompt=delegation_prompt,
                         tool_name=tool_name,
                         tool_params=tool_params,
+                        subagent_id=tool_call.agent_id if tool_call else None,
                     )
                 else:
                     unit = WorkUnit(
@@ -365,12 +371,13 @@ class LaborExtractor:
 
     def _extract_tool_calls(
         self, entry: Entry
-    ) -> list[tuple[str, dict[str, Any], str, bool, str | None]]:
+    ) -> list[tuple[str, dict[str, Any], str, bool, str | None, str | None]]:
         """
         Extract tool calls from an entry.
 
         Returns:
-            List of (tool_name, tool_params, description, is_delegation, delegation_prompt) tuples
+            List of (tool_name, tool_params, description, is_delegation, delegation_prompt,
+            tool_use_id) tuples
         """
         tool_calls = []
 
@@ -406,6 +413,7 @@ class LaborExtractor:
                     description,
                     is_delegation,
                     delegation_prompt,
+                    None,
                 )
             )
 
@@ -453,6 +461,7 @@ class LaborExtractor:
                                     description,
                                     is_delegation,
                                     delegation_prompt,
+                                    block.get("id"),
                                 )
                             )
 
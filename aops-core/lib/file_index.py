@@ -12,19 +12,44 @@ Usage:
 
     paths = get_relevant_file_paths("fix the prompt hydrator routing logic")
     # Returns paths related to: hydrator, routing, hooks
+
+Scoring: the keywords of FILE_INDEX and of the project workflows are
+compiled into a RelevanceIndex, a keyword automaton (lib.keyword_index) with
+each keyword's entries, which scores a prompt in one pass over it. The index
+is built once and persisted as a pickle in the file-index cache directory
+(lib.cache_utils.get_cache_dir), one per working directory. It is
+rebuilt when FILE_INDEX changes or a workflow file is added, removed or
+modified (by mtime and size), so workflows aren't re-read and re-parsed per
+prompt. Set AOPS_CACHE=0 to build it from scratch every time.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import pickle
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
+from lib.cache_utils import caches_enabled, get_cache_dir, write_cache_file
+from lib.keyword_index import KeywordIndex
 from lib.paths import get_plugin_root
 
+# Bump when FileEntry or RelevanceIndex change shape
+INDEX_VERSION = 1
+
+# Relevance indexes loaded by this process, with their fingerprints, by index file path
+_loaded: dict[Path, tuple[dict, RelevanceIndex]] = {}
+
+# The last prompt scored: (index, normalized prompt, scored entries)
+_last_scores: tuple[RelevanceIndex, str, list[tuple[int, FileEntry]]] | None = None
+
+_file_index_digest: str | None = None
+
 
 @dataclass
 class FileEntry:
@@ -39,9 +64,8 @@ class FileEntry:
         return get_plugin_root() / self.path
 
 
-def _get_project_workflow_entries() -> list[FileEntry]:
-    """Discover project-specific workflows in .agent/workflows/."""
-    entries = []
+def _project_workflow_dirs() -> list[Path]:
+    """Get the .agent/workflows/ directories searched for project workflows."""
     cwd = Path.cwd()
     plugin_root = get_plugin_root()
 
@@ -51,6 +75,14 @@ def _get_project_workflow_entries() -> list[FileEntry]:
         search_dirs.append(cwd / ".agent" / "workflows")
     if (plugin_root.parent / ".agent" / "workflows").exists():
         search_dirs.append(plugin_root.parent / ".agent" / "workflows")
+    return search_dirs
+
+
+def _get_project_workflow_entries() -> list[FileEntry]:
+    """Discover project-specific workflows in .agent/workflows/."""
+    entries = []
+    plugin_root = get_plugin_root()
+    search_dirs = _project_workflow_dirs()
 
     # Resolve allowed roots for symlink boundary checking
     allowed_roots = [d.resolve() for d in search_dirs]
@@ -526,6 +558,124 @@ def _normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", text.lower().strip())
 
 
+class RelevanceIndex:
+    """File entries with a keyword automaton over their lowercased keywords."""
+
+    def __init__(self, entries: list[FileEntry]):
+        self.entries = entries
+        keyword_ids: dict[str, int] = {}
+        # Per keyword: entry index -> score, the keyword's length
+        # times its occurrences among the entry's keywords
+        self.postings: list[dict[int, int]] = []
+        for entry_index, entry in enumerate(entries):
+            for keyword in entry.keywords:
+                keyword_lower = keyword.lower()
+                keyword_id = keyword_ids.setdefault(keyword_lower, len(keyword_ids))
+                if keyword_id == len(self.postings):
+                    self.postings.append({})
+                postings = self.postings[keyword_id]
+                postings[entry_index] = postings.get(entry_index, 0) + len(keyword)
+        self.keywords = KeywordIndex(keyword_ids)
+
+    def score(self, prompt_lower: str) -> list[tuple[int, FileEntry]]:
+        """Score entries by the keywords the prompt contains, best first.
+
+        Each keyword occurring in the prompt adds its length to the score of
+        the entries it belongs to (longer matches are more specific). Ties
+        keep index order.
+        """
+        scores: dict[int, int] = {}
+        for keyword_id in self.keywords.find(prompt_lower):
+            for entry_index, score in self.postings[keyword_id].items():
+                scores[entry_index] = scores.get(entry_index, 0) + score
+        ranked = sorted(
+            (entry_index for entry_index, score in scores.items() if score > 0),
+            key=lambda entry_index: (-scores[entry_index], entry_index),
+        )
+        return [(scores[entry_index], self.entries[entry_index]) for entry_index in ranked]
+
+
+def _index_fingerprint() -> dict:
+    """Describe the index's inputs: FILE_INDEX and the workflow files (by mtime and size)."""
+    global _file_index_digest
+    if _file_index_digest is None:
+        _file_index_digest = hashlib.sha256(repr(FILE_INDEX).encode()).hexdigest()
+    workflow_dirs = []
+    for workflows_dir in _project_workflow_dirs():
+        files = []
+        try:
+            with os.scandir(workflows_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(".md"):
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    files.append((dir_entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            pass
+        workflow_dirs.append((str(workflows_dir), sorted(files)))
+    return {
+        "version": INDEX_VERSION,
+        "file_index": _file_index_digest,
+        "plugin_root": str(get_plugin_root()),
+        "workflow_dirs": workflow_dirs,
+    }
+
+
+def get_index_path() -> Path:
+    """Get the relevance index file for the current working directory."""
+    key = hashlib.sha256(str(Path.cwd().resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir("file-index") / f"{key}.pickle"
+
+
+def get_relevance_index() -> RelevanceIndex:
+    """Get the relevance index for FILE_INDEX and the project workflows.
+
+    Reuses the index loaded by this process or persisted on disk while its
+    inputs are unchanged; otherwise rebuilds and persists it.
+    """
+    if not caches_enabled():
+        return RelevanceIndex(list(FILE_INDEX) + _get_project_workflow_entries())
+
+    fingerprint = _index_fingerprint()
+    path = get_index_path()
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == fingerprint:
+        return loaded[1]
+
+    index = None
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("fingerprint") == fingerprint:
+            index = data["index"]
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        ValueError,
+        TypeError,
+        KeyError,
+        AttributeError,
+        ImportError,
+    ):
+        # Missing, truncated or written by an incompatible version: rebuild
+        index = None
+
+    if not isinstance(index, RelevanceIndex):
+        index = RelevanceIndex(list(FILE_INDEX) + _get_project_workflow_entries())
+        write_cache_file(
+            path,
+            pickle.dumps(
+                {"fingerprint": fingerprint, "index": index}, protocol=pickle.HIGHEST_PROTOCOL
+            ),
+        )
+    _loaded[path] = (fingerprint, index)
+    return index
+
+
 def get_relevant_file_paths(prompt: str, max_files: int = 10) -> list[dict[str, str]]:
     """
     Get file paths relevant to the given prompt.
@@ -541,30 +691,20 @@ def get_relevant_file_paths(prompt: str, max_files: int = 10) -> list[dict[str,
         List of dicts with 'path', 'description', and 'absolute_path' keys.
         Sorted by relevance (more keyword matches first).
     """
+    global _last_scores
     if not prompt:
         return []
 
     prompt_lower = _normalize_text(prompt)
 
-    # Score each file entry by number of keyword matches
-    scored_entries: list[tuple[int, FileEntry]] = []
-
-    # Combined framework and project entries
-    all_entries = list(FILE_INDEX) + _get_project_workflow_entries()
-
-    for entry in all_entries:
-        score = 0
-        for keyword in entry.keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in prompt_lower:
-                # Longer keyword matches are more specific, score higher
-                score += len(keyword)
-
-        if score > 0:
-            scored_entries.append((score, entry))
-
-    # Sort by score descending
-    scored_entries.sort(key=lambda x: x[0], reverse=True)
+    # Hydration asks twice per prompt (relevant files, then workflows)
+    index = get_relevance_index()
+    last = _last_scores
+    if last is not None and last[0] is index and last[1] == prompt_lower:
+        scored_entries = last[2]
+    else:
+        scored_entries = index.score(prompt_lower)
+        _last_scores = (index, prompt_lower, scored_entries)
 
     # Take top entries up to max_files
     results: list[dict[str, str]] = []
@@ -1,5 +1,6 @@
 from hooks.gate_config import (
     COMMIT_GATE_MODE,
+    CUSTODIET_COUNTDOWN_START_BEFORE,
     CUSTODIET_GATE_MODE,
     CUSTODIET_TOOL_CALL_THRESHOLD,
     HANDOVER_GATE_MODE,
@@ -84,7 +85,7 @@ GATE_CONFIGS = [
         description="Enforces periodic compliance checks.",
         initial_status=GateStatus.OPEN,
         countdown=CountdownConfig(
-            start_before=7,
+            start_before=CUSTODIET_COUNTDOWN_START_BEFORE,
             threshold=CUSTODIET_TOOL_CALL_THRESHOLD,
             message_key="custodiet.countdown",
         ),
@@ -0,0 +1,231 @@
+"""
+Compiled gate conditions and per-gate dispatch tables.
+
+GenericGate used to interpret each GateCondition from scratch on every hook:
+scan hook_event for regex metacharacters, re.search raw pattern strings,
+stringify tool_input, and categorise the tool (importing hooks.gate_config),
+for every trigger and policy of every gate.
+
+Here each condition is compiled once, when its gate is built
+(GateRegistry.initialize in the router and daemon):
+- hook_event becomes an equality check or a precompiled regex,
+- tool, tool input and subagent patterns are precompiled regexes,
+- excluded tool categories become a frozenset.
+
+A gate's DispatchTable then lists, per (hook event, tool category), the
+triggers and policies whose event and category checks can pass; the list
+for a key is built on first use and reused. Per hook, evaluation only visits
+those candidates, and the tool category and stringified tool input are
+computed at most once per hook and shared by every gate (see hook_facts).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from hooks.schemas import HookContext
+
+from lib.gate_types import GateCondition, GatePolicy, GateState, GateTrigger
+from lib.session_state import SessionState
+
+_REGEX_CHARS = "^$|[]()"
+
+_UNSET = object()
+
+_get_tool_category: Callable[[str, dict[str, Any] | None], str] | None = None
+
+_last_facts: HookFacts | None = None
+
+
+def _tool_category(tool_name: str, tool_input: Any) -> str:
+    global _get_tool_category
+    if _get_tool_category is None:
+        from hooks.gate_config import get_tool_category
+
+        _get_tool_category = get_tool_category
+    return _get_tool_category(tool_name, tool_input if isinstance(tool_input, dict) else None)
+
+
+def _compile(pattern: str | None) -> re.Pattern[str] | None:
+    return re.compile(pattern) if pattern else None
+
+
+class HookFacts:
+    """Per-hook values conditions test, computed on first use."""
+
+    __slots__ = ("ctx", "tool_name", "tool_input", "_category", "_input_str")
+
+    def __init__(self, ctx: HookContext):
+        self.ctx = ctx
+        self.tool_name = ctx.tool_name
+        self.tool_input = ctx.tool_input
+        self._category: Any = _UNSET
+        self._input_str: str | None = None
+
+    def describes(self, ctx: HookContext) -> bool:
+        return (
+            self.ctx is ctx
+            and self.tool_name == ctx.tool_name
+            and self.tool_input is ctx.tool_input
+        )
+
+    @property
+    def category(self) -> str | None:
+        """The tool's category (hooks.gate_config.get_tool_category), None without a tool."""
+        if self._category is _UNSET:
+            self._category = (
+                _tool_category(self.tool_name, self.tool_input) if self.tool_name else None
+            )
+        return self._category
+
+    @property
+    def input_str(self) -> str:
+        """The stringified tool input tool_input_pattern searches."""
+        if self._input_str is None:
+            self._input_str = str(self.tool_input)
+        return self._input_str
+
+
+def hook_facts(ctx: HookContext) -> HookFacts:
+    """Get the facts for a hook, reusing them while every gate evaluates it."""
+    global _last_facts
+    facts = _last_facts
+    if facts is None or not facts.describes(ctx):
+        facts = _last_facts = HookFacts(ctx)
+    return facts
+
+
+class CompiledCondition:
+    """A GateCondition with its matchers precompiled."""
+
+    __slots__ = (
+        "condition",
+        "_event",
+        "_event_re",
+        "_tool_name_re",
+        "_tool_input_re",
+        "_subagent_type_re",
+        "_excluded_categories",
+        "_tool_name_matches",
+    )
+
+    def __init__(self, condition: GateCondition):
+        self.condition = condition
+        event = condition.hook_event
+        self._event = event
+        # Regex if it starts with ^ or ends with $ or contains |, else equality
+        self._event_re = (
+            re.compile(event) if event and any(c in event for c in _REGEX_CHARS) else None
+        )
+        self._tool_name_re = _compile(condition.tool_name_pattern)
+        self._tool_input_re = _compile(condition.tool_input_pattern)
+        self._subagent_type_re = _compile(condition.subagent_type_pattern)
+        self._excluded_categories = frozenset(condition.excluded_tool_categories or ())
+        self._tool_name_matches: dict[str, bool] = {}
+
+    def can_match(self, event: str, category: str | None) -> bool:
+        """Check the parts of the condition fixed by the hook event and tool category."""
+        if self._event:
+            if self._event_re is not None:
+                if not self._event_re.search(event):
+                    return False
+            elif self._event != event:
+                return False
+        return category is None or category not in self._excluded_categories
+
+    def matches(
+        self,
+        ctx: HookContext,
+        facts: HookFacts,
+        state: GateState,
+        session_state: SessionState,
+    ) -> bool:
+        """Check the rest of the condition, for a hook can_match() passed."""
+        condition = self.condition
+        if condition.current_status and state.status != condition.current_status:
+            return False
+
+        if self._tool_name_re is not None:
+            tool_name = facts.tool_name
+            if not tool_name:
+                return False
+            matched = self._tool_name_matches.get(tool_name)
+            if matched is None:
+                matched = self._tool_name_matches[tool_name] = bool(
+                    self._tool_name_re.search(tool_name)
+                )
+            if not matched:
+                return False
+
+        if self._tool_input_re is not None and not self._tool_input_re.search(facts.input_str):
+            return False
+
+        if self._subagent_type_re is not None:
+            if not ctx.subagent_type or not self._subagent_type_re.search(ctx.subagent_type):
+                return False
+
+        if condition.min_ops_since_open is not None:
+            if state.ops_since_open < condition.min_ops_since_open:
+                return False
+        if condition.min_ops_since_close is not None:
+            if state.ops_since_close < condition.min_ops_since_close:
+                return False
+        if condition.min_turns_since_open is not None:
+            diff = session_state.global_turn_count - state.last_open_turn
+            if diff < condition.min_turns_since_open:
+                return False
+
+        # Custom checks may record metrics, so they run last
+        if condition.custom_check:
+            from lib.gates.custom_conditions import check_custom_condition
+
+            if not check_custom_condition(condition.custom_check, ctx, state, session_state):
+                return False
+
+        return True
+
+
+class DispatchTable:
+    """A gate's triggers and policies, by the hook event and tool category they can match."""
+
+    def __init__(self, triggers: list[GateTrigger], policies: list[GatePolicy]):
+        self.triggers = [(trigger, CompiledCondition(trigger.condition)) for trigger in triggers]
+        self.policies = [(policy, CompiledCondition(policy.condition)) for policy in policies]
+        self._compiled = {id(c.condition): c for _, c in self.triggers + self.policies}
+        # Without excluded categories the category can't narrow the candidates
+        self.uses_categories = any(
+            c.condition.excluded_tool_categories for _, c in self.triggers + self.policies
+        )
+        self._entries: dict[
+            tuple[str, str | None],
+            tuple[
+                list[tuple[GateTrigger, CompiledCondition]],
+                list[tuple[GatePolicy, CompiledCondition]],
+            ],
+        ] = {}
+
+    def candidates(
+        self, event: str, category: str | None
+    ) -> tuple[
+        list[tuple[GateTrigger, CompiledCondition]], list[tuple[GatePolicy, CompiledCondition]]
+    ]:
+        """Get the (triggers, policies) that can match a hook, in config order."""
+        if not self.uses_categories:
+            category = None
+        key = (event, category)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = (
+                [item for item in self.triggers if item[1].can_match(event, category)],
+                [item for item in self.policies if item[1].can_match(event, category)],
+            )
+        return entry
+
+    def compiled(self, condition: GateCondition) -> CompiledCondition:
+        """Get the compiled form of a condition (compiling it if not the table's own)."""
+        compiled = self._compiled.get(id(condition))
+        if compiled is None or compiled.condition is not condition:
+            compiled = CompiledCondition(condition)
+        return compiled
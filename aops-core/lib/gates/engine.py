@@ -1,5 +1,4 @@
 import logging
-import re
 import time
 from typing import Any
 
@@ -13,6 +12,7 @@ from lib.gate_types import (
     GateStatus,
     GateTransition,
 )
+from lib.gates.dispatch import DispatchTable, hook_facts
 from lib.session_paths import get_gate_file_path
 from lib.session_state import SessionState
 from lib.template_registry import TemplateRegistry
@@ -27,6 +27,7 @@ class GenericGate:
 
     def __init__(self, config: GateConfig):
         self.config = config
+        self._table = DispatchTable(config.triggers, config.policies)
 
     @property
     def name(self) -> str:
@@ -45,80 +46,18 @@ class GenericGate:
         state: GateState,
         session_state: SessionState,
     ) -> bool:
-        # 0. Check Current Status
-        if condition.current_status:
-            if state.status != condition.current_status:
-                return False
-
-        # 1. Hook Event Match
-        if condition.hook_event:
-            # Match regex if it starts with ^ or ends with $ or contains |
-            if any(c in condition.hook_event for c in "^$|[]()"):
-                if not re.search(condition.hook_event, ctx.hook_event):
-                    return False
-            else:
-                # Simple equality check for backward compatibility and speed
-                if condition.hook_event != ctx.hook_event:
-                    return False
-
-        # 2. Tool Name Pattern
-        if condition.tool_name_pattern:
-            if not ctx.tool_name:
-                return False
-            if not re.search(condition.tool_name_pattern, ctx.tool_name):
-                return False
-
-        # 2.5 Excluded Tool Categories
-        if condition.excluded_tool_categories:
-            from hooks.gate_config import get_tool_category
-
-            if (
-                ctx.tool_name
-                and get_tool_category(
-                    ctx.tool_name,
-                    ctx.tool_input if isinstance(ctx.tool_input, dict) else None,
-                )
-                in condition.excluded_tool_categories
-            ):
-                return False
-
-        # 3. Tool Input Pattern
-        if condition.tool_input_pattern:
-            # Stringify tool_input and regex search
-            input_str = str(ctx.tool_input)
-            if not re.search(condition.tool_input_pattern, input_str):
-                return False
-
-        # 3.5 Subagent Type Pattern
-        if condition.subagent_type_pattern:
-            if not ctx.subagent_type:
-                return False
-            if not re.search(condition.subagent_type_pattern, ctx.subagent_type):
-                return False
-
-        # 4. State Metrics Checks
-        if condition.min_ops_since_open is not None:
-            if state.ops_since_open < condition.min_ops_since_open:
-                return False
-        if condition.min_ops_since_close is not None:
-            if state.ops_since_close < condition.min_ops_since_close:
-                return False
-        if condition.min_turns_since_open is not None:
-            current_turn = session_state.global_turn_count
-            diff = current_turn - state.last_open_turn
-            if diff < condition.min_turns_since_open:
-                return False
-        # ... implement other metric checks as needed ...
-
-        # 5. Custom Check
-        if condition.custom_check:
-            # Import dynamically or use registry
-            from lib.gates.custom_conditions import check_custom_condition
-
-            if not check_custom_condition(condition.custom_check, ctx, state, session_state):
-                return False
-
-        return True
+        facts = hook_facts(ctx)
+        compiled = self._table.compiled(condition)
+        category = facts.category if condition.excluded_tool_categories else None
+        return compiled.can_match(ctx.hook_event, category) and compiled.matches(
+            ctx, facts, state, session_state
+        )
+
+    def _candidates(self, ctx: HookContext):
+        """Get the hook's facts and the (triggers, policies) that can match it."""
+        facts = hook_facts(ctx)
+        category = facts.category if self._table.uses_categories else None
+        return facts, self._table.candidates(ctx.hook_event, category)
 
     def _build_template_variables(
         self, ctx: HookContext, state: GateState, session_state: SessionState
@@ -262,8 +201,9 @@ class GenericGate:
         injections = []
         transition_occurred = False
 
-        for trigger in self.config.triggers:
-            if self._evaluate_condition(trigger.condition, ctx, state, session_state):
+        facts, (triggers, _) = self._candidates(ctx)
+        for trigger, condition in triggers:
+            if condition.matches(ctx, facts, state, session_state):
                 result = self._apply_transition(trigger.transition, ctx, state, session_state)
                 if result.system_message:
                     messages.append(result.system_message)
@@ -356,8 +296,9 @@ class GenericGate:
         """Evaluate policies (Blocking/Warning)."""
         state = self._get_state(session_state)
 
-        for policy in self.config.policies:
-            if self._evaluate_condition(policy.condition, ctx, state, session_state):
+        facts, (_, policies) = self._candidates(ctx)
+        for policy, condition in policies:
+            if condition.matches(ctx, facts, state, session_state):
                 # Policy matched!
 
                 # Custom Action (Side Effects before message rendering)
@@ -24,7 +24,11 @@ class GateRegistry:
 
     @classmethod
     def initialize(cls) -> None:
-        """Initialize all gates (import and register them)."""
+        """Initialize all gates (import, compile and register them).
+
+        Building each GenericGate compiles its conditions into its dispatch
+        table (lib.gates.dispatch), so this is done once per process.
+        """
         if cls._initialized:
             return
 
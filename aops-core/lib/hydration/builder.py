@@ -19,23 +19,16 @@ from lib.hook_utils import (
 from lib.hook_utils import (
     write_temp_file as _write_temp,
 )
+from lib.hydration.context_cache import get_static_context
 from lib.hydration.context_loaders import (
     get_task_work_state,
     load_environment_variables_context,
     load_framework_paths,
-    load_glossary,
     load_mcp_tools_context,
-    load_project_context_index,
-    load_project_paths_context,
-    load_project_rules,
-    load_scripts_index,
-    load_skills_index,
-    load_workflows_index,
 )
 from lib.session_paths import get_gate_file_path
 from lib.session_reader import extract_router_context
 from lib.session_state import SessionState
-from lib.template_loader import load_template
 
 # Temp directory category
 TEMP_CATEGORY = "hydrator"
@@ -116,36 +109,31 @@ def build_hydration_instruction(
                 f"Context extraction failed (degrading gracefully): {type(e).__name__}: {e}"
             )
 
-    # Load all context components
-    glossary = load_glossary()
+    # Framework and project files (cached until they change), then the
+    # prompt-dependent sections
+    static = get_static_context(CONTEXT_TEMPLATE_FILE, INSTRUCTION_TEMPLATE_FILE)
     framework_paths = load_framework_paths()
     mcp_tools = load_mcp_tools_context()
     env_vars = load_environment_variables_context()
-    project_paths = load_project_paths_context()
-    workflows_index = load_workflows_index(prompt)
-    skills_index = load_skills_index()
-    scripts_index = load_scripts_index()
-    project_rules = load_project_rules()
+    workflows_index = static.workflows_index(prompt)
     task_state = get_task_work_state()
     relevant_files = get_formatted_relevant_paths(prompt, max_files=10)
-    project_context_index = load_project_context_index()
 
     # Build full context for temp file
-    context_template = load_template(CONTEXT_TEMPLATE_FILE)
-    full_context = context_template.format(
+    full_context = static.context_template.format(
         prompt=prompt,
         session_context=session_context,
-        glossary=glossary,
+        glossary=static.glossary,
         framework_paths=framework_paths,
         mcp_tools=mcp_tools,
         env_vars=env_vars,
-        project_paths=project_paths,
-        project_context_index=project_context_index,
-        project_rules=project_rules,
+        project_paths=static.project_paths,
+        project_context_index=static.project_context_index,
+        project_rules=static.project_rules,
         relevant_files=relevant_files,
         workflows_index=workflows_index,
-        skills_index=skills_index,
-        scripts_index=scripts_index,
+        skills_index=static.skills_index,
+        scripts_index=static.scripts_index,
         task_state=task_state,
     )
 
@@ -184,8 +172,7 @@ def build_hydration_instruction(
         prompt_preview += "..."
 
     # Build short instruction with file path
-    instruction_template = load_template(INSTRUCTION_TEMPLATE_FILE)
-    instruction = instruction_template.format(
+    instruction = static.instruction_template.format(
         prompt_preview=prompt_preview,
         temp_path=str(temp_path),
     )
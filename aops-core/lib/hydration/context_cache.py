@@ -0,0 +1,191 @@
+"""Hydration context cache - the prompt-independent part of the hydrator context.
+
+build_hydration_instruction used to reread and strip GLOSSARY.md, SKILLS.md,
+SCRIPTS.md, WORKFLOWS.md, the project rules, context map and workflows, and
+re-parse workflow frontmatter to resolve bases, for every hydratable prompt.
+None of that depends on the prompt.
+
+get_static_context() returns those sections read once. The bundle is keyed
+by a fingerprint of its inputs:
+- the plugin version and root, and the working directory,
+- (path, mtime, size) of every file the sections are read from, and the
+  directories whose listing they depend on,
+
+and stored content-addressed, as <fingerprint hash>.json in the hydration
+cache directory (lib.cache_utils.get_cache_dir). A changed
+file gives a new fingerprint, so a stale bundle is never read; old bundles
+are pruned when a new one is written. Bundles already loaded by the process
+(the router daemon) are reused from memory.
+
+Per prompt, only the fingerprint is computed (stats, no reads). The
+prompt-dependent parts - relevant files, the workflows selected by the
+prompt, session context - are still built per prompt by the caller, from
+the bundle's scanned workflows.
+
+Set AOPS_CACHE=0 to read the sections from scratch every time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from lib.cache_utils import caches_enabled, get_cache_dir, write_cache_file
+from lib.hydration import context_loaders
+from lib.session_state import _get_plugin_version
+from lib.template_loader import load_template
+
+# Bump when the bundle's sections or how they are read change
+BUNDLE_VERSION = 1
+
+# Bundles kept on disk (one per project directory and framework version in use)
+_KEEP_BUNDLES = 16
+
+# Bundles loaded by this process, by fingerprint hash
+_loaded: dict[str, StaticContext] = {}
+
+
+@dataclass
+class StaticContext:
+    """The prompt-independent sections of the hydrator context."""
+
+    glossary: str
+    skills_index: str
+    scripts_index: str
+    project_rules: str
+    project_context_index: str
+    project_paths: str
+    base_workflows: str
+    # context_loaders._scan_project_workflows()
+    project_workflows: dict
+    # context_loaders._scan_global_workflows()
+    global_workflows: dict[str, dict]
+    context_template: str
+    instruction_template: str
+
+    def workflows_index(self, prompt: str) -> str:
+        """Build the workflows section for a prompt (see load_workflows_index)."""
+        return (
+            self.base_workflows
+            + context_loaders._select_project_workflows(self.project_workflows, prompt)
+            + context_loaders._load_global_workflow_content(prompt, self.global_workflows.get)
+        )
+
+
+def _read_static_context(context_template: Path, instruction_template: Path) -> StaticContext:
+    return StaticContext(
+        glossary=context_loaders.load_glossary(),
+        skills_index=context_loaders.load_skills_index(),
+        scripts_index=context_loaders.load_scripts_index(),
+        project_rules=context_loaders.load_project_rules(),
+        project_context_index=context_loaders.load_project_context_index(),
+        project_paths=context_loaders.load_project_paths_context(),
+        base_workflows=context_loaders._load_base_workflows(),
+        project_workflows=context_loaders._scan_project_workflows(),
+        global_workflows=context_loaders._scan_global_workflows(),
+        context_template=load_template(context_template),
+        instruction_template=load_template(instruction_template),
+    )
+
+
+def _stat(path: Path) -> list | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _fingerprint(context_template: Path, instruction_template: Path) -> dict:
+    """Describe every input of the static sections, without reading them."""
+    plugin_root = context_loaders.get_plugin_root()
+    cwd = Path.cwd()
+    agent_dir = cwd / ".agent"
+    paths = [
+        plugin_root / "GLOSSARY.md",
+        plugin_root / "SKILLS.md",
+        plugin_root / "SCRIPTS.md",
+        plugin_root / "skills" / "hydrator" / "WORKFLOWS.md",
+        context_template,
+        instruction_template,
+        cwd / "projects.json",
+        agent_dir,
+        agent_dir / "context-map.json",
+        agent_dir / "WORKFLOWS.md",
+    ]
+    # Directories are listed: their mtimes change when files are added or removed
+    for directory, pattern in [
+        (agent_dir / "rules", "*.md"),
+        (agent_dir / "workflows", "*.md"),
+        (plugin_root / context_loaders.GLOBAL_WORKFLOWS_DIR, "**/*.md"),
+    ]:
+        paths.append(directory)
+        if directory.is_dir():
+            paths.extend(sorted(directory.glob(pattern)))
+    return {
+        "version": BUNDLE_VERSION,
+        "plugin_version": _get_plugin_version(),
+        "plugin_root": str(plugin_root),
+        "cwd": str(cwd),
+        "files": [[str(path), _stat(path)] for path in paths],
+    }
+
+
+def get_bundle_path(key: str) -> Path:
+    """Get the cache file for a bundle by its fingerprint hash."""
+    return get_cache_dir("hydration") / f"{key}.json"
+
+
+def get_static_context(context_template: Path, instruction_template: Path) -> StaticContext:
+    """Get the static hydrator context, reading it only if its inputs changed.
+
+    Args:
+        context_template: The hydrator context template (hooks/templates/)
+        instruction_template: The hydration instruction template
+
+    Raises:
+        FileNotFoundError: If a framework file is missing (fail fast, as the
+            context loaders do; nothing is cached)
+    """
+    if not caches_enabled():
+        return _read_static_context(context_template, instruction_template)
+
+    fingerprint = _fingerprint(context_template, instruction_template)
+    key = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()[:16]
+    context = _loaded.get(key)
+    if context is not None:
+        return context
+
+    path = get_bundle_path(key)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("fingerprint") == fingerprint:
+            context = StaticContext(**data["sections"])
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        context = None
+
+    if context is None:
+        context = _read_static_context(context_template, instruction_template)
+        _save(path, {"fingerprint": fingerprint, "sections": asdict(context)})
+    _loaded[key] = context
+    return context
+
+
+def _save(path: Path, data: dict) -> None:
+    if write_cache_file(path, json.dumps(data, separators=(",", ":")).encode()):
+        _prune(path.parent)
+
+
+def _prune(cache_dir: Path) -> None:
+    """Delete all but the most recently written bundles."""
+    bundles = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            bundles.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            pass
+    bundles.sort(reverse=True)
+    for _, path in bundles[_KEEP_BUNDLES:]:
+        path.unlink(missing_ok=True)
@@ -1,5 +1,6 @@
 import json
 import re
+from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
 
@@ -98,26 +99,36 @@ def _load_project_rules() -> str:
     return "\n".join(lines)
 
 
-def _load_project_workflows(prompt: str = "") -> str:
-    """Load project-specific workflows from .agent/workflows/ in cwd."""
+def _scan_project_workflows() -> dict:
+    """Read project-specific workflows from .agent/ in cwd (the prompt-independent part).
+
+    Returns:
+        {"table": the section listing the workflows, "workflows": [{"stem",
+        "name", "content"}]}, content without frontmatter. A project
+        WORKFLOWS.md index replaces the listing and workflows.
+    """
     cwd = Path.cwd()
     project_agent_dir = cwd / ".agent"
+    empty: dict = {"table": "", "workflows": []}
 
     if not project_agent_dir.exists():
-        return ""
+        return empty
 
     project_index = project_agent_dir / "WORKFLOWS.md"
     if project_index.exists():
         content = project_index.read_text()
-        return f"\n\n## Project-Specific Workflows ({cwd.name})\n\n{_strip_frontmatter(content)}"
+        return {
+            "table": f"\n\n## Project-Specific Workflows ({cwd.name})\n\n{_strip_frontmatter(content)}",
+            "workflows": [],
+        }
 
     workflows_dir = project_agent_dir / "workflows"
     if not workflows_dir.exists():
-        return ""
+        return empty
 
     workflow_files = sorted(workflows_dir.glob("*.md"))
     if not workflow_files:
-        return ""
+        return empty
 
     lines = [f"\n\n## Project-Specific Workflows ({cwd.name})", ""]
     lines.append(f"Location: `{workflows_dir}`")
@@ -127,8 +138,7 @@ def _load_project_workflows(prompt: str = "") -> str:
     lines.append("| Workflow | Description | Triggers | File |")
     lines.append("|----------|-------------|----------|------|")
 
-    included_workflows = []
-    prompt_lower = prompt.lower()
+    workflows = []
 
     import yaml
 
@@ -159,47 +169,113 @@ def _load_project_workflows(prompt: str = "") -> str:
             desc_table = desc.replace("|", "-")[:100] + ("..." if len(desc) > 100 else "")
             triggers_table = triggers.replace("|", "-")
             lines.append(f"| {name} | {desc_table} | {triggers_table} | `{wf_file.name}` |")
-
-            filename_keywords = set(
-                wf_file.stem.lower().replace("-", " ").replace("_", " ").split()
+            workflows.append(
+                {"stem": wf_file.stem, "name": name, "content": _strip_frontmatter(content)}
             )
-            if (
-                any(
-                    re.search(r"\b" + re.escape(kw) + r"\b", prompt_lower)
-                    for kw in filename_keywords
-                )
-                or wf_file.stem.lower() in prompt_lower
-            ):
-                header_name = name
-                if name != wf_file.stem:
-                    header_name = f"{name} ({wf_file.stem})"
-                included_workflows.append(
-                    f"\n\n### {header_name} (Project Instructions)\n\n{_strip_frontmatter(content)}"
-                )
         except OSError:
             pass
 
-    result = "\n".join(lines)
+    return {"table": "\n".join(lines), "workflows": workflows}
+
+
+def _select_project_workflows(scan: dict, prompt: str = "") -> str:
+    """Format scanned project workflows, with the content of those the prompt names."""
+    prompt_lower = prompt.lower()
+    included_workflows = []
+    for workflow in scan["workflows"]:
+        stem = workflow["stem"]
+        filename_keywords = set(stem.lower().replace("-", " ").replace("_", " ").split())
+        if (
+            any(re.search(r"\b" + re.escape(kw) + r"\b", prompt_lower) for kw in filename_keywords)
+            or stem.lower() in prompt_lower
+        ):
+            name = workflow["name"]
+            header_name = name
+            if name != stem:
+                header_name = f"{name} ({stem})"
+            included_workflows.append(
+                f"\n\n### {header_name} (Project Instructions)\n\n{workflow['content']}"
+            )
+
+    result = scan["table"]
     if included_workflows:
         result += "\n" + "".join(included_workflows)
     return result
 
 
-def _load_global_workflow_content(prompt: str = "") -> str:
-    """Selectively load the content of relevant global workflows and their bases."""
+def _load_project_workflows(prompt: str = "") -> str:
+    """Load project-specific workflows from .agent/workflows/ in cwd."""
+    return _select_project_workflows(_scan_project_workflows(), prompt)
+
+
+GLOBAL_WORKFLOWS_DIR = "skills/hydrator/workflows"
+
+
+def _read_global_workflow(rel_path: str) -> dict | None:
+    """Read one global workflow: {"name", "bases" (as paths), "content"}, None if unreadable."""
     import yaml
 
+    path = get_plugin_root() / rel_path
+    if not path.exists():
+        return None
+
+    try:
+        raw_content = path.read_text()
+    except OSError:
+        return None
+
+    bases_paths = []
+    # Parse frontmatter to find bases
+    if raw_content.startswith("---"):
+        parts = raw_content.split("---", 2)
+        if len(parts) >= 3:
+            try:
+                fm = yaml.safe_load(parts[1])
+                if isinstance(fm, dict):
+                    bases = fm.get("bases", [])
+                    if isinstance(bases, list):
+                        # Convert base ID to path (e.g. base-commit -> skills/hydrator/workflows/base-commit.md)
+                        bases_paths = [f"{GLOBAL_WORKFLOWS_DIR}/{base}.md" for base in bases]
+            except Exception:
+                pass
+
+    return {
+        "name": Path(rel_path).stem,
+        "bases": bases_paths,
+        "content": _strip_frontmatter(raw_content),
+    }
+
+
+def _scan_global_workflows() -> dict[str, dict]:
+    """Read every global workflow, by path relative to the plugin root."""
+    plugin_root = get_plugin_root()
+    workflows = {}
+    for path in sorted((plugin_root / GLOBAL_WORKFLOWS_DIR).rglob("*.md")):
+        rel_path = path.relative_to(plugin_root).as_posix()
+        workflow = _read_global_workflow(rel_path)
+        if workflow is not None:
+            workflows[rel_path] = workflow
+    return workflows
+
+
+def _load_global_workflow_content(
+    prompt: str = "", lookup: Callable[[str], dict | None] = _read_global_workflow
+) -> str:
+    """Selectively load the content of relevant global workflows and their bases.
+
+    Args:
+        prompt: The user's prompt
+        lookup: Gets a workflow by relative path (default: read it; the
+            hydration context cache passes its scanned workflows)
+    """
     from lib.file_index import get_relevant_file_paths
 
     relevant_paths = get_relevant_file_paths(prompt, max_files=20)
-    workflow_paths = [
-        p for p in relevant_paths if p["path"].startswith("skills/hydrator/workflows/")
-    ]
+    workflow_paths = [p for p in relevant_paths if p["path"].startswith(f"{GLOBAL_WORKFLOWS_DIR}/")]
 
     if not workflow_paths:
         return ""
 
-    plugin_root = get_plugin_root()
     included_content = {}  # Use dict to avoid duplicates: name -> content
 
     # Use a queue for breadth-first traversal of bases
@@ -212,34 +288,13 @@ def _load_global_workflow_content(prompt: str = "") -> str:
             continue
         processed.add(rel_path)
 
-        path = plugin_root / rel_path
-        if not path.exists():
+        workflow = lookup(rel_path)
+        if workflow is None:
             continue
-
-        try:
-            raw_content = path.read_text()
-            wf_name = Path(rel_path).stem
-
-            # Parse frontmatter to find bases
-            if raw_content.startswith("---"):
-                parts = raw_content.split("---", 2)
-                if len(parts) >= 3:
-                    try:
-                        fm = yaml.safe_load(parts[1])
-                        if isinstance(fm, dict):
-                            bases = fm.get("bases", [])
-                            if isinstance(bases, list):
-                                for base in bases:
-                                    # Convert base ID to path (e.g. base-commit -> skills/hydrator/workflows/base-commit.md)
-                                    base_path = f"skills/hydrator/workflows/{base}.md"
-                                    if base_path not in processed:
-                                        queue.append(base_path)
-                    except Exception:
-                        pass
-
-            included_content[wf_name] = _strip_frontmatter(raw_content)
-        except OSError:
-            pass
+        for base_path in workflow["bases"]:
+            if base_path not in processed:
+                queue.append(base_path)
+        included_content[workflow["name"]] = workflow["content"]
 
     # Format output
     result = []
@@ -251,17 +306,19 @@ def _load_global_workflow_content(prompt: str = "") -> str:
     return "".join(result)
 
 
-def load_workflows_index(prompt: str = "") -> str:
-    """Load WORKFLOWS.md for hydrator context."""
-    plugin_root = get_plugin_root()
-    workflows_path = plugin_root / "skills" / "hydrator" / "WORKFLOWS.md"
+def _load_base_workflows() -> str:
+    """Load the hydrator skill's WORKFLOWS.md, without frontmatter."""
+    workflows_path = get_plugin_root() / "skills" / "hydrator" / "WORKFLOWS.md"
 
     if not workflows_path.exists():
         raise FileNotFoundError(f"Framework file not found: {workflows_path}")
 
-    content = workflows_path.read_text()
-    base_workflows = _strip_frontmatter(content)
+    return _strip_frontmatter(workflows_path.read_text())
+
 
+def load_workflows_index(prompt: str = "") -> str:
+    """Load WORKFLOWS.md for hydrator context."""
+    base_workflows = _load_base_workflows()
     project_workflows = _load_project_workflows(prompt)
     global_workflow_content = _load_global_workflow_content(prompt)
 
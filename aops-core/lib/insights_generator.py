@@ -6,6 +6,7 @@ Used by both automatic generation (Stop hook) and manual generation (skill).
 
 from __future__ import annotations
 
+import fnmatch
 import json
 import os
 import re
@@ -16,6 +17,7 @@ from typing import Any
 
 from lib.paths import get_plugin_root, get_summaries_dir
 from lib.session_reader import extract_gate_context, find_sessions
+from lib.summary_catalog import SummaryCatalog
 
 
 class InsightsValidationError(Exception):
@@ -422,7 +424,12 @@ def validate_insights_schema(insights: dict[str, Any]) -> None:
 # get_summaries_dir is now imported from lib.paths
 
 
-def find_existing_insights(date: str, session_id: str, index: int | None = None) -> Path | None:
+def find_existing_insights(
+    date: str,
+    session_id: str,
+    index: int | None = None,
+    catalog: SummaryCatalog | None = None,
+) -> Path | None:
     """Find existing insights file for a session ID.
 
     Args:
@@ -432,11 +439,13 @@ def find_existing_insights(date: str, session_id: str, index: int | None = None)
                If None, finds *any* insights file for the session (default behavior).
                If > 0, finds files ending in -{index}.json.
                If 0, finds files NOT ending in -{digit}.json.
+        catalog: Summary catalog to search (default: loaded for summaries/)
 
     Returns:
         Path to existing insights file if found, None otherwise
     """
-    summaries_dir = get_summaries_dir()
+    if catalog is None:
+        catalog = SummaryCatalog.load(get_summaries_dir())
     date_compact = date[:10].replace("-", "") if "T" in date else date.replace("-", "")
 
     # Search for insights with this session_id
@@ -456,28 +465,32 @@ def find_existing_insights(date: str, session_id: str, index: int | None = None)
         f"{date_compact}-*{session_id}*.json",  # Legacy: session_id anywhere
         f"{date[:10]}-{session_id}.json",  # Old format with dashes in date
     ]
+    # Every pattern starts with one of these, so only that day's entries can match
+    names = [entry.name for entry in catalog.with_prefix(date_compact)]
+    if date[:10] != date_compact:
+        names += [entry.name for entry in catalog.with_prefix(date[:10])]
 
     for pattern in patterns:
-        matches = list(summaries_dir.glob(pattern))
+        matches = [name for name in names if fnmatch.fnmatchcase(name, pattern)]
         if matches:
             if index is not None:
                 # Filter matches by index
                 filtered = []
-                for path in matches:
-                    stem = path.stem
+                for name in matches:
+                    stem = name[: -len(".json")]
                     if index > 0:
                         # Must end with -{index}
                         if stem.endswith(f"-{index}"):
-                            filtered.append(path)
+                            filtered.append(name)
                     else:
                         # Must NOT end with -{digit}
                         if not re.search(r"-\d+$", stem):
-                            filtered.append(path)
+                            filtered.append(name)
 
                 if filtered:
-                    return filtered[0]
+                    return catalog.summaries_dir / filtered[0]
             else:
-                return matches[0]
+                return catalog.summaries_dir / matches[0]
     return None
 
 
@@ -593,17 +606,22 @@ def merge_insights(existing: dict[str, Any], new: dict[str, Any]) -> dict[str, A
 
 
 def write_insights_file(
-    path: Path, insights: dict[str, Any], session_id: str | None = None
+    path: Path,
+    insights: dict[str, Any],
+    session_id: str | None = None,
+    catalog: SummaryCatalog | None = None,
 ) -> None:
     """Atomically write insights JSON file.
 
     Uses temp file + rename pattern for atomic writes.
     Optionally loads and merges base information from session status file.
+    The file is recorded in the summary catalog of its directory.
 
     Args:
         path: Target file path
         insights: Insights dictionary to write
         session_id: Optional session ID to load status file for enrichment
+        catalog: Summary catalog of path's directory (default: loaded for it)
 
     Raises:
         Exception: If write fails
@@ -655,6 +673,9 @@ def write_insights_file(
 
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Load before writing: after it, the directory has changed and would be rescanned
+    if catalog is None:
+        catalog = SummaryCatalog.load(path.parent)
 
     # Create temp file in same directory
     fd, temp_path_str = tempfile.mkstemp(suffix=".json", prefix="insights-", dir=str(path.parent))
@@ -675,6 +696,9 @@ def write_insights_file(
         temp_path.unlink(missing_ok=True)
         raise
 
+    catalog.record(path, insights)
+    catalog.save()
+
 
 def generate_fallback_insights(
     metadata: dict[str, str], operational_metrics: dict[str, Any]
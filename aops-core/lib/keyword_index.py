@@ -0,0 +1,76 @@
+"""
+Keyword Index - find every keyword occurring in a text in one pass.
+
+An Aho-Corasick automaton over a fixed set of keywords: a trie of the
+keywords with failure links, so scanning a text visits each character once
+however many keywords there are, instead of one substring search per keyword.
+
+Keywords match as plain substrings, exactly as `keyword in text` would
+(case-sensitive: lowercase both sides first for case-insensitive matching).
+
+Usage:
+    from lib.keyword_index import KeywordIndex
+
+    index = KeywordIndex(["hydrator", "hook", "gate"])
+    index.find("fix the hydrator hook")  # {0, 1}
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+
+class KeywordIndex:
+    """Aho-Corasick automaton over a list of keywords."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(keywords)
+        # State 0 is the root; each state is a trie node
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Keyword indices ending at each state, including via failure links
+        self._out: list[tuple[int, ...]] = [()]
+
+        for index, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        # Breadth-first, so each state's failure target is complete first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def find(self, text: str) -> set[int]:
+        """Get the indices of the keywords occurring in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
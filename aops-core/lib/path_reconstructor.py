@@ -18,6 +18,7 @@ from enum import Enum
 from pathlib import Path
 
 from lib.paths import get_summaries_dir
+from lib.summary_catalog import SummaryCatalog
 
 
 class EventType(Enum):
@@ -375,21 +376,21 @@ def reconstruct_path(hours: int = 24) -> ReconstructedPath:
     seen_sessions: set[str] = set()
     filtered_count = 0
 
-    for json_path in sorted(summaries_dir.glob("*.json"), reverse=True):
+    catalog = SummaryCatalog.load(summaries_dir)
+    for entry in catalog.since(cutoff.strftime("%Y%m%d"), cutoff.strftime("%H")):
         # Quick date filter from filename (YYYYMMDD-HH-...)
-        try:
-            name = json_path.stem
-            date_part = name[:8]
-            hour_part = name[9:11] if len(name) > 10 and name[8] == "-" else "00"
-            file_dt = datetime.strptime(f"{date_part}{hour_part}", "%Y%m%d%H")
-            file_dt = file_dt.astimezone()
-            if file_dt < cutoff:
-                continue
-        except (ValueError, IndexError):
+        if entry.hour is None:
+            continue
+        file_dt = datetime.strptime(f"{entry.date}{entry.hour}", "%Y%m%d%H").astimezone()
+        if file_dt < cutoff:
+            continue
+
+        # Skip sessions already seen without loading them
+        if not entry.readable or not entry.session_id or entry.session_id in seen_sessions:
             continue
 
         try:
-            with open(json_path, encoding="utf-8") as f:
+            with open(summaries_dir / entry.name, encoding="utf-8") as f:
                 summary = json.load(f)
         except (json.JSONDecodeError, OSError):
             continue
@@ -400,7 +401,7 @@ def reconstruct_path(hours: int = 24) -> ReconstructedPath:
         seen_sessions.add(session_id)
 
         # Extract filename slug for fallback goal
-        filename_slug = _extract_slug_from_filename(name)
+        filename_slug = _extract_slug_from_filename(entry.name[: -len(".json")])
 
         thread = _build_thread_from_summary(summary, filename_slug, resolver)
         if thread:
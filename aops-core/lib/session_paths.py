@@ -9,7 +9,7 @@ where HH is the 24-hour local time when the session was created.
 
 import hashlib
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 
@@ -311,6 +311,71 @@ def get_session_file_path(
     )
 
 
+def get_session_pointer_path(session_id: str) -> Path:
+    """Get the file naming a session's current state file.
+
+    Written by SessionState.save, so lookups read one small file instead of
+    globbing the status directory.
+    """
+    short_hash = get_session_short_hash(session_id)
+    return get_session_status_dir(session_id) / f".{short_hash}.current"
+
+
+def read_session_pointer(session_id: str) -> Path | None:
+    """Get the state file the session's pointer names.
+
+    Returns:
+        The state file, or None if there's no pointer, the file is gone, or
+        it isn't from today or yesterday (the window find_session_file searches)
+    """
+    pointer = get_session_pointer_path(session_id)
+    try:
+        name = pointer.read_text().strip()
+    except OSError:
+        return None
+    now = datetime.now()
+    if name[:8] not in (now.strftime("%Y%m%d"), (now - timedelta(days=1)).strftime("%Y%m%d")):
+        return None
+    path = pointer.parent / name
+    return path if path.is_file() else None
+
+
+def find_session_file(session_id: str) -> Path | None:
+    """Find the existing session state file for a session.
+
+    Reads the session's pointer file (see get_session_pointer_path) when
+    there is one. Otherwise searches today's and yesterday's files, new format
+    (YYYYMMDD-HH-hash.json, any hour) before legacy format (YYYYMMDD-hash.json).
+    When several files match, the most recently modified wins.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Path to the state file, or None if the session has no state yet
+    """
+    pointed = read_session_pointer(session_id)
+    if pointed is not None:
+        return pointed
+
+    now = datetime.now()
+    today = now.strftime("%Y%m%d")
+    yesterday = (now - timedelta(days=1)).strftime("%Y%m%d")
+
+    short_hash = get_session_short_hash(session_id)
+    status_dir = get_session_status_dir(session_id)
+
+    for date_compact in [today, yesterday]:
+        for pattern in [
+            f"{date_compact}-??-{short_hash}.json",
+            f"{date_compact}-{short_hash}.json",
+        ]:
+            matches = list(status_dir.glob(pattern))
+            if matches:
+                return max(matches, key=lambda p: p.stat().st_mtime)
+    return None
+
+
 def get_session_directory(
     session_id: str, date: str | None = None, base_dir: Path | None = None
 ) -> Path:
@@ -454,11 +519,17 @@ def get_all_gate_file_paths(
     return {gate: get_gate_file_path(gate, session_id, input_data, date) for gate in GATE_NAMES}
 
 
-def get_pid_session_map_path() -> Path:
+def get_pid_session_map_path(ppid: int | None = None) -> Path:
     """Get path for PID -> SessionID mapping file.
 
     Used by router to bootstrap session ID from process ID when not provided.
     Stores simple JSON: {"session_id": "..."}
+
+    Args:
+        ppid: Parent PID of the hook invocation. Defaults to this process's
+            parent; the router daemon passes the client's parent instead.
     """
     # PID session maps are ephemeral runtime files, always use /tmp
-    return Path("/tmp") / f"session-{os.getppid()}.json"
+    if ppid is None:
+        ppid = os.getppid()
+    return Path("/tmp") / f"session-{ppid}.json"
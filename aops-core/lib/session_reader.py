@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Any
 
 from lib.paths import get_summaries_dir, get_transcripts_dir
+from lib.transcript_cache import read_transcript
 from lib.transcript_parser import (
     SessionInfo,
     SessionProcessor,
@@ -239,19 +240,13 @@ def _extract_and_expand_prompts(turns: list, max_turns: int) -> list[str]:
 
 def _extract_router_context_impl(transcript_path: Path, max_turns: int) -> str:
     """Implementation of router context extraction."""
-    # Use SessionProcessor to parse and group turns (DRY compliant)
+    # Parse and group turns incrementally (only lines appended since the last hook)
     # Skip agents and hooks for speed - we only need main conversation
-    processor = SessionProcessor()
-    _, entries, _ = processor.parse_session_file(
-        transcript_path, load_agents=False, load_hooks=False
-    )
+    entries, turns = read_transcript(transcript_path)
 
     if not entries:
         return ""
 
-    # Group into turns to handle command expansion properly
-    turns = processor.group_entries_into_turns(entries, full_mode=True)
-
     # Extract user prompts, expanding commands
     recent_prompts = _extract_and_expand_prompts(turns, max_turns)
 
@@ -604,13 +599,11 @@ def build_audit_session_context(transcript_path: Path | str) -> str:
     if not path.exists():
         return "(No transcript path available)"
 
-    processor = SessionProcessor()
-    _, entries, _ = processor.parse_session_file(path, load_agents=False, load_hooks=False)
+    entries, turns = read_transcript(path)
 
     if not entries:
         return "(Empty session)"
 
-    turns = processor.group_entries_into_turns(entries, full_mode=True)
     if not turns:
         return "(No conversation turns found)"
 
@@ -795,16 +788,11 @@ def _extract_gate_context_impl(
 ) -> dict[str, Any]:
     """Implementation of gate context extraction using SessionProcessor."""
     processor = SessionProcessor()
-    _, entries, _ = processor.parse_session_file(
-        transcript_path, load_agents=False, load_hooks=False
-    )
+    entries, turns = read_transcript(transcript_path, processor)
 
     if not entries:
         return {}
 
-    # Group into turns for consistent parsing
-    turns = processor.group_entries_into_turns(entries, full_mode=True)
-
     result = {}
 
     # Extract prompts using Turns logic
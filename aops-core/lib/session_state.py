@@ -11,6 +11,13 @@ not share state. Session ID is the unique identifier provided by Claude Code.
 
 Location: Sessions are stored in a centralized flat directory for easy access and
 cleanup. Files are named by date and session hash (e.g., 20260121-abc12345.json).
+
+Concurrency: parallel tool calls fire hooks concurrently, and subagents share
+their parent's session, so several processes can load, modify and save the
+same state. save() is a compare-and-swap under a per-session lock file: each
+save bumps the state's revision, and a save whose loaded revision is no longer
+the one on disk merges its changes into the newer state (see _merge) instead
+of overwriting it.
 """
 
 from __future__ import annotations
@@ -21,19 +28,28 @@ import re
 import sys
 import tempfile
 import time
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
 from lib.gate_types import GateState, GateStatus
 from lib.session_paths import (
+    find_session_file,
     get_session_file_path,
+    get_session_pointer_path,
     get_session_short_hash,
     get_session_status_dir,
+    read_session_pointer,
 )
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 # Cache: computed once per process
 _PLUGIN_VERSION: str | None = None
 
@@ -133,6 +149,12 @@ class SessionState(BaseModel):
     # Session insights (written at close)
     insights: dict[str, Any] | None = None
 
+    # Bumped by every save (see save())
+    revision: int = 0
+
+    # The state as loaded (or created), for merging with concurrent saves
+    _base: dict[str, Any] | None = PrivateAttr(default=None)
+
     @classmethod
     def create(cls, session_id: str) -> SessionState:
         """Create new session state."""
@@ -169,83 +191,86 @@ class SessionState(BaseModel):
         instance.state["hydration_pending"] = True
         instance.state["handover_skill_invoked"] = True
 
+        instance._base = instance.model_dump(mode="json")
         return instance
 
     @classmethod
     def load(cls, session_id: str, retries: int = 3) -> SessionState:
         """Load session state from disk."""
-        now = datetime.now()
-        today = now.strftime("%Y%m%d")
-        yesterday = (now - timedelta(days=1)).strftime("%Y%m%d")
-
-        short_hash = get_session_short_hash(session_id)
-        status_dir = get_session_status_dir(session_id)
-
-        # Search for files matching this session_id on today or yesterday
-        for date_compact in [today, yesterday]:
-            # New format: YYYYMMDD-HH-hash.json (try all hours)
-            new_pattern = f"{date_compact}-??-{short_hash}.json"
-            # Legacy format: YYYYMMDD-hash.json
-            legacy_pattern = f"{date_compact}-{short_hash}.json"
-
-            for pattern in [new_pattern, legacy_pattern]:
-                matches = list(status_dir.glob(pattern))
-                if matches:
-                    # Use the most recent file if multiple matches
-                    path = max(matches, key=lambda p: p.stat().st_mtime)
-                    for attempt in range(retries):
-                        try:
-                            text = path.read_text()
-                            data = json.loads(text)
-                            # Convert dict to Pydantic
-                            return cls.model_validate(data)
-                        except json.JSONDecodeError as e:
-                            if attempt < retries - 1:
-                                time.sleep(0.01)
-                                continue
-                            print(f"WARNING: SessionState JSON decode error: {e}", file=sys.stderr)
-                            # Return new state on failure to avoid blocking
-                            return cls.create(session_id)
-                        except ValidationError as e:
-                            print(f"WARNING: SessionState validation error: {e}", file=sys.stderr)
-                            # Schema mismatch -> Create new (migration via reset)
-                            return cls.create(session_id)
-                        except Exception as e:
-                            print(f"WARNING: SessionState load error: {e}", file=sys.stderr)
-                            # Unknown error -> Create new? Or retry?
-                            if attempt < retries - 1:
-                                time.sleep(0.01)
-                                continue
-                            return cls.create(session_id)
+        path = find_session_file(session_id)
+        if path is not None:
+            for attempt in range(retries):
+                try:
+                    text = path.read_text()
+                    data = json.loads(text)
+                    # Convert dict to Pydantic
+                    instance = cls.model_validate(data)
+                    instance._base = data
+                    return instance
+                except json.JSONDecodeError as e:
+                    if attempt < retries - 1:
+                        time.sleep(0.01)
+                        continue
+                    print(f"WARNING: SessionState JSON decode error: {e}", file=sys.stderr)
+                    # Return new state on failure to avoid blocking
+                    return cls.create(session_id)
+                except ValidationError as e:
+                    print(f"WARNING: SessionState validation error: {e}", file=sys.stderr)
+                    # Schema mismatch -> Create new (migration via reset)
+                    return cls.create(session_id)
+                except Exception as e:
+                    print(f"WARNING: SessionState load error: {e}", file=sys.stderr)
+                    # Unknown error -> Create new? Or retry?
+                    if attempt < retries - 1:
+                        time.sleep(0.01)
+                        continue
+                    return cls.create(session_id)
 
         # Not found, create new
         return cls.create(session_id)
 
     def save(self) -> None:
-        """Save session state to disk."""
-        # Ensure directory exists
-        path = get_session_file_path(self.session_id, self.date)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        fd, temp_path_str = tempfile.mkstemp(
-            prefix=f"aops-{self.date}-", suffix=".tmp", dir=str(path.parent)
-        )
-        temp_path = Path(temp_path_str)
-
-        try:
-            # Dump with exclude_none=False to preserve structure?
-            # Or use mode='json'
-            data = self.model_dump_json(indent=2)
-            os.write(fd, data.encode())
-            os.close(fd)
-            temp_path.rename(path)
-        except Exception:
-            try:
-                os.close(fd)
-            except Exception:
-                pass
-            temp_path.unlink(missing_ok=True)
-            raise
+        """Save session state to disk.
+
+        Under the session's lock: if the state on disk is still the revision
+        this one was loaded from, it's replaced; otherwise another process
+        saved meanwhile, and this state's changes since load are merged into
+        that one (this instance is updated to the merged state). Either way
+        the saved state gets the next revision.
+        """
+        with _session_lock(self.session_id):
+            current = read_session_pointer(self.session_id)
+            pointed = current is not None
+            if current is None:
+                current = find_session_file(self.session_id)
+            mine = self.model_dump(mode="json")
+            theirs = _read_state(current) if current is not None else None
+            base = self._base or {}
+
+            if theirs is not None and theirs.get("revision", 0) != base.get("revision", 0):
+                merged = _merge(base, mine, theirs)
+                merged["revision"] = theirs.get("revision", 0) + 1
+                try:
+                    merged_state = type(self).model_validate(merged)
+                except ValidationError:
+                    # Can't merge into an unreadable state: overwrite it
+                    mine["revision"] = merged["revision"]
+                else:
+                    for name in type(self).model_fields:
+                        setattr(self, name, getattr(merged_state, name))
+                    mine = self.model_dump(mode="json")
+            else:
+                mine["revision"] = self.revision + 1
+            self.revision = mine["revision"]
+
+            path = get_session_file_path(self.session_id, self.date)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, json.dumps(mine, indent=2), prefix=f"aops-{self.date}-")
+            self._base = mine
+            if not pointed or current != path:
+                _write_atomic(
+                    get_session_pointer_path(self.session_id), path.name, prefix="aops-pointer-"
+                )
 
     # --- Helper methods for common checks ---
 
@@ -278,6 +303,101 @@ class SessionState(BaseModel):
         self.gates[name] = gate
 
 
+# --- Persistence ---
+
+_MISSING = object()
+
+
+@contextmanager
+def _session_lock(session_id: str):
+    """Hold the session's lock file (exclusive flock) for a read-modify-write."""
+    status_dir = get_session_status_dir(session_id)
+    lock_path = status_dir / f".{get_session_short_hash(session_id)}.lock"
+    with open(lock_path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _read_state(path: Path) -> dict[str, Any] | None:
+    """Read a state file's JSON, or None if it's missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_atomic(path: Path, text: str, prefix: str) -> None:
+    """Write a file via a temp file renamed over it."""
+    fd, temp_path_str = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=str(path.parent))
+    temp_path = Path(temp_path_str)
+    try:
+        os.write(fd, text.encode())
+        os.close(fd)
+        temp_path.rename(path)
+    except Exception:
+        try:
+            os.close(fd)
+        except Exception:
+            pass
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _is_count(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# Fields that count events, so concurrent increments add up. Every other field
+# is a snapshot (last_open_turn, todos_total, ...): both sides setting it to
+# the same value must not count twice.
+_COUNTERS = frozenset({"ops_since_open", "ops_since_close", "global_turn_count"})
+
+
+def _merge(base: Any, mine: Any, theirs: Any, key: str | None = None) -> Any:
+    """Three-way merge of JSON state: apply mine's changes since base to theirs.
+
+    - A value only one side changed takes that side's value.
+    - Objects are merged key by key.
+    - Counters (_COUNTERS) both sides incremented add mine's increment to
+      theirs. A counter mine reset keeps mine; one both sides added counts
+      from 0.
+    - Any other conflict goes to mine, as the later save (so a snapshot both
+      sides set to the same value keeps that value).
+
+    _MISSING stands for an absent key; key is the value's key in its object.
+    """
+    if mine == base:
+        return theirs
+    if theirs == base or theirs is _MISSING:
+        return mine
+    if isinstance(mine, dict) and isinstance(theirs, dict):
+        base_dict = base if isinstance(base, dict) else {}
+        merged = {}
+        for name in [*theirs, *(name for name in mine if name not in theirs)]:
+            value = _merge(
+                base_dict.get(name, _MISSING),
+                mine.get(name, _MISSING),
+                theirs.get(name, _MISSING),
+                name,
+            )
+            if value is not _MISSING:
+                merged[name] = value
+        return merged
+    if key in _COUNTERS:
+        if base is _MISSING:
+            # Both sides added it (a gate first used concurrently): count from 0
+            base = 0
+        if _is_count(base) and _is_count(mine) and _is_count(theirs) and mine > base:
+            return theirs + (mine - base)
+    return mine
+
+
 # --- Utility Functions ---
 
 
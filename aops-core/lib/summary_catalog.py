@@ -0,0 +1,346 @@
+"""
+Summary Catalog - an index of the session summary JSONs in summaries/.
+
+Readers of summaries/ used to glob it per lookup: find_existing_insights tries
+up to ten patterns per session, path reconstruction sorts and globs every
+summary and JSON-loads each in its window, and the dashboard and daily-note
+scans list the whole directory again. With a year of summaries each of those
+is O(summaries) of directory listing and name parsing per call.
+
+The catalog keeps, per summary file name:
+- the fields encoded in the name (date, hour, project, session ID, slug,
+  reflection index),
+- the file's mtime and size when it was catalogued,
+- a few key fields of its content (session_id, outcome, summary),
+
+sorted by name, so lookups by date are a bisect and by session a filter over
+one day's entries.
+
+The catalog is persisted as JSON in the summary-catalog cache directory (see
+lib.cache_utils.get_cache_dir), not in the synced sessions repo. Like
+lib.transcript_manifest it records the directory's mtime; when the directory
+has changed since (summaries written by another machine and synced in, or
+renamed by hand), it is refreshed from a single listing, re-reading only files
+whose mtime or size changed. write_insights_file records the files it writes.
+
+The mtime stored is the one observed when the directory was last listed, so
+any write since (including the catalog owner's own) makes the next load
+refresh: a file another process wrote meanwhile is never taken as known.
+save() holds a lock on the catalog file and merges in entries other
+processes saved since this catalog was loaded.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from filelock import FileLock, Timeout
+
+from lib.cache_utils import get_cache_dir, write_cache_file
+from lib.paths import get_summaries_dir
+
+# Bump when the persisted format changes
+CATALOG_VERSION = 1
+
+_INDEX_SUFFIX = re.compile(r"-(\d+)$")
+
+# Catalogs loaded by this process, by catalog path
+_loaded: dict[Path, SummaryCatalog] = {}
+
+
+@dataclass
+class SummaryEntry:
+    """One summary JSON file in the catalog."""
+
+    name: str
+    date: str  # YYYYMMDD from the file name, "" if it doesn't start with one
+    hour: str | None  # HH for v3.7.0+ names
+    project: str
+    session_id: str  # From the content if readable, else from the file name
+    slug: str
+    index: int  # Reflection index (0 for the first reflection)
+    mtime_ns: int
+    size: int
+    readable: bool = True  # False if the content isn't a JSON object
+    outcome: str | None = None
+    summary: str | None = None
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        """(date, hour) for ordering, with "00" for names without an hour."""
+        return self.date, self.hour or "00"
+
+
+def parse_summary_name(stem: str) -> dict[str, str | int | None]:
+    """Split a summary file stem into the fields get_insights_file_path encodes.
+
+    Formats:
+        YYYYMMDD-HH-project-sessionid-slug[-index]  (v3.7.0+)
+        YYYYMMDD-project-sessionid-slug[-index]     (v3.6.0)
+
+    Project and session ID are "" for names that don't fit either.
+    """
+    parts = stem.split("-")
+    date = parts[0] if len(parts[0]) == 8 and parts[0].isdigit() else ""
+    fields: dict[str, str | int | None] = {
+        "date": date,
+        "hour": None,
+        "project": "",
+        "session_id": "",
+        "slug": "",
+        "index": 0,
+    }
+    if not date or len(parts) < 3:
+        return fields
+    rest = parts[1:]
+    if len(rest) >= 3 and len(rest[0]) == 2 and rest[0].isdigit():
+        fields["hour"] = rest[0]
+        rest = rest[1:]
+    fields["project"] = rest[0]
+    fields["session_id"] = rest[1] if len(rest) > 1 else ""
+    slug = "-".join(rest[2:])
+    match = _INDEX_SUFFIX.search(stem)
+    if match and slug:
+        fields["index"] = int(match.group(1))
+        slug = slug[: -len(match.group(0))] if slug != match.group(1) else ""
+    fields["slug"] = slug
+    return fields
+
+
+def get_catalog_path(summaries_dir: Path) -> Path:
+    """Get the catalog file for a summaries directory."""
+    key = hashlib.sha256(str(summaries_dir.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir("summary-catalog") / f"{key}.json"
+
+
+class SummaryCatalog:
+    """Index of the summary JSONs in one directory, sorted by file name."""
+
+    def __init__(self, summaries_dir: Path, catalog_path: Path | None = None):
+        self.summaries_dir = summaries_dir
+        self.path = catalog_path or get_catalog_path(summaries_dir)
+        self.dir_mtime_ns: int | None = None
+        self.entries: dict[str, SummaryEntry] = {}
+        self._names: list[str] = []
+
+    @classmethod
+    def load(
+        cls, summaries_dir: Path | None = None, catalog_path: Path | None = None
+    ) -> SummaryCatalog:
+        """Load the catalog for summaries_dir (default: summaries/), refreshing it if stale.
+
+        A missing or unreadable catalog file just means a full refresh. A
+        catalog already loaded by this process is reused while the directory
+        is unchanged.
+        """
+        catalog = cls(summaries_dir or get_summaries_dir(), catalog_path)
+        loaded = _loaded.get(catalog.path)
+        if (
+            loaded is not None
+            and loaded.summaries_dir == catalog.summaries_dir
+            and loaded.dir_mtime_ns is not None
+            and loaded.dir_mtime_ns == _mtime_ns(catalog.summaries_dir)
+        ):
+            return loaded
+        _loaded[catalog.path] = catalog
+        # Stat before reading: a write after this makes the next load refresh
+        dir_mtime_ns = _mtime_ns(catalog.summaries_dir)
+        data = _read_catalog(catalog.path)
+        catalog.entries = _parse_entries(data)
+        catalog._names = sorted(catalog.entries)
+
+        if dir_mtime_ns is not None and dir_mtime_ns == data.get("dir_mtime_ns"):
+            catalog.dir_mtime_ns = dir_mtime_ns
+        else:
+            catalog.refresh()
+            catalog.save()
+        return catalog
+
+    def refresh(self) -> None:
+        """Bring the catalog up to date from a single listing of the directory."""
+        self.dir_mtime_ns = _mtime_ns(self.summaries_dir)
+        entries: dict[str, SummaryEntry] = {}
+        try:
+            with os.scandir(self.summaries_dir) as it:
+                for dir_entry in it:
+                    if not _is_summary_name(dir_entry.name):
+                        continue
+                    try:
+                        if not dir_entry.is_file():
+                            continue
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    entry = self.entries.get(dir_entry.name)
+                    if (
+                        entry is None
+                        or entry.mtime_ns != stat.st_mtime_ns
+                        or entry.size != stat.st_size
+                    ):
+                        entry = _read_entry(Path(dir_entry.path), stat)
+                    entries[dir_entry.name] = entry
+        except OSError:
+            pass
+        self.entries = entries
+        self._names = sorted(entries)
+
+    def record(self, path: Path, insights: dict | None = None) -> None:
+        """Record a summary file just written to the directory.
+
+        Args:
+            path: The summary file
+            insights: Its content, if the caller has it (saves re-reading it)
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            self._remove(path.name)
+            return
+        if path.name not in self.entries:
+            bisect.insort(self._names, path.name)
+        self.entries[path.name] = _read_entry(path, stat, insights)
+
+    def _remove(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self._names.remove(name)
+
+    # --- Queries ---------------------------------------------------------------
+
+    def with_prefix(self, prefix: str) -> list[SummaryEntry]:
+        """Get the entries whose file name starts with prefix, sorted by name."""
+        start = bisect.bisect_left(self._names, prefix)
+        result = []
+        for name in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            result.append(self.entries[name])
+        return result
+
+    def since(self, date: str, hour: str = "00") -> list[SummaryEntry]:
+        """Get the entries dated from date (YYYYMMDD) and hour on, newest first.
+
+        Names without a date aren't included; names without an hour count
+        as hour "00".
+        """
+        start = bisect.bisect_left(self._names, date)
+        result = [
+            entry
+            for entry in (self.entries[name] for name in self._names[start:])
+            if entry.date and entry.sort_key >= (date, hour)
+        ]
+        result.sort(key=lambda entry: (entry.sort_key, entry.name), reverse=True)
+        return result
+
+    def paths(self, entries: list[SummaryEntry]) -> list[Path]:
+        """Get the file paths of entries."""
+        return [self.summaries_dir / entry.name for entry in entries]
+
+    # --- Persistence -------------------------------------------------------------
+
+    def save(self) -> None:
+        """Persist the catalog, merged with what other processes saved since load().
+
+        Holds the catalog's lock across re-reading the saved catalog and
+        writing the merge, so two writers never drop each other's entries.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with FileLock(str(self.path) + ".lock", timeout=10):
+                self._merge_saved()
+                self._write()
+        except (OSError, Timeout):
+            # The stored dir mtime is already stale: the next load refreshes
+            pass
+
+    def _merge_saved(self) -> None:
+        """Add entries in the saved catalog that this one lacks, if their files are unchanged."""
+        for name, entry in _parse_entries(_read_catalog(self.path)).items():
+            if name in self.entries:
+                continue
+            try:
+                stat = (self.summaries_dir / name).stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+                bisect.insort(self._names, name)
+                self.entries[name] = entry
+
+    def _write(self) -> None:
+        data = {
+            "version": CATALOG_VERSION,
+            "summaries_dir": str(self.summaries_dir),
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "entries": {
+                name: {key: value for key, value in asdict(entry).items() if key != "name"}
+                for name, entry in sorted(self.entries.items())
+            },
+        }
+        write_cache_file(self.path, json.dumps(data, separators=(",", ":")).encode())
+
+
+def _read_catalog(path: Path) -> dict:
+    """Read a saved catalog, or {} if it's missing, unreadable or another version."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return {}
+    return data
+
+
+def _parse_entries(data: dict) -> dict[str, SummaryEntry]:
+    try:
+        return {
+            name: SummaryEntry(name=name, **fields)
+            for name, fields in data.get("entries", {}).items()
+        }
+    except (AttributeError, TypeError):
+        return {}
+
+
+def _is_summary_name(name: str) -> bool:
+    # insights-*.json are write_insights_file's temp files
+    return name.endswith(".json") and not name.startswith((".", "insights-"))
+
+
+def _read_entry(path: Path, stat: os.stat_result, content: dict | None = None) -> SummaryEntry:
+    """Catalogue one summary file, reading its content unless given."""
+    fields = parse_summary_name(path.stem)
+    if content is None:
+        try:
+            content = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            content = None
+    readable = isinstance(content, dict)
+    content = content if readable else {}
+    session_id = content.get("session_id")
+    summary = content.get("summary")
+    outcome = content.get("outcome")
+    return SummaryEntry(
+        name=path.name,
+        date=fields["date"],
+        hour=fields["hour"],
+        project=fields["project"],
+        session_id=session_id if isinstance(session_id, str) else fields["session_id"],
+        slug=fields["slug"],
+        index=fields["index"],
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        readable=readable,
+        outcome=outcome if isinstance(outcome, str) else None,
+        summary=summary if isinstance(summary, str) else None,
+    )
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
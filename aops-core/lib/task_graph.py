@@ -0,0 +1,274 @@
+#!/usr/bin/env -S uv run python
+"""Task Graph: in-memory snapshot of every task under $ACA_DATA.
+
+TaskStorage's graph queries (ready, blocked, children, descendants,
+ancestors, inverse relationships) used to parse the whole data tree on every
+call, some of them more than once. A TaskGraph is built from one parse and
+answers them with adjacency lookups:
+
+    children[parent_id]    -> files of tasks with that parent
+    blocks[task_id]        -> files of tasks that depend_on it
+    soft_blocks[task_id]   -> files of tasks that soft_depend_on it
+
+Keeping it current:
+- sync() compares each directory's mtime with the one recorded when it was
+  listed. A changed directory (files added, removed, or replaced by an
+  atomic rename, as TaskStorage writes them) is listed again, and only its
+  new or changed files are parsed.
+- Editors that rewrite a file in place leave the directory mtime alone, so
+  sync() also re-stats every file once per sweep_interval seconds.
+- refresh() forces that full re-stat now; files_changed() re-lists one
+  directory after a write.
+
+One TaskGraph is shared per data root within a process (see get_task_graph).
+It holds Task objects parsed from disk: callers must copy them before
+handing them out (see copy_task).
+
+Usage:
+    from lib.task_graph import get_task_graph
+
+    graph = get_task_graph(data_root, excluded_dirs)
+    graph.sync()
+    for path in graph.children.get("20260112-write-book", ()):
+        print(graph.by_path[path].title)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from lib.task_model import Task
+
+_MUTABLE = (list, dict, set)
+
+
+def copy_task(task: Task) -> Task:
+    """Copy a task, including its list fields, so callers can mutate it freely."""
+    clone = object.__new__(type(task))
+    clone.__dict__.update(
+        {
+            name: value.copy() if isinstance(value, _MUTABLE) else value
+            for name, value in task.__dict__.items()
+        }
+    )
+    return clone
+
+
+def _parse_task(path: Path) -> Task | None:
+    """Parse a markdown file as a task, or None if it isn't a valid task."""
+    try:
+        return Task.from_file(path)
+    except (ValueError, OSError, KeyError):
+        return None
+
+
+class TaskGraph:
+    """Snapshot of the tasks under a data root, with parent/dependency adjacency."""
+
+    # Seconds between full re-stats of every file (catches in-place edits)
+    sweep_interval = 5.0
+
+    def __init__(
+        self,
+        data_root: Path,
+        excluded_dirs: Iterable[str] = (),
+        parse: Callable[[Path], Task | None] = _parse_task,
+    ):
+        self.data_root = data_root
+        self.excluded_dirs = frozenset(excluded_dirs)
+        self._parse = parse
+        self.lock = threading.RLock()
+
+        # Tasks by file, in discovery order; several files may share an ID
+        self.by_path: dict[Path, Task] = {}
+        self.paths_by_id: dict[str, set[Path]] = {}
+        self.children: dict[str, set[Path]] = {}
+        self.blocks: dict[str, set[Path]] = {}
+        self.soft_blocks: dict[str, set[Path]] = {}
+
+        # (mtime_ns, size) of every markdown file seen, task or not
+        self._files: dict[Path, tuple[int, int]] = {}
+        # Directory -> mtime when last listed, and what it contained
+        self._dirs: dict[Path, int] = {}
+        self._dir_files: dict[Path, set[Path]] = {}
+        self._dir_subdirs: dict[Path, set[Path]] = {}
+        self._swept_at: float | None = None
+
+    # --- Keeping the snapshot current -------------------------------------
+
+    def sync(self) -> None:
+        """Bring the snapshot up to date with the files on disk."""
+        with self.lock:
+            now = time.monotonic()
+            if (
+                self._swept_at is None
+                or not self._dirs
+                or now - self._swept_at >= self.sweep_interval
+            ):
+                self._sweep(now)
+                return
+            for directory, mtime_ns in list(self._dirs.items()):
+                if directory not in self._dirs:
+                    continue  # Dropped along with a removed parent
+                try:
+                    changed = directory.stat().st_mtime_ns != mtime_ns
+                except OSError:
+                    changed = True
+                if changed:
+                    self._list_dir(directory)
+
+    def refresh(self) -> None:
+        """Re-stat every file now, picking up in-place edits."""
+        with self.lock:
+            self._sweep(time.monotonic())
+
+    def files_changed(self, *paths: Path) -> None:
+        """Re-list the directories of files just written or deleted."""
+        with self.lock:
+            if self._swept_at is None:
+                return  # Not built yet: the first sync() reads everything
+            for directory in {path.parent for path in paths}:
+                if directory in self._dirs or directory.parent in self._dirs:
+                    self._list_dir(directory)
+
+    def _sweep(self, now: float) -> None:
+        if not self._dirs:
+            self._list_dir(self.data_root)
+        else:
+            for directory in list(self._dirs):
+                if directory in self._dirs:
+                    self._list_dir(directory)
+        self._swept_at = now
+
+    def _list_dir(self, directory: Path) -> None:
+        """List one directory: parse new and changed files, drop removed ones.
+
+        New subdirectories are listed recursively; known ones are left to
+        their own mtime check.
+        """
+        try:
+            # Before listing: a change made while listing shows up next sync
+            mtime_ns = directory.stat().st_mtime_ns
+            it = os.scandir(directory)
+        except OSError:
+            self._drop_dir(directory)
+            return
+
+        files: set[Path] = set()
+        subdirs: set[Path] = set()
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.excluded_dirs:
+                        subdirs.add(directory / entry.name)
+                    continue
+                if not entry.name.endswith(".md"):
+                    continue
+                path = directory / entry.name
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.add(path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._files.get(path) != signature:
+                    self._files[path] = signature
+                    self._set_task(path, self._parse(path))
+
+        for path in self._dir_files.get(directory, set()) - files:
+            self._files.pop(path, None)
+            self._set_task(path, None)
+        for subdir in self._dir_subdirs.get(directory, set()) - subdirs:
+            self._drop_dir(subdir)
+
+        self._dirs[directory] = mtime_ns
+        self._dir_files[directory] = files
+        self._dir_subdirs[directory] = subdirs
+        for subdir in subdirs:
+            if subdir not in self._dirs:
+                self._list_dir(subdir)
+
+    def _drop_dir(self, directory: Path) -> None:
+        for path in self._dir_files.pop(directory, set()):
+            self._files.pop(path, None)
+            self._set_task(path, None)
+        for subdir in self._dir_subdirs.pop(directory, set()):
+            self._drop_dir(subdir)
+        self._dirs.pop(directory, None)
+
+    def _set_task(self, path: Path, task: Task | None) -> None:
+        """Replace the task parsed from path (None removes it), with its edges."""
+        old = self.by_path.pop(path, None)
+        if old is not None:
+            _discard(self.paths_by_id, old.id, path)
+            if old.parent:
+                _discard(self.children, old.parent, path)
+            for dep_id in old.depends_on:
+                _discard(self.blocks, dep_id, path)
+            for dep_id in old.soft_depends_on:
+                _discard(self.soft_blocks, dep_id, path)
+        if task is None:
+            return
+        self.by_path[path] = task
+        self.paths_by_id.setdefault(task.id, set()).add(path)
+        if task.parent:
+            self.children.setdefault(task.parent, set()).add(path)
+        for dep_id in task.depends_on:
+            self.blocks.setdefault(dep_id, set()).add(path)
+        for dep_id in task.soft_depends_on:
+            self.soft_blocks.setdefault(dep_id, set()).add(path)
+
+    # --- Queries (call sync() first, hold lock while using results) -------
+
+    def get(self, task_id: str) -> Task | None:
+        """Get a task by ID (the first file by path if several share it)."""
+        paths = self.paths_by_id.get(task_id)
+        if not paths:
+            return None
+        return self.by_path[min(paths)]
+
+    def tasks(self, paths: Iterable[Path]) -> list[Task]:
+        """Get the tasks parsed from the given files, in path order."""
+        return [self.by_path[path] for path in sorted(paths)]
+
+    def ids(self, paths: Iterable[Path]) -> list[str]:
+        """Get the IDs of the tasks parsed from the given files, in path order."""
+        return [self.by_path[path].id for path in sorted(paths)]
+
+
+def _discard(adjacency: dict[str, set[Path]], key: str, path: Path) -> None:
+    paths = adjacency.get(key)
+    if paths is not None:
+        paths.discard(path)
+        if not paths:
+            del adjacency[key]
+
+
+_graphs: dict[Path, TaskGraph] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_task_graph(data_root: Path, excluded_dirs: Iterable[str] = ()) -> TaskGraph:
+    """Get the process-wide TaskGraph for a data root (not yet synced).
+
+    Keyed by the path as given, so the graph's file paths are spelled the
+    way the caller spells data_root.
+    """
+    key = Path(data_root)
+    with _graphs_lock:
+        graph = _graphs.get(key)
+        if graph is None:
+            graph = _graphs[key] = TaskGraph(key, excluded_dirs)
+        return graph
+
+
+def clear_task_graphs() -> None:
+    """Forget all process-wide TaskGraphs."""
+    with _graphs_lock:
+        _graphs.clear()
@@ -21,6 +21,9 @@ Usage:
 
     loaded = Task.from_file(path)
 
+    # Frontmatter only, for bulk scans (None if the file isn't a task)
+    header = TaskHeader.from_file(path)
+
     # State transitions with guards
     result = task.transition_to(
         TaskStatus.IN_PROGRESS,
@@ -43,7 +46,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, TextIO, TypeVar
 
 import yaml
 
@@ -51,6 +54,9 @@ logger = logging.getLogger(__name__)
 
 E = TypeVar("E", bound=Enum)
 
+# libyaml's loader is several times faster; fall back to pure Python without it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TaskType(Enum):
     """Semantic task levels for hierarchical decomposition."""
@@ -415,6 +421,42 @@ def _safe_parse_enum(
         return default
 
 
+def _parse_task_type(fm: dict[str, Any], task_id: str) -> TaskType:
+    """Parse the required type field of task frontmatter.
+
+    Raises:
+        ValueError: If the type is missing or not a TaskType (not a task)
+    """
+    task_type_str = fm.get("type")
+    if task_type_str is None:
+        raise ValueError(f"Missing 'type' field for item {task_id} - not a task file")
+    try:
+        return TaskType(task_type_str)
+    except ValueError as e:
+        raise ValueError(f"Invalid type '{task_type_str}' for item {task_id} - not a task") from e
+
+
+def _parse_status_and_rank(fm: dict[str, Any], task_id: str) -> tuple[TaskStatus, int, int]:
+    """Parse status, priority and order from frontmatter, coercing bad values.
+
+    Returns:
+        (status, priority, order)
+    """
+    status_str = fm.get("status", "active")
+    if isinstance(status_str, str):
+        status_str = Task.STATUS_ALIASES.get(status_str, status_str)
+    status = _safe_parse_enum(status_str, TaskStatus, TaskStatus.ACTIVE, "status", task_id)
+
+    # Numeric fields may come as strings from YAML
+    priority = fm.get("priority", 2)
+    if isinstance(priority, str):
+        priority = int(priority) if priority.isdigit() else 2
+    order = fm.get("order", 0)
+    if isinstance(order, str):
+        order = int(order) if order.isdigit() else 0
+    return status, priority, order
+
+
 @dataclass
 class Task:
     """Task model with graph relationships for hierarchical decomposition.
@@ -656,29 +698,10 @@ class Task:
             decision_deadline = datetime.fromisoformat(decision_deadline)
 
         # Parse type - require explicit type field (skip non-task files)
-        task_type_str = fm.get("type")
-        if task_type_str is None:
-            raise ValueError(f"Missing 'type' field for item {task_id} - not a task file")
-        try:
-            task_type = TaskType(task_type_str)
-        except ValueError as e:
-            raise ValueError(
-                f"Invalid type '{task_type_str}' for item {task_id} - not a task"
-            ) from e
+        task_type = _parse_task_type(fm, task_id)
 
         # Map status aliases and parse with graceful coercion
-        status_str = fm.get("status", "active")
-        if isinstance(status_str, str):
-            status_str = cls.STATUS_ALIASES.get(status_str, status_str)
-        status = _safe_parse_enum(status_str, TaskStatus, TaskStatus.ACTIVE, "status", task_id)
-
-        # Parse numeric fields (may come as strings from YAML)
-        priority = fm.get("priority", 2)
-        if isinstance(priority, str):
-            priority = int(priority) if priority.isdigit() else 2
-        order = fm.get("order", 0)
-        if isinstance(order, str):
-            order = int(order) if order.isdigit() else 0
+        status, priority, order = _parse_status_and_rank(fm, task_id)
         depth = fm.get("depth", 0)
         if isinstance(depth, str):
             depth = int(depth) if depth.isdigit() else 0
@@ -862,21 +885,32 @@ class Task:
         if len(parts) < 3:
             raise ValueError("Invalid frontmatter format")
 
+        fm = cls._load_frontmatter(parts[1])
+        body = parts[2].strip()
+        return cls.from_frontmatter(fm, body)
+
+    @staticmethod
+    def _load_frontmatter(text: str) -> dict[str, Any]:
+        """Parse frontmatter YAML and check the fields every task needs.
+
+        Raises:
+            ValueError: If the YAML is invalid or required fields are missing
+        """
         try:
-            fm = yaml.safe_load(parts[1])
+            fm = yaml.load(text, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML frontmatter: {e}") from e
 
         if not fm:
             raise ValueError("Empty frontmatter")
+        if not isinstance(fm, dict):
+            raise ValueError("Frontmatter must be a mapping")
         # Accept id, task_id, or permalink as the ID field
         if "id" not in fm and "task_id" not in fm and "permalink" not in fm:
             raise ValueError("Task frontmatter missing required field: id, task_id, or permalink")
         if "title" not in fm:
             raise ValueError("Task frontmatter missing required field: title")
-
-        body = parts[2].strip()
-        return cls.from_frontmatter(fm, body)
+        return fm
 
     def to_file(self, path: Path) -> None:
         """Write task to file.
@@ -894,14 +928,27 @@ class Task:
     def from_file(cls, path: Path) -> Task:
         """Load task from file.
 
+        The body is only read once the frontmatter has been checked, so
+        non-task notes are rejected without reading them in full.
+
         Args:
             path: File path to read from
 
         Returns:
             Task instance
+
+        Raises:
+            ValueError: If frontmatter is missing or invalid, or not a task's
         """
-        content = path.read_text(encoding="utf-8")
-        return cls.from_markdown(content)
+        with path.open(encoding="utf-8") as f:
+            block = _read_frontmatter_block(f)
+            if block is None:
+                raise ValueError("Task file must start with closed YAML frontmatter (---)")
+            fm = cls._load_frontmatter(block)
+            # Reject notes without a task type before their body is read
+            _parse_task_type(fm, fm.get("id") or fm.get("task_id") or fm.get("permalink"))
+            body = f.read().strip()
+        return cls.from_frontmatter(fm, body)
 
     def is_ready(self) -> bool:
         """Check if task is ready to work on.
@@ -1209,6 +1256,171 @@ class Task:
         return f"Task(id={self.id!r}, title={self.title!r}, type={self.type.value})"
 
 
+# =============================================================================
+# Frontmatter-only Reading
+# =============================================================================
+
+
+def _read_frontmatter_block(f: TextIO) -> str | None:
+    """Read the frontmatter block from an open file, up to the closing ---.
+
+    Leaves the file positioned at the start of the body. Returns None, after
+    reading only the first line, if the file doesn't open with ---, and None
+    if the block is never closed.
+    """
+    # Bounded, so a huge single-line file isn't read to find its first newline
+    if f.readline(8).rstrip("\r\n") != "---":
+        return None
+    lines = []
+    for line in f:
+        if line.rstrip() == "---":
+            return "".join(lines)
+        lines.append(line)
+    return None
+
+
+def read_frontmatter(path: Path) -> dict[str, Any] | None:
+    """Read only the YAML frontmatter of a markdown file.
+
+    Reads line by line and stops at the closing ---, so the body is never
+    read.
+
+    Args:
+        path: Markdown file to read
+
+    Returns:
+        Frontmatter mapping, or None if the file has no (closed) frontmatter
+        block or it isn't a mapping
+
+    Raises:
+        ValueError: If the frontmatter is not valid YAML or not UTF-8
+        OSError: If the file can't be read
+    """
+    with path.open(encoding="utf-8") as f:
+        block = _read_frontmatter_block(f)
+    if block is None:
+        return None
+
+    try:
+        fm = yaml.load(block, Loader=_YAML_LOADER)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML frontmatter in {path}: {e}") from e
+    return fm if isinstance(fm, dict) else None
+
+
+class TaskHeader:
+    """The frontmatter fields bulk scans filter on, without the body.
+
+    Built by TaskHeader.from_file, which reads only the frontmatter. Field
+    values are coerced the same way as Task.from_frontmatter.
+    """
+
+    __slots__ = (
+        "path",
+        "id",
+        "title",
+        "type",
+        "status",
+        "priority",
+        "order",
+        "parent",
+        "depends_on",
+        "soft_depends_on",
+        "project",
+        "assignee",
+        "leaf",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        id: str,
+        title: str,
+        type: TaskType,
+        status: TaskStatus = TaskStatus.ACTIVE,
+        priority: int = 2,
+        order: int = 0,
+        parent: str | None = None,
+        depends_on: list[str] | None = None,
+        soft_depends_on: list[str] | None = None,
+        project: str | None = None,
+        assignee: str | None = None,
+        leaf: bool = True,
+    ):
+        self.path = path
+        self.id = id
+        self.title = title
+        self.type = type
+        self.status = status
+        self.priority = priority
+        self.order = order
+        self.parent = parent
+        self.depends_on = depends_on or []
+        self.soft_depends_on = soft_depends_on or []
+        self.project = project
+        self.assignee = assignee
+        self.leaf = leaf
+
+    @classmethod
+    def from_frontmatter(cls, fm: dict[str, Any], path: Path) -> TaskHeader | None:
+        """Create a header from a frontmatter dictionary.
+
+        Args:
+            fm: Frontmatter dictionary from YAML
+            path: File the frontmatter was read from
+
+        Returns:
+            TaskHeader, or None if the frontmatter isn't a task's (no ID,
+            no title, or a missing or unknown type)
+        """
+        task_id = fm.get("id") or fm.get("task_id") or fm.get("permalink")
+        if not task_id or "title" not in fm:
+            return None
+        try:
+            task_type = _parse_task_type(fm, task_id)
+        except ValueError:
+            return None
+        status, priority, order = _parse_status_and_rank(fm, task_id)
+
+        return cls(
+            path=path,
+            id=task_id,
+            title=fm["title"],
+            type=task_type,
+            status=status,
+            priority=priority,
+            order=order,
+            parent=fm.get("parent"),
+            depends_on=fm.get("depends_on"),
+            soft_depends_on=fm.get("soft_depends_on"),
+            project=fm.get("project"),
+            assignee=fm.get("assignee"),
+            leaf=fm.get("leaf", True),
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> TaskHeader | None:
+        """Read a task header from a file's frontmatter only.
+
+        Args:
+            path: Markdown file to read
+
+        Returns:
+            TaskHeader, or None if the file isn't a task
+
+        Raises:
+            ValueError: If the frontmatter is not valid YAML
+            OSError: If the file can't be read
+        """
+        fm = read_frontmatter(path)
+        if fm is None:
+            return None
+        return cls.from_frontmatter(fm, path)
+
+    def __repr__(self) -> str:
+        return f"TaskHeader(id={self.id!r}, title={self.title!r}, type={self.type.value})"
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -0,0 +1,309 @@
+#!/usr/bin/env -S uv run python
+"""Task Queue: persistent queue of claimable tasks for worker claims.
+
+Claiming used to mean get_ready_tasks (a parse of every task), then a path
+lookup, a per-task lock and a reload for each candidate. The ready queue
+keeps the claimable tasks in $ACA_DATA/tasks/.ready-queue.json:
+
+    ready[task_id]    -> path, priority, order, title, project, assignee:
+                         claimable now
+    waiting[task_id]  -> dependency IDs not yet done: claimable once they are
+
+A claim takes one lock (.ready-queue.json.lock), picks the best ready entry,
+re-reads that one file to confirm it is still claimable, and marks it
+in_progress before releasing the lock.
+
+Keeping it current:
+- TaskStorage tells the queue about every task it saves, claims or deletes.
+  Completing a task moves the waiting tasks that depended on it to ready.
+  Saves that change none of the fields deciding a task's place (status,
+  priority, dependencies, ...) leave the queue file alone.
+- Files edited by other tools are only noticed at claim time (the entry is
+  re-checked) or when the queue is rebuilt from a full scan: when it is
+  missing, older than max_age, or has nothing to claim and is older than
+  retry_age.
+
+Usage:
+    from lib.task_storage import TaskStorage
+
+    storage = TaskStorage()
+    task = storage.claim_next_task("polecat-1", project="aops")
+    depth = storage.ready_queue.depth(project="aops")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock
+
+from lib.cache_utils import atomic_write
+from lib.task_model import Task, TaskHeader, TaskStatus
+
+if TYPE_CHECKING:
+    from lib.task_storage import TaskStorage
+
+logger = logging.getLogger(__name__)
+
+# Bump when the queue file format changes
+READY_QUEUE_VERSION = 1
+
+_COMPLETED = (TaskStatus.DONE, TaskStatus.CANCELLED)
+
+
+class ReadyQueue:
+    """Persistent ready queue for one data root (see module docstring)."""
+
+    # Seconds before a full rebuild, to pick up edits made outside TaskStorage
+    max_age = 300.0
+    # Seconds before a rebuild when nothing can be claimed
+    retry_age = 30.0
+
+    def __init__(self, storage: TaskStorage):
+        self.storage = storage
+        self.path = storage.data_root / "tasks" / ".ready-queue.json"
+        # A rebuild parses every task while holding the lock
+        self._lock = FileLock(str(self.path) + ".lock", timeout=120)
+
+    # --- Public API --------------------------------------------------------
+
+    def claim(self, caller: str, project: str | None = None) -> Task | None:
+        """Claim the highest-priority ready task for caller.
+
+        Args:
+            caller: Worker claiming the task; becomes the assignee
+            project: Only claim tasks in this project
+
+        Returns:
+            The claimed task, now in_progress, or None if nothing is claimable
+        """
+        with self._lock:
+            data = self._load()
+            rebuilt = data is None or self._age(data) >= self.max_age
+            if rebuilt:
+                data = self._rebuild()
+            task = self._claim_from(data, caller, project)
+            if task is None and not rebuilt and self._age(data) >= self.retry_age:
+                data = self._rebuild()
+                task = self._claim_from(data, caller, project)
+            self._save(data)
+        return task
+
+    def depth(self, project: str | None = None) -> int:
+        """Count ready tasks, without rebuilding (0 if the queue isn't built)."""
+        data = self._load()
+        if data is None:
+            return 0
+        return sum(
+            1 for entry in data["ready"].values() if project is None or entry["project"] == project
+        )
+
+    def placement_inputs(self, path: Path | None) -> tuple | None:
+        """Read the fields that place a task in the queue from its file.
+
+        Called before a save, so task_saved can skip saves that change none
+        of them. None if the queue isn't built or the file isn't a task.
+        """
+        if path is None or not self.path.exists():
+            return None
+        try:
+            header = TaskHeader.from_file(path)
+        except (ValueError, OSError):
+            return None
+        return None if header is None else _placement_inputs(header)
+
+    def task_saved(self, task: Task, path: Path, before: tuple | None = None) -> None:
+        """Update the queue for a task just written to path.
+
+        A no-op until the queue has been built by a claim, or when before
+        (placement_inputs of the file before the save) shows that nothing
+        deciding the task's place changed.
+        """
+        if not self.path.exists():
+            return
+        if before is not None and before == _placement_inputs(task):
+            return
+        with self._lock:
+            data = self._load()
+            if data is None:
+                return
+            self._place(data, task, path)
+            if task.status in _COMPLETED:
+                self._release_waiting(data, task.id)
+            self._save(data)
+
+    def task_removed(self, task_id: str) -> None:
+        """Drop a deleted task from the queue."""
+        if not self.path.exists():
+            return
+        with self._lock:
+            data = self._load()
+            if data is None:
+                return
+            data["ready"].pop(task_id, None)
+            data["waiting"].pop(task_id, None)
+            self._save(data)
+
+    # --- Placement -----------------------------------------------------------
+
+    def _claimable(self, task: Task) -> bool:
+        """Check everything get_ready_tasks checks except dependencies.
+
+        Tasks with a PR are never claimable, even if their status reverted
+        to active.
+        """
+        return (
+            task.status == TaskStatus.ACTIVE
+            and task.leaf
+            and task.type in self.storage.CLAIMABLE_TYPES
+            and not (task.pr_url or task.pr)
+        )
+
+    def _unmet_dependencies(self, task: Task) -> list[str]:
+        """Get the dependencies of a task that are not done (or don't exist)."""
+        unmet = []
+        for dep_id in task.depends_on:
+            path = self.storage._find_task_path(dep_id)
+            try:
+                header = TaskHeader.from_file(path) if path else None
+            except (ValueError, OSError):
+                header = None
+            if header is None or header.status not in _COMPLETED:
+                unmet.append(dep_id)
+        return unmet
+
+    def _place(self, data: dict[str, Any], task: Task, path: Path) -> None:
+        """Put a task in ready or waiting, or drop it, per its current state."""
+        data["ready"].pop(task.id, None)
+        data["waiting"].pop(task.id, None)
+        if not self._claimable(task):
+            return
+        unmet = self._unmet_dependencies(task)
+        if unmet:
+            data["waiting"][task.id] = unmet
+        else:
+            self._set_ready(data, task, path)
+
+    def _set_ready(self, data: dict[str, Any], task: Task, path: Path) -> None:
+        try:
+            relative = str(path.relative_to(self.storage.data_root))
+        except ValueError:
+            return
+        data["ready"][task.id] = {
+            "path": relative,
+            "priority": task.priority,
+            "order": task.order,
+            "title": task.title,
+            "project": task.project,
+            "assignee": task.assignee,
+        }
+
+    def _release_waiting(self, data: dict[str, Any], done_id: str) -> None:
+        """Re-place waiting tasks whose last unmet dependency was done_id."""
+        for task_id, unmet in list(data["waiting"].items()):
+            if done_id not in unmet:
+                continue
+            unmet.remove(done_id)
+            if unmet:
+                continue
+            del data["waiting"][task_id]
+            path = self.storage._find_task_path(task_id)
+            if path is None:
+                continue
+            try:
+                task = Task.from_file(path)
+            except (ValueError, OSError, KeyError):
+                continue
+            self._place(data, task, path)
+
+    def _claim_from(self, data: dict[str, Any], caller: str, project: str | None) -> Task | None:
+        candidates = sorted(
+            (
+                (entry["priority"], entry["order"], entry["title"], task_id)
+                for task_id, entry in data["ready"].items()
+                if (project is None or entry["project"] == project)
+                and entry["assignee"] in (None, caller)
+            ),
+        )
+        for *_, task_id in candidates:
+            path = self.storage.data_root / data["ready"][task_id]["path"]
+            try:
+                task = Task.from_file(path)
+            except (ValueError, OSError, KeyError):
+                del data["ready"][task_id]
+                continue
+            if task.id != task_id:
+                del data["ready"][task_id]
+                continue
+
+            # The file may have changed since it was queued
+            self._place(data, task, path)
+            if task_id not in data["ready"] or task.assignee not in (None, caller):
+                continue
+
+            task.status = TaskStatus.IN_PROGRESS
+            task.assignee = caller
+            # Not save_task: the queue is updated here, under the lock held now
+            self.storage._write_task(path, task)
+            del data["ready"][task_id]
+            return task
+        return None
+
+    # --- Persistence ---------------------------------------------------------
+
+    def _age(self, data: dict[str, Any]) -> float:
+        return time.time() - data["built"]
+
+    def _rebuild(self) -> dict[str, Any]:
+        """Build the queue from a full scan of the task graph."""
+        tasks = list(self.storage._iter_all_tasks_with_paths())
+        completed_ids = {task.id for task, _ in tasks if task.status in _COMPLETED}
+        data: dict[str, Any] = {"built": time.time(), "ready": {}, "waiting": {}}
+        for task, path in tasks:
+            if not self._claimable(task):
+                continue
+            unmet = [dep_id for dep_id in task.depends_on if dep_id not in completed_ids]
+            if unmet:
+                data["waiting"][task.id] = unmet
+            else:
+                self._set_ready(data, task, path)
+        logger.debug("Rebuilt ready queue: %d ready", len(data["ready"]))
+        return data
+
+    def _load(self) -> dict[str, Any] | None:
+        """Load the queue file, or None if it is missing or unreadable."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != READY_QUEUE_VERSION:
+            return None
+        return data
+
+    def _save(self, data: dict[str, Any]) -> None:
+        """Persist the queue atomically (callers hold the lock)."""
+        data["version"] = READY_QUEUE_VERSION
+        try:
+            atomic_write(self.path, json.dumps(data, separators=(",", ":")).encode())
+        except OSError as e:
+            # The queue is rebuilt from the task files when missing
+            logger.warning("Failed to save ready queue %s: %s", self.path, e)
+
+
+def _placement_inputs(task: Task | TaskHeader) -> tuple:
+    """Get the fields _place and _set_ready read that a save can change."""
+    return (
+        task.status,
+        task.priority,
+        task.order,
+        task.title,
+        task.project,
+        task.assignee,
+        task.type,
+        task.leaf,
+        tuple(task.depends_on),
+    )
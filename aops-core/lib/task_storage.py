@@ -18,6 +18,7 @@ Directory Structure:
     │       └── ...
     └── tasks/
         ├── index.json
+        ├── .path-index.json    # id -> (path, mtime, size) lookup cache
         └── inbox/
             └── 20260112-random-idea.md
 
@@ -34,6 +35,8 @@ Usage:
 
 from __future__ import annotations
 
+import json
+import os
 import tempfile
 from collections import deque
 from collections.abc import Iterator
@@ -42,8 +45,11 @@ from pathlib import Path
 
 from filelock import FileLock
 
+from lib.cache_utils import atomic_write
 from lib.paths import get_data_root
-from lib.task_model import Task, TaskComplexity, TaskStatus, TaskType
+from lib.task_graph import TaskGraph, copy_task, get_task_graph
+from lib.task_model import Task, TaskComplexity, TaskHeader, TaskStatus, TaskType
+from lib.task_queue import ReadyQueue
 
 # Directories to exclude from recursive task scanning
 # These contain non-task data that shouldn't be indexed
@@ -60,6 +66,9 @@ EXCLUDED_DIRS = frozenset(
     }
 )
 
+# Bump when the path index format changes
+PATH_INDEX_VERSION = 1
+
 
 class TaskStorage:
     """Flat file storage for tasks organized by project.
@@ -67,6 +76,20 @@ class TaskStorage:
     Tasks are stored as markdown files with YAML frontmatter.
     Each project has its own tasks/ subdirectory.
     Tasks without a project go to the global inbox.
+
+    Task lookups by ID go through a persistent path index
+    ($ACA_DATA/tasks/.path-index.json) mapping each ID to its file path,
+    mtime and size. It is kept up to date by save, claim and delete; an entry whose
+    file changed on disk is re-verified, and a miss falls back to scanning
+    $ACA_DATA and repairs the index.
+
+    Graph queries (list, ready, blocked, children, descendants, ancestors)
+    are answered from a process-wide in-memory snapshot of all tasks
+    (lib.task_graph.TaskGraph), kept current by directory mtimes. Call
+    refresh() to pick up files edited in place by other tools right away.
+
+    Workers claim through claim_next_task, backed by a persistent ready
+    queue (lib.task_queue.ReadyQueue) that save, claim and delete keep current.
     """
 
     def __init__(self, data_root: Path | None = None):
@@ -76,6 +99,149 @@ class TaskStorage:
             data_root: Root data directory. Defaults to $ACA_DATA.
         """
         self.data_root = data_root or get_data_root()
+        # task_id -> (path relative to data_root, mtime_ns, size); loaded lazily
+        self._path_index: dict[str, tuple[str, int, int]] | None = None
+        self._path_index_mtime_ns: int | None = None
+        self.ready_queue = ReadyQueue(self)
+
+    def _graph(self) -> TaskGraph:
+        """Get the task graph snapshot for data_root, synced with the disk.
+
+        Callers must hold graph.lock while using it and copy tasks they return.
+        """
+        graph = get_task_graph(self.data_root, EXCLUDED_DIRS)
+        graph.sync()
+        return graph
+
+    def refresh(self) -> None:
+        """Re-read every changed task file into the task graph snapshot now.
+
+        Only needed after another tool rewrote task files in place within
+        the last few seconds; files added, removed or renamed are noticed
+        on the next query.
+        """
+        get_task_graph(self.data_root, EXCLUDED_DIRS).refresh()
+
+    def _files_changed(self, *paths: Path) -> None:
+        """Tell the task graph snapshot about files this storage wrote or deleted."""
+        get_task_graph(self.data_root, EXCLUDED_DIRS).files_changed(*paths)
+
+    @property
+    def path_index_file(self) -> Path:
+        """Path to the persistent task ID -> path index."""
+        return self.data_root / "tasks" / ".path-index.json"
+
+    def _load_path_index(self) -> dict[str, tuple[str, int, int]]:
+        """Load the path index from disk, or start an empty one.
+
+        Returns:
+            Mapping of task ID to (path relative to data_root, mtime_ns, size)
+        """
+        index: dict[str, tuple[str, int, int]] = {}
+        try:
+            mtime_ns = self.path_index_file.stat().st_mtime_ns
+            data = json.loads(self.path_index_file.read_text(encoding="utf-8"))
+            if data.get("version") == PATH_INDEX_VERSION:
+                index = {task_id: tuple(entry) for task_id, entry in data["tasks"].items()}
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            mtime_ns = None
+        self._path_index = index
+        self._path_index_mtime_ns = mtime_ns
+        return index
+
+    def _get_path_index(self, *, reload: bool = False) -> dict[str, tuple[str, int, int]]:
+        """Get the in-memory path index, reloading it if another process saved it.
+
+        Args:
+            reload: Check the file on disk even if the index is already loaded
+        """
+        if self._path_index is None:
+            return self._load_path_index()
+        if reload:
+            try:
+                mtime_ns = self.path_index_file.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns != self._path_index_mtime_ns:
+                return self._load_path_index()
+        return self._path_index
+
+    def _save_path_index(self) -> None:
+        """Persist the path index atomically.
+
+        Concurrent writers may lose each other's updates; that only costs a
+        scan on the next miss, since every entry is verified before use.
+        """
+        index = self._get_path_index()
+        data = {
+            "version": PATH_INDEX_VERSION,
+            "tasks": {task_id: list(entry) for task_id, entry in index.items()},
+        }
+        path = self.path_index_file
+        try:
+            atomic_write(path, json.dumps(data, separators=(",", ":")).encode())
+            self._path_index_mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            # The index is a cache: the next miss rescans
+            pass
+
+    def _index_task_path(self, task_id: str, path: Path, *, save: bool = True) -> None:
+        """Record a task's current path, mtime and size in the path index.
+
+        Args:
+            task_id: Task ID
+            path: Task file, under data_root
+            save: Persist the index now
+        """
+        try:
+            stat = path.stat()
+            relative = str(path.relative_to(self.data_root))
+        except (OSError, ValueError):
+            return
+        entry = (relative, stat.st_mtime_ns, stat.st_size)
+        index = self._get_path_index()
+        if index.get(task_id) == entry:
+            return
+        index[task_id] = entry
+        if save:
+            self._save_path_index()
+
+    def _unindex_task(self, task_id: str) -> None:
+        """Remove a task from the path index."""
+        index = self._get_path_index()
+        if index.pop(task_id, None) is not None:
+            self._save_path_index()
+
+    def _lookup_indexed_path(self, task_id: str) -> Path | None:
+        """Look up a task in the path index, verifying the entry.
+
+        An entry whose file's mtime and size still match is trusted without
+        reading the file. If the file changed, its frontmatter ID is checked again.
+        Entries pointing at missing or different files are dropped.
+
+        Args:
+            task_id: Task ID to find
+
+        Returns:
+            Path if the index has a valid entry, None otherwise
+        """
+        entry = self._get_path_index(reload=True).get(task_id)
+        if entry is None:
+            return None
+        relative, mtime_ns, size = entry
+        path = self.data_root / relative
+        try:
+            stat = path.stat()
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                return path
+            header = TaskHeader.from_file(path)
+            if header is not None and header.id == task_id:
+                self._index_task_path(task_id, path)
+                return path
+        except (ValueError, OSError, KeyError):
+            pass
+        self._unindex_task(task_id)
+        return None
 
     def _get_project_tasks_dir(self, project: str | None) -> Path:
         """Get tasks directory for a project.
@@ -106,14 +272,31 @@ class TaskStorage:
     def _find_task_path(self, task_id: str) -> Path | None:
         """Find existing task file by ID.
 
+        Checks the path index first. On a miss, scans $ACA_DATA (see
+        _scan_for_task_path) and records what it finds in the index.
+
+        Args:
+            task_id: Task ID to find
+
+        Returns:
+            Path if found, None otherwise
+        """
+        path = self._lookup_indexed_path(task_id)
+        if path is not None:
+            return path
+        return self._scan_for_task_path(task_id)
+
+    def _scan_for_task_path(self, task_id: str) -> Path | None:
+        """Find a task file by scanning $ACA_DATA, repairing the path index.
+
         Searches all markdown files in $ACA_DATA for a task with matching ID.
         The ID is matched against the 'id' field in the YAML frontmatter.
 
-        This uses the same scanning approach as _iter_all_tasks to ensure
-        consistency - any task that list_tasks returns can be found by get_task.
-
-        For performance on repeated lookups, consider using TaskIndex which
-        maintains a cached mapping of task IDs to file paths.
+        Falls back to the task graph snapshot, the same source as
+        _iter_all_tasks, to ensure consistency - any task that list_tasks
+        returns can be found by get_task. Every task in the snapshot is
+        added to the path index, so one miss indexes the whole tree for
+        later lookups.
 
         Args:
             task_id: Task ID to find
@@ -143,22 +326,28 @@ class TaskStorage:
                     if path.is_file() and (
                         path.stem == task_id or path.stem.startswith(f"{task_id}-")
                     ):
+                        self._index_task_path(task_id, path)
                         return path
 
-        # Slow path: scan all markdown files and check frontmatter ID
+        # Slow path: check frontmatter IDs of all markdown files
         # This catches tasks where:
         # - Stored in non-standard locations (goals/, projects/, etc.)
         # - Filename doesn't match the frontmatter ID (e.g., legacy files)
-        for md_file in self._iter_markdown_files():
-            try:
-                task = Task.from_file(md_file)
-                if task.id == task_id:
-                    return md_file
-            except (ValueError, OSError, KeyError):
-                # Skip files that aren't valid tasks
-                continue
-
-        return None
+        index = self._get_path_index()
+        # A miss is rare and may follow an in-place edit, so re-stat every file
+        graph = get_task_graph(self.data_root, EXCLUDED_DIRS)
+        graph.refresh()
+        with graph.lock:
+            for other_id, paths in graph.paths_by_id.items():
+                if other_id not in index:
+                    self._index_task_path(other_id, min(paths), save=False)
+            paths = graph.paths_by_id.get(task_id)
+            found = min(paths) if paths else None
+        if found is not None:
+            self._index_task_path(task_id, found, save=False)
+
+        self._save_path_index()
+        return found
 
     def create_task(
         self,
@@ -268,8 +457,6 @@ class TaskStorage:
         Returns:
             Updated Task if successfully claimed, None if already claimed or not found
         """
-        import os
-
         path = self._find_task_path(task_id)
         if path is None:
             return None
@@ -314,10 +501,31 @@ class TaskStorage:
             except Exception:
                 Path(temp_path).unlink(missing_ok=True)
                 raise
+            self._index_task_path(task_id, path)
+            self._files_changed(path)
+
+        # After releasing the task lock: claim_next_task takes the queue lock first
+        self.ready_queue.task_saved(task, path)
+
+        # Populate relationships for response
+        self._populate_inverse_relationships(task)
+        return task
+
+    def claim_next_task(self, assignee: str, project: str | None = None) -> Task | None:
+        """Atomically claim the highest-priority ready task.
 
-            # Populate relationships for response
-            self._populate_inverse_relationships(task)
-            return task
+        Candidates come from the ready queue; only the chosen task's file is
+        read, and claims from all workers are serialized by the queue lock.
+        Tasks assigned to someone else, or with a PR, are skipped.
+
+        Args:
+            assignee: Agent/worker claiming the task
+            project: Only claim tasks in this project
+
+        Returns:
+            Claimed Task (now in_progress), or None if no task is ready
+        """
+        return self.ready_queue.claim(assignee, project)
 
     def save_task(self, task: Task, *, update_body: bool = True) -> Path:
         """Save task to file with file locking and atomic writes.
@@ -342,31 +550,43 @@ class TaskStorage:
         Returns:
             Path where task was saved
         """
-        # Populate inverse relationships for markdown rendering
-        self._populate_inverse_relationships(task)
-
         # Use existing path if task already exists, otherwise compute new path
         existing_path = self._find_task_path(task.id)
         path = existing_path if existing_path else self._get_task_path(task)
-        self._atomic_write(path, task, update_body=update_body)
+        before = self.ready_queue.placement_inputs(existing_path)
+        self._write_task(path, task, update_body=update_body)
+        self.ready_queue.task_saved(task, path, before)
 
         # Update parent's leaf status
         if task.parent:
             parent = self.get_task(task.parent)
             if parent:
                 parent.add_child(task.id)
-                self._populate_inverse_relationships(parent)
                 parent_path = self._find_task_path(task.parent)
                 if parent_path:
+                    before = self.ready_queue.placement_inputs(parent_path)
                     # Parent update is metadata-only (children list), so preserve body
-                    self._atomic_write(parent_path, parent, update_body=False)
+                    self._write_task(parent_path, parent, update_body=False)
+                    self.ready_queue.task_saved(parent, parent_path, before)
 
         return path
 
+    def _write_task(self, path: Path, task: Task, *, update_body: bool = True) -> None:
+        """Write a task file and update the path index and task graph.
+
+        Populates inverse relationships first, so the rendered Relationships
+        section stays current. Updating the ready queue is left to callers
+        (a claim holds the queue lock and places the task itself).
+        """
+        self._populate_inverse_relationships(task)
+        self._atomic_write(path, task, update_body=update_body)
+        self._index_task_path(task.id, path)
+        self._files_changed(path)
+
     def _populate_inverse_relationships(self, task: Task) -> None:
         """Populate inverse relationships (children, blocks, soft_blocks) for a task.
 
-        Scans all tasks to compute:
+        Looks up in the task graph:
         - children: tasks that have this task as parent
         - blocks: tasks that depend on this task (hard blocking)
         - soft_blocks: tasks that soft-depend on this task (non-blocking context)
@@ -374,26 +594,12 @@ class TaskStorage:
         Args:
             task: Task to populate relationships for
         """
-        children = []
-        blocks = []
-        soft_blocks = []
-
-        for other_task in self._iter_all_tasks():
+        graph = self._graph()
+        with graph.lock:
             # Skip self
-            if other_task.id == task.id:
-                continue
-
-            # Children: tasks that have this task as parent
-            if other_task.parent == task.id:
-                children.append(other_task.id)
-
-            # Blocks: tasks that hard-depend on this task
-            if task.id in other_task.depends_on:
-                blocks.append(other_task.id)
-
-            # Soft blocks: tasks that soft-depend on this task
-            if task.id in other_task.soft_depends_on:
-                soft_blocks.append(other_task.id)
+            children = [i for i in graph.ids(graph.children.get(task.id, ())) if i != task.id]
+            blocks = [i for i in graph.ids(graph.blocks.get(task.id, ())) if i != task.id]
+            soft_blocks = [i for i in graph.ids(graph.soft_blocks.get(task.id, ())) if i != task.id]
 
         task.children = children
         task.blocks = blocks
@@ -417,8 +623,6 @@ class TaskStorage:
         Raises:
             IOError: If write verification fails (file missing or invalid)
         """
-        import os
-
         lock_path = path.with_suffix(path.suffix + ".lock")
         lock = FileLock(lock_path, timeout=10)
 
@@ -509,6 +713,9 @@ class TaskStorage:
         if path is None:
             return False
         path.unlink()
+        self._unindex_task(task_id)
+        self._files_changed(path)
+        self.ready_queue.task_removed(task_id)
         return True
 
     def list_tasks(
@@ -569,37 +776,16 @@ class TaskStorage:
     def _iter_all_tasks_with_paths(self) -> Iterator[tuple[Task, Path]]:
         """Iterate over all task files with their paths.
 
-        Yields:
-            Tuples of (Task, Path) for each valid task file
-        """
-        valid_types = {t.value for t in TaskType}
-
-        for md_file in self._iter_markdown_files():
-            try:
-                task = Task.from_file(md_file)
-                # Verify it has a valid task type
-                if task.type.value in valid_types:
-                    yield task, md_file
-            except (ValueError, OSError, KeyError):
-                # Skip files that aren't valid tasks
-                continue
-
-    def _iter_markdown_files(self) -> Iterator[Path]:
-        """Iterate over all markdown files in $ACA_DATA.
-
-        Recursively walks the data directory, skipping excluded
-        directories and hidden files/folders.
+        Served from the task graph snapshot; each task is a copy.
 
         Yields:
-            Path to each .md file
+            Tuples of (Task, Path) for each valid task file
         """
-        for root, dirs, files in self.data_root.walk():
-            # Filter out excluded and hidden directories (in-place modification)
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d not in EXCLUDED_DIRS]
-
-            for filename in files:
-                if filename.endswith(".md") and not filename.startswith("."):
-                    yield root / filename
+        graph = self._graph()
+        with graph.lock:
+            snapshot = list(graph.by_path.items())
+        for path, task in snapshot:
+            yield copy_task(task), path
 
     def get_children(self, task_id: str) -> list[Task]:
         """Get direct children of a task.
@@ -610,10 +796,9 @@ class TaskStorage:
         Returns:
             List of child tasks sorted by order
         """
-        children = []
-        for task in self._iter_all_tasks():
-            if task.parent == task_id:
-                children.append(task)
+        graph = self._graph()
+        with graph.lock:
+            children = [copy_task(task) for task in graph.tasks(graph.children.get(task_id, ()))]
 
         children.sort(key=lambda t: (t.order, t.title))
         return children
@@ -629,13 +814,20 @@ class TaskStorage:
         """
         descendants = []
         to_visit = deque([task_id])
-
-        while to_visit:
-            current_id = to_visit.popleft()
-            children = self.get_children(current_id)
-            for child in children:
-                descendants.append(child)
-                to_visit.append(child.id)
+        visited = {task_id}
+
+        graph = self._graph()
+        with graph.lock:
+            while to_visit:
+                current_id = to_visit.popleft()
+                children = graph.tasks(graph.children.get(current_id, ()))
+                children.sort(key=lambda t: (t.order, t.title))
+                for child in children:
+                    descendants.append(copy_task(child))
+                    # Guard against parent cycles
+                    if child.id not in visited:
+                        visited.add(child.id)
+                        to_visit.append(child.id)
 
         return descendants
 
@@ -649,15 +841,20 @@ class TaskStorage:
             List of ancestors from immediate parent to root
         """
         ancestors = []
-        task = self.get_task(task_id)
-
-        while task and task.parent:
-            parent = self.get_task(task.parent)
-            if parent:
-                ancestors.append(parent)
-                task = parent
-            else:
-                break
+        graph = self._graph()
+        with graph.lock:
+            task = graph.get(task_id)
+            visited = {task_id}
+
+            # Stop at a missing parent or a parent cycle
+            while task and task.parent and task.parent not in visited:
+                parent = graph.get(task.parent)
+                if parent:
+                    ancestors.append(copy_task(parent))
+                    visited.add(parent.id)
+                    task = parent
+                else:
+                    break
 
         return ancestors
 
@@ -693,15 +890,15 @@ class TaskStorage:
         Returns:
             List of ready tasks sorted by priority
         """
+        graph = self._graph()
+        with graph.lock:
+            tasks = list(graph.by_path.values())
+
         # Get all completed task IDs for dependency checking
-        completed_ids = {
-            t.id
-            for t in self._iter_all_tasks()
-            if t.status in (TaskStatus.DONE, TaskStatus.CANCELLED)
-        }
+        completed_ids = {t.id for t in tasks if t.status in (TaskStatus.DONE, TaskStatus.CANCELLED)}
 
         ready = []
-        for task in self._iter_all_tasks():
+        for task in tasks:
             if project is not None and task.project != project:
                 continue
 
@@ -722,7 +919,7 @@ class TaskStorage:
             if unmet_deps:
                 continue
 
-            ready.append(task)
+            ready.append(copy_task(task))
 
         ready.sort(key=lambda t: (t.priority, t.order, t.title))
         return ready
@@ -733,23 +930,23 @@ class TaskStorage:
         Returns:
             List of blocked tasks
         """
-        completed_ids = {
-            t.id
-            for t in self._iter_all_tasks()
-            if t.status in (TaskStatus.DONE, TaskStatus.CANCELLED)
-        }
+        graph = self._graph()
+        with graph.lock:
+            tasks = list(graph.by_path.values())
+
+        completed_ids = {t.id for t in tasks if t.status in (TaskStatus.DONE, TaskStatus.CANCELLED)}
 
         blocked = []
-        for task in self._iter_all_tasks():
+        for task in tasks:
             if task.status == TaskStatus.BLOCKED:
-                blocked.append(task)
+                blocked.append(copy_task(task))
                 continue
 
             # Check for unmet dependencies
             if task.depends_on:
                 unmet = [d for d in task.depends_on if d not in completed_ids]
                 if unmet:
-                    blocked.append(task)
+                    blocked.append(copy_task(task))
 
         return blocked
 
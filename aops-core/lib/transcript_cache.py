@@ -0,0 +1,323 @@
+"""
+Transcript Cache - incremental, offset-tracking reader for session transcripts.
+
+Hooks re-read the whole session JSONL on every invocation to build gate and
+router context, so the cost of each hook grows with the session. This module
+keeps a per-transcript parse cache holding:
+- the byte offset up to which the file has been parsed,
+- the parsed entries, and
+- the partial turn-grouping state (TurnGroupingState).
+
+A later read parses only the lines appended since the offset and regroups
+only the open turn. The cache is held in memory (for the router daemon) and
+persisted as a pickle in the transcripts cache directory (for one-shot hook
+processes; see lib.cache_utils):
+
+    <cache root>/transcripts, the cache root being $AOPS_CACHE_DIR, else
+    ${XDG_CACHE_HOME:-~/.cache}/aops
+
+The cache is dropped and the file re-parsed from the start when the file was
+replaced (device/inode changed), truncated, or rewritten at its start or just
+before the offset.
+Set AOPS_CACHE=0 to always parse from scratch.
+
+Only Claude JSONL transcripts are cached; Gemini JSON files and Antigravity
+brain directories are parsed in full every time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from lib import cache_utils
+from lib.transcript_parser import ConversationTurn, Entry, SessionProcessor, TurnGroupingState
+
+# Bump when Entry, TurnGroupingState or the grouping logic change shape
+CACHE_VERSION = 1
+
+# Bytes at the start of the file and before the parsed offset that must be
+# unchanged for the cache to be reused. Transcripts are append-only, so this
+# catches truncation and rewrites without reading the whole prefix.
+_FINGERPRINT_BYTES = 256
+
+# Transcripts kept in memory by a long-running process (the router daemon)
+_MEMORY_CACHE_SIZE = 8
+
+_memory_cache: OrderedDict[str, _CachedTranscript] = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+@dataclass
+class _CachedTranscript:
+    """Parse state of one transcript file, up to offset."""
+
+    device: int
+    inode: int
+    offset: int = 0
+    head: bytes = b""
+    fingerprint: bytes = b""
+    entries: list[Entry] = field(default_factory=list)
+    grouping: TurnGroupingState | None = None
+    # What the persisted cache file holds, or None if it must be rewritten
+    persisted: _Segment | None = None
+
+
+@dataclass
+class _Segment:
+    """One record of a persisted cache file.
+
+    The file is a header dict followed by segments, each holding what one
+    read added to the previous segment. Reads append a segment instead of
+    rewriting the file, so persisting costs O(appended) rather than O(session).
+    """
+
+    start: int  # Offset the previous segment ended at
+    end: int
+    head: bytes
+    fingerprint: bytes
+    entries: list[Entry]
+    sealed_turns: list[dict]
+    unresolved_tool_ids: list[str]
+    resume_index: int
+    conversation_start_time: datetime | None
+    # Totals after this segment, to diff the next segment against
+    entry_count: int = 0
+    sealed_count: int = 0
+    unresolved_count: int = 0
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for persisted transcript caches (not created)."""
+    return cache_utils.get_cache_dir("transcripts")
+
+
+def _cache_file(key: str) -> Path:
+    return get_cache_dir() / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.pickle"
+
+
+def _load_cached(key: str) -> _CachedTranscript | None:
+    cached = _memory_cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        f = open(_cache_file(key), "rb")
+    except OSError:
+        return None
+
+    with f:
+        try:
+            header = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+            return None
+
+        cached = _CachedTranscript(
+            device=header["device"], inode=header["inode"], grouping=TurnGroupingState()
+        )
+        while True:
+            try:
+                segment = pickle.load(f)
+            except EOFError:
+                break
+            except Exception:
+                # Torn write: keep what was read, rewrite the file next time
+                cached.persisted = None
+                break
+            if not isinstance(segment, _Segment) or segment.start != cached.offset:
+                # Two processes appended concurrently: keep the first chain
+                cached.persisted = None
+                break
+            _apply_segment(cached, segment)
+
+    return cached if cached.offset else None
+
+
+def _apply_segment(cached: _CachedTranscript, segment: _Segment) -> None:
+    grouping = cached.grouping
+    assert grouping is not None
+    cached.offset = segment.end
+    cached.head = segment.head
+    cached.fingerprint = segment.fingerprint
+    cached.entries.extend(segment.entries)
+    grouping.turns.extend(segment.sealed_turns)
+    grouping.unresolved_tool_ids.extend(segment.unresolved_tool_ids)
+    grouping.entry_count = len(cached.entries)
+    grouping.resume_index = segment.resume_index
+    grouping.sealed_count = len(grouping.turns)
+    grouping.unresolved_count = len(grouping.unresolved_tool_ids)
+    grouping.conversation_start_time = segment.conversation_start_time
+    cached.persisted = segment
+
+
+def _new_segment(cached: _CachedTranscript, since: _Segment | None) -> _Segment:
+    """Build the segment holding what cached adds to since (everything if None)."""
+    grouping = cached.grouping
+    assert grouping is not None
+    return _Segment(
+        start=since.end if since else 0,
+        end=cached.offset,
+        head=cached.head,
+        fingerprint=cached.fingerprint,
+        entries=cached.entries[since.entry_count if since else 0 :],
+        sealed_turns=grouping.turns[since.sealed_count if since else 0 : grouping.sealed_count],
+        unresolved_tool_ids=grouping.unresolved_tool_ids[
+            since.unresolved_count if since else 0 : grouping.unresolved_count
+        ],
+        resume_index=grouping.resume_index,
+        conversation_start_time=grouping.conversation_start_time,
+        entry_count=len(cached.entries),
+        sealed_count=grouping.sealed_count,
+        unresolved_count=grouping.unresolved_count,
+    )
+
+
+def _persist(key: str, cached: _CachedTranscript, since: _Segment | None) -> None:
+    """Append cached's new state to the cache file, or rewrite it if since is None."""
+    segment = _new_segment(cached, since)
+    data = pickle.dumps(segment, protocol=pickle.HIGHEST_PROTOCOL)
+    path = _cache_file(key)
+    if since is not None:
+        try:
+            # A single O_APPEND write: concurrent appends never interleave
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        except OSError:
+            # The next read just parses more
+            return
+    else:
+        header = {"version": CACHE_VERSION, "device": cached.device, "inode": cached.inode}
+        if not cache_utils.write_cache_file(
+            path, pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL) + data
+        ):
+            return
+    cached.persisted = segment
+
+
+def _remember(key: str, cached: _CachedTranscript) -> None:
+    # The router daemon reads transcripts of different sessions concurrently
+    with _memory_cache_lock:
+        _memory_cache[key] = cached
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def clear_memory_cache() -> None:
+    """Forget all in-memory transcript caches (persisted caches are kept)."""
+    _memory_cache.clear()
+
+
+def read_transcript(
+    transcript_path: Path | str,
+    processor: SessionProcessor | None = None,
+) -> tuple[list[Entry], list[ConversationTurn | dict]]:
+    """Read a session transcript's entries and conversation turns.
+
+    Equivalent to SessionProcessor.parse_session_file(path, load_agents=False,
+    load_hooks=False) followed by group_entries_into_turns(entries), but
+    only parses what was appended since the previous read.
+
+    Args:
+        transcript_path: Path to the session transcript
+        processor: SessionProcessor to parse with (a new one by default)
+
+    Returns:
+        (entries, turns). Callers must treat both as read-only: they share
+        objects with the cache.
+
+    Raises:
+        OSError: If the transcript can't be read
+    """
+    path = Path(transcript_path)
+    processor = processor or SessionProcessor()
+
+    if path.is_dir() or path.suffix.lower() == ".json" or not cache_utils.caches_enabled():
+        _, entries, _ = processor.parse_session_file(path, load_agents=False, load_hooks=False)
+        return entries, processor.group_entries_into_turns(entries, full_mode=True)
+
+    key = str(path.resolve())
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        cached = _load_cached(key)
+        if cached is not None and not _is_valid(cached, f, stat):
+            cached = None
+        if cached is None:
+            cached = _CachedTranscript(device=stat.st_dev, inode=stat.st_ino)
+
+        f.seek(cached.offset)
+        data = f.read()
+
+    consumed = _complete_length(data)
+    # Split on "\n" only: str.splitlines() would also split inside JSON strings
+    # holding raw separators such as U+2028
+    lines = data[:consumed].decode("utf-8").split("\n")
+    entries = cached.entries + processor.parse_jsonl_lines(path, lines)
+    turns, grouping = processor.group_entries_incremental(entries, cached.grouping)
+
+    updated = _CachedTranscript(
+        device=cached.device,
+        inode=cached.inode,
+        offset=cached.offset + consumed,
+        head=(cached.head + data[:consumed])[:_FINGERPRINT_BYTES],
+        fingerprint=(cached.fingerprint + data[:consumed])[-_FINGERPRINT_BYTES:],
+        entries=entries,
+        grouping=grouping,
+        persisted=cached.persisted,
+    )
+    if cached.persisted is None or not _extends(cached.grouping, grouping):
+        _persist(key, updated, since=None)
+    elif consumed:
+        _persist(key, updated, since=cached.persisted)
+    _remember(key, updated)
+    return list(entries), turns
+
+
+def _extends(old: TurnGroupingState | None, new: TurnGroupingState) -> bool:
+    """Check that new resumed from old instead of regrouping from scratch."""
+    if old is None:
+        return False
+    if old.sealed_count == 0:
+        return True
+    last = old.sealed_count - 1
+    return new.sealed_count > last and new.turns[last] is old.turns[last]
+
+
+def _complete_length(data: bytes) -> int:
+    """Length of the prefix of data made of complete lines.
+
+    A trailing line without a newline counts as complete once it parses as a
+    JSON object: a truncated object never does, and the newline written after
+    it later is just a blank line.
+    """
+    end = data.rfind(b"\n") + 1
+    tail = data[end:]
+    if not tail.strip():
+        return end
+    try:
+        return len(data) if isinstance(json.loads(tail), dict) else end
+    except ValueError:
+        return end
+
+
+def _is_valid(cached: _CachedTranscript, f, stat: os.stat_result) -> bool:
+    """Check that the file still holds the bytes the cache was built from."""
+    if (cached.device, cached.inode) != (stat.st_dev, stat.st_ino):
+        return False
+    if stat.st_size < cached.offset:
+        return False
+    if f.read(len(cached.head)) != cached.head:
+        return False
+    f.seek(cached.offset - len(cached.fingerprint))
+    return f.read(len(cached.fingerprint)) == cached.fingerprint
@@ -16,19 +16,35 @@ Used by:
 - QA verification workflows
 - Session insights pipeline
 - Hydration quality diagnostics
+
+scan_recent_sessions analyses sessions on a process pool and caches each
+session's report in the error-reports cache directory (see
+lib.cache_utils.get_cache_dir), keyed on the session file's path, size
+and mtime and on ANALYZER_VERSION, so a repeated scan only analyses new or
+grown sessions. Set AOPS_CACHE=0 to always analyse from scratch.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from lib.cache_utils import caches_enabled, get_cache_dir, write_cache_file
 from lib.session_paths import get_claude_project_folder
+from lib.transcript_parser import ToolCallIndex
+
+# Bump when extraction, classification or the report shape change, so cached
+# reports are recomputed
+ANALYZER_VERSION = 1
 
 # Exploration patterns: common convention files agents probe for
 _EXPLORATION_PATTERNS = {
@@ -297,41 +313,58 @@ def _load_entries(session_path: Path) -> list[dict[str, Any]]:
     return entries
 
 
-def _build_tool_use_map(entries: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    """Build mapping from tool_use_id to tool info (name, input, timestamp)."""
-    tool_map: dict[str, dict[str, Any]] = {}
+def _active_skills(entries: list[dict[str, Any]]) -> list[str | None]:
+    """Most recent Skill invocation before each entry index, in one forward pass."""
+    active: list[str | None] = []
+    current: str | None = None
     for entry in entries:
+        active.append(current)
         if entry.get("type") != "assistant":
             continue
-        message = entry.get("message", {})
-        content = message.get("content", [])
+        content = entry.get("message", {}).get("content", [])
         if not isinstance(content, list):
             continue
+        # The entry's last Skill block wins, as in a backward scan
+        entry_skill: str | None = None
         for block in content:
-            if isinstance(block, dict) and block.get("type") == "tool_use":
-                tool_id = block.get("id", "")
-                if tool_id:
-                    tool_map[tool_id] = {
-                        "name": block.get("name", "unknown"),
-                        "input": block.get("input", {}),
-                        "timestamp": entry.get("timestamp"),
-                    }
-    return tool_map
-
-
-def _build_hydration_state(entries: list[dict[str, Any]], error_index: int) -> HydrationState:
+            if (
+                isinstance(block, dict)
+                and block.get("type") == "tool_use"
+                and block.get("name") == "Skill"
+            ):
+                entry_skill = block.get("input", {}).get("skill")
+        if entry_skill is not None:
+            current = entry_skill
+    return active
+
+
+def _build_hydration_state(
+    entries: list[dict[str, Any]],
+    error_index: int,
+    active_skills: list[str | None] | None = None,
+) -> HydrationState:
     """Build the hydration state at the point of an error.
 
     Looks backward from error_index to find:
     - Most recent Skill invocation (active skill)
     - Recent user prompts (last 3)
     - Recent tool calls (last 5 before the error)
+
+    Args:
+        entries: Raw session entries
+        error_index: Index of the entry holding the error
+        active_skills: Precomputed _active_skills(entries), so that many errors
+            in one session don't each scan back to the start of the session
     """
-    active_skill: str | None = None
+    if active_skills is None:
+        active_skills = _active_skills(entries[: error_index + 1])
+    active_skill = active_skills[error_index]
     prompts: list[str] = []
     tool_calls: list[dict[str, Any]] = []
 
     for i in range(error_index - 1, -1, -1):
+        if len(prompts) >= 3 and len(tool_calls) >= 5:
+            break
         entry = entries[i]
         etype = entry.get("type")
 
@@ -346,19 +379,6 @@ def _build_hydration_state(entries: list[dict[str, Any]], error_index: int) -> H
                         if text and len(prompts) < 3:
                             prompts.append(text)
 
-        # Find most recent Skill invocation
-        if etype == "assistant" and active_skill is None:
-            message = entry.get("message", {})
-            content = message.get("content", [])
-            if isinstance(content, list):
-                for block in content:
-                    if (
-                        isinstance(block, dict)
-                        and block.get("type") == "tool_use"
-                        and block.get("name") == "Skill"
-                    ):
-                        active_skill = block.get("input", {}).get("skill")
-
         # Collect recent tool calls (non-error ones)
         if etype == "assistant":
             message = entry.get("message", {})
@@ -404,11 +424,16 @@ def extract_transcript_errors(session_path: Path) -> list[TranscriptError]:
     Returns:
         List of TranscriptError objects, in chronological order.
     """
-    entries = _load_entries(session_path)
+    return _extract_errors(_load_entries(session_path))
+
+
+def _extract_errors(entries: list[dict[str, Any]]) -> list[TranscriptError]:
+    """Extract all tool errors from a session's loaded entries."""
     if not entries:
         return []
 
-    tool_map = _build_tool_use_map(entries)
+    tool_index = ToolCallIndex(entries)
+    active_skills = _active_skills(entries)
     errors: list[TranscriptError] = []
 
     for idx, entry in enumerate(entries):
@@ -428,16 +453,17 @@ def extract_transcript_errors(session_path: Path) -> list[TranscriptError]:
                 continue
 
             tool_id = item.get("tool_use_id") or item.get("toolUseId") or ""
-            tool_info = tool_map.get(tool_id, {})
-            tool_name = tool_info.get("name", "unknown")
-            tool_input = tool_info.get("input", {})
+            tool_call = tool_index.get(tool_id)
+            tool_name = (tool_call.name if tool_call else None) or "unknown"
+            tool_input = tool_call.input if tool_call else {}
             error_content = str(item.get("content", ""))
 
-            hydration_state = _build_hydration_state(entries, idx)
+            hydration_state = _build_hydration_state(entries, idx, active_skills)
 
             errors.append(
                 TranscriptError(
-                    timestamp=tool_info.get("timestamp") or entry.get("timestamp"),
+                    timestamp=(tool_call.use_timestamp if tool_call else None)
+                    or entry.get("timestamp"),
                     tool_name=tool_name,
                     tool_input=tool_input,
                     tool_input_summary=_summarize_tool_input(tool_name, tool_input),
@@ -584,8 +610,7 @@ def analyze_transcript(session_path: Path) -> ErrorAnalysisReport:
         ErrorAnalysisReport with all errors classified and summary statistics.
     """
     entries = _load_entries(session_path)
-    errors = extract_transcript_errors(session_path)
-    classified = classify_errors(errors, entries)
+    classified = classify_errors(_extract_errors(entries), entries)
 
     category_counts: dict[str, int] = {}
     hydration_related = 0
@@ -626,6 +651,11 @@ def _grouping_key(error: TranscriptError) -> str:
         return f"{error.category}:{tool}"
 
 
+def _error_path(error: TranscriptError) -> str:
+    """Get the file path or pattern an error was about ("" if none)."""
+    return error.tool_input.get("file_path", "") or error.tool_input.get("pattern", "")
+
+
 def _find_recent_sessions(
     sessions_dir: Path,
     hours: float = 48.0,
@@ -647,16 +677,78 @@ def _find_recent_sessions(
     return [f for _, f in sessions]
 
 
+def _report_cache_file(session_path: Path) -> Path:
+    key = str(session_path.resolve())
+    return (
+        get_cache_dir("error-reports") / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.pickle"
+    )
+
+
+def _cache_key(session_path: Path) -> dict[str, Any]:
+    stat = session_path.stat()
+    return {
+        "version": ANALYZER_VERSION,
+        "path": str(session_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def _load_cached_report(session_path: Path, key: dict[str, Any]) -> ErrorAnalysisReport | None:
+    """Load a session's cached report, if it was computed for key."""
+    try:
+        with open(_report_cache_file(session_path), "rb") as f:
+            if pickle.load(f) != key:
+                return None
+            report = pickle.load(f)
+    except Exception:
+        return None
+    return report if isinstance(report, ErrorAnalysisReport) else None
+
+
+def _save_cached_report(
+    session_path: Path, key: dict[str, Any], report: ErrorAnalysisReport
+) -> None:
+    write_cache_file(
+        _report_cache_file(session_path),
+        pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+        + pickle.dumps(report, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+
+def _analyze_for_scan(session_path: Path, use_cache: bool) -> ErrorAnalysisReport | None:
+    """Analyse one session for scan_recent_sessions (in a worker process or not).
+
+    Returns:
+        The report, or None if the file is corrupt, unreadable or malformed
+    """
+    try:
+        # Keyed before reading: a session that grows meanwhile is re-analysed next scan
+        key = _cache_key(session_path)
+        report = analyze_transcript(session_path)
+    except (json.JSONDecodeError, OSError, KeyError, ValueError):
+        return None
+    if use_cache:
+        _save_cached_report(session_path, key, report)
+    return report
+
+
 def scan_recent_sessions(
     sessions_dir: Path | None = None,
     hours: float = 48.0,
+    jobs: int | None = None,
 ) -> MultiSessionReport:
     """Scan recent sessions and produce a severity-weighted investigation report.
 
+    Sessions unchanged since a previous scan reuse their cached report; the
+    rest are analysed on a process pool.
+
     Args:
         sessions_dir: Directory containing session JSONL files.
             Defaults to ~/.claude/projects/-home-nic-src-academicOps/
         hours: How far back to look (default 48 hours).
+        jobs: Worker processes for uncached sessions (default: CPU count;
+            1 analyses them in this process).
 
     Returns:
         MultiSessionReport with investigation queue sorted by severity * frequency.
@@ -682,19 +774,47 @@ def scan_recent_sessions(
             sessions_dir = projects_dir
 
     recent = _find_recent_sessions(sessions_dir, hours)
+    use_cache = caches_enabled()
+
+    by_path: dict[Path, ErrorAnalysisReport | None] = {}
+    pending: list[Path] = []
+    for session_file in recent:
+        cached = None
+        if use_cache:
+            try:
+                cached = _load_cached_report(session_file, _cache_key(session_file))
+            except OSError:
+                pass  # Reported (skipped) by the analysis
+        if cached is not None:
+            by_path[session_file] = cached
+        else:
+            pending.append(session_file)
+
+    jobs = jobs if jobs is not None else os.cpu_count() or 1
+    if jobs <= 1 or len(pending) <= 1:
+        for session_file in pending:
+            by_path[session_file] = _analyze_for_scan(session_file, use_cache)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            results = pool.map(_analyze_for_scan, pending, [use_cache] * len(pending), chunksize=1)
+            by_path.update(zip(pending, results, strict=True))
 
+    # Merge in scan order (most recent first), skipping corrupt/unreadable files
     reports: list[ErrorAnalysisReport] = []
     all_errors: list[tuple[str, TranscriptError]] = []  # (session_id, error)
-
     for session_file in recent:
+        report = by_path[session_file]
+        if report is None:
+            continue
+        reports.append(report)
         session_id = session_file.stem[:12]
-        try:
-            report = analyze_transcript(session_file)
-            reports.append(report)
-            for e in report.errors:
-                all_errors.append((session_id, e))
-        except (json.JSONDecodeError, OSError, KeyError, ValueError):
-            continue  # Skip corrupt/unreadable/malformed files
+        for e in report.errors:
+            all_errors.append((session_id, e))
+
+    # Repeats of each (path, category), for severity escalation
+    path_counts = Counter(
+        (path, error.category) for _, error in all_errors if (path := _error_path(error))
+    )
 
     # Aggregate into patterns
     pattern_map: dict[str, dict[str, Any]] = {}
@@ -702,18 +822,8 @@ def scan_recent_sessions(
         key = _grouping_key(error)
         if key not in pattern_map:
             # Count repeats for this specific error's path
-            path = error.tool_input.get("file_path", "") or error.tool_input.get("pattern", "")
-            path_count = (
-                sum(
-                    1
-                    for _, e in all_errors
-                    if (e.tool_input.get("file_path", "") or e.tool_input.get("pattern", ""))
-                    == path
-                    and e.category == error.category
-                )
-                if path
-                else 1
-            )
+            path = _error_path(error)
+            path_count = path_counts[(path, error.category)] if path else 1
             sev_label, sev_weight = severity_for(error.category, path_count)
             pattern_map[key] = {
                 "category": error.category,
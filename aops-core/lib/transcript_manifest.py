@@ -0,0 +1,262 @@
+"""
+Transcript Manifest - which transcripts exist per session, and what they were built from.
+
+Batch transcript generation (scripts/transcript.py --all) has to decide for
+every session whether its transcripts are current. Globbing the transcripts
+directory per session costs O(transcripts) each, O(sessions x transcripts) per
+run. The manifest keeps:
+- the names of the transcript files in the directory, indexed by session ID,
+- per session, the source file's mtime, size and content hash at the time its
+  transcripts were generated,
+
+so the freshness check is a dictionary lookup plus one stat of the source.
+
+The manifest is persisted as JSON in the transcript-manifest cache directory
+(see lib.cache_utils.get_cache_dir), not in the synced sessions repo. It
+records the transcripts directory's mtime; when the directory has changed
+since (transcripts added, removed or renamed by anything else), the file list
+is rebuilt from a single directory listing. Source records are only trusted
+while the session's transcript files are exactly those they were recorded
+with.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from lib.cache_utils import get_cache_dir, write_cache_file
+
+# Bump when the persisted format changes
+MANIFEST_VERSION = 1
+
+TRANSCRIPT_SUFFIXES = ("-full.md", "-abridged.md")
+
+_HASH_CHUNK = 1 << 20
+
+
+@dataclass
+class SourceRecord:
+    """The session source a session's transcripts were generated from."""
+
+    files: list[str]  # Transcript file names written from this source
+    mtime_ns: int
+    size: int
+    sha256: str | None = None  # None for directory sources (Antigravity)
+
+
+def source_fingerprint(session_path: Path) -> SourceRecord:
+    """Fingerprint a session source; the caller fills in the files written from it.
+
+    Take it before reading the session: if the session grows meanwhile, the
+    next run sees a different size and regenerates.
+    """
+    stat = session_path.stat()
+    digest = None
+    if session_path.is_file():
+        digest = _sha256(session_path)
+    return SourceRecord(files=[], mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=digest)
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_manifest_path(out_dir: Path) -> Path:
+    """Get the manifest file for a transcripts directory."""
+    key = hashlib.sha256(str(out_dir.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir("transcript-manifest") / f"{key}.json"
+
+
+class TranscriptManifest:
+    """Index of the transcripts in one directory, by session ID."""
+
+    def __init__(self, out_dir: Path, manifest_path: Path | None = None):
+        self.out_dir = out_dir
+        self.path = manifest_path or get_manifest_path(out_dir)
+        self.dir_mtime_ns: int | None = None
+        self.sources: dict[str, SourceRecord] = {}
+        self._files: set[str] = set()
+        self._by_token: dict[str, set[str]] = {}
+
+    @classmethod
+    def load(cls, out_dir: Path, manifest_path: Path | None = None) -> TranscriptManifest:
+        """Load the manifest for out_dir, rescanning the directory if it changed.
+
+        A missing or unreadable manifest file just means a full rescan.
+        """
+        manifest = cls(out_dir, manifest_path)
+        try:
+            data = json.loads(manifest.path.read_text())
+            if data.get("version") != MANIFEST_VERSION:
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+
+        manifest.sources = {
+            session_id: SourceRecord(**record)
+            for session_id, record in data.get("sources", {}).items()
+        }
+        dir_mtime_ns = _mtime_ns(out_dir)
+        if dir_mtime_ns is not None and dir_mtime_ns == data.get("dir_mtime_ns"):
+            manifest.dir_mtime_ns = dir_mtime_ns
+            manifest._set_files(data.get("files", []))
+        else:
+            manifest.rescan()
+        return manifest
+
+    def rescan(self) -> None:
+        """Rebuild the file list from a single listing of the directory."""
+        self.dir_mtime_ns = _mtime_ns(self.out_dir)
+        names = []
+        try:
+            with os.scandir(self.out_dir) as it:
+                for entry in it:
+                    if (
+                        entry.name.endswith(TRANSCRIPT_SUFFIXES)
+                        and not entry.name.startswith(".")
+                        and entry.is_file()
+                    ):
+                        names.append(entry.name)
+        except OSError:
+            pass
+        self._set_files(names)
+        # Forget sessions whose transcripts are gone
+        self.sources = {
+            session_id: record
+            for session_id, record in self.sources.items()
+            if self._files.issuperset(record.files)
+        }
+
+    def _set_files(self, names: list[str]) -> None:
+        self._files = set()
+        self._by_token = {}
+        for name in names:
+            self._add_file(name)
+
+    def _add_file(self, name: str) -> None:
+        self._files.add(name)
+        for token in set(_stem(name).split("-")[1:]):
+            self._by_token.setdefault(token, set()).add(name)
+
+    def _remove_file(self, name: str) -> None:
+        self._files.discard(name)
+        for token in set(_stem(name).split("-")[1:]):
+            names = self._by_token.get(token)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._by_token[token]
+
+    def transcripts(self, session_id: str) -> list[Path]:
+        """Find all transcript files (-full.md and -abridged.md) for a session.
+
+        Matches what globbing for "*-{session_id}-*" and "*-{session_id}" with
+        either suffix would: the session ID appears as a dash-separated field
+        after the first one, in both the current (date-hour-project-id-slug)
+        and legacy (date-project-id-slug) name formats.
+        """
+        if "-" in session_id:
+            # Spans fields: fall back to a scan of the file list
+            needle = f"-{session_id}-"
+            names = {name for name in self._files if needle in _stem(name) + "-"}
+        else:
+            names = self._by_token.get(session_id, set())
+        return [self.out_dir / name for name in sorted(names)]
+
+    def full_transcript(self, session_id: str) -> Path | None:
+        """Find a session's -full.md transcript, if any."""
+        for path in self.transcripts(session_id):
+            if path.name.endswith("-full.md"):
+                return path
+        return None
+
+    def is_current(self, session_id: str, session_path: Path) -> bool:
+        """Check whether a session's transcripts are up to date with its source.
+
+        Current if the source is unchanged since the transcripts were
+        generated (same mtime and size, or same size and content hash). For
+        transcripts the manifest has no source record for (written before the
+        manifest existed, or by single-session mode), falls back to the
+        transcript being at least as new as the source.
+        """
+        full = self.full_transcript(session_id)
+        if full is None:
+            return False
+        stat = session_path.stat()
+
+        record = self.sources.get(session_id)
+        names = sorted(path.name for path in self.transcripts(session_id))
+        if record is None or record.files != names:
+            try:
+                return full.stat().st_mtime >= stat.st_mtime
+            except FileNotFoundError:
+                return False
+
+        if record.size != stat.st_size:
+            return False
+        if record.mtime_ns == stat.st_mtime_ns:
+            return True
+        if record.sha256 is None or not session_path.is_file():
+            return False
+        # Touched but maybe unchanged (e.g. copied or synced): compare content
+        if _sha256(session_path) != record.sha256:
+            return False
+        record.mtime_ns = stat.st_mtime_ns
+        return True
+
+    def update(
+        self,
+        session_id: str,
+        removed: list[Path],
+        written: list[Path],
+        source: SourceRecord | None,
+    ) -> None:
+        """Record transcript files removed and written for a session."""
+        for path in removed:
+            self._remove_file(path.name)
+        for path in written:
+            self._add_file(path.name)
+        if source is not None:
+            self.sources[session_id] = source
+        else:
+            self.sources.pop(session_id, None)
+
+    def save(self) -> None:
+        """Persist the manifest with the directory mtime observed when it was listed.
+
+        The directory's own writes since then (and anyone else's) leave its
+        mtime newer than the recorded one, so the next load() rescans rather
+        than trusting a file list that may miss another process's files.
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "out_dir": str(self.out_dir),
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "files": sorted(self._files),
+            "sources": {
+                session_id: asdict(record) for session_id, record in sorted(self.sources.items())
+            },
+        }
+        write_cache_file(self.path, json.dumps(data, separators=(",", ":")).encode())
+
+
+def _stem(name: str) -> str:
+    for suffix in TRANSCRIPT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
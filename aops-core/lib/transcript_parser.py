@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum, auto
@@ -1006,6 +1007,126 @@ class ConversationTurn:
     cache_read_tokens: int | None = None
 
 
+@dataclass
+class TurnGroupingState:
+    """Resumable progress of SessionProcessor.group_entries_incremental().
+
+    Raw turns before resume_index are sealed: entries appended later can't
+    change them, unless a tool result arrives for one of their unresolved tool
+    calls or a sidechain entry arrives. Main entries from resume_index on (the
+    open turn) are regrouped on every call.
+    """
+
+    entry_count: int = 0  # Length of the entries list this state was built from
+    resume_index: int = 0  # Index into the main (non-sidechain) entries
+    # Append-only lists shared between checkpoints; only the first
+    # sealed_count/unresolved_count items belong to this state.
+    turns: list[dict] = field(default_factory=list)
+    sealed_count: int = 0
+    unresolved_tool_ids: list[str] = field(default_factory=list)
+    unresolved_count: int = 0
+    conversation_start_time: datetime | None = None
+
+
+@dataclass
+class ToolCallRecord:
+    """A tool_use block and the tool_result blocks answering it."""
+
+    tool_use_id: str
+    name: str | None = None
+    input: dict[str, Any] = field(default_factory=dict)
+    # datetime for Entry objects, the raw ISO string for JSONL dicts
+    use_timestamp: Any = None
+    # (entry, tool_result block) pairs, in transcript order
+    results: list[tuple[Any, dict[str, Any]]] = field(default_factory=list)
+
+    @property
+    def result_timestamp(self) -> Any:
+        """Timestamp of the entry carrying the first result, if any."""
+        if not self.results:
+            return None
+        return _entry_field(self.results[0][0], "timestamp")
+
+    @property
+    def duration_seconds(self) -> float | None:
+        """Seconds from the tool call to its first result, when both are datetimes."""
+        end = self.result_timestamp
+        if isinstance(self.use_timestamp, datetime) and isinstance(end, datetime):
+            return (end - self.use_timestamp).total_seconds()
+        return None
+
+    @property
+    def agent_id(self) -> str | None:
+        """agentId reported by the first result of an Agent/Task call."""
+        for entry, _block in self.results:
+            tool_use_result = _entry_field(entry, "tool_use_result")
+            if isinstance(tool_use_result, dict):
+                return tool_use_result.get("agentId")
+        return None
+
+
+def _entry_field(entry: Any, name: str) -> Any:
+    """Read a field from an Entry or the equivalent key from a raw JSONL dict."""
+    if isinstance(entry, dict):
+        if name == "tool_use_result":
+            return entry.get("toolUseResult")
+        return entry.get(name)
+    return getattr(entry, name)
+
+
+class ToolCallIndex:
+    """Index of tool calls by tool_use_id, built in one pass over the entries.
+
+    Replaces per-call scans of the whole session when pairing tool_use blocks
+    with their tool_result blocks. Accepts Entry objects or raw JSONL dicts.
+    """
+
+    def __init__(self, entries: list[Any] | None = None):
+        self._records: dict[str, ToolCallRecord] = {}
+        self.indexed_count = 0
+        if entries:
+            self.update(entries)
+
+    def update(self, entries: list[Any]) -> None:
+        """Index the entries appended to entries since the last update."""
+        for entry in entries[self.indexed_count :]:
+            entry_type = _entry_field(entry, "type")
+            if entry_type not in ("assistant", "user"):
+                continue
+            message = _entry_field(entry, "message")
+            content = message.get("content", []) if isinstance(message, dict) else None
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                if entry_type == "assistant" and block.get("type") == "tool_use":
+                    tool_id = block.get("id")
+                    if tool_id:
+                        record = self._record(tool_id)
+                        record.name = block.get("name")
+                        record.input = block.get("input", {})
+                        record.use_timestamp = _entry_field(entry, "timestamp")
+                elif entry_type == "user" and block.get("type") == "tool_result":
+                    tool_id = block.get("tool_use_id")
+                    if tool_id:
+                        self._record(tool_id).results.append((entry, block))
+        self.indexed_count = len(entries)
+
+    def _record(self, tool_id: str) -> ToolCallRecord:
+        record = self._records.get(tool_id)
+        if record is None:
+            record = self._records[tool_id] = ToolCallRecord(tool_use_id=tool_id)
+        return record
+
+    def get(self, tool_id: str) -> ToolCallRecord | None:
+        """Get the record for a tool_use_id, or None if it never appeared."""
+        return self._records.get(tool_id)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
 class SessionState(Enum):
     """Current processing state of a session."""
 
@@ -1298,6 +1419,27 @@ def _summarize_tool_input(tool_name: str, tool_input: dict) -> str:
 class SessionProcessor:
     """Processes JSONL sessions into structured data."""
 
+    # (entries list, its index): rebuilt when a different list is passed in
+    _tool_index: tuple[list[Entry], ToolCallIndex] | None = None
+
+    def tool_call_index(self, all_entries: list[Entry]) -> ToolCallIndex:
+        """Get the tool call index for a session's entries.
+
+        Built once per entries list and shared by every tool result lookup;
+        entries appended to the same list are indexed incrementally.
+        """
+        cached = self._tool_index
+        if (
+            cached is None
+            or cached[0] is not all_entries
+            or len(all_entries) < cached[1].indexed_count
+        ):
+            cached = self._tool_index = (all_entries, ToolCallIndex())
+        index = cached[1]
+        if index.indexed_count < len(all_entries):
+            index.update(all_entries)
+        return index
+
     def parse_session_file(
         self,
         file_path: str | Path,
@@ -1470,42 +1612,17 @@ class SessionProcessor:
         load_hooks: bool = True,
     ) -> tuple[SessionSummary, list[Entry], dict[str, list[Entry]]]:
         """Parse Claude Code JSONL session file."""
-        entries = []
         session_summary = None
         session_uuid = file_path.stem
 
         with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-
-                    # Handle hook logs passed as main file
-                    if file_path.name.endswith("-hooks.jsonl"):
-                        # Map hook log format to Entry format
-                        hook_output = data.get("hookSpecificOutput") or {}
-                        if not hook_output.get("hookEventName"):
-                            hook_output["hookEventName"] = data.get("hook_event", "Unknown")
-                        if "exit_code" in data and "exitCode" not in hook_output:
-                            hook_output["exitCode"] = data["exit_code"]
-
-                        data = {
-                            "type": "system_reminder",
-                            "timestamp": data.get("logged_at"),
-                            "hookSpecificOutput": hook_output,
-                        }
-
-                    entry = Entry.from_dict(data)
-                    entries.append(entry)
+            entries = self.parse_jsonl_lines(file_path, f)
 
-                    # Extract summary if available
-                    if entry.type == "summary":
-                        summary_text = entry.content.get("summary", "Claude Code Session")
-                        session_summary = SessionSummary(uuid=session_uuid, summary=summary_text)
-                except json.JSONDecodeError:
-                    continue
+        # Extract summary if available
+        for entry in entries:
+            if entry.type == "summary":
+                summary_text = entry.content.get("summary", "Claude Code Session")
+                session_summary = SessionSummary(uuid=session_uuid, summary=summary_text)
 
         # Create default summary if none found
         if not session_summary:
@@ -1529,6 +1646,41 @@ class SessionProcessor:
 
         return session_summary, entries, agent_entries
 
+    def parse_jsonl_lines(self, file_path: Path, lines: Iterable[str]) -> list[Entry]:
+        """Parse lines of a JSONL session file into entries.
+
+        Blank and malformed lines are skipped. Lines of a hook log
+        (*-hooks.jsonl) are mapped to system_reminder entries.
+        """
+        entries = []
+        is_hook_log = file_path.name.endswith("-hooks.jsonl")
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            # Handle hook logs passed as main file
+            if is_hook_log:
+                # Map hook log format to Entry format
+                hook_output = data.get("hookSpecificOutput") or {}
+                if not hook_output.get("hookEventName"):
+                    hook_output["hookEventName"] = data.get("hook_event", "Unknown")
+                if "exit_code" in data and "exitCode" not in hook_output:
+                    hook_output["exitCode"] = data["exit_code"]
+
+                data = {
+                    "type": "system_reminder",
+                    "timestamp": data.get("logged_at"),
+                    "hookSpecificOutput": hook_output,
+                }
+
+            entries.append(Entry.from_dict(data))
+        return entries
+
     def _parse_antigravity_brain(
         self, brain_dir: Path
     ) -> tuple[SessionSummary, list[Entry], dict[str, list[Entry]]]:
@@ -1786,16 +1938,64 @@ class SessionProcessor:
         full_mode: bool = False,
     ) -> list[ConversationTurn | dict]:
         """Group JSONL entries into conversational turns."""
+        turns, _ = self.group_entries_incremental(entries, agent_entries=agent_entries)
+        return turns
+
+    def group_entries_incremental(
+        self,
+        entries: list[Entry],
+        state: TurnGroupingState | None = None,
+        agent_entries: dict[str, list[Entry]] | None = None,
+    ) -> tuple[list[ConversationTurn | dict], TurnGroupingState]:
+        """Group entries into turns, resuming from an earlier grouping.
+
+        Args:
+            entries: All entries of the session. When state is given, this must
+                be the list state was built from with new entries appended.
+            state: State returned by a previous call, or None to group from scratch.
+                It is discarded (full regroup) when the appended entries could
+                change a sealed turn.
+            agent_entries: Agent transcripts by agent id. Only supported for
+                a from-scratch grouping.
+
+        Returns:
+            (turns, state): the same turns group_entries_into_turns() returns,
+            and the state to pass in once more entries have been appended.
+        """
+        if state is not None and (agent_entries or not self._can_resume(entries, state)):
+            state = None
+        if state is None:
+            state = TurnGroupingState()
+
         main_entries = [e for e in entries if not e.is_sidechain]
         sidechain_entries = [e for e in entries if e.is_sidechain]
 
         sidechain_groups = self._group_sidechain_entries(sidechain_entries)
 
-        turns: list[dict] = []
+        turns: list[dict] = state.turns[: state.sealed_count]
         current_turn: dict = {}
-        conversation_start_time = None
+        conversation_start_time = state.conversation_start_time
+        unresolved_tool_ids = state.unresolved_tool_ids[: state.unresolved_count]
+
+        def seal(index: int) -> TurnGroupingState:
+            """Checkpoint before main entry index: nothing earlier depends on later entries."""
+            return TurnGroupingState(
+                entry_count=len(entries),
+                resume_index=index,
+                turns=turns,
+                sealed_count=len(turns),
+                unresolved_tool_ids=unresolved_tool_ids,
+                unresolved_count=len(unresolved_tool_ids),
+                conversation_start_time=conversation_start_time,
+            )
+
+        checkpoint = seal(state.resume_index)
+
+        for i in range(state.resume_index, len(main_entries)):
+            entry = main_entries[i]
+            if not current_turn:
+                checkpoint = seal(i)
 
-        for i, entry in enumerate(main_entries):
             if entry.type == "user":
                 # Check if this is a command invocation that might need next entry for args
                 message = entry.message or {}
@@ -1820,6 +2020,7 @@ class SessionProcessor:
 
                 if current_turn:
                     turns.append(current_turn)
+                    checkpoint = seal(i)
 
                 if conversation_start_time is None:
                     conversation_start_time = entry.timestamp
@@ -1915,6 +2116,8 @@ class SessionProcessor:
                                         if result_info.get("exit_code") is not None:
                                             tool_item["exit_code"] = result_info["exit_code"]
                                         tool_item["is_error"] = result_info.get("is_error", False)
+                                    else:
+                                        unresolved_tool_ids.append(tool_id)
 
                                 if tool_name in ("Agent", "Task") and tool_id:
                                     agent_id = self._extract_agent_id_from_result(tool_id, entries)
@@ -1957,6 +2160,34 @@ class SessionProcessor:
         ):
             turns.append(current_turn)
 
+        return self._finalize_turns(turns, conversation_start_time), checkpoint
+
+    def _can_resume(self, entries: list[Entry], state: TurnGroupingState) -> bool:
+        """Check that the entries appended since state was built leave sealed turns unchanged."""
+        if len(entries) < state.entry_count:
+            return False
+        unresolved = set(state.unresolved_tool_ids[: state.unresolved_count])
+        for entry in entries[state.entry_count :]:
+            if entry.is_sidechain:
+                return False
+            if not unresolved or entry.type != "user":
+                continue
+            content = (entry.message or {}).get("content", [])
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if (
+                    isinstance(block, dict)
+                    and block.get("type") == "tool_result"
+                    and block.get("tool_use_id") in unresolved
+                ):
+                    return False
+        return True
+
+    def _finalize_turns(
+        self, turns: list[dict], conversation_start_time: datetime | None
+    ) -> list[ConversationTurn | dict]:
+        """Add timing and token totals to raw turns and convert them to ConversationTurns."""
         # Add timing information
         first_user_turn_found = False
         for turn in turns:
@@ -2692,79 +2923,41 @@ session_id: {session_uuid}
 
     def _extract_agent_id_from_result(self, tool_id: str, all_entries: list[Entry]) -> str | None:
         """Find the agentId from the tool result."""
-        for entry in all_entries:
-            if entry.type != "user":
-                continue
-
-            message = entry.message or {}
-            content = message.get("content", [])
-            if not isinstance(content, list):
-                continue
-
-            for block in content:
-                if isinstance(block, dict):
-                    if block.get("type") == "tool_result" and block.get("tool_use_id") == tool_id:
-                        if isinstance(entry.tool_use_result, dict):
-                            return entry.tool_use_result.get("agentId")
+        record = self.tool_call_index(all_entries).get(tool_id)
+        return record.agent_id if record else None
 
-        return None
+    def _tool_result_blocks(self, tool_id: str, all_entries: list[Entry]) -> list[dict]:
+        record = self.tool_call_index(all_entries).get(tool_id)
+        return [block for _entry, block in record.results] if record else []
 
     def _get_tool_result(self, tool_id: str, all_entries: list[Entry]) -> str | None:
         """Get successful tool result content."""
-        for entry in all_entries:
-            if entry.type != "user":
-                continue
-
-            message = entry.message or {}
-            content = message.get("content", [])
-            if not isinstance(content, list):
-                continue
-
-            for block in content:
-                if isinstance(block, dict):
-                    if (
-                        block.get("type") == "tool_result"
-                        and block.get("tool_use_id") == tool_id
-                        and not block.get("is_error")
-                    ):
-                        result_content = block.get("content", "")
-                        if isinstance(result_content, list):
-                            texts = []
-                            for item in result_content:
-                                if isinstance(item, dict) and item.get("type") == "text":
-                                    texts.append(item.get("text", ""))
-                            return "\n".join(texts)
-                        if isinstance(result_content, str):
-                            return result_content
+        for block in self._tool_result_blocks(tool_id, all_entries):
+            if not block.get("is_error"):
+                result_content = block.get("content", "")
+                if isinstance(result_content, list):
+                    texts = []
+                    for item in result_content:
+                        if isinstance(item, dict) and item.get("type") == "text":
+                            texts.append(item.get("text", ""))
+                    return "\n".join(texts)
+                if isinstance(result_content, str):
+                    return result_content
         return None
 
     def _get_tool_error(self, tool_id: str, all_entries: list[Entry]) -> str | None:
         """Get error message if tool failed."""
-        for entry in all_entries:
-            if entry.type != "user":
-                continue
-
-            message = entry.message or {}
-            content = message.get("content", [])
-            if not isinstance(content, list):
-                continue
-
-            for block in content:
-                if isinstance(block, dict):
-                    if (
-                        block.get("type") == "tool_result"
-                        and block.get("tool_use_id") == tool_id
-                        and block.get("is_error")
-                    ):
-                        result_content = block.get("content", "")
-                        if isinstance(result_content, list):
-                            texts = []
-                            for item in result_content:
-                                if isinstance(item, dict) and item.get("type") == "text":
-                                    texts.append(item.get("text", ""))
-                            return "\n".join(texts)[:500]
-                        if isinstance(result_content, str):
-                            return result_content[:500]
+        for block in self._tool_result_blocks(tool_id, all_entries):
+            if block.get("is_error"):
+                result_content = block.get("content", "")
+                if isinstance(result_content, list):
+                    texts = []
+                    for item in result_content:
+                        if isinstance(item, dict) and item.get("type") == "text":
+                            texts.append(item.get("text", ""))
+                    return "\n".join(texts)[:500]
+                if isinstance(result_content, str):
+                    return result_content[:500]
         return None
 
     def _get_tool_result_info(
@@ -2777,40 +2970,29 @@ session_id: {session_uuid}
             - is_error: Whether it was an error
             - exit_code: Extracted exit code (int or None)
         """
-        for entry in all_entries:
-            if entry.type != "user":
-                continue
-
-            message = entry.message or {}
-            content = message.get("content", [])
-            if not isinstance(content, list):
-                continue
-
-            for block in content:
-                if isinstance(block, dict):
-                    if block.get("type") == "tool_result" and block.get("tool_use_id") == tool_id:
-                        is_error = block.get("is_error", False)
-                        result_content = block.get("content", "")
-
-                        # Handle list content
-                        if isinstance(result_content, list):
-                            texts = []
-                            for item in result_content:
-                                if isinstance(item, dict) and item.get("type") == "text":
-                                    texts.append(item.get("text", ""))
-                            result_content = "\n".join(texts)
-
-                        # Extract exit code
-                        exit_code = _extract_exit_code_from_content(
-                            result_content if isinstance(result_content, str) else "",
-                            is_error,
-                        )
+        for block in self._tool_result_blocks(tool_id, all_entries):
+            is_error = block.get("is_error", False)
+            result_content = block.get("content", "")
+
+            # Handle list content
+            if isinstance(result_content, list):
+                texts = []
+                for item in result_content:
+                    if isinstance(item, dict) and item.get("type") == "text":
+                        texts.append(item.get("text", ""))
+                result_content = "\n".join(texts)
+
+            # Extract exit code
+            exit_code = _extract_exit_code_from_content(
+                result_content if isinstance(result_content, str) else "",
+                is_error,
+            )
 
-                        return {
-                            "content": result_content,
-                            "is_error": is_error,
-                            "exit_code": exit_code,
-                        }
+            return {
+                "content": result_content,
+                "is_error": is_error,
+                "exit_code": exit_code,
+            }
         return None
 
     def _extract_user_content(self, entry: Entry, next_meta_content: str = "") -> str:
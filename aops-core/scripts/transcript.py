@@ -8,11 +8,16 @@ Usage:
     uv run python aops-core/scripts/transcript.py session.jsonl
     uv run python aops-core/scripts/transcript.py session.jsonl -o output.md
     uv run python aops-core/scripts/transcript.py --all  # Process all sessions
+    uv run python aops-core/scripts/transcript.py --all --jobs 8  # ...on 8 processes
 """
 
 import argparse
+import contextlib
+import io
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -33,6 +38,11 @@ from lib.insights_generator import (  # noqa: E402
 )
 from lib.paths import get_sessions_repo, get_transcripts_dir  # noqa: E402
 from lib.session_reader import find_sessions  # noqa: E402
+from lib.transcript_manifest import (  # noqa: E402
+    SourceRecord,
+    TranscriptManifest,
+    source_fingerprint,
+)
 from lib.transcript_parser import (  # noqa: E402
     SessionProcessor,
     UsageStats,
@@ -92,40 +102,60 @@ def _is_excluded_project(project: str, config: dict | None = None) -> bool:
     return project.lower() in exclude_set
 
 
-def format_markdown(file_path: Path) -> bool:
-    """Format markdown file with dprint.
+# Files per dprint invocation in batch mode, to stay well under ARG_MAX
+DPRINT_BATCH_SIZE = 200
 
-    Checks multiple locations for dprint, preferring local installs for speed.
-    Skips formatting if no local dprint found (npx is too slow).
-    Returns True if formatting succeeded or skipped, False on error.
-    """
+
+def _find_dprint() -> Path | None:
+    """Find a local dprint install, or None (npx is too slow to fall back on)."""
     # Check locations in order of preference (fastest first)
     dprint_locations = [
         Path.home() / ".dprint" / "bin" / "dprint",  # Official installer
         Path(__file__).parent.parent / "node_modules" / ".bin" / "dprint",  # Local npm
     ]
-
-    dprint_path = None
     for path in dprint_locations:
         if path.exists():
-            dprint_path = path
-            break
+            return path
+    return None
+
 
+def format_markdown(file_path: Path) -> bool:
+    """Format markdown file with dprint.
+
+    Checks multiple locations for dprint, preferring local installs for speed.
+    Skips formatting if no local dprint found (npx is too slow).
+    Returns True if formatting succeeded or skipped, False on error.
+    """
+    return format_markdown_files([file_path])
+
+
+def format_markdown_files(file_paths: list[Path]) -> bool:
+    """Format several markdown files with as few dprint invocations as possible.
+
+    Batch mode defers formatting to a single call here instead of starting
+    dprint twice per session.
+    Returns True if formatting succeeded or skipped, False on any error.
+    """
+    dprint_path = _find_dprint()
     if dprint_path is None:
         # No local dprint found, skip formatting (npx is too slow)
         return True
 
-    try:
-        result = subprocess.run(
-            [str(dprint_path), "fmt", str(file_path)],
-            capture_output=True,
-            timeout=30,
-            check=False,
-        )
-        # Exit code 0 = success, 14 = no matching files (OK for external paths)
-        return result.returncode in (0, 14)
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+    ok = True
+    for i in range(0, len(file_paths), DPRINT_BATCH_SIZE):
+        batch = [str(path) for path in file_paths[i : i + DPRINT_BATCH_SIZE]]
+        try:
+            result = subprocess.run(
+                [str(dprint_path), "fmt", *batch],
+                capture_output=True,
+                timeout=30 + len(batch),
+                check=False,
+            )
+            # Exit code 0 = success, 14 = no matching files (OK for external paths)
+            ok = ok and result.returncode in (0, 14)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            ok = False
+    return ok
 
 
 def _save_minimal_token_summary(
@@ -436,59 +466,6 @@ def _generate_transcript_filename(
     )
 
 
-def _find_existing_transcripts(out_dir: Path, session_id: str) -> list[Path]:
-    """Find all existing transcript files by session ID.
-
-    Args:
-        out_dir: Output directory to search
-        session_id: 8-character session ID
-
-    Returns:
-        List of all matching transcript files (both -full.md and -abridged.md)
-    """
-    # Search for transcripts with this session_id
-    # v3.7.0+ Pattern: with hour (e.g., 20260105-17-writing-3bf94f77-session-full.md)
-    # Legacy Pattern: without hour (e.g., 20260105-writing-3bf94f77-session-full.md)
-    matches = []
-    for suffix in ("-full.md", "-abridged.md"):
-        # New format with hour
-        matches.extend(out_dir.glob(f"*-??-*-{session_id}-*{suffix}"))
-        matches.extend(out_dir.glob(f"*-??-*-{session_id}{suffix}"))
-        # Legacy format without hour
-        matches.extend(out_dir.glob(f"*-{session_id}-*{suffix}"))
-        matches.extend(out_dir.glob(f"*-{session_id}{suffix}"))
-    return list(set(matches))  # Deduplicate
-
-
-def _find_existing_transcript(out_dir: Path, session_id: str) -> Path | None:
-    """Find existing transcript file by session ID.
-
-    Args:
-        out_dir: Output directory to search
-        session_id: 8-character session ID
-
-    Returns:
-        Path to existing -full.md transcript if found, None otherwise
-    """
-    matches = [
-        p for p in _find_existing_transcripts(out_dir, session_id) if p.name.endswith("-full.md")
-    ]
-    return matches[0] if matches else None
-
-
-def _transcript_is_current(session_path: Path, transcript_path: Path) -> bool:
-    """Check if transcript is current (newer than session file).
-
-    Args:
-        session_path: Path to source session file
-        transcript_path: Path to transcript file
-
-    Returns:
-        True if transcript mtime >= session mtime
-    """
-    return transcript_path.stat().st_mtime >= session_path.stat().st_mtime
-
-
 def _infer_project(
     session_path: Path,
     entries: list | None = None,
@@ -607,6 +584,238 @@ def git_sync():
         print(f"Git sync failed: {e}", file=sys.stderr)
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one session in batch mode, sent back to the parent process."""
+
+    status: str  # "processed", "skipped" or "error"
+    # Markdown files written, formatted with dprint in one batch at the end
+    written: list[str] = field(default_factory=list)
+    # Stale transcripts deleted
+    removed: list[str] = field(default_factory=list)
+    # What the written transcripts were generated from, for the manifest
+    source: SourceRecord | None = None
+    # Output captured in a worker process, replayed by the parent
+    stdout: str = ""
+    stderr: str = ""
+
+
+def _process_batch_session(
+    session_path: Path, out_dir: Path, existing: list[Path] | None = None
+) -> BatchResult:
+    """Generate transcripts and insights for one session in batch mode.
+
+    Each session is independent: this runs in the parent (--jobs 1) or in a
+    worker process. The caller has already found the session's transcripts
+    stale; dprint formatting and git sync are left to it too.
+
+    Args:
+        session_path: Session to process
+        out_dir: Transcripts directory
+        existing: The session's current transcripts, deleted before regenerating
+    """
+    processor = SessionProcessor()
+    result = BatchResult("error")
+    try:
+        # Delete stale transcripts before regenerating (prevents duplicates
+        # when filename format changes, e.g., slug added/changed)
+        for stale in existing or []:
+            print(f"🗑️  Removing stale transcript: {stale.name}")
+            stale.unlink(missing_ok=True)
+            result.removed.append(str(stale))
+
+        source = source_fingerprint(session_path)
+
+        # Process the session
+        print(f"📝 Processing session: {session_path}")
+        session_summary, entries, agent_entries = processor.parse_session_file(str(session_path))
+
+        # Check for meaningful content
+        MIN_MEANINGFUL_ENTRIES = 2
+        meaningful_count = sum(
+            1
+            for e in entries
+            if e.type in ("user", "assistant")
+            and not (
+                hasattr(e, "message")
+                and e.message
+                and e.message.get("subtype") in ("system", "informational")
+            )
+        )
+        if meaningful_count < MIN_MEANINGFUL_ENTRIES:
+            print(
+                f"⏭️  Skipping: only {meaningful_count} meaningful entries (need {MIN_MEANINGFUL_ENTRIES}+)"
+            )
+            result.status = "skipped"
+            return result
+
+        # Generate output name
+        (
+            filename,
+            date_str,
+            short_project,
+            session_id,
+            slug,
+        ) = _generate_transcript_filename(session_path, entries, processor=processor)
+
+        # Note: _output_exists() check removed - early mtime check handles
+        # both "already current" (skip) and "stale" (regenerate) cases
+
+        base_name = str(out_dir / filename)
+
+        # Extract and process reflection (if present)
+        # Convert date format from YYYYMMDD to YYYY-MM-DD for insights
+        date_iso = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+        # Get timestamp from entries for ISO 8601 output
+        session_timestamp = None
+        for entry in entries:
+            if entry.timestamp:
+                session_timestamp = entry.timestamp
+                break
+
+        # Compute usage stats and session duration for token_metrics
+        usage_stats = processor._aggregate_session_usage(entries, agent_entries)
+        session_duration_minutes = _compute_session_duration(entries)
+
+        # Extract timeline events for path reconstruction
+        turns = processor.group_entries_into_turns(entries, agent_entries)
+        timeline_events = extract_timeline_events(turns, session_id)
+
+        reflection_header, _ = _process_reflection(
+            entries,
+            session_id,
+            date_iso,
+            short_project,
+            slug,
+            agent_entries,
+            session_timestamp,
+            usage_stats,
+            session_duration_minutes,
+            timeline_events,
+        )
+
+        # Generate full version
+        full_path = Path(f"{base_name}-full.md")
+        markdown_full = processor.format_session_as_markdown(
+            session_summary,
+            entries,
+            agent_entries,
+            include_tool_results=True,
+            variant="full",
+            source_file=str(session_path.resolve()),
+            reflection_header=reflection_header,
+        )
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(markdown_full)
+        result.written.append(str(full_path))
+        file_size = full_path.stat().st_size
+        print(f"✅ Full transcript: {full_path} ({file_size:,} bytes)")
+
+        # Generate abridged version
+        abridged_path = Path(f"{base_name}-abridged.md")
+        markdown_abridged = processor.format_session_as_markdown(
+            session_summary,
+            entries,
+            agent_entries,
+            include_tool_results=False,
+            variant="abridged",
+            source_file=str(session_path.resolve()),
+            reflection_header=reflection_header,
+        )
+        with open(abridged_path, "w", encoding="utf-8") as f:
+            f.write(markdown_abridged)
+        result.written.append(str(abridged_path))
+        file_size = abridged_path.stat().st_size
+        print(f"✅ Abridged transcript: {abridged_path} ({file_size:,} bytes)")
+
+        source.files = sorted(path.name for path in (full_path, abridged_path))
+        result.source = source
+        result.status = "processed"
+        return result
+
+    except Exception as e:
+        print(f"❌ Error processing {session_path}: {e}", file=sys.stderr)
+        return result
+
+
+def _process_batch_session_captured(
+    session_path: Path, out_dir: Path, existing: list[Path]
+) -> BatchResult:
+    """Worker entry point: _process_batch_session with its output captured."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        result = _process_batch_session(session_path, out_dir, existing)
+    result.stdout = stdout.getvalue()
+    result.stderr = stderr.getvalue()
+    return result
+
+
+def _run_batch(session_paths: list[Path], out_dir: Path, jobs: int) -> dict[str, int]:
+    """Process sessions serially or on a process pool; returns counts per status.
+
+    Freshness is checked here against the transcript manifest, so sessions
+    whose transcripts are current never reach a worker.
+    """
+    counts = {"processed": 0, "skipped": 0, "error": 0}
+    manifest = TranscriptManifest.load(out_dir)
+    written: list[Path] = []
+
+    pending: list[tuple[Path, str, list[Path]]] = []
+    for session_path in session_paths:
+        session_id = _get_session_id(session_path)
+        try:
+            if manifest.is_current(session_id, session_path):
+                counts["skipped"] += 1
+                continue
+        except OSError:
+            pass  # Reported by the worker
+        pending.append((session_path, session_id, manifest.transcripts(session_id)))
+
+    def collect(session_id: str, result: BatchResult) -> None:
+        counts[result.status] += 1
+        written.extend(Path(path) for path in result.written)
+        manifest.update(
+            session_id,
+            removed=[Path(path) for path in result.removed],
+            written=[Path(path) for path in result.written],
+            source=result.source,
+        )
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+
+    crashed = False
+    if jobs <= 1:
+        for session_path, session_id, existing in pending:
+            collect(session_id, _process_batch_session(session_path, out_dir, existing))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(_process_batch_session_captured, session_path, out_dir, existing): (
+                    session_path,
+                    session_id,
+                )
+                for session_path, session_id, existing in pending
+            }
+            for future in as_completed(futures):
+                session_path, session_id = futures[future]
+                try:
+                    collect(session_id, future.result())
+                except Exception as e:
+                    # Worker crashed (e.g. killed): count it, keep going
+                    print(f"❌ Error processing {session_path}: {e}", file=sys.stderr)
+                    counts["error"] += 1
+                    crashed = True
+
+    if written:
+        print(f"🎨 Formatting {len(written)} transcripts...")
+        format_markdown_files(written)
+    if crashed:
+        # Unknown what crashed workers left behind
+        manifest.rescan()
+    manifest.save()
+    return counts
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert Claude Code JSONL or Gemini JSON sessions to markdown transcripts",
@@ -619,6 +828,7 @@ Examples:
   python transcript.py session.jsonl -o /abs/path/name  # Uses absolute path
   python transcript.py                                  # Process recent sessions (last 7 days, default)
   python transcript.py --all                            # Process ALL sessions in ~/.claude/projects/
+  python transcript.py --all --jobs 8                   # ...8 sessions at a time
         """,
     )
 
@@ -650,6 +860,13 @@ Examples:
         action="store_true",
         help="Skip git commit and push after generating transcripts",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Batch mode: process N sessions in parallel worker processes (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -705,150 +922,12 @@ Examples:
             reverse=True,
         )
 
-        processed = 0
-        skipped = 0
-        errors = 0
-
-        for s in sessions:
-            try:
-                session_path = s.path if hasattr(s, "path") else Path(str(s))
-
-                # Early mtime check: skip if transcript already exists and is current
-                session_id = _get_session_id(session_path)
-                existing_transcript = _find_existing_transcript(sessions_claude, session_id)
-                if existing_transcript and _transcript_is_current(
-                    session_path, existing_transcript
-                ):
-                    skipped += 1
-                    continue
-
-                # Delete stale transcripts before regenerating (prevents duplicates
-                # when filename format changes, e.g., slug added/changed)
-                if existing_transcript:
-                    stale_files = _find_existing_transcripts(sessions_claude, session_id)
-                    for stale in stale_files:
-                        print(f"🗑️  Removing stale transcript: {stale.name}")
-                        stale.unlink()
-
-                # Process the session
-                print(f"📝 Processing session: {session_path}")
-                session_summary, entries, agent_entries = processor.parse_session_file(
-                    str(session_path)
-                )
-
-                # Check for meaningful content
-                MIN_MEANINGFUL_ENTRIES = 2
-                meaningful_count = sum(
-                    1
-                    for e in entries
-                    if e.type in ("user", "assistant")
-                    and not (
-                        hasattr(e, "message")
-                        and e.message
-                        and e.message.get("subtype") in ("system", "informational")
-                    )
-                )
-                if meaningful_count < MIN_MEANINGFUL_ENTRIES:
-                    print(
-                        f"⏭️  Skipping: only {meaningful_count} meaningful entries (need {MIN_MEANINGFUL_ENTRIES}+)"
-                    )
-                    # Cleanup existing transcripts if empty
-                    stale_files = _find_existing_transcripts(sessions_claude, session_id)
-                    for stale in stale_files:
-                        print(f"🗑️  Removing empty transcript: {stale.name}")
-                        stale.unlink()
-
-                    skipped += 1
-                    continue
-
-                # Generate output name
-                (
-                    filename,
-                    date_str,
-                    short_project,
-                    session_id,
-                    slug,
-                ) = _generate_transcript_filename(session_path, entries, processor=processor)
-
-                # Note: _output_exists() check removed - early mtime check handles
-                # both "already current" (skip) and "stale" (regenerate) cases
-
-                base_name = str(sessions_claude / filename)
-
-                # Extract and process reflection (if present)
-                # Convert date format from YYYYMMDD to YYYY-MM-DD for insights
-                date_iso = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                # Get timestamp from entries for ISO 8601 output
-                session_timestamp = None
-                for entry in entries:
-                    if entry.timestamp:
-                        session_timestamp = entry.timestamp
-                        break
-
-                # Compute usage stats and session duration for token_metrics
-                usage_stats = processor._aggregate_session_usage(entries, agent_entries)
-                session_duration_minutes = _compute_session_duration(entries)
-
-                # Extract timeline events for path reconstruction
-                turns = processor.group_entries_into_turns(entries, agent_entries)
-                timeline_events = extract_timeline_events(turns, session_id)
-
-                reflection_header, _ = _process_reflection(
-                    entries,
-                    session_id,
-                    date_iso,
-                    short_project,
-                    slug,
-                    agent_entries,
-                    session_timestamp,
-                    usage_stats,
-                    session_duration_minutes,
-                    timeline_events,
-                )
-
-                # Generate full version
-                full_path = Path(f"{base_name}-full.md")
-                markdown_full = processor.format_session_as_markdown(
-                    session_summary,
-                    entries,
-                    agent_entries,
-                    include_tool_results=True,
-                    variant="full",
-                    source_file=str(session_path.resolve()),
-                    reflection_header=reflection_header,
-                )
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(markdown_full)
-                format_markdown(full_path)
-                file_size = full_path.stat().st_size
-                print(f"✅ Full transcript: {full_path} ({file_size:,} bytes)")
-
-                # Generate abridged version
-                abridged_path = Path(f"{base_name}-abridged.md")
-                markdown_abridged = processor.format_session_as_markdown(
-                    session_summary,
-                    entries,
-                    agent_entries,
-                    include_tool_results=False,
-                    variant="abridged",
-                    source_file=str(session_path.resolve()),
-                    reflection_header=reflection_header,
-                )
-                with open(abridged_path, "w", encoding="utf-8") as f:
-                    f.write(markdown_abridged)
-                format_markdown(abridged_path)
-                file_size = abridged_path.stat().st_size
-                print(f"✅ Abridged transcript: {abridged_path} ({file_size:,} bytes)")
-
-                processed += 1
-
-            except Exception as e:
-                errors += 1
-                print(f"❌ Error processing {session_path}: {e}", file=sys.stderr)
+        session_paths = [s.path if hasattr(s, "path") else Path(str(s)) for s in sessions]
+        counts = _run_batch(session_paths, sessions_claude, args.jobs)
 
-        print(f"Processed: {processed}", file=sys.stderr)
-        print(f"Skipped: {skipped}", file=sys.stderr)
-        print(f"Errors: {errors}", file=sys.stderr)
+        print(f"Processed: {counts['processed']}", file=sys.stderr)
+        print(f"Skipped: {counts['skipped']}", file=sys.stderr)
+        print(f"Errors: {counts['error']}", file=sys.stderr)
         return 0
 
     # Single session mode (specific file provided)
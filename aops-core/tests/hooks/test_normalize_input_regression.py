@@ -15,7 +15,7 @@ from hooks.router import HookRouter
 @pytest.fixture
 def router(monkeypatch):
     # Mock get_session_data to avoid reading shared PID session map during xdist tests
-    monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+    monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
     return HookRouter()
 
 
@@ -35,30 +35,18 @@ class TestUserPromptSubmit(unittest.TestCase):
     @patch("lib.hydration.builder.load_framework_paths")
     @patch("lib.hydration.builder.load_mcp_tools_context")
     @patch("lib.hydration.builder.load_environment_variables_context")
-    @patch("lib.hydration.builder.load_project_paths_context")
-    @patch("lib.hydration.builder.load_workflows_index")
-    @patch("lib.hydration.builder.load_skills_index")
-    @patch("lib.hydration.builder.load_scripts_index")
-    @patch("lib.hydration.builder.load_project_rules")
     @patch("lib.hydration.builder.get_task_work_state")
     @patch("lib.hydration.builder.get_formatted_relevant_paths")
-    @patch("lib.hydration.builder.load_project_context_index")
-    @patch("lib.hydration.builder.load_template")
+    @patch("lib.hydration.builder.get_static_context")
     @patch("lib.hydration.builder.extract_router_context")
     @patch("lib.session_state.SessionState.load")
     def test_build_hydration_instruction(
         self,
         mock_load,
         mock_extract_context,
-        mock_load_template,
-        mock_load_context_index,
+        mock_get_static_context,
         mock_get_relevant_paths,
         mock_get_task_work,
-        mock_load_project_rules,
-        mock_load_scripts,
-        mock_load_skills,
-        mock_load_workflows,
-        mock_load_project_paths,
         mock_load_env,
         mock_load_mcp,
         mock_load_framework,
@@ -72,15 +60,9 @@ class TestUserPromptSubmit(unittest.TestCase):
         mock_gate_path.parent = MagicMock()
         mock_get_gate_file_path.return_value = mock_gate_path
 
-        # Determine return value based on file argument
-        def side_effect(filepath):
-            if filepath == CONTEXT_TEMPLATE_FILE:
-                return "Context for {prompt}"
-            if filepath == INSTRUCTION_TEMPLATE_FILE:
-                return "Instruction template: {temp_path}"
-            return "Unknown template"
-
-        mock_load_template.side_effect = side_effect
+        static = mock_get_static_context.return_value
+        static.context_template = "Context for {prompt}"
+        static.instruction_template = "Instruction template: {temp_path}"
 
         # Call function
         result = build_hydration_instruction(self.session_id, self.prompt)
@@ -88,6 +70,10 @@ class TestUserPromptSubmit(unittest.TestCase):
         # Verification
         self.assertIn(self.temp_path, result)
 
+        mock_get_static_context.assert_called_once_with(
+            CONTEXT_TEMPLATE_FILE, INSTRUCTION_TEMPLATE_FILE
+        )
+
         # Verify gate file path was used
         mock_get_gate_file_path.assert_called_once()
         mock_gate_path.write_text.assert_called_once()
@@ -4,7 +4,8 @@ import os
 import shutil
 import subprocess
 import sys
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 # Add aops-core to path for lib imports
@@ -15,7 +16,8 @@ if str(REPO_ROOT / "aops-core") not in sys.path:
 
 import click
 from lib.agent_env import apply_env_mappings
-from manager import PolecatManager
+from manager import MIRROR_TIMEOUT, PolecatManager, get_polecat_home
+from observability import METRIC_KINDS, metrics, read_events, summarize
 from validation import TaskIDValidationError, validate_task_id_or_raise
 
 
@@ -145,6 +147,25 @@ def save_worker_transcript(
         raise OSError(f"Failed to save transcript for task {task_id}: {e}") from e
 
 
+def _alternate_object_dirs(work_dir: Path) -> list[Path]:
+    """Get the object stores a clone borrows from (git alternates).
+
+    Worktrees cloned from a mirror with --shared read their objects from
+    the mirror's object store, by absolute host path.
+    """
+    objects_dir = work_dir / ".git" / "objects"
+    try:
+        lines = (objects_dir / "info" / "alternates").read_text().splitlines()
+    except OSError:
+        return []
+    dirs = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            dirs.append((objects_dir / line).resolve())
+    return dirs
+
+
 def _build_docker_cmd(
     cli_tool: str, work_dir: Path, env: dict, agent_cmd: list[str], is_interactive: bool
 ) -> list[str]:
@@ -167,6 +188,11 @@ def _build_docker_cmd(
     cmd.extend(["-v", f"{work_dir.resolve()}:/workspace"])
     cmd.extend(["-w", "/workspace"])
 
+    # Mount borrowed object stores at the paths the worktree's alternates name,
+    # so git in the container can read the mirror's objects
+    for objects_dir in _alternate_object_dirs(work_dir):
+        cmd.extend(["-v", f"{objects_dir}:{objects_dir}:ro"])
+
     # Mount authentication for Claude
     home = Path.home()
     if cli_tool == "claude":
@@ -211,27 +237,62 @@ def main(ctx, home):
     """Polecat: Ephemeral worker management system."""
     ctx.ensure_object(dict)
     ctx.obj["home"] = home
+    metrics.enable_store((home or get_polecat_home()).expanduser() / "metrics")
+
+
+def _get_manager(ctx) -> PolecatManager:
+    """Get the manager for a command.
+
+    Warm swarm workers pass their long-lived manager in ctx.obj so each
+    cycle reuses its loaded config and task storage.
+    """
+    manager = ctx.obj.get("manager")
+    if manager is None:
+        manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    return manager
+
+
+def _phase_done(ctx, name: str) -> None:
+    """Record the seconds since the previous phase of `polecat run` ended."""
+    now = time.monotonic()
+    ctx.obj.setdefault("phases", {})[name] = now - ctx.obj.get("phase_start", now)
+    ctx.obj["phase_start"] = now
+
+
+_mirror_jobs_option = click.option(
+    "--jobs", "-j", default=4, show_default=True, help="Mirrors to clone or fetch at once"
+)
+_mirror_timeout_option = click.option(
+    "--timeout",
+    default=MIRROR_TIMEOUT,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Seconds allowed per project",
+)
 
 
 @main.command()
 @click.option("--project", "-p", help="Initialize only this project (default: all)")
+@_mirror_jobs_option
+@_mirror_timeout_option
 @click.pass_context
-def init(ctx, project):
+def init(ctx, project, jobs, timeout):
     """Initialize bare mirror repos in <home>/polecat/.repos/
 
     Creates bare clones of all registered projects for isolated worktree spawning.
     Run this once before using polecat, or when adding new projects.
 
     Examples:
-        polecat init              # Initialize all projects
+        polecat init              # Initialize all projects, 4 at a time
+        polecat init -j 1         # One project at a time
         polecat init -p aops      # Initialize only aops
         polecat --home /custom/path init  # Use custom home directory
     """
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     if project:
         try:
-            path = manager.ensure_repo_mirror(project)
+            path = manager.ensure_repo_mirror(project, timeout=timeout)
             print(f"✓ {project} -> {path}")
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -241,39 +302,73 @@ def init(ctx, project):
             sys.exit(1)
     else:
         print(f"Initializing mirrors in {manager.repos_dir}...")
-        results = manager.init_all_mirrors()
-        failures = [p for p, path in results.items() if path is None]
-        if failures:
-            print(f"\n⚠️  Failed: {', '.join(failures)}")
+        results = manager.init_all_mirrors(jobs=jobs, timeout=timeout)
+        if any(path is None for path in results.values()):
             sys.exit(1)
         print("\n✓ All mirrors ready")
 
 
 @main.command()
+@_mirror_jobs_option
+@_mirror_timeout_option
 @click.pass_context
-def sync(ctx):
+def sync(ctx, jobs, timeout):
     """Fetch latest from origin for all mirror repos.
 
     Updates existing bare mirrors with latest branches from origin.
     Use before spawning polecats to ensure they have recent code.
 
     Examples:
-        polecat sync
+        polecat sync              # 4 mirrors at a time
+        polecat sync -j 8 --timeout 120
     """
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     print(f"Syncing mirrors in {manager.repos_dir}...")
-    results = manager.sync_all_mirrors()
+    results = manager.sync_all_mirrors(jobs=jobs, timeout=timeout)
     successes = sum(1 for v in results.values() if v)
     print(f"\n✓ Synced {successes}/{len(results)} mirrors")
 
 
+@main.command()
+@click.option("--project", "-p", required=True, help="Project to pre-create clones for")
+@click.option(
+    "--size",
+    "-n",
+    type=click.IntRange(min=0),
+    default=2,
+    show_default=True,
+    help="Number of clones to keep ready (0 empties the pool)",
+)
+@click.pass_context
+def pool(ctx, project, size):
+    """Pre-create clones that new polecat worktrees can start from.
+
+    Each pooled clone is synced and checked out ahead of time, so
+    setting up a worktree only has to refresh refs and create the task
+    branch. Re-run to top the pool up after polecats have used it.
+
+    Examples:
+        polecat pool -p aops          # Keep 2 clones ready
+        polecat pool -p aops -n 8     # Before starting a swarm of 8
+        polecat pool -p aops -n 0     # Remove pooled clones
+    """
+    manager = _get_manager(ctx)
+    try:
+        project = manager.resolve_project_alias(project)
+        count = manager.warm_worktree_pool(project, size)
+    except (ValueError, FileNotFoundError, subprocess.CalledProcessError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✓ {count} pooled clone(s) ready for {project}")
+
+
 @main.command()
 @click.option("--project", "-p", help="Project to claim tasks from")
 @click.option("--caller", "-c", default="polecat", help="Identity claiming the task")
 @click.pass_context
 def start(ctx, project, caller):
     """Claim next ready task and spawn a worktree."""
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     print(f"Looking for ready tasks{' in project ' + project if project else ''}...")
     task = manager.claim_next_task(caller, project)
@@ -313,7 +408,7 @@ def checkout(ctx, task_id, caller):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     task = manager.storage.get_task(task_id)
     if not task:
@@ -364,7 +459,7 @@ def finish(ctx, no_push, do_nuke, force, force_done):
     """
     import subprocess
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     cwd = Path.cwd()
 
     # Detect if we're in a polecat worktree
@@ -863,7 +958,7 @@ def nuke(ctx, task_id, force):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     try:
         manager.nuke_worktree(task_id, force=force)
         print(f"Nuked polecat {task_id}")
@@ -876,7 +971,7 @@ def nuke(ctx, task_id, force):
 @click.pass_context
 def list_polecats(ctx):
     """List active polecats."""
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     if not manager.polecats_dir.exists():
         print("No polecats directory found.")
         return
@@ -895,17 +990,29 @@ def list_polecats(ctx):
 
 
 @main.command()
-def merge():
+@click.option(
+    "--train",
+    "-t",
+    "train_size",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Merge up to this many tasks together, testing them as one stack",
+)
+def merge(train_size):
     """Scan for tasks in REVIEW status and merge them to main.
 
     This runs the Refinery: finds all tasks marked 'review',
     squash-merges their polecat branches, runs tests, and
     marks them 'done' on success.
+
+    With --train N, up to N tasks from the same repo are stacked and
+    tested together; a failing stack is bisected to find the culprits.
     """
     from engineer import Engineer
 
     eng = Engineer()
-    eng.scan_and_merge()
+    eng.scan_and_merge(train_size=train_size)
 
 
 def _branch_has_open_pr(branch_name: str, repo_path: Path) -> bool:
@@ -967,7 +1074,7 @@ def crew(ctx, target, extra, name, gemini, resume, keep):
     """
     import subprocess
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     # --- Resolve target project(s) ---
     if resume:
@@ -1117,7 +1224,7 @@ def crew(ctx, target, extra, name, gemini, resume, keep):
 @click.pass_context
 def nuke_crew(ctx, name, force):
     """Remove a crew worker and their worktrees."""
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     try:
         manager.nuke_crew(name, force=force)
     except (ValueError, RuntimeError) as e:
@@ -1129,7 +1236,7 @@ def nuke_crew(ctx, name, force):
 @click.pass_context
 def list_crew(ctx):
     """List active crew workers."""
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
     crew = manager.list_crew()
     if not crew:
         print("No active crew workers.")
@@ -1276,7 +1383,9 @@ def run(ctx, project, caller, task_id, issue, no_finish, gemini, interactive, no
         print("Error: --issue and --task-id are mutually exclusive.", file=sys.stderr)
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
+    ctx.obj["phases"] = {}
+    ctx.obj["phase_start"] = time.monotonic()
 
     # Step 1: Get/claim task (or fetch GitHub issue)
     is_issue = False
@@ -1339,6 +1448,7 @@ def run(ctx, project, caller, task_id, issue, no_finish, gemini, interactive, no
         print(f"🎯 Issue: {task.title} ({getattr(task, 'issue_url', '') or task.id})")
     else:
         print(f"🎯 Task: {task.title} ({task.id})")
+    _phase_done(ctx, "claim")
 
     # Step 2: Setup worktree
     try:
@@ -1347,6 +1457,7 @@ def run(ctx, project, caller, task_id, issue, no_finish, gemini, interactive, no
     except Exception as e:
         print(f"Error setting up worktree: {e}", file=sys.stderr)
         sys.exit(1)
+    _phase_done(ctx, "setup")
 
     # Step 3: Build prompt from task context (self-contained, no /pull needed)
     from polecat.prompt_template import build_polecat_prompt
@@ -1506,6 +1617,7 @@ def run(ctx, project, caller, task_id, issue, no_finish, gemini, interactive, no
             reset_terminal_title()
 
     print("-" * 50)
+    _phase_done(ctx, "agent")
 
     # Step 5: Auto-finish on success (unless disabled)
     if exit_code == 0:
@@ -1570,6 +1682,7 @@ def run(ctx, project, caller, task_id, issue, no_finish, gemini, interactive, no
                 print(f"   You can retry manually: cd {worktree_path} && polecat finish")
             finally:
                 os.chdir(original_cwd)
+                _phase_done(ctx, "finish")
         else:
             print("📝 Auto-finish disabled. Run `polecat finish` when ready.")
             print(f"   Worktree: {worktree_path}")
@@ -1602,7 +1715,7 @@ def analyze(ctx, task_id, transcript_lines):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     # Load task
     task = manager.storage.get_task(task_id)
@@ -1822,7 +1935,7 @@ def reset_stalled(ctx, project, hours, dry_run, force):
         )
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     # Calculate cutoff time
     cutoff = datetime.now().astimezone() - timedelta(hours=hours)
@@ -1923,7 +2036,8 @@ def _send_notification(title: str, message: str, urgency: str = "normal"):
     "--interval",
     "-i",
     default=300,
-    help="Polling interval in seconds (default: 300 = 5 min)",
+    help="Seconds between status lines, and between rescans without "
+    "filesystem notifications (default: 300 = 5 min)",
 )
 @click.option(
     "--stall-threshold",
@@ -1932,36 +2046,44 @@ def _send_notification(title: str, message: str, urgency: str = "normal"):
     help="Minutes without progress before stall alert (default: 30)",
 )
 @click.option("--project", "-p", help="Project to monitor (default: all)")
+@click.option("--poll", is_flag=True, help="Rescan every interval instead of watching files")
 @click.pass_context
-def watch(ctx, interval, stall_threshold, project):
+def watch(ctx, interval, stall_threshold, project, poll):
     """Monitor swarm activity and send desktop notifications.
 
     Runs as a background process that:
-    - Polls for new PRs and merge_ready tasks
-    - Sends notification when a new PR is filed
+    - Watches task files for status changes (falls back to polling
+      without watchdog, or with --poll)
+    - Sends notification when a new PR is filed or a task needs review
     - Alerts if swarm stalls (no progress in threshold minutes)
 
     Examples:
-        polecat watch              # Default: poll every 5min, stall at 30min
-        polecat watch -i 60        # Poll every 60 seconds
+        polecat watch              # Watch files, stall at 30min
+        polecat watch -i 60        # Status line every 60 seconds
         polecat watch -s 60        # Alert after 60min of no progress
+        polecat watch --poll       # Rescan every 5min instead of watching
         polecat watch &            # Run in background
     """
     import signal
-    import time
-    from datetime import datetime, timedelta
+    from datetime import timedelta
 
     try:
         from lib.task_model import TaskStatus
+        from task_watcher import TaskWatcher
     except ImportError:
         print("Error: Could not import task libraries.", file=sys.stderr)
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
+    watcher = TaskWatcher(manager.storage, project=project)
 
-    # Track seen PRs and last activity time
-    seen_merge_ready = set()
-    seen_review = set()
+    # Statuses whose writes count as swarm progress
+    progress_statuses = {
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.MERGE_READY,
+        TaskStatus.REVIEW,
+        TaskStatus.DONE,
+    }
     last_activity = datetime.now().astimezone()
 
     # Graceful shutdown
@@ -1975,105 +2097,163 @@ def watch(ctx, interval, stall_threshold, project):
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
+    # Initial scan to populate the status map (don't alert on startup)
+    try:
+        watcher.load()
+        counts = watcher.counts()
+        print(
+            f"Initial state: {counts[TaskStatus.MERGE_READY]} merge_ready, "
+            f"{counts[TaskStatus.REVIEW]} review"
+        )
+    except Exception as e:
+        print(f"Warning: Initial scan failed: {e}")
+
+    event_driven = not poll and watcher.start()
+
     print("Starting polecat watch...")
-    print(f"  Polling interval: {interval}s")
+    if event_driven:
+        print(f"  Watching: {manager.storage.data_root}")
+    else:
+        print(f"  Polling interval: {interval}s")
     print(f"  Stall threshold: {stall_threshold}min")
     print(f"  Project filter: {project or 'all'}")
     print("  Press Ctrl+C to stop.\n")
 
-    # Initial scan to populate seen sets (don't alert on startup)
+    last_scan = last_status = time.monotonic()
     try:
-        merge_ready_tasks = manager.storage.list_tasks(
-            status=TaskStatus.MERGE_READY, project=project
-        )
-        for task in merge_ready_tasks:
-            seen_merge_ready.add(task.id)
-
-        review_tasks = manager.storage.list_tasks(status=TaskStatus.REVIEW, project=project)
-        for task in review_tasks:
-            seen_review.add(task.id)
+        while not stop_requested:
+            try:
+                if event_driven:
+                    changes = watcher.poll(timeout=1.0)
+                elif time.monotonic() - last_scan >= interval:
+                    changes = watcher.rescan()
+                    last_scan = time.monotonic()
+                else:
+                    # Sleep in small chunks to allow interrupt
+                    time.sleep(1)
+                    changes = []
 
-        print(f"Initial state: {len(seen_merge_ready)} merge_ready, {len(seen_review)} review")
-    except Exception as e:
-        print(f"Warning: Initial scan failed: {e}")
+                now = datetime.now().astimezone()
+                transitions = [change for change in changes if change.is_transition]
+                if any(change.new_status in progress_statuses for change in changes):
+                    last_activity = now
 
-    while not stop_requested:
-        try:
-            now = datetime.now().astimezone()
+                for change in transitions:
+                    if change.new_status == TaskStatus.MERGE_READY:
+                        _send_notification(
+                            "PR Filed",
+                            f"{change.task_id}: {change.title}",
+                            urgency="normal",
+                        )
+                    elif change.new_status == TaskStatus.REVIEW:
+                        _send_notification(
+                            "Review Needed",
+                            f"{change.task_id}: {change.title}",
+                            urgency="critical",
+                        )
 
-            # Check for new merge_ready tasks (new PRs filed)
-            merge_ready_tasks = manager.storage.list_tasks(
-                status=TaskStatus.MERGE_READY, project=project
-            )
-            for task in merge_ready_tasks:
-                if task.id not in seen_merge_ready:
-                    seen_merge_ready.add(task.id)
-                    last_activity = now
+                # Check for stall
+                stall_cutoff = now - timedelta(minutes=stall_threshold)
+                if last_activity < stall_cutoff:
+                    minutes_stalled = int((now - last_activity).total_seconds() / 60)
                     _send_notification(
-                        "PR Filed",
-                        f"{task.id}: {task.title}",
-                        urgency="normal",
+                        "Swarm Stalled",
+                        f"No progress in {minutes_stalled} minutes",
+                        urgency="critical",
                     )
-
-            # Check for new review tasks (merge failures)
-            review_tasks = manager.storage.list_tasks(status=TaskStatus.REVIEW, project=project)
-            for task in review_tasks:
-                if task.id not in seen_review:
-                    seen_review.add(task.id)
+                    # Reset to avoid spamming alerts
                     last_activity = now
-                    _send_notification(
-                        "Review Needed",
-                        f"{task.id}: {task.title}",
-                        urgency="critical",
+
+                # Status line on transitions, and at least every interval
+                if transitions or time.monotonic() - last_status >= interval:
+                    last_status = time.monotonic()
+                    counts = watcher.counts()
+                    timestamp = now.strftime("%H:%M:%S")
+                    print(
+                        f"[{timestamp}] active={counts[TaskStatus.IN_PROGRESS]} "
+                        f"merge_ready={counts[TaskStatus.MERGE_READY]} "
+                        f"review={counts[TaskStatus.REVIEW]}"
                     )
 
-            # Check for completed tasks (mark as activity)
-            manager.storage.list_tasks(status=TaskStatus.DONE, project=project)
-            # We don't track done tasks, but finding new ones means progress
-            # This is a simplification - in production you'd track these too
-
-            # Check for in_progress tasks (active work)
-            in_progress = manager.storage.list_tasks(status=TaskStatus.IN_PROGRESS, project=project)
-            if in_progress:
-                # Check if any were modified recently
-                for task in in_progress:
-                    task_mod = task.modified
-                    if task_mod.tzinfo is None:
-                        task_mod = task_mod.replace(tzinfo=UTC)
-                    if task_mod > last_activity:
-                        last_activity = task_mod
-
-            # Check for stall
-            stall_cutoff = now - timedelta(minutes=stall_threshold)
-            if last_activity < stall_cutoff:
-                minutes_stalled = int((now - last_activity).total_seconds() / 60)
-                _send_notification(
-                    "Swarm Stalled",
-                    f"No progress in {minutes_stalled} minutes",
-                    urgency="critical",
-                )
-                # Reset to avoid spamming alerts
-                last_activity = now
-
-            # Status line
-            active_count = len(in_progress)
-            ready_count = len(merge_ready_tasks)
-            review_count = len(review_tasks)
-            timestamp = now.strftime("%H:%M:%S")
-            print(
-                f"[{timestamp}] active={active_count} merge_ready={ready_count} review={review_count}"
-            )
+            except Exception as e:
+                print(f"Error during watch: {e}")
+    finally:
+        watcher.stop()
 
-        except Exception as e:
-            print(f"Error during poll: {e}")
+    print("Watch stopped.")
 
-        # Sleep in small chunks to allow interrupt
-        for _ in range(interval):
-            if stop_requested:
-                break
-            time.sleep(1)
 
-    print("Watch stopped.")
+_METRIC_SECTIONS = {
+    "operation": "Operation latency (ms)",
+    "lock_wait": "Lock wait (ms)",
+    "merge": "Merge duration (ms) by success",
+    "lock_timeout": "Lock timeouts",
+    "queue_depth": "Queue depth",
+}
+
+
+@main.command("metrics")
+@click.option(
+    "--days",
+    "-d",
+    type=click.FloatRange(min=0, min_open=True),
+    default=7,
+    show_default=True,
+    help="Look back this many days",
+)
+@click.option("--project", "-p", help="Only show this project")
+@click.option("--kind", "-k", type=click.Choice(list(METRIC_KINDS)), help="Only show one kind")
+@click.option("--json", "as_json", is_flag=True, help="Print rows as JSON")
+@click.pass_context
+def show_metrics(ctx, days, project, kind, as_json):
+    """Show percentiles of recorded metrics per operation and project.
+
+    Reads the event log that polecat commands write to <home>/metrics.
+    Cumulative totals for scraping are in <home>/metrics/polecat.prom.
+
+    Examples:
+        polecat metrics                 # Last 7 days
+        polecat metrics -d 1 -p aops    # Last day, aops only
+        polecat metrics -k lock_wait    # Just lock waits
+    """
+    directory = metrics.store.directory if metrics.store else get_polecat_home() / "metrics"
+    since = datetime.now(UTC) - timedelta(days=days)
+    rows = summarize(read_events(directory, since))
+    if project:
+        rows = [r for r in rows if r["project"] == project]
+    if kind:
+        rows = [r for r in rows if r["kind"] == kind]
+
+    if as_json:
+        print(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        print(f"No metrics recorded in the last {days:g} days ({directory}).")
+        return
+
+    for section, title in _METRIC_SECTIONS.items():
+        section_rows = [r for r in rows if r["kind"] == section]
+        if not section_rows:
+            continue
+        print(f"\n{title}, last {days:g} days")
+        if section == "lock_timeout":
+            print(f"  {'NAME':<28} {'PROJECT':<16} {'COUNT':>7}")
+            for r in section_rows:
+                print(f"  {r['name']:<28} {r['project'] or '-':<16} {r['count']:>7}")
+        elif section == "queue_depth":
+            print(f"  {'NAME':<28} {'PROJECT':<16} {'COUNT':>7} {'LAST':>8} {'MAX':>8}")
+            for r in section_rows:
+                print(
+                    f"  {r['name']:<28} {r['project'] or '-':<16} {r['count']:>7} "
+                    f"{r['last']:>8g} {r['max']:>8g}"
+                )
+        else:
+            columns = ("p50", "p90", "p95", "p99", "max")
+            header = " ".join(f"{c.upper():>9}" for c in columns)
+            print(f"  {'NAME':<28} {'PROJECT':<16} {'COUNT':>7} {header}")
+            for r in section_rows:
+                values = " ".join(f"{r[c]:>9.1f}" for c in columns)
+                print(f"  {r['name']:<28} {r['project'] or '-':<16} {r['count']:>7} {values}")
 
 
 @main.command()
@@ -2082,12 +2262,21 @@ def watch(ctx, interval, stall_threshold, project):
 @click.option("--project", "-p", help="Project to focus on (default: all)")
 @click.option("--caller", default="polecat", help="Identity claiming the tasks (default: bot)")
 @click.option("--dry-run", is_flag=True, help="Simulate execution")
+@click.option(
+    "--warm",
+    is_flag=True,
+    help="Keep each worker loaded and run cycles in-process (reports phase timings)",
+)
 @click.pass_context
-def swarm(ctx, claude, gemini, project, caller, dry_run):
+def swarm(ctx, claude, gemini, project, caller, dry_run, warm):
     """Run a swarm of parallel Polecat workers.
 
     Spawns N claude and M gemini workers, managing CPU affinity.
     Restarting workers on success, stopping on failure.
+
+    With --warm, each worker loads polecat once and runs every
+    claim → setup → run → finish cycle in its own process, spawning
+    only the agent CLI.
     """
     try:
         from swarm import run_swarm
@@ -2106,14 +2295,12 @@ def swarm(ctx, claude, gemini, project, caller, dry_run):
                 sys.exit(1)
 
     home = ctx.obj.get("home")
-    run_swarm(claude, gemini, project, caller, dry_run, str(home) if home else None)
+    run_swarm(claude, gemini, project, caller, dry_run, str(home) if home else None, warm)
 
 
 @main.command()
 @click.option("--project", "-p", required=True, help="Project to pull tasks from")
-@click.option(
-    "--max-pairs", "-n", default=3, help="Max (task, runner) pairs per round (default: 3)"
-)
+@click.option("--max-pairs", "-n", default=3, help="Max concurrent workers (default: 3)")
 @click.option("--max-rounds", default=10, help="Max supervisor loop iterations (default: 10)")
 @click.option(
     "--supervisor",
@@ -2126,8 +2313,10 @@ def swarm(ctx, claude, gemini, project, caller, dry_run):
 def supervise(project, max_pairs, max_rounds, supervisor, model, dry_run):
     """LLM-driven supervisor loop: plan, dispatch, verify, repeat.
 
-    Each round: an LLM reviews the task queue, selects tasks to dispatch,
-    workers run in parallel, then the LLM verifies results before continuing.
+    Each round: an LLM verifies the workers that finished since its last
+    decision and selects tasks for the free slots. Workers run in parallel
+    and each finished worker frees its slot, up to --max-pairs at once
+    (fewer while workers report lock contention or the machine is loaded).
     """
     try:
         from supervisor_loop import supervisor_loop
@@ -2225,7 +2414,7 @@ def summary(ctx, since, project):
         )
         sys.exit(1)
 
-    manager = PolecatManager(home_dir=ctx.obj.get("home"))
+    manager = _get_manager(ctx)
 
     # Parse the duration
     try:
@@ -23,15 +23,23 @@ except ImportError as e:
 
 
 class Engineer:
+    # Command run in the repo to verify a merge
+    test_cmd = ["uv", "run", "pytest"]
+
     def __init__(self):
         self.storage = TaskStorage()
         self.polecat_mgr = PolecatManager()
 
-    def scan_and_merge(self):
+    def scan_and_merge(self, train_size: int = 1):
         """Scans for tasks in MERGE_READY status and attempts to merge them.
 
-        Uses MERGING status as a merge slot - only one task can be merging at a time.
-        This serializes merges to prevent conflicts and ensure orderly integration.
+        Uses MERGING status as a merge slot - only one merge (or merge train)
+        can be in flight at a time. This serializes merges to prevent
+        conflicts and ensure orderly integration.
+
+        Args:
+            train_size: With more than 1, merge up to this many tasks from the
+                same repo as one train (see merge_train)
         """
         # Check if another task is already merging (merge slot occupied)
         merging_tasks = self.storage.list_tasks(status=TaskStatus.MERGING)
@@ -51,6 +59,12 @@ class Engineer:
 
         print(f"Found {len(tasks)} tasks awaiting merge.")
 
+        if train_size > 1:
+            repo_path = self.polecat_mgr.get_repo_path(tasks[0])
+            train = [t for t in tasks if self.polecat_mgr.get_repo_path(t) == repo_path]
+            self.merge_train(train[:train_size])
+            return
+
         for task in tasks:
             print(f"\nProcessing {task.id}: {task.title}")
             start_time = time.perf_counter()
@@ -61,6 +75,7 @@ class Engineer:
                     task_id=task.id,
                     success=True,
                     duration_ms=duration_ms,
+                    project=task.project,
                 )
             except Exception as e:
                 duration_ms = (time.perf_counter() - start_time) * 1000
@@ -71,6 +86,7 @@ class Engineer:
                     success=False,
                     duration_ms=duration_ms,
                     failure_reason=failure_reason,
+                    project=task.project,
                 )
                 self.handle_failure(task, str(e))
             # Only process one task per scan (merge slot pattern)
@@ -152,7 +168,7 @@ class Engineer:
                 f"No test configuration found. Expected pyproject.toml at {repo_path}. "
                 f"Merge verification requires a test suite."
             )
-        test_cmd = ["uv", "run", "pytest"]
+        test_cmd = self.test_cmd
         print(f"  Running tests: {' '.join(test_cmd)}")
         try:
             # Capture output to log on failure
@@ -182,6 +198,203 @@ class Engineer:
         self.polecat_mgr.nuke_worktree(task.id)
         print("  ✅ Merge Complete.")
 
+    def merge_train(self, tasks):
+        """Merge several MERGE_READY tasks from one repo as a train.
+
+        Each task's branch is squash-merged onto the target branch in turn,
+        and the test command runs once on the whole stack. If the tests
+        fail, the train is bisected: the first half is tested on its own,
+        then the second half on top of whatever of the first half passed,
+        until the failing tasks are isolated. Passing tasks are pushed with
+        a single push; failing ones go through handle_failure. A train with
+        no failures costs one test run instead of one per task.
+
+        Status transitions are those of process_merge, for every task in the
+        train.
+        """
+        start_time = time.perf_counter()
+        print(f"\n🚂 Merge train of {len(tasks)}: {', '.join(t.id for t in tasks)}")
+        print("  Claiming merge slot...")
+        for task in tasks:
+            task.status = TaskStatus.MERGING
+            self.storage.save_task(task)
+
+        repo_path = self.polecat_mgr.get_repo_path(tasks[0])
+        target_branch = "main"
+        # Task ID -> error message, for tasks that can't be merged
+        failures: dict[str, str] = {}
+        accepted = []
+        try:
+            base = self._prepare_train(repo_path, target_branch, tasks, failures)
+            candidates = [t for t in tasks if t.id not in failures]
+            head, accepted = self._land(repo_path, base, candidates, failures)
+
+            if accepted:
+                print(f"  Pushing {len(accepted)} merge(s)...")
+                self._run_git(repo_path, ["reset", "--hard", head])
+                self._run_git(repo_path, ["push", "origin", target_branch])
+            else:
+                self._run_git(repo_path, ["reset", "--hard", base])
+        except Exception as e:
+            # The train as a whole failed (bad repo state, push rejected...)
+            for task in tasks:
+                failures.setdefault(task.id, str(e))
+            accepted = []
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        accepted_ids = {task.id for task in accepted}
+        for task in tasks:
+            if task.id in accepted_ids:
+                metrics.record_merge_attempt(
+                    task_id=task.id,
+                    success=True,
+                    duration_ms=duration_ms,
+                    project=task.project,
+                )
+                self._finish_merged(repo_path, task)
+            else:
+                error_msg = failures[task.id]
+                print(f"  ❌ {task.id}: {error_msg.splitlines()[0]}")
+                metrics.record_merge_attempt(
+                    task_id=task.id,
+                    success=False,
+                    duration_ms=duration_ms,
+                    failure_reason=self._categorize_merge_failure(error_msg),
+                    project=task.project,
+                )
+                self.handle_failure(task, error_msg)
+        print(f"  🚂 Train done: {len(accepted)}/{len(tasks)} merged.")
+
+    def _prepare_train(
+        self, repo_path: Path, target_branch: str, tasks, failures: dict[str, str]
+    ) -> str:
+        """Run process_merge's pre-flight checks and update the target branch.
+
+        Tasks whose branch is missing are failed here.
+
+        Returns:
+            The commit the train is built on
+        """
+        if not repo_path.exists():
+            raise FileNotFoundError(f"Repo not found at {repo_path}")
+        if self._is_dirty(repo_path):
+            raise RuntimeError(
+                f"Repository has uncommitted changes. Run:\n  cd {repo_path} && git stash"
+            )
+        if not (repo_path / "pyproject.toml").exists():
+            raise RuntimeError(
+                f"No test configuration found. Expected pyproject.toml at {repo_path}. "
+                f"Merge verification requires a test suite."
+            )
+
+        print(f"  Fetching in {repo_path}...")
+        self._run_git(repo_path, ["fetch", "origin"])
+        unpushed = self._get_unpushed_count(repo_path, target_branch)
+        if unpushed > 0:
+            raise RuntimeError(
+                f"Main branch has {unpushed} unpushed commits. Run:\n"
+                f"  cd {repo_path} && git push origin {target_branch}"
+            )
+
+        for task in tasks:
+            branch_name = f"polecat/{task.id}"
+            if not self._branch_exists(repo_path, f"origin/{branch_name}") and not (
+                self._branch_exists(repo_path, branch_name)
+            ):
+                failures[task.id] = f"Branch {branch_name} not found locally or on origin"
+
+        print(f"  Updating {target_branch}...")
+        self._run_git(repo_path, ["checkout", target_branch])
+        self._run_git(repo_path, ["pull", "origin", target_branch])
+        return self._rev_parse(repo_path, "HEAD")
+
+    def _land(
+        self,
+        repo_path: Path,
+        base: str,
+        tasks,
+        failures: dict[str, str],
+        known_error: str | None = None,
+    ):
+        """Find the tasks that pass tests when stacked on base, in order.
+
+        Args:
+            base: Commit to stack on
+            tasks: Tasks to try, in merge order
+            failures: Collects the error for each task that fails
+            known_error: Test failure the stack of these tasks on base is
+                already known to produce, so it isn't built and tested again
+
+        Returns:
+            (head, accepted): the commit with the accepted tasks stacked on
+            base, and those tasks
+        """
+        if not tasks:
+            return base, []
+
+        error = known_error
+        if error is None:
+            head, tasks = self._stack(repo_path, base, tasks, failures)
+            if not tasks:
+                return base, []
+            print(f"  Running tests on {len(tasks)} stacked merge(s): {' '.join(self.test_cmd)}")
+            error = self._run_tests(repo_path)
+            if error is None:
+                return head, tasks
+        if len(tasks) == 1:
+            failures[tasks[0].id] = error
+            return base, []
+
+        mid = len(tasks) // 2
+        print(f"  Bisecting: {mid} + {len(tasks) - mid}")
+        head, left = self._land(repo_path, base, tasks[:mid], failures)
+        # If all of the first half passed, the failure is in the second half
+        right_error = error if len(left) == mid else None
+        head, right = self._land(repo_path, head, tasks[mid:], failures, right_error)
+        return head, left + right
+
+    def _stack(self, repo_path: Path, base: str, tasks, failures: dict[str, str]):
+        """Squash-merge each task's branch onto base, one commit per task.
+
+        Tasks that conflict are failed and left out.
+
+        Returns:
+            (head, stacked): the resulting commit and the tasks in it
+        """
+        self._run_git(repo_path, ["reset", "--hard", base])
+        stacked = []
+        for task in tasks:
+            branch_name = f"polecat/{task.id}"
+            if not self._branch_exists(repo_path, branch_name):
+                branch_name = f"origin/{branch_name}"
+            try:
+                self._run_git(repo_path, ["merge", "--squash", branch_name])
+            except subprocess.CalledProcessError:
+                self._run_git(repo_path, ["reset", "--hard", "HEAD"])
+                failures[task.id] = "Merge conflicts detected"
+                continue
+            commit_msg = f"Merge polecat/{task.id}: {task.title} ({task.id})"
+            self._run_git(repo_path, ["commit", "--allow-empty", "-m", commit_msg])
+            stacked.append(task)
+        return self._rev_parse(repo_path, "HEAD"), stacked
+
+    def _run_tests(self, repo_path: Path) -> str | None:
+        """Run the test command, returning a failure message or None."""
+        result = subprocess.run(self.test_cmd, cwd=repo_path, capture_output=True)
+        if result.returncode == 0:
+            return None
+        return f"Tests failed:\n{result.stdout.decode()}\n{result.stderr.decode()}"
+
+    def _finish_merged(self, repo_path: Path, task):
+        """Clean up after a train merged a task (process_merge steps 6-8)."""
+        branch_name = f"polecat/{task.id}"
+        self._run_git(repo_path, ["branch", "-D", branch_name], check=False)
+        self._run_git(repo_path, ["push", "origin", "--delete", branch_name], check=False)
+        task.status = TaskStatus.DONE
+        self.storage.save_task(task)
+        self.polecat_mgr.nuke_worktree(task.id)
+        print(f"  ✅ {task.id} merged.")
+
     def handle_failure(self, task, error_msg):
         """Kickback workflow: Set status to review for human intervention."""
         print("  ↪ Kickback: Setting status to REVIEW.")
@@ -202,6 +415,9 @@ class Engineer:
         cmd = ["git"] + args
         return subprocess.run(cmd, cwd=cwd, check=check, capture_output=True)
 
+    def _rev_parse(self, cwd, rev) -> str:
+        return self._run_git(cwd, ["rev-parse", rev]).stdout.decode().strip()
+
     def _branch_exists(self, cwd, branch):
         res = self._run_git(cwd, ["rev-parse", "--verify", branch], check=False)
         return res.returncode == 0
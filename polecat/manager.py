@@ -4,6 +4,10 @@ import os
 import shutil
 import subprocess
 import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
 import yaml
@@ -17,11 +21,41 @@ sys.path.insert(0, str(REPO_ROOT / "aops-core"))
 
 # These imports will fail here but work when moved to academicOps
 try:
-    from lib.task_model import TaskStatus
     from lib.task_storage import TaskStorage
 except ImportError:
     pass
 
+# Default per-project time limit (seconds) for mirror clones and fetches
+MIRROR_TIMEOUT = 600.0
+
+# Namespace in a mirror holding the refs of the clones that borrow its objects
+CLONE_REFS = "refs/polecat-clones"
+
+
+def _time_left(deadline: float | None, cmd: list[str]) -> float | None:
+    """Seconds left before deadline (a time.monotonic() value) for a git command.
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline has already passed
+    """
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise subprocess.TimeoutExpired(cmd, 0)
+    return remaining
+
+
+def _describe_failure(error: Exception) -> str:
+    """One-line reason for a failed mirror operation."""
+    if isinstance(error, subprocess.TimeoutExpired):
+        return f"timed out running {' '.join(map(str, error.cmd))}"
+    if isinstance(error, subprocess.CalledProcessError):
+        stderr = (error.stderr or "").strip() if isinstance(error.stderr, str) else ""
+        detail = stderr.splitlines()[-1] if stderr else f"exit status {error.returncode}"
+        return f"{' '.join(map(str, error.cmd))}: {detail}"
+    return str(error)
+
 
 def get_polecat_home() -> Path:
     """Get the polecat home directory.
@@ -204,6 +238,10 @@ class PolecatManager:
         self.repos_dir = self.polecats_dir / ".repos"
         self.repos_dir.mkdir(exist_ok=True)
 
+        # Hidden directories for worktree creation locks and pre-created clones
+        self.locks_dir = self.polecats_dir / ".locks"
+        self.pool_dir = self.polecats_dir / ".pool"
+
         # Directory for persistent crew workers
         self.crew_dir = self.polecats_dir / "crew"
         self.crew_dir.mkdir(exist_ok=True)
@@ -473,8 +511,9 @@ class PolecatManager:
         Prefers bare mirror in $POLECAT_HOME/polecat/.repos/ if it exists (for isolation).
         Falls back to local project path from config.
         """
-        project = task.project or "aops"
+        return self._project_repo_path(task.project or "aops")
 
+    def _project_repo_path(self, project: str) -> Path:
         # Check for bare mirror first
         mirror_path = self.repos_dir / f"{project}.git"
         if mirror_path.exists():
@@ -497,13 +536,14 @@ class PolecatManager:
         )
         return result.stdout.strip()
 
-    def ensure_repo_mirror(self, project: str) -> Path:
+    def ensure_repo_mirror(self, project: str, timeout: float | None = None) -> Path:
         """Creates or updates a bare mirror clone for the project.
 
         Derives the remote URL from the actual repo's git config (not hardcoded).
 
         Args:
             project: Project slug (must exist in PROJECTS registry)
+            timeout: Seconds allowed for all git commands together (default: no limit)
 
         Returns:
             Path to the bare mirror repo (.repos/<project>.git)
@@ -512,9 +552,11 @@ class PolecatManager:
             ValueError: If project not in registry
             FileNotFoundError: If source repo doesn't exist
             subprocess.CalledProcessError: If git operations fail
+            subprocess.TimeoutExpired: If git operations take longer than timeout
         """
         if project not in self.projects:
             raise ValueError(f"Unknown project: {project}. Known: {list(self.projects.keys())}")
+        deadline = time.monotonic() + timeout if timeout is not None else None
 
         config = self.projects[project]
         source_path = config["path"]
@@ -526,19 +568,32 @@ class PolecatManager:
         if mirror_path.exists():
             # Update existing mirror
             print(f"Fetching latest for {project}...")
+            cmd = ["git", "fetch", "--all", "--prune"]
             subprocess.run(
-                ["git", "fetch", "--all", "--prune"],
+                cmd,
                 cwd=mirror_path,
                 check=True,
+                capture_output=True,
+                text=True,
+                timeout=_time_left(deadline, cmd),
             )
         else:
             # Derive remote URL from source repo
             remote_url = self._get_remote_url(source_path)
             print(f"Cloning {project} from {remote_url}...")
-            subprocess.run(
-                ["git", "clone", "--bare", remote_url, str(mirror_path)],
-                check=True,
-            )
+            cmd = ["git", "clone", "--bare", remote_url, str(mirror_path)]
+            try:
+                subprocess.run(
+                    cmd,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=_time_left(deadline, cmd),
+                )
+            except subprocess.TimeoutExpired:
+                # Don't leave a partial clone that later runs would fetch into
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                raise
             # Configure fetch refspec to get all branches
             subprocess.run(
                 ["git", "config", "remote.origin.fetch", "+refs/heads/*:refs/heads/*"],
@@ -812,116 +867,118 @@ class PolecatManager:
         except Exception as e:
             return False, str(e)
 
-    def init_all_mirrors(self) -> dict[str, Path]:
-        """Initialize bare mirrors for all registered projects.
+    def _run_per_project(
+        self, operation: str, projects: list[str], work, jobs: int, **fields
+    ) -> tuple[dict, dict[str, str]]:
+        """Run work(project) for each project on a pool of up to jobs threads.
+
+        Each call is timed as a metrics span for operation. A failing project
+        doesn't stop the others: its error is collected instead.
 
         Returns:
-            Dict mapping project slug to mirror path
+            Tuple of (results, failures): work's return value for each project
+            that succeeded, and a one-line reason for each that failed
         """
+
+        def run_one(project: str):
+            with metrics.time_operation(operation, project=project, **fields):
+                return work(project)
+
         results = {}
-        for project in self.projects:
-            try:
-                results[project] = self.ensure_repo_mirror(project)
-                print(f"✓ {project}")
-            except Exception as e:
-                print(f"✗ {project}: {e}")
-                results[project] = None
-        return results
+        failures = {}
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = {pool.submit(run_one, project): project for project in projects}
+            for future in as_completed(futures):
+                project = futures[future]
+                try:
+                    results[project] = future.result()
+                    print(f"✓ {project}")
+                except Exception as e:
+                    failures[project] = _describe_failure(e)
+                    print(f"✗ {project}: {failures[project]}")
+        return results, failures
+
+    @staticmethod
+    def _report_failures(failures: dict[str, str], total: int) -> None:
+        if failures:
+            print(f"\n{len(failures)}/{total} mirrors failed:", file=sys.stderr)
+            for project in sorted(failures):
+                print(f"  {project}: {failures[project]}", file=sys.stderr)
+
+    def init_all_mirrors(
+        self, jobs: int = 1, timeout: float | None = MIRROR_TIMEOUT
+    ) -> dict[str, Path]:
+        """Initialize bare mirrors for all registered projects.
+
+        Args:
+            jobs: Number of projects to clone or fetch at once
+            timeout: Seconds allowed per project (None: no limit)
+
+        Returns:
+            Dict mapping project slug to mirror path (None if it failed)
+        """
+        projects = list(self.projects)
+        mirrors, failures = self._run_per_project(
+            "mirror_init",
+            projects,
+            lambda project: self.ensure_repo_mirror(project, timeout=timeout),
+            jobs,
+        )
+        self._report_failures(failures, len(projects))
+        return {project: mirrors.get(project) for project in projects}
 
-    def sync_all_mirrors(self) -> dict[str, bool]:
+    def sync_all_mirrors(
+        self, jobs: int = 1, timeout: float | None = MIRROR_TIMEOUT
+    ) -> dict[str, bool]:
         """Fetch latest from origin for all existing mirrors.
 
+        Args:
+            jobs: Number of mirrors to fetch at once
+            timeout: Seconds allowed per mirror (None: no limit)
+
         Returns:
             Dict mapping project slug to success status
         """
-        results = {}
+        results = dict.fromkeys(self.projects, False)
+        to_sync = []
         for project in self.projects:
-            mirror_path = self.repos_dir / f"{project}.git"
-            if not mirror_path.exists():
+            if (self.repos_dir / f"{project}.git").exists():
+                to_sync.append(project)
+            else:
                 print(f"⊘ {project}: no mirror (run 'polecat init' first)")
-                results[project] = False
-                continue
-            try:
-                with metrics.time_operation("sync", project=project, mode="full"):
-                    subprocess.run(
-                        ["git", "fetch", "--all", "--prune"],
-                        cwd=mirror_path,
-                        check=True,
-                        capture_output=True,
-                    )
-                print(f"✓ {project}")
-                results[project] = True
-            except subprocess.CalledProcessError as e:
-                print(f"✗ {project}: {e}")
-                results[project] = False
-        return results
-
-    def claim_next_task(self, caller: str, project: str | None = None):
-        """Finds and claims the highest priority ready task."""
-        tasks = self.storage.get_ready_tasks(project=project)
-
-        # Record queue depth of ready tasks
-        metrics.record_queue_depth("ready", count=len(tasks), project=project)
-
-        if not tasks:
-            return None
-
-        for task in tasks:
-            task_path = self.storage._find_task_path(task.id)
-            if task_path is None:
-                continue
-
-            lock_path = task_path.with_suffix(".lock")
 
-            try:
-                with open(lock_path, "w") as lock_file:
-                    try:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    except BlockingIOError:
-                        # Lock contention - another worker has this task
-                        metrics.record_lock_wait(
-                            "task_claim",
-                            wait_time_ms=0,  # Non-blocking, so no wait
-                            acquired=False,
-                            caller=caller,
-                        )
-                        continue
-
-                    try:
-                        fresh_task = self.storage.get_task(task.id)
-                        if fresh_task is None or fresh_task.status != TaskStatus.ACTIVE:
-                            continue
-                        if fresh_task.assignee and fresh_task.assignee != caller:
-                            continue
-                        # Defense in depth: skip tasks that already have an open PR,
-                        # even if their status somehow reverted to ACTIVE.
-                        if fresh_task.pr_url or fresh_task.pr:
-                            print(
-                                f"[claim] Skipping {fresh_task.id}: locked by existing PR "
-                                f"({fresh_task.pr_url or f'#{fresh_task.pr}'})",
-                                file=sys.stderr,
-                            )
-                            continue
+        def fetch(project: str) -> None:
+            cmd = ["git", "fetch", "--all", "--prune"]
+            subprocess.run(
+                cmd,
+                cwd=self.repos_dir / f"{project}.git",
+                check=True,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
 
-                        fresh_task.status = TaskStatus.IN_PROGRESS
-                        fresh_task.assignee = caller
-                        self.storage.save_task(fresh_task)
-                        return fresh_task
+        synced, failures = self._run_per_project("sync", to_sync, fetch, jobs, mode="full")
+        self._report_failures(failures, len(to_sync))
+        for project in synced:
+            results[project] = True
+        return results
 
-                    finally:
-                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    def claim_next_task(self, caller: str, project: str | None = None):
+        """Finds and claims the highest priority ready task.
 
-            except OSError as e:
-                print(f"Warning: Failed to claim {task.id}: {e}", file=sys.stderr)
-                continue
-            finally:
-                try:
-                    lock_path.unlink(missing_ok=True)
-                except OSError:
-                    # Lock file cleanup is best-effort; may fail if already removed
-                    pass
+        Claims go through the task storage's persistent ready queue, so this
+        reads one task file rather than scanning every task.
+        """
+        with metrics.time_operation("task_claim", project=project, caller=caller) as ctx:
+            task = self.storage.claim_next_task(caller, project=project)
+            ctx["task_id"] = task.id if task else None
 
-        return None
+        # Record queue depth of ready tasks left after this claim
+        metrics.record_queue_depth(
+            "ready", count=self.storage.ready_queue.depth(project=project), project=project
+        )
+        return task
 
     def setup_worktree(self, task, lock_timeout: float = 30.0):
         """Creates a local git clone in $POLECAT_HOME/polecat linked to the project repo.
@@ -947,16 +1004,33 @@ class PolecatManager:
         return self._setup_worktree_locked(task, lock_timeout)
 
     def _setup_worktree_locked(self, task, lock_timeout: float):
-        """Internal worktree setup with lock protection."""
-        import time
+        """Internal worktree setup with lock protection.
 
-        lock_path = self.polecats_dir / ".worktree_creation.lock"
-        start_time = time.monotonic()
+        The lock is per task, so polecats setting up different tasks don't
+        wait for each other; only mirror syncs are serialised, per project.
+        """
+        with self._worktree_lock(f"task-{task.id}", "worktree_creation", lock_timeout, task.id):
+            return self._do_setup_worktree(task, lock_timeout)
 
-        # Ensure lock file exists
-        lock_path.touch(exist_ok=True)
+    @contextmanager
+    def _worktree_lock(self, name: str, lock_name: str, timeout: float, caller: str):
+        """Hold an exclusive fcntl lock on <home>/.locks/<name>.lock.
+
+        Args:
+            name: Lock file name (a project or task scope)
+            lock_name: Lock identifier for metrics
+            timeout: Seconds to wait for the lock
+            caller: Task ID recorded with lock metrics
+
+        Raises:
+            TimeoutError: If the lock cannot be acquired within timeout
+        """
+        self.locks_dir.mkdir(exist_ok=True)
+        lock_path = self.locks_dir / f"{name}.lock"
+        start_time = time.monotonic()
 
-        with open(lock_path, "w") as lock_file:
+        while True:
+            lock_file = open(lock_path, "a")
             # Try to acquire lock with timeout
             while True:
                 try:
@@ -964,48 +1038,88 @@ class PolecatManager:
                     break  # Lock acquired
                 except BlockingIOError:
                     elapsed = time.monotonic() - start_time
-                    if elapsed >= lock_timeout:
+                    if elapsed >= timeout:
+                        lock_file.close()
                         # Record lock timeout metric
                         metrics.record_lock_timeout(
-                            "worktree_creation",
-                            timeout_seconds=lock_timeout,
-                            caller=task.id,
+                            lock_name,
+                            timeout_seconds=timeout,
+                            caller=caller,
                         )
                         raise TimeoutError(
-                            f"Could not acquire worktree creation lock within {lock_timeout}s. "
+                            f"Could not acquire {lock_name} lock ({name}) within {timeout}s. "
                             f"Another polecat may be creating a worktree."
                         ) from None
                     time.sleep(0.1)  # Brief sleep before retry
+            # The file may have been removed while we waited (see _remove_lock_file)
+            if self._is_current_lock_file(lock_path, lock_file):
+                break
+            lock_file.close()
 
+        with lock_file:
             # Record lock wait time (time from start to acquisition)
             wait_time_ms = (time.monotonic() - start_time) * 1000
             if wait_time_ms > 10:  # Only record if there was meaningful contention
                 metrics.record_lock_wait(
-                    "worktree_creation",
+                    lock_name,
                     wait_time_ms=wait_time_ms,
                     acquired=True,
-                    caller=task.id,
+                    caller=caller,
                 )
 
             try:
-                return self._do_setup_worktree(task)
+                yield
             finally:
                 fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
-    def _do_setup_worktree(self, task):
-        """Actual worktree creation logic (called under lock).
-
-        Containerization-aware: Assumes fresh clone/worktree each time.
-        Always syncs before work to handle stateless environments.
-        """
+    @staticmethod
+    def _is_current_lock_file(lock_path: Path, lock_file) -> bool:
+        try:
+            return os.stat(lock_path).st_ino == os.fstat(lock_file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
 
-        project = task.project if task.project else "aops"
+    def _remove_lock_file(self, name: str):
+        """Delete <home>/.locks/<name>.lock unless someone holds it.
 
-        # --- SYNC BEFORE WORK ---
-        # Critical for containerized/stateless environments where workers start fresh.
-        # Even for persistent environments, ensures we have latest code.
+        Deleted while held, so a polecat that was waiting on the old file
+        notices and opens a new one (see _worktree_lock).
+        """
+        lock_path = self.locks_dir / f"{name}.lock"
+        try:
+            lock_file = open(lock_path, "a")
+        except OSError:
+            return
+        with lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return  # In use; removed when its worktree is nuked again
+            if self._is_current_lock_file(lock_path, lock_file):
+                lock_path.unlink()
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _sync_mirror_for_worktree(self, project: str, lock_timeout: float, caller: str):
+        """Sync a project's mirror before creating a worktree from it.
+
+        Runs under the project's mirror lock. When several polecats start at
+        once, a sync that began after this call was made already covers it,
+        so waiters skip theirs: a burst of N setups runs at most two syncs.
+        """
         mirror_path = self.repos_dir / f"{project}.git"
-        if mirror_path.exists():
+        stamp = self.locks_dir / f"mirror-{project}.synced"
+        requested = time.time()
+
+        with self._worktree_lock(f"mirror-{project}", "mirror_sync", lock_timeout, caller):
+            try:
+                last_sync_start = stamp.stat().st_mtime
+            except FileNotFoundError:
+                last_sync_start = 0.0
+            if last_sync_start >= requested:
+                print(f"  ✅ {project} mirror synced by another polecat")
+                return
+
+            sync_start = time.time()
             print(f"🔄 Syncing {project} mirror before worktree setup...")
             self.safe_sync_mirror(project)
 
@@ -1016,6 +1130,277 @@ class PolecatManager:
             else:
                 print("  ✅ Mirror is fresh")
 
+            self._protect_borrowed_objects(mirror_path)
+            stamp.touch()
+            os.utime(stamp, (sync_start, sync_start))
+
+    def _protect_borrowed_objects(self, mirror_path: Path):
+        """Keep gc in a mirror from pruning objects that live clones borrow.
+
+        Worktrees are cloned with --shared, reading objects through the
+        mirror's object store. Refs the mirror later drops (fetch --prune)
+        leave objects unreachable in the mirror that a clone may still need.
+        Each live clone's refs are recorded in the mirror under CLONE_REFS,
+        keeping exactly those objects reachable; the refs of clones that are
+        gone are deleted, so gc can prune what only they needed.
+        """
+        # Mirrors set up by earlier versions never pruned at all
+        result = subprocess.run(
+            ["git", "config", "--get", "gc.pruneExpire"],
+            cwd=mirror_path,
+            capture_output=True,
+            text=True,
+        )
+        if result.stdout.strip() == "never":
+            subprocess.run(["git", "config", "--unset", "gc.pruneExpire"], cwd=mirror_path)
+
+        live = set()
+        for clone_path in self._borrowing_clones(mirror_path):
+            key = self._clone_key(clone_path)
+            live.add(key)
+            self._record_clone_refs(mirror_path, key, clone_path)
+
+        result = subprocess.run(
+            ["git", "for-each-ref", "--format=%(refname)", f"{CLONE_REFS}/"],
+            cwd=mirror_path,
+            capture_output=True,
+            text=True,
+        )
+        stale = [
+            ref
+            for ref in result.stdout.split()
+            if "/".join(ref.removeprefix(f"{CLONE_REFS}/").split("/")[:2]) not in live
+        ]
+        self._delete_refs(mirror_path, stale)
+
+    def _borrowing_clones(self, mirror_path: Path) -> list[Path]:
+        """Task worktrees and pooled clones whose objects come from mirror_path."""
+        candidates = [p for p in self.polecats_dir.iterdir() if not p.name.startswith(".")]
+        if self.pool_dir.exists():
+            candidates += [p for pool in self.pool_dir.iterdir() for p in pool.iterdir()]
+
+        objects = (mirror_path / "objects").resolve()
+        clones = []
+        for path in candidates:
+            alternates = path / ".git" / "objects" / "info" / "alternates"
+            try:
+                lines = alternates.read_text().splitlines()
+            except OSError:
+                continue
+            if any(Path(line).resolve() == objects for line in lines if line):
+                clones.append(path)
+        return clones
+
+    def _clone_key(self, clone_path: Path) -> str:
+        """Name of a clone's refs under CLONE_REFS (a pooled clone keeps its key when renamed)."""
+        if clone_path.parent.parent == self.pool_dir:
+            return f"pool/{clone_path.name.lstrip('.')}"
+        return f"tasks/{clone_path.name}"
+
+    @staticmethod
+    def _record_clone_refs(mirror_path: Path, key: str, clone_path: Path):
+        """Copy a clone's refs into the mirror under CLONE_REFS/<key>/.
+
+        Objects the clone made itself are fetched too; everything else is
+        already in the mirror. Failures only warn: the refs are recorded
+        again at the next mirror sync.
+        """
+        result = subprocess.run(
+            [
+                "git",
+                "fetch",
+                "--quiet",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--prune",
+                str(clone_path),
+                f"+refs/*:{CLONE_REFS}/{key}/*",
+            ],
+            cwd=mirror_path,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(
+                f"  ⚠ Could not record refs of {clone_path} in mirror: {result.stderr.strip()}",
+                file=sys.stderr,
+            )
+
+    @staticmethod
+    def _delete_refs(mirror_path: Path, refs: list[str]):
+        if not refs:
+            return
+        subprocess.run(
+            ["git", "update-ref", "--stdin"],
+            cwd=mirror_path,
+            input="".join(f"delete {ref}\n" for ref in refs),
+            capture_output=True,
+            text=True,
+        )
+
+    def _clone_for_worktree(self, repo_path: Path, worktree_path: Path):
+        """Clone repo_path to worktree_path with origin pointing at the real remote.
+
+        Clones of a bare mirror share its object store (--shared), so no
+        objects are copied or hardlinked; only the checkout is written.
+        Sandboxed runs mount the mirror's objects at the same path (see
+        cli._build_docker_cmd).
+        """
+        shared = repo_path.is_relative_to(self.repos_dir)
+        cmd = ["git", "clone"]
+        if shared:
+            cmd.append("--shared")
+        cmd += [str(repo_path), str(worktree_path)]
+
+        try:
+            subprocess.run(cmd, check=True)
+        except subprocess.CalledProcessError as e:
+            print(
+                f"Clone creation failed: {e}",
+                file=sys.stderr,
+            )
+            raise e
+
+        # Propagate git identity from source repo (clone doesn't copy local config)
+        self._propagate_git_identity(repo_path, worktree_path)
+
+        # Re-point origin to the actual remote instead of the local repo
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+        )
+        origin_url = result.stdout.strip()
+        if origin_url:
+            subprocess.run(
+                ["git", "remote", "set-url", "origin", origin_url], cwd=worktree_path, check=True
+            )
+
+        if shared:
+            self._record_clone_refs(repo_path, self._clone_key(worktree_path), worktree_path)
+
+    # --- Worktree pool ---------------------------------------------------------
+
+    def warm_worktree_pool(self, project: str, size: int, lock_timeout: float = 30.0) -> int:
+        """Grow or shrink a project's pool of pre-created clones to size.
+
+        Pooled clones are made by the same steps as a fresh worktree, up to
+        (not including) the task branch. setup_worktree moves one into place
+        and only has to refresh its refs and check out the task branch.
+
+        Args:
+            project: Project slug (must exist in the registry)
+            size: Number of clones to keep ready
+            lock_timeout: Seconds to wait for the mirror lock
+
+        Returns:
+            Number of pooled clones after warming
+        """
+        if project not in self.projects:
+            raise ValueError(f"Unknown project: {project}. Known: {list(self.projects.keys())}")
+
+        pool = self.pool_dir / project
+        pool.mkdir(parents=True, exist_ok=True)
+        entries = self._pooled_worktrees(project)
+        for entry in entries[size:]:
+            shutil.rmtree(entry, ignore_errors=True)
+        if len(entries) >= size:
+            return size
+
+        if (self.repos_dir / f"{project}.git").exists():
+            self._sync_mirror_for_worktree(project, lock_timeout, caller=f"pool-{project}")
+        repo_path = self._project_repo_path(project)
+        if not repo_path.exists():
+            raise FileNotFoundError(f"Project repository not found at {repo_path}")
+
+        with metrics.time_operation("pool_warm", project=project, size=size):
+            for _ in range(size - len(entries)):
+                # Clone under a hidden name so it can't be taken half-made
+                name = uuid.uuid4().hex[:12]
+                staging = pool / f".{name}"
+                try:
+                    self._clone_for_worktree(repo_path, staging)
+                except subprocess.CalledProcessError:
+                    shutil.rmtree(staging, ignore_errors=True)
+                    raise
+                staging.rename(pool / name)
+        return len(self._pooled_worktrees(project))
+
+    def _pooled_worktrees(self, project: str) -> list[Path]:
+        pool = self.pool_dir / project
+        if not pool.exists():
+            return []
+        return sorted(p for p in pool.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+    def _take_pooled_worktree(
+        self, project: str, repo_path: Path, worktree_path: Path, default_branch: str
+    ) -> bool:
+        """Move a pooled clone to worktree_path and bring it up to date.
+
+        The move is a rename, so concurrent polecats never get the same
+        clone. Refs are refreshed from repo_path (local, and object-free for
+        --shared clones), matching what a fresh clone would have.
+
+        Returns:
+            False if the pool is empty or the taken clone couldn't be refreshed
+        """
+        for entry in self._pooled_worktrees(project):
+            try:
+                entry.rename(worktree_path)
+            except OSError:
+                continue  # Taken by another polecat
+            break
+        else:
+            return False
+
+        print(f"Using pooled clone for {worktree_path}...")
+        refresh = [
+            [
+                "git",
+                "fetch",
+                "--quiet",
+                "--prune",
+                str(repo_path),
+                "+refs/heads/*:refs/remotes/origin/*",
+            ],
+            [
+                "git",
+                "checkout",
+                "--quiet",
+                "--force",
+                "-B",
+                default_branch,
+                f"origin/{default_branch}",
+            ],
+        ]
+        for cmd in refresh:
+            result = subprocess.run(cmd, cwd=worktree_path, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(
+                    f"  ⚠ Pooled clone refresh failed, cloning instead: {result.stderr.strip()}",
+                    file=sys.stderr,
+                )
+                shutil.rmtree(worktree_path, ignore_errors=True)
+                return False
+        return True
+
+    def _do_setup_worktree(self, task, lock_timeout: float = 30.0):
+        """Actual worktree creation logic (called under the task's lock).
+
+        Containerization-aware: Assumes fresh clone/worktree each time.
+        Always syncs before work to handle stateless environments.
+        """
+
+        project = task.project if task.project else "aops"
+
+        # --- SYNC BEFORE WORK ---
+        # Critical for containerized/stateless environments where workers start fresh.
+        # Even for persistent environments, ensures we have latest code.
+        mirror_path = self.repos_dir / f"{project}.git"
+        if mirror_path.exists():
+            self._sync_mirror_for_worktree(project, lock_timeout, caller=task.id)
+
         repo_path = self.get_repo_path(task)
         if not repo_path.exists():
             raise FileNotFoundError(f"Project repository not found at {repo_path}")
@@ -1049,39 +1434,9 @@ class PolecatManager:
             # Remove the broken/non-repo directory
             shutil.rmtree(worktree_path)
 
-        print(f"Creating local clone at {worktree_path} from repo {repo_path}...")
-
-        cmd = [
-            "git",
-            "clone",
-            str(repo_path),
-            str(worktree_path),
-        ]
-
-        try:
-            subprocess.run(cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            print(
-                f"Clone creation failed: {e}",
-                file=sys.stderr,
-            )
-            raise e
-
-        # Propagate git identity from source repo (clone doesn't copy local config)
-        self._propagate_git_identity(repo_path, worktree_path)
-
-        # Re-point origin to the actual remote instead of the local repo
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-        )
-        origin_url = result.stdout.strip()
-        if origin_url:
-            subprocess.run(
-                ["git", "remote", "set-url", "origin", origin_url], cwd=worktree_path, check=True
-            )
+        if not self._take_pooled_worktree(project, repo_path, worktree_path, default_branch):
+            print(f"Creating local clone at {worktree_path} from repo {repo_path}...")
+            self._clone_for_worktree(repo_path, worktree_path)
 
         # Check if the branch exists on remote, if so check it out, else create fresh from default
         branch_exists_result = subprocess.run(
@@ -1456,3 +1811,15 @@ class PolecatManager:
         if self._branch_exists(repo_path, branch_name):
             print(f"Deleting branch {branch_name}...")
             subprocess.run(["git", "branch", "-D", branch_name], cwd=repo_path, check=False)
+
+        # Let the mirror prune what only this clone needed
+        if repo_path.is_relative_to(self.repos_dir):
+            result = subprocess.run(
+                ["git", "for-each-ref", "--format=%(refname)", f"{CLONE_REFS}/tasks/{task_id}/"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+            )
+            self._delete_refs(repo_path, result.stdout.split())
+
+        self._remove_lock_file(f"task-{task_id}")
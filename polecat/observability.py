@@ -17,12 +17,264 @@ Usage:
 
     # Record queue depth
     metrics.record_queue_depth("merge_ready", count=5)
+
+Aggregation:
+    Once enable_store() is called (the CLI does this for <home>/metrics),
+    every metric is also fed to a MetricsStore. It keeps counters, gauges
+    and histograms in memory and flushes them every FLUSH_INTERVAL seconds
+    and at exit:
+
+    - polecat.prom: cumulative totals across processes, in Prometheus text
+      format (for node_exporter's textfile collector or similar)
+    - events-YYYY-MM-DD.jsonl: one line per observation, kept for
+      RETENTION_DAYS, from which `polecat metrics` computes percentiles
+
+    Swarm workers share the files; flushes are serialised by a file lock.
 """
 
+import atexit
+import fcntl
+import json
+import math
 import sys
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+# Add aops-core to path for lib imports
+SCRIPT_DIR = Path(__file__).parent.resolve()
+REPO_ROOT = SCRIPT_DIR.parent
+if str(REPO_ROOT / "aops-core") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from lib.cache_utils import atomic_write  # noqa: E402
+
+# Seconds between flushes of aggregated metrics to disk
+FLUSH_INTERVAL = 30.0
+
+# Days of JSONL event files to keep
+RETENTION_DAYS = 14
+
+# Histogram bucket upper bounds, in milliseconds
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000)
+
+# Prometheus metric name, help text and type for each kind of observation
+METRIC_KINDS = {
+    "operation": ("polecat_operation_duration_ms", "Duration of timed operations", "histogram"),
+    "lock_wait": ("polecat_lock_wait_ms", "Time spent waiting for locks", "histogram"),
+    "lock_timeout": ("polecat_lock_timeouts_total", "Lock acquisitions that timed out", "counter"),
+    "queue_depth": ("polecat_queue_depth", "Items in each queue when last recorded", "gauge"),
+    "merge": ("polecat_merge_duration_ms", "Duration of merge attempts", "histogram"),
+}
+
+
+class MetricsStore:
+    """In-process aggregation of polecat metrics, flushed to a directory.
+
+    Observations are keyed by kind (see METRIC_KINDS) and a sorted tuple of
+    label pairs. Histograms keep per-bucket counts, a sum and a count;
+    counters a total; gauges the last value.
+    """
+
+    def __init__(self, directory: Path, flush_interval: float = FLUSH_INTERVAL):
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._deltas: dict[tuple, dict] = {}
+        self._last_flush = time.monotonic()
+
+    def observe(self, kind: str, value: float, **labels):
+        """Record one observation; flushes if FLUSH_INTERVAL has passed."""
+        labels = {k: str(v) for k, v in labels.items() if v is not None}
+        key = (kind, tuple(sorted(labels.items())))
+        with self._lock:
+            self._pending.append({"ts": time.time(), "kind": kind, "value": value, **labels})
+            series = self._deltas.setdefault(key, {"count": 0, "sum": 0.0, "buckets": {}})
+            series["count"] += 1
+            series["sum"] += value
+            series["last"] = value
+            if METRIC_KINDS[kind][2] == "histogram":
+                bucket = next((str(b) for b in BUCKETS_MS if value <= b), "+Inf")
+                series["buckets"][bucket] = series["buckets"].get(bucket, 0) + 1
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write pending observations and merge totals into polecat.prom.
+
+        Errors are reported on stderr and the data dropped: metrics must
+        never break the operation being measured.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            deltas, self._deltas = self._deltas, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / ".lock", "w") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._append_events(pending)
+                    totals = self._merge_totals(deltas)
+                    atomic_write(
+                        self.directory / "polecat.prom", render_prometheus(totals).encode()
+                    )
+                    self._prune_events()
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        except OSError as e:
+            print(f"⚠ Failed to flush metrics to {self.directory}: {e}", file=sys.stderr)
+
+    def _append_events(self, events: list[dict]):
+        by_day = defaultdict(list)
+        for event in events:
+            day = datetime.fromtimestamp(event["ts"], UTC).date()
+            by_day[day].append(json.dumps(event, separators=(",", ":")))
+        for day, lines in by_day.items():
+            with open(self.directory / f"events-{day.isoformat()}.jsonl", "a") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def _merge_totals(self, deltas: dict[tuple, dict]) -> list[dict]:
+        """Add this flush to the cumulative totals in state.json."""
+        state_path = self.directory / "state.json"
+        try:
+            series = json.loads(state_path.read_text())["series"]
+        except (OSError, ValueError, KeyError):
+            series = []
+        index = {(s["kind"], tuple(sorted(s["labels"].items()))): s for s in series}
+        for (kind, labels), delta in deltas.items():
+            total = index.get((kind, labels))
+            if total is None:
+                total = {"kind": kind, "labels": dict(labels), "count": 0, "sum": 0.0}
+                total["buckets"] = {}
+                index[(kind, labels)] = total
+                series.append(total)
+            total["count"] += delta["count"]
+            total["sum"] += delta["sum"]
+            total["last"] = delta["last"]
+            for bucket, count in delta["buckets"].items():
+                total["buckets"][bucket] = total["buckets"].get(bucket, 0) + count
+        atomic_write(state_path, json.dumps({"series": series}).encode())
+        return series
+
+    def _prune_events(self):
+        cutoff = (datetime.now(UTC).date() - timedelta(days=RETENTION_DAYS)).isoformat()
+        for path in self.directory.glob("events-*.jsonl"):
+            if path.stem.removeprefix("events-") < cutoff:
+                path.unlink(missing_ok=True)
+
+
+def render_prometheus(series: list[dict]) -> str:
+    """Render cumulative totals in the Prometheus text exposition format."""
+    lines = []
+    for kind, (name, help_text, metric_type) in METRIC_KINDS.items():
+        of_kind = [s for s in series if s["kind"] == kind]
+        if not of_kind:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for s in sorted(of_kind, key=lambda s: sorted(s["labels"].items())):
+            labels = s["labels"]
+            if metric_type == "counter":
+                lines.append(f"{name}{_prom_labels(labels)} {s['count']}")
+            elif metric_type == "gauge":
+                lines.append(f"{name}{_prom_labels(labels)} {_prom_number(s['last'])}")
+            else:
+                cumulative = 0
+                for bound in [*map(str, BUCKETS_MS), "+Inf"]:
+                    cumulative += s["buckets"].get(bound, 0)
+                    bucket_labels = _prom_labels(labels, le=bound)
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{name}_sum{_prom_labels(labels)} {_prom_number(s['sum'])}")
+                lines.append(f"{name}_count{_prom_labels(labels)} {s['count']}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _prom_labels(labels: dict, le: str | None = None) -> str:
+    pairs = sorted(labels.items())
+    if le is not None:
+        pairs.append(("le", le))
+    if not pairs:
+        return ""
+    escaped = (
+        f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _prom_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.3f}"
+
+
+def read_events(directory: Path, since: datetime) -> list[dict]:
+    """Read observations recorded at or after since from the JSONL files."""
+    events = []
+    since_ts = since.timestamp()
+    first_day = since.astimezone(UTC).date().isoformat()
+    for path in sorted(Path(directory).glob("events-*.jsonl")):
+        if path.stem.removeprefix("events-") < first_day:
+            continue
+        with open(path) as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a killed process
+                if event.get("ts", 0) >= since_ts:
+                    events.append(event)
+    return events
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0-100) of sorted values."""
+    if not sorted_values:
+        return math.nan
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(events: list[dict]) -> list[dict]:
+    """Group observations by kind, name and project, with percentiles.
+
+    The name is the operation, lock or queue; merges are grouped by outcome.
+
+    Returns:
+        One row per group: kind, name, project, count, and for timed kinds
+        p50/p90/p95/p99/max (for queue_depth: last and max)
+    """
+    name_field = {"operation": "operation", "lock_wait": "lock", "lock_timeout": "lock"}
+    name_field.update(queue_depth="queue", merge="success")
+    groups = defaultdict(list)
+    for event in events:
+        kind = event.get("kind")
+        if kind not in METRIC_KINDS:
+            continue
+        key = (kind, event.get(name_field[kind], ""), event.get("project", ""))
+        groups[key].append(event["value"])
+
+    rows = []
+    for (kind, name, project), values in sorted(groups.items()):
+        row = {"kind": kind, "name": name, "project": project, "count": len(values)}
+        if METRIC_KINDS[kind][2] == "histogram":
+            ordered = sorted(values)
+            for q in (50, 90, 95, 99):
+                row[f"p{q}"] = percentile(ordered, q)
+            row["max"] = ordered[-1]
+        elif kind == "queue_depth":
+            row["last"] = values[-1]
+            row["max"] = max(values)
+        rows.append(row)
+    return rows
 
 
 class PolecatMetrics:
@@ -30,6 +282,32 @@ class PolecatMetrics:
 
     PREFIX = "[POLECAT_METRIC]"
 
+    def __init__(self):
+        # Set by enable_store(); None keeps metrics to stderr only
+        self.store: MetricsStore | None = None
+
+    def enable_store(self, directory: Path) -> MetricsStore:
+        """Aggregate metrics in memory and flush them to directory.
+
+        Idempotent for the same directory. Flushes at interpreter exit.
+        """
+        directory = Path(directory)
+        if self.store is None or self.store.directory != directory:
+            if self.store is not None:
+                self.store.flush()
+            else:
+                atexit.register(self._flush_at_exit)
+            self.store = MetricsStore(directory)
+        return self.store
+
+    def _flush_at_exit(self):
+        if self.store is not None:
+            self.store.flush()
+
+    def _observe(self, kind: str, value: float, **labels):
+        if self.store is not None:
+            self.store.observe(kind, value, **labels)
+
     def _emit(self, metric_type: str, **fields):
         """Emit a structured metric line to stderr.
 
@@ -72,6 +350,9 @@ class PolecatMetrics:
             raise
         finally:
             elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self._observe(
+                "operation", elapsed_ms, operation=operation, project=project, success=success
+            )
             self._emit(
                 f"{operation}_latency",
                 duration_ms=f"{elapsed_ms:.2f}",
@@ -96,6 +377,7 @@ class PolecatMetrics:
             acquired: Whether the lock was successfully acquired
             caller: Optional identifier for who was waiting
         """
+        self._observe("lock_wait", wait_time_ms, lock=lock_name, acquired=acquired)
         self._emit(
             "lock_contention",
             lock_name=lock_name,
@@ -112,6 +394,7 @@ class PolecatMetrics:
             count: Number of items in the queue
             project: Optional project filter used
         """
+        self._observe("queue_depth", count, queue=queue_name, project=project)
         self._emit("queue_depth", queue_name=queue_name, count=count, project=project)
 
     def record_lock_timeout(
@@ -124,6 +407,7 @@ class PolecatMetrics:
             timeout_seconds: How long we waited before timing out
             caller: Optional identifier for who timed out
         """
+        self._observe("lock_timeout", timeout_seconds * 1000, lock=lock_name)
         self._emit(
             "lock_timeout",
             lock_name=lock_name,
@@ -137,6 +421,7 @@ class PolecatMetrics:
         success: bool,
         duration_ms: float,
         failure_reason: str | None = None,
+        project: str | None = None,
     ):
         """Record a merge attempt with outcome.
 
@@ -145,13 +430,18 @@ class PolecatMetrics:
             success: Whether the merge succeeded
             duration_ms: Time taken for the merge attempt
             failure_reason: If failed, why (e.g., "conflicts", "tests_failed")
+            project: Optional project slug of the task
         """
+        self._observe(
+            "merge", duration_ms, success=success, failure_reason=failure_reason, project=project
+        )
         self._emit(
             "merge_attempt",
             task_id=task_id,
             success=success,
             duration_ms=f"{duration_ms:.2f}",
             failure_reason=failure_reason,
+            project=project,
         )
 
 
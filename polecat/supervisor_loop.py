@@ -3,9 +3,17 @@
 Supervisor Loop: LLM-driven batch orchestration for polecat workers.
 
 Each iteration:
-1. PLAN: LLM reviews task queue + previous results, selects (task, runner) pairs
-2. EXECUTE: Dispatches workers in parallel, waits for completion
-3. VERIFY: LLM checks results (PRs on GitHub, etc.), decides whether to continue
+1. PLAN: LLM reviews task queue + results since the last plan, selects
+   (task, runner) pairs for the free worker slots
+2. EXECUTE: Starts those workers, then waits until at least one worker finishes
+3. VERIFY: The next plan checks those results (PRs on GitHub, etc.) and
+   decides whether to continue
+
+Workers stream: a slow task holds only its own slot, and every finished
+worker frees a slot for the next plan. The number of slots adapts between
+1 and --max-pairs: it halves when workers report lock timeouts or long
+lock waits (from the polecat metrics log) or the machine is overloaded,
+and grows by one per finished worker otherwise.
 
 Usage:
     python polecat/supervisor_loop.py -p aops -n 3
@@ -26,6 +34,8 @@ import time
 from datetime import UTC, datetime
 from pathlib import Path
 
+from observability import percentile, read_events
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -61,6 +71,15 @@ SUPERVISOR_SCHEMA = json.dumps(
     }
 )
 
+# Seconds between checks for finished workers
+POLL_INTERVAL = 0.5
+
+# Concurrency backs off above this 1-minute load average per CPU
+LOAD_PER_CPU_LIMIT = 1.5
+
+# ...or when the p95 lock wait reported by workers exceeds this
+LOCK_WAIT_P95_LIMIT_MS = 5000.0
+
 # Signal handling for clean shutdown
 _STOP_REQUESTED = False
 
@@ -88,10 +107,13 @@ def _install_signal_handlers():
 # ---------------------------------------------------------------------------
 
 
+def _polecat_home() -> Path:
+    return Path(os.environ.get("POLECAT_HOME", os.path.expanduser("~/.polecat")))
+
+
 def _state_path(project: str) -> Path:
     """State file lives at $POLECAT_HOME/supervisor-state.json."""
-    home = os.environ.get("POLECAT_HOME", os.path.expanduser("~/.polecat"))
-    return Path(home) / f"supervisor-state-{project}.json"
+    return _polecat_home() / f"supervisor-state-{project}.json"
 
 
 def load_state(project: str) -> dict:
@@ -355,46 +377,53 @@ def call_supervisor_llm(
 # ---------------------------------------------------------------------------
 
 
-def dispatch_workers(
-    pairs: list[dict],
-    project: str,
-    dry_run: bool = False,
-) -> list[dict]:
-    """Dispatch polecat workers for each (task_id, runner) pair.
+class WorkerPool:
+    """Polecat workers running as subprocesses, collected as they finish."""
 
-    Runs all workers in parallel, waits for completion.
-    Returns list of result dicts with exit codes.
-    """
-    if dry_run:
-        print(f"[supervisor] DRY RUN: would dispatch {len(pairs)} workers:")
-        for p in pairs:
-            print(
-                f"  polecat run -t {p['task_id']} -p {project} {'[-g]' if p['runner'] == 'gemini' else ''}"
-            )
-        return [
-            {"task_id": p["task_id"], "runner": p["runner"], "exit_code": 0, "dry_run": True}
-            for p in pairs
-        ]
+    def __init__(self, project: str, dry_run: bool = False):
+        self.project = project
+        self.dry_run = dry_run
+        self.running: list[tuple[dict, subprocess.Popen]] = []
+        # Dry-run "workers" finish as soon as they start
+        self._finished: list[dict] = []
+        self.aops_path = os.environ.get("AOPS")
+        if not self.aops_path and not dry_run:
+            print("[supervisor] ERROR: AOPS environment variable not set.", file=sys.stderr)
+            sys.exit(1)
 
-    aops_path = os.environ.get("AOPS")
-    if not aops_path:
-        print("[supervisor] ERROR: AOPS environment variable not set.", file=sys.stderr)
-        sys.exit(1)
+    def in_flight(self) -> list[dict]:
+        """Pairs whose workers haven't finished yet."""
+        return [pair for pair, _ in self.running]
 
-    processes: list[tuple[dict, subprocess.Popen]] = []
+    def start(self, pair: dict) -> None:
+        """Start a polecat worker for a (task_id, runner) pair."""
+        if self.dry_run:
+            flag = "[-g]" if pair["runner"] == "gemini" else ""
+            print(
+                f"[supervisor] DRY RUN: polecat run -t {pair['task_id']} -p {self.project} {flag}"
+            )
+            self._finished.append(
+                {
+                    "task_id": pair["task_id"],
+                    "runner": pair["runner"],
+                    "exit_code": 0,
+                    "dry_run": True,
+                }
+            )
+            return
 
-    for pair in pairs:
+        assert self.aops_path is not None  # guaranteed by __init__
         cmd = [
             "uv",
             "run",
             "--project",
-            aops_path,
-            os.path.join(aops_path, "polecat/cli.py"),
+            self.aops_path,
+            os.path.join(self.aops_path, "polecat/cli.py"),
             "run",
             "-t",
             pair["task_id"],
             "-p",
-            project,
+            self.project,
             "-c",
             "supervisor-loop",
         ]
@@ -403,25 +432,92 @@ def dispatch_workers(
 
         print(f"[supervisor] Dispatching: {pair['task_id']} -> {pair['runner']}")
         proc = subprocess.Popen(cmd, stdout=sys.stdout, stderr=sys.stderr)
-        processes.append((pair, proc))
-
-        # Stagger launches slightly to avoid lock contention
-        time.sleep(1)
+        self.running.append((pair, proc))
+
+    def wait_any(self) -> list[dict]:
+        """Wait until at least one worker finishes.
+
+        Returns:
+            Result dicts for every worker that has finished (empty if none
+            were running)
+        """
+        while True:
+            finished, self._finished = self._finished, []
+            still_running = []
+            for pair, proc in self.running:
+                if proc.poll() is None:
+                    still_running.append((pair, proc))
+                    continue
+                status = "OK" if proc.returncode == 0 else f"FAILED (exit {proc.returncode})"
+                print(f"[supervisor] Finished: {pair['task_id']} -> {status}")
+                finished.append(
+                    {
+                        "task_id": pair["task_id"],
+                        "runner": pair["runner"],
+                        "exit_code": proc.returncode,
+                    }
+                )
+            self.running = still_running
+            if finished or not self.running:
+                return finished
+            time.sleep(POLL_INTERVAL)
+
+    def wait_all(self) -> list[dict]:
+        """Wait for every running worker to finish."""
+        results = []
+        while self.running or self._finished:
+            results.extend(self.wait_any())
+        return results
+
+
+class ConcurrencyController:
+    """Worker slot limit, adjusted as workers finish (additive increase,
+    multiplicative decrease).
+
+    Pressure is a 1-minute load average above LOAD_PER_CPU_LIMIT per CPU,
+    or lock timeouts or a p95 lock wait above LOCK_WAIT_P95_LIMIT_MS in
+    the metrics workers have flushed since the last adjustment.
+    """
 
-    # Wait for all workers
-    results = []
-    for pair, proc in processes:
-        proc.wait()
-        result = {
-            "task_id": pair["task_id"],
-            "runner": pair["runner"],
-            "exit_code": proc.returncode,
-        }
-        status = "OK" if proc.returncode == 0 else f"FAILED (exit {proc.returncode})"
-        print(f"[supervisor] Finished: {pair['task_id']} -> {status}")
-        results.append(result)
+    def __init__(self, max_limit: int, metrics_dir: Path | None = None):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.metrics_dir = metrics_dir or _polecat_home() / "metrics"
+        self._since = datetime.now(UTC)
 
-    return results
+    def pressure(self) -> str | None:
+        """Describe why concurrency should back off, or None."""
+        try:
+            load = os.getloadavg()[0] / (os.cpu_count() or 1)
+        except OSError:
+            load = 0.0
+        if load > LOAD_PER_CPU_LIMIT:
+            return f"load {load:.2f} per CPU"
+
+        now = datetime.now(UTC)
+        events = read_events(self.metrics_dir, self._since)
+        self._since = now
+        timeouts = sum(1 for e in events if e.get("kind") == "lock_timeout")
+        if timeouts:
+            return f"{timeouts} lock timeout(s)"
+        waits = sorted(e["value"] for e in events if e.get("kind") == "lock_wait")
+        if waits and (p95 := percentile(waits, 95)) > LOCK_WAIT_P95_LIMIT_MS:
+            return f"p95 lock wait {p95:.0f}ms"
+        return None
+
+    def update(self) -> int:
+        """Adjust the limit after workers finish; returns the new limit."""
+        reason = self.pressure()
+        if reason:
+            new_limit = max(1, self.limit // 2)
+            if new_limit < self.limit:
+                print(f"[supervisor] Concurrency {self.limit} -> {new_limit} ({reason})")
+        else:
+            new_limit = min(self.max_limit, self.limit + 1)
+            if new_limit > self.limit:
+                print(f"[supervisor] Concurrency {self.limit} -> {new_limit}")
+        self.limit = new_limit
+        return new_limit
 
 
 # ---------------------------------------------------------------------------
@@ -435,17 +531,29 @@ def build_supervisor_prompt(
     previous_results: list[dict] | None,
     round_num: int,
     state: dict | None = None,
+    in_flight: list[dict] | None = None,
 ) -> str:
-    """Build a single prompt that both verifies previous results AND selects next tasks."""
+    """Build a single prompt that both verifies previous results AND selects next tasks.
+
+    previous_results are the workers that finished since the last decision;
+    in_flight are the workers still running, which must not be re-selected.
+    """
     task_queue = get_ready_tasks(project)
     in_progress = get_in_progress_tasks(project)
     prs = get_recent_prs()
     history = format_history_for_prompt(state or {})
 
+    running_section = ""
+    if in_flight:
+        lines = ["Workers still running (do NOT select these tasks):"]
+        for p in in_flight:
+            lines.append(f"  - {p['task_id']} ({p['runner']})")
+        running_section = "\n".join(lines)
+
     previous_section = ""
     verify_instructions = ""
     if previous_results:
-        lines = ["Previous batch results:"]
+        lines = ["Results since the last decision:"]
         for r in previous_results:
             status = "SUCCESS" if r["exit_code"] == 0 else f"FAILED (exit {r['exit_code']})"
             dry = " [dry-run]" if r.get("dry_run") else ""
@@ -454,7 +562,7 @@ def build_supervisor_prompt(
         verify_instructions = textwrap.dedent("""\
             ## Step 1: Verify Previous Results
 
-            Check the previous batch:
+            Check the workers that finished since the last decision:
             1. Did workers exit successfully (exit code 0)?
             2. For successful workers, is there a corresponding PR on GitHub?
                (Branch name should contain the task ID, e.g. polecat/task-id)
@@ -469,8 +577,8 @@ def build_supervisor_prompt(
         """)
 
     return textwrap.dedent(f"""\
-        You are a swarm supervisor. Review previous results (if any) and select
-        the next batch of tasks for parallel polecat workers.
+        You are a swarm supervisor. Review finished workers (if any) and select
+        tasks for the free polecat worker slots.
 
         ## Current State (Round {round_num})
 
@@ -485,6 +593,8 @@ def build_supervisor_prompt(
 
         {previous_section}
 
+        {running_section}
+
         ### Run History (across invocations)
         {history}
 
@@ -492,7 +602,7 @@ def build_supervisor_prompt(
 
         ## {"Step 2: " if previous_results else ""}Select Tasks to Dispatch
 
-        Select up to {max_pairs} (task_id, runner) pairs.
+        Select up to {max_pairs} (task_id, runner) pairs (the number of free worker slots).
 
         Rules:
         - Only select tasks from the ready queue above
@@ -555,7 +665,12 @@ def supervisor_loop(
     model: str | None,
     dry_run: bool,
 ):
-    """Main supervisor loop."""
+    """Main supervisor loop.
+
+    A round is one supervisor decision. Between decisions the loop waits
+    only until some worker finishes, so free slots are refilled while
+    slower workers keep running.
+    """
     _install_signal_handlers()
     state = load_state(project)
     invocation_id = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
@@ -564,25 +679,86 @@ def supervisor_loop(
     print(f"[supervisor]   project={project}, max_pairs={max_pairs}, max_rounds={max_rounds}")
     print(f"[supervisor]   supervisor={supervisor}, dry_run={dry_run}")
     print(f"[supervisor]   invocation={invocation_id}, prior_rounds={total_history_rounds}")
-    print("[supervisor]   Ctrl+C to stop after current batch\n")
+    print("[supervisor]   Ctrl+C to stop after current workers\n")
 
+    pool = WorkerPool(project, dry_run)
+    controller = ConcurrencyController(max_pairs)
     previous_results: list[dict] | None = None
     round_num = 0
+    # Failures since the last successful worker
+    consecutive_failures = 0
+    # Workers that finished while waiting for a free slot, recorded with the
+    # next round
+    carried: list[dict] = []
+
+    def count_failures(finished: list[dict]) -> bool:
+        """Count finished workers' failures; True once a full batch failed in a row."""
+        nonlocal consecutive_failures
+        for result in finished:
+            consecutive_failures = consecutive_failures + 1 if result["exit_code"] != 0 else 0
+        return consecutive_failures >= controller.max_limit and not dry_run
+
+    def drain(exit_reason: str | None) -> None:
+        """Wait for running workers and record their results (and any carried)."""
+        nonlocal carried
+        if not pool.running and not carried:
+            return
+        if pool.running:
+            print(f"[supervisor] Waiting for {len(pool.running)} running worker(s)...")
+        drain_start = time.monotonic()
+        results = carried + pool.wait_all()
+        carried = []
+        _save_round(
+            state, project, invocation_id, round_num, drain_start, results, True, exit_reason
+        )
 
-    for round_num in range(1, max_rounds + 1):
+    def halt_on_failures() -> None:
+        print(
+            f"[supervisor] {consecutive_failures} workers failed in a row. Exiting.",
+            file=sys.stderr,
+        )
+        drain("all_workers_failed")
+        sys.exit(1)
+
+    while round_num < max_rounds:
         if _STOP_REQUESTED:
             print("[supervisor] Stop requested. Exiting.")
             break
 
+        round_start = time.monotonic()
+        free_slots = controller.limit - len(pool.running)
+        if free_slots <= 0:
+            # Concurrency was lowered below the running count: no decision
+            # to make until enough workers finish
+            finished = pool.wait_any()
+            controller.update()
+            previous_results = (previous_results or []) + finished
+            carried += finished
+            if count_failures(finished):
+                _save_round(
+                    state,
+                    project,
+                    invocation_id,
+                    round_num,
+                    round_start,
+                    carried,
+                    False,
+                    "all_workers_failed",
+                )
+                carried = []
+                halt_on_failures()
+            continue
+
+        round_num += 1
         print(f"\n{'=' * 60}")
         print(f"  ROUND {round_num}/{max_rounds} (total: {total_history_rounds + round_num})")
         print(f"{'=' * 60}\n")
 
-        round_start = time.monotonic()
-
         # ----- SUPERVISOR CALL: verify previous + select next -----
         print("[supervisor] === SUPERVISOR DECISION ===")
-        prompt = build_supervisor_prompt(project, max_pairs, previous_results, round_num, state)
+        prompt = build_supervisor_prompt(
+            project, free_slots, previous_results, round_num, state, pool.in_flight()
+        )
 
         try:
             decision = call_supervisor_llm(prompt, SUPERVISOR_SCHEMA, supervisor, model)
@@ -598,6 +774,8 @@ def supervisor_loop(
                 False,
                 "llm_call_failed",
             )
+            carried = []  # Recorded above, in previous_results
+            drain("llm_call_failed")
             sys.exit(1)
 
         safe = decision.get("safe_to_continue", True)
@@ -623,45 +801,58 @@ def supervisor_loop(
                 False,
                 "verification_unsafe",
             )
+            carried = []  # Recorded above, in previous_results
+            drain("verification_unsafe")
             sys.exit(1)
 
+        running_ids = {p["task_id"] for p in pool.in_flight()}
+        pairs = [p for p in pairs if p["task_id"] not in running_ids][:free_slots]
         print(f"[supervisor] Selected {len(pairs)} pairs:")
         for p in pairs:
             print(f"  {p['task_id']} -> {p['runner']}")
 
-        if not pairs:
+        if not pairs and not pool.running:
             print("[supervisor] No tasks selected (n=0). Exiting.")
+            drain(None)
             sys.exit(0)
 
         # ----- EXECUTE -----
-        print(f"\n[supervisor] === EXECUTE ({len(pairs)} workers) ===")
-        batch_results = dispatch_workers(pairs, project, dry_run)
-
-        # Record round
-        all_failed = all(r["exit_code"] != 0 for r in batch_results) and not dry_run
+        print(
+            f"\n[supervisor] === EXECUTE ({len(pairs)} new, {len(pool.running)} running, "
+            f"limit {controller.limit}) ==="
+        )
+        for pair in pairs:
+            pool.start(pair)
+        finished = pool.wait_any()
+        controller.update()
+
+        # Record round. A full batch's worth of failures in a row counts as
+        # all workers failing.
+        all_failed = count_failures(finished)
         _save_round(
             state,
             project,
             invocation_id,
             round_num,
             round_start,
-            batch_results,
+            carried + finished,
             not all_failed,
             "all_workers_failed" if all_failed else None,
         )
+        carried = []
 
         if all_failed:
-            print("[supervisor] ALL workers failed. Exiting.", file=sys.stderr)
-            sys.exit(1)
+            halt_on_failures()
 
         if _STOP_REQUESTED:
             print("[supervisor] Stop requested after execution. Exiting.")
             break
 
-        previous_results = batch_results
+        previous_results = finished
         elapsed = int(time.monotonic() - round_start)
         print(f"\n[supervisor] Round {round_num} complete ({elapsed}s). Continuing...")
 
+    drain(None)
     print(f"\n[supervisor] Supervisor loop finished ({round_num} rounds).")
 
 
@@ -687,7 +878,7 @@ def main():
         "--max-pairs",
         type=int,
         default=3,
-        help="Max (task, runner) pairs per round (default: 3)",
+        help="Max concurrent workers (default: 3)",
     )
     parser.add_argument(
         "--max-rounds",
@@ -5,6 +5,12 @@ Polecat Swarm: Manage a swarm of parallel polecat workers.
 Spawns N claude and M gemini workers, binding them to specific CPUs.
 Restarts workers that finish successfully (exit code 0).
 Alerts and stops workers that fail (non-zero exit code).
+
+By default each cycle runs `polecat run` in a fresh `uv run` process. With
+warm=True (`polecat swarm --warm`) a worker imports the CLI and builds its
+PolecatManager once, then runs each claim → setup → run → finish cycle
+in-process; only the agent CLI is spawned. Warm workers report how long
+each phase of every cycle took.
 """
 
 import argparse
@@ -17,6 +23,8 @@ import subprocess
 import sys
 import time
 
+from observability import metrics
+
 # Worker startup delay configuration
 MIN_STARTUP_DELAY_S = 0.5
 MAX_STARTUP_DELAY_S = 3.0
@@ -46,6 +54,80 @@ def alert(message: str):
             pass
 
 
+def run_args(
+    agent_type: str, project: str | None, caller: str, home_dir: str | None = None
+) -> list[str]:
+    """Build the `polecat` arguments for one worker cycle."""
+    args = []
+
+    # Add --home option before subcommand if specified
+    if home_dir:
+        args.extend(["--home", home_dir])
+
+    args.append("run")
+
+    # Claim tasks with the specified caller identity
+    args.extend(["-c", caller])
+
+    if agent_type == "gemini":
+        args.append("-g")
+
+    if project:
+        args.extend(["-p", project])
+    return args
+
+
+class WarmRunner:
+    """Runs `polecat run` cycles inside a long-lived worker process.
+
+    The CLI module, PolecatManager and its TaskStorage are loaded once and
+    shared by every cycle, instead of paying for uv resolution, interpreter
+    start-up and imports each time.
+    """
+
+    def __init__(self, home_dir: str | None = None):
+        from cli import main as cli_main
+        from manager import PolecatManager
+
+        self.cli_main = cli_main
+        self.manager = PolecatManager(home_dir=home_dir)
+
+    def run_cycle(self, args: list[str]) -> tuple[int, dict[str, float]]:
+        """Run one cycle in-process.
+
+        Returns:
+            (exit code as `polecat run` would exit, seconds per phase)
+        """
+        import click
+
+        obj = {"manager": self.manager}
+        try:
+            self.cli_main.main(args, prog_name="polecat", standalone_mode=False, obj=obj)
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None:
+                exit_code = 0
+            elif isinstance(e.code, int):
+                exit_code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except click.ClickException as e:
+            e.show()
+            exit_code = e.exit_code
+        except click.Abort:
+            exit_code = 130
+        except Exception as e:
+            print(f"❌ Cycle error: {e}", file=sys.stderr)
+            exit_code = 1
+        return exit_code, obj.get("phases", {})
+
+
+def format_phases(phases: dict[str, float]) -> str:
+    """Format per-phase timings, e.g. "claim 0.1s, setup 2.3s"."""
+    return ", ".join(f"{name} {seconds:.1f}s" for name, seconds in phases.items())
+
+
 def worker_loop(
     agent_type: str,
     cpu_id: int | None,
@@ -53,6 +135,7 @@ def worker_loop(
     caller: str,
     dry_run: bool,
     home_dir: str | None = None,
+    warm: bool = False,
 ):
     """
     Main loop for a single worker process.
@@ -63,6 +146,7 @@ def worker_loop(
         project: Optional project filter.
         dry_run: If True, do not actually run polecat, just simulate.
         home_dir: Optional polecat home directory override.
+        warm: If True, run cycles in-process with a WarmRunner.
     """
     # Set affinity if a CPU ID is provided
     if cpu_id is not None:
@@ -92,12 +176,28 @@ def worker_loop(
         print(f"[{worker_name}] ❌ AOPS environment variable not set. Exiting.")
         return
 
+    runner = None
+    if warm and not dry_run:
+        runner = WarmRunner(home_dir)
+
     while True:
         if dry_run:
             print(f"[{worker_name}] 🧪 Dry run: simulating work...")
             time.sleep(2)
             exit_code = 0
             print(f"[{worker_name}] 🧪 Dry run finished with {exit_code}")
+        elif runner is not None:
+            print(f"[{worker_name}] 🔄 Starting cycle (warm)...")
+            with metrics.time_operation(
+                "swarm_cycle", project=project, worker=worker_name, agent=agent_type
+            ) as ctx:
+                exit_code, phases = runner.run_cycle(
+                    run_args(agent_type, project, caller, home_dir)
+                )
+                ctx["exit_code"] = exit_code
+                ctx.update({f"{name}_ms": f"{s * 1000:.0f}" for name, s in phases.items()})
+            if phases:
+                print(f"[{worker_name}] ⏱️  {format_phases(phases)}")
         else:
             assert aops_path is not None  # guaranteed by guard above
             cmd = [
@@ -106,22 +206,7 @@ def worker_loop(
                 "--project",
                 aops_path,
                 os.path.join(aops_path, "polecat/cli.py"),
-            ]
-
-            # Add --home option before subcommand if specified
-            if home_dir:
-                cmd.extend(["--home", home_dir])
-
-            cmd.append("run")
-
-            # Claim tasks with the specified caller identity
-            cmd.extend(["-c", caller])
-
-            if agent_type == "gemini":
-                cmd.append("-g")
-
-            if project:
-                cmd.extend(["-p", project])
+            ] + run_args(agent_type, project, caller, home_dir)
 
             print(f"[{worker_name}] 🔄 Starting cycle...")
             try:
@@ -140,7 +225,7 @@ def worker_loop(
                 break
 
             print(f"[{worker_name}] 🔄 Restarting immediately...")
-            if not dry_run:
+            if not dry_run and runner is None:
                 time.sleep(1)  # Safety buffer
             continue
         elif exit_code == 3:
@@ -162,6 +247,7 @@ def run_swarm(
     caller: str = "polecat",
     dry_run: bool = False,
     home_dir: str | None = None,
+    warm: bool = False,
 ):
     """Entry point for CLI integration.
 
@@ -172,6 +258,7 @@ def run_swarm(
         caller: Identity claiming the tasks (default: bot).
         dry_run: If True, simulate execution.
         home_dir: Optional polecat home directory override.
+        warm: If True, workers run cycles in-process instead of via `uv run`.
     """
     total_workers = claude_count + gemini_count
     if total_workers == 0:
@@ -206,7 +293,7 @@ def run_swarm(
     for _ in range(claude_count):
         cpu = available_cpus[cpu_idx % len(available_cpus)]
         p = multiprocessing.Process(
-            target=worker_loop, args=("claude", cpu, project, caller, dry_run, home_dir)
+            target=worker_loop, args=("claude", cpu, project, caller, dry_run, home_dir, warm)
         )
         p.start()
         processes.append(p)
@@ -216,7 +303,7 @@ def run_swarm(
     for _ in range(gemini_count):
         cpu = available_cpus[cpu_idx % len(available_cpus)]
         p = multiprocessing.Process(
-            target=worker_loop, args=("gemini", cpu, project, caller, dry_run, home_dir)
+            target=worker_loop, args=("gemini", cpu, project, caller, dry_run, home_dir, warm)
         )
         p.start()
         processes.append(p)
@@ -254,6 +341,11 @@ def main():
         action="store_true",
         help="Simulate execution without running actual agents",
     )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Keep each worker loaded and run cycles in-process",
+    )
     parser.add_argument(
         "--home",
         type=str,
@@ -261,7 +353,9 @@ def main():
     )
 
     args = parser.parse_args()
-    run_swarm(args.claude, args.gemini, args.project, args.caller, args.dry_run, args.home)
+    run_swarm(
+        args.claude, args.gemini, args.project, args.caller, args.dry_run, args.home, args.warm
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Polecat Task Watcher: in-memory task status map updated per changed file.
+
+`polecat watch` used to list every task four times per poll. The watcher
+loads the status of every task once, then re-reads only the files that
+change and reports each status transition as it happens.
+
+Changes come from filesystem notifications (watchdog, inotify on Linux)
+when watchdog is installed. Without it, rescan() compares the status map
+against the task storage's graph snapshot, which re-parses only changed
+files.
+
+Usage:
+    from task_watcher import TaskWatcher
+
+    watcher = TaskWatcher(storage, project="aops")
+    watcher.load()
+    if not watcher.start():
+        ...  # No watchdog: call watcher.rescan() periodically instead
+    for change in watcher.poll(timeout=1.0):
+        if change.is_transition:
+            print(change.task_id, change.old_status, "->", change.new_status)
+    watcher.stop()
+"""
+
+import queue
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+# Add aops-core to path for lib imports
+SCRIPT_DIR = Path(__file__).parent.resolve()
+REPO_ROOT = SCRIPT_DIR.parent
+if str(REPO_ROOT / "aops-core") not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from lib.task_model import TaskHeader, TaskStatus  # noqa: E402
+from lib.task_storage import EXCLUDED_DIRS, TaskStorage  # noqa: E402
+
+# Seconds to keep collecting events after the first one, so the burst of
+# events from one atomic write is handled as a single change
+DEBOUNCE_SECONDS = 0.2
+
+# Longest a poll keeps collecting, so a steady stream of writes is still
+# handled in batches
+MAX_BATCH_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    """A watched task file that changed on disk.
+
+    old_status is None for a new task, new_status None for a removed one.
+    """
+
+    task_id: str
+    title: str
+    old_status: TaskStatus | None
+    new_status: TaskStatus | None
+
+    @property
+    def is_transition(self) -> bool:
+        return self.old_status != self.new_status
+
+
+class TaskWatcher:
+    """Status of every task under a storage's data root, kept current per file."""
+
+    def __init__(self, storage: TaskStorage, project: str | None = None):
+        self.storage = storage
+        self.project = project
+        self.data_root = Path(storage.data_root)
+        self.tasks: dict[Path, TaskHeader] = {}
+        # Task modified timestamps, for rescan() only
+        self._modified: dict[Path, datetime] = {}
+        self._pending: queue.Queue[Path] = queue.Queue()
+        self._observer = None
+
+    def load(self) -> None:
+        """Fill the status map from one scan, without reporting changes."""
+        self.tasks = {}
+        self._modified = {}
+        for task, path in self.storage._iter_all_tasks_with_paths():
+            if self._wanted(task.project):
+                self.tasks[path] = _header(task, path)
+                self._modified[path] = task.modified
+
+    def counts(self) -> Counter:
+        """Count watched tasks by status."""
+        return Counter(header.status for header in self.tasks.values())
+
+    # --- Filesystem notifications -------------------------------------------
+
+    def start(self) -> bool:
+        """Start watching the data root for changes.
+
+        Returns:
+            False if watchdog isn't installed (use rescan() instead)
+        """
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                for attr in ("src_path", "dest_path"):
+                    path = getattr(event, attr, None)
+                    if path:
+                        watcher._notify(Path(str(path)))
+
+        self._observer = Observer()
+        self._observer.schedule(Handler(), str(self.data_root), recursive=True)
+        self._observer.daemon = True
+        self._observer.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop watching."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def poll(self, timeout: float) -> list[TaskChange]:
+        """Wait up to timeout seconds for file events and apply them.
+
+        Returns:
+            Changes to watched tasks, in no particular order
+        """
+        try:
+            first = self._pending.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        paths = {first}
+        deadline = time.monotonic() + MAX_BATCH_SECONDS
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                paths.add(self._pending.get(timeout=min(DEBOUNCE_SECONDS, remaining)))
+        except queue.Empty:
+            pass
+        return [change for path in paths if (change := self.update(path)) is not None]
+
+    def _notify(self, path: Path) -> None:
+        """Queue a changed path for the next poll if it is a task file."""
+        if self._is_task_file(path):
+            self._pending.put(path)
+
+    # --- Applying changes ----------------------------------------------------
+
+    def update(self, path: Path) -> TaskChange | None:
+        """Re-read one file's frontmatter and update the status map.
+
+        Returns:
+            The change, or None if the file isn't (and wasn't) a watched task
+        """
+        if not self._is_task_file(path):
+            return None
+        try:
+            header = TaskHeader.from_file(path)
+        except (ValueError, OSError):
+            header = None
+        if header is not None and not self._wanted(header.project):
+            header = None
+
+        old = self.tasks.pop(path, None)
+        if header is not None:
+            self.tasks[path] = header
+        elif old is None:
+            return None
+        current = header or old
+        return TaskChange(
+            task_id=current.id,
+            title=current.title,
+            old_status=old.status if old else None,
+            new_status=header.status if header else None,
+        )
+
+    def rescan(self) -> list[TaskChange]:
+        """Compare the status map against a fresh scan (the polling fallback).
+
+        Tasks whose modified timestamp moved are reported even without a
+        status change, as update() reports every write.
+        """
+        self.storage.refresh()
+        seen = {}
+        modified = {}
+        for task, path in self.storage._iter_all_tasks_with_paths():
+            if self._wanted(task.project):
+                seen[path] = _header(task, path)
+                modified[path] = task.modified
+
+        changes = []
+        for path in self.tasks.keys() | seen.keys():
+            old, new = self.tasks.get(path), seen.get(path)
+            if (
+                old
+                and new
+                and old.status == new.status
+                and self._modified.get(path) == modified[path]
+            ):
+                continue
+            current = new or old
+            changes.append(
+                TaskChange(
+                    task_id=current.id,
+                    title=current.title,
+                    old_status=old.status if old else None,
+                    new_status=new.status if new else None,
+                )
+            )
+        self.tasks = seen
+        self._modified = modified
+        return changes
+
+    def _wanted(self, project: str | None) -> bool:
+        return self.project is None or project == self.project
+
+    def _is_task_file(self, path: Path) -> bool:
+        """Check a path is a markdown file the task storage would scan."""
+        if path.suffix != ".md":
+            return False
+        try:
+            parts = path.relative_to(self.data_root).parts
+        except ValueError:
+            return False
+        if any(part.startswith(".") for part in parts):
+            return False
+        return not any(part in EXCLUDED_DIRS for part in parts[:-1])
+
+
+def _header(task, path: Path) -> TaskHeader:
+    return TaskHeader(
+        path=path,
+        id=task.id,
+        title=task.title,
+        type=task.type,
+        status=task.status,
+        priority=task.priority,
+        order=task.order,
+        parent=task.parent,
+        depends_on=task.depends_on,
+        soft_depends_on=task.soft_depends_on,
+        project=task.project,
+        assignee=task.assignee,
+        leaf=task.leaf,
+    )
@@ -0,0 +1,172 @@
+#!/usr/bin/env -S uv run python
+"""File index relevance scoring benchmark.
+
+Builds a project with N synthetic workflows in .agent/workflows/ (default
+3,000, each with frontmatter triggers) and times
+lib.file_index.get_relevant_file_paths per prompt:
+
+    legacy          parse every workflow, then one substring search per
+                    keyword per entry (get_relevant_file_paths before
+                    lib.keyword_index)
+    cold            no index on disk: parse the workflows, build and save the
+                    index, score the prompt
+    warm            a fresh process with the index on disk: stat the
+                    workflows, load the index, score the prompt
+    memory          the index loaded (the router daemon): stat the workflows
+                    and score the prompt (mean per prompt)
+
+Usage:
+    uv run python scripts/benchmark_file_index.py
+    uv run python scripts/benchmark_file_index.py --workflows 10000 --prompts 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+AOPS_CORE_DIR = REPO_ROOT / "aops-core"
+sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from lib import file_index  # noqa: E402
+
+WORDS = [
+    "deploy", "release", "migrate", "database", "schema", "review", "audit",
+    "triage", "incident", "rollback", "benchmark", "profile", "refactor",
+    "document", "publish", "archive", "ingest", "export", "sync", "backup",
+    "lint", "format", "bisect", "hotfix", "onboard", "budget", "invoice",
+    "survey", "dataset", "pipeline", "notebook", "dashboard", "alert",
+]  # fmt: skip
+
+PROMPTS = [
+    "fix the prompt hydrator routing logic",
+    "deploy the release and rollback the schema migration if it fails",
+    "write a benchmark for the ingest pipeline and profile it",
+    "triage the incident from last night's alert",
+    "please update the task with my notes",
+    "hello",
+]
+
+
+def legacy_relevant_file_paths(prompt: str, max_files: int = 10) -> list[dict[str, str]]:
+    """Score every entry by substring search (get_relevant_file_paths before the index)."""
+    if not prompt:
+        return []
+    prompt_lower = file_index._normalize_text(prompt)
+    scored_entries: list[tuple[int, file_index.FileEntry]] = []
+    for entry in list(file_index.FILE_INDEX) + file_index._get_project_workflow_entries():
+        score = 0
+        for keyword in entry.keywords:
+            if keyword.lower() in prompt_lower:
+                score += len(keyword)
+        if score > 0:
+            scored_entries.append((score, entry))
+    scored_entries.sort(key=lambda x: x[0], reverse=True)
+
+    results: list[dict[str, str]] = []
+    for _score, entry in scored_entries[:max_files]:
+        try:
+            abs_path = str(entry.absolute_path())
+        except RuntimeError:
+            abs_path = f"$AOPS/{entry.path}"
+        results.append(
+            {"path": entry.path, "description": entry.description, "absolute_path": abs_path}
+        )
+    return results
+
+
+def build_project(root: Path, workflows: int, seed: int = 0) -> None:
+    """Write a project with synthetic workflows under root/.agent/workflows/."""
+    rng = random.Random(seed)
+    workflows_dir = root / ".agent" / "workflows"
+    workflows_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(workflows):
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i:05d}"
+        triggers = [
+            " ".join(rng.sample(WORDS, rng.randint(1, 3))) for _ in range(rng.randint(2, 8))
+        ]
+        (workflows_dir / f"{name}.md").write_text(
+            "---\n"
+            f"title: {name}\n"
+            f"description: Synthetic workflow {i}\n"
+            f"triggers: [{', '.join(triggers)}]\n"
+            "---\n"
+            f"Steps for {name}.\n"
+        )
+
+
+def _forget_index() -> None:
+    """Drop the indexes loaded by this process, as a fresh process would start."""
+    file_index._loaded.clear()
+    file_index._last_scores = None
+
+
+def _time(fn, prompts: list[str], fresh: bool) -> float:
+    start = time.perf_counter()
+    for prompt in prompts:
+        if fresh:
+            _forget_index()
+        fn(prompt)
+    return (time.perf_counter() - start) / len(prompts)
+
+
+def run(workflows: int, prompts: int) -> dict[str, float]:
+    """Time each phase in a temp project; returns seconds per prompt."""
+    queries = [PROMPTS[i % len(PROMPTS)] for i in range(prompts)]
+    cwd = os.getcwd()
+    cache_env = os.environ.get("AOPS_CACHE_DIR")
+    with tempfile.TemporaryDirectory(prefix="aops-file-index-bench-") as tmp:
+        root = Path(tmp)
+        build_project(root / "project", workflows)
+        os.environ["AOPS_CACHE_DIR"] = str(root / "cache")
+        os.chdir(root / "project")
+        try:
+            timings = {"legacy": _time(legacy_relevant_file_paths, queries, fresh=False)}
+
+            start = time.perf_counter()
+            _forget_index()
+            file_index.get_index_path().unlink(missing_ok=True)
+            file_index.get_relevant_file_paths(queries[0])
+            timings["cold"] = time.perf_counter() - start
+
+            timings["warm"] = _time(file_index.get_relevant_file_paths, queries, fresh=True)
+            timings["memory"] = _time(file_index.get_relevant_file_paths, queries, fresh=False)
+
+            for prompt in PROMPTS:
+                assert file_index.get_relevant_file_paths(
+                    prompt, max_files=20
+                ) == legacy_relevant_file_paths(prompt, max_files=20), prompt
+        finally:
+            os.chdir(cwd)
+            _forget_index()
+            if cache_env is None:
+                os.environ.pop("AOPS_CACHE_DIR", None)
+            else:
+                os.environ["AOPS_CACHE_DIR"] = cache_env
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workflows", type=int, default=3000)
+    parser.add_argument("--prompts", type=int, default=20)
+    args = parser.parse_args()
+
+    timings = run(args.workflows, args.prompts)
+
+    print(f"{args.workflows} workflows, {len(file_index.FILE_INDEX)} framework entries")
+    print(f"{'phase':<10}{'per prompt':>14}")
+    for name, seconds in timings.items():
+        print(f"{name:<10}{seconds * 1e3:>12.2f}ms")
+    print(f"{'speedup':<10}{timings['legacy'] / timings['memory']:>13.1f}x (memory)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env -S uv run python
+"""Gate evaluation micro-benchmark.
+
+Times one hook through every gate in GATE_CONFIGS, the way
+HookRouter._dispatch_gates calls them, with two engines:
+
+    interpreted     every trigger and policy condition evaluated from its raw
+                    GateCondition (GenericGate before lib.gates.dispatch)
+    compiled        GenericGate: precompiled conditions, only the candidates
+                    the gate's dispatch table lists for the hook's event and
+                    tool category
+
+Both engines run the same transitions, policies and templates, so the
+difference is condition evaluation alone. Each round runs a mix of
+PreToolUse, PostToolUse, SubagentStop and UserPromptSubmit hooks against a
+fresh session state (Stop is left out: its custom checks run git).
+
+Usage:
+    uv run python scripts/benchmark_gates.py
+    uv run python scripts/benchmark_gates.py --rounds 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+AOPS_CORE_DIR = REPO_ROOT / "aops-core"
+sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from hooks.schemas import HookContext  # noqa: E402
+from lib.gate_types import GateCondition, GateState  # noqa: E402
+from lib.gates.definitions import GATE_CONFIGS  # noqa: E402
+from lib.gates.engine import GenericGate  # noqa: E402
+from lib.session_state import SessionState  # noqa: E402
+
+SESSION_ID = "bench-gates-0000"
+
+# (hook_event, tool_name, tool_input, subagent_type)
+HOOKS = [
+    ("PreToolUse", "Read", {"file_path": "/repo/README.md"}, None),
+    ("PostToolUse", "Read", {"file_path": "/repo/README.md"}, None),
+    ("PreToolUse", "Grep", {"pattern": "def main", "path": "/repo"}, None),
+    ("PostToolUse", "Grep", {"pattern": "def main", "path": "/repo"}, None),
+    (
+        "PreToolUse",
+        "Edit",
+        {"file_path": "/repo/app.py", "old_string": "a", "new_string": "b"},
+        None,
+    ),
+    (
+        "PostToolUse",
+        "Edit",
+        {"file_path": "/repo/app.py", "old_string": "a", "new_string": "b"},
+        None,
+    ),
+    ("PreToolUse", "Bash", {"command": "git status"}, None),
+    ("PostToolUse", "Bash", {"command": "git status"}, None),
+    ("PreToolUse", "ToolSearch", {"query": "select:WebFetch"}, None),
+    ("PreToolUse", "Task", {"subagent_type": "aops-core:prompt-hydrator", "prompt": "x"}, None),
+    ("SubagentStop", None, {}, "aops-core:prompt-hydrator"),
+    ("UserPromptSubmit", None, {}, None),
+]
+
+# HookRouter._call_gate_method
+GATE_METHODS = {
+    "PreToolUse": "check",
+    "PostToolUse": "on_tool_use",
+    "UserPromptSubmit": "on_user_prompt",
+    "SubagentStop": "on_subagent_stop",
+}
+
+
+def interpreted_matches(
+    condition: GateCondition, ctx: HookContext, state: GateState, session_state: SessionState
+) -> bool:
+    """Evaluate a condition from scratch (GenericGate._evaluate_condition before compiling)."""
+    if condition.current_status:
+        if state.status != condition.current_status:
+            return False
+
+    if condition.hook_event:
+        if any(c in condition.hook_event for c in "^$|[]()"):
+            if not re.search(condition.hook_event, ctx.hook_event):
+                return False
+        else:
+            if condition.hook_event != ctx.hook_event:
+                return False
+
+    if condition.tool_name_pattern:
+        if not ctx.tool_name:
+            return False
+        if not re.search(condition.tool_name_pattern, ctx.tool_name):
+            return False
+
+    if condition.excluded_tool_categories:
+        from hooks.gate_config import get_tool_category
+
+        if (
+            ctx.tool_name
+            and get_tool_category(
+                ctx.tool_name,
+                ctx.tool_input if isinstance(ctx.tool_input, dict) else None,
+            )
+            in condition.excluded_tool_categories
+        ):
+            return False
+
+    if condition.tool_input_pattern:
+        input_str = str(ctx.tool_input)
+        if not re.search(condition.tool_input_pattern, input_str):
+            return False
+
+    if condition.subagent_type_pattern:
+        if not ctx.subagent_type:
+            return False
+        if not re.search(condition.subagent_type_pattern, ctx.subagent_type):
+            return False
+
+    if condition.min_ops_since_open is not None:
+        if state.ops_since_open < condition.min_ops_since_open:
+            return False
+    if condition.min_ops_since_close is not None:
+        if state.ops_since_close < condition.min_ops_since_close:
+            return False
+    if condition.min_turns_since_open is not None:
+        diff = session_state.global_turn_count - state.last_open_turn
+        if diff < condition.min_turns_since_open:
+            return False
+
+    if condition.custom_check:
+        from lib.gates.custom_conditions import check_custom_condition
+
+        if not check_custom_condition(condition.custom_check, ctx, state, session_state):
+            return False
+
+    return True
+
+
+class _Interpreted:
+    def __init__(self, condition: GateCondition):
+        self.condition = condition
+
+    def matches(self, ctx, facts, state, session_state) -> bool:
+        return interpreted_matches(self.condition, ctx, state, session_state)
+
+
+class InterpretedGate(GenericGate):
+    """GenericGate visiting every trigger and policy, evaluated from scratch."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._all = (
+            [(trigger, _Interpreted(trigger.condition)) for trigger in config.triggers],
+            [(policy, _Interpreted(policy.condition)) for policy in config.policies],
+        )
+
+    def _candidates(self, ctx):
+        return None, self._all
+
+
+def build_hooks() -> list[HookContext]:
+    return [
+        HookContext(
+            session_id=SESSION_ID,
+            hook_event=event,
+            tool_name=tool_name,
+            tool_input=tool_input,
+            subagent_type=subagent_type,
+            raw_input={},
+        )
+        for event, tool_name, tool_input, subagent_type in HOOKS
+    ]
+
+
+def _run_round(gates: list[GenericGate], hooks: list[HookContext], template: SessionState):
+    state = template.model_copy(deep=True)
+    for ctx in hooks:
+        method = GATE_METHODS[ctx.hook_event]
+        for gate in gates:
+            getattr(gate, method)(ctx, state)
+
+
+def run(rounds: int) -> dict[str, float]:
+    """Time each engine; returns seconds per hook (through every gate)."""
+    hooks = build_hooks()
+    template = SessionState.create(SESSION_ID)
+    engines = {
+        "interpreted": [InterpretedGate(config) for config in GATE_CONFIGS],
+        "compiled": [GenericGate(config) for config in GATE_CONFIGS],
+    }
+    timings: dict[str, float] = {}
+    for name, gates in engines.items():
+        _run_round(gates, hooks, template)  # Warm up
+        start = time.perf_counter()
+        for _ in range(rounds):
+            _run_round(gates, hooks, template)
+        timings[name] = (time.perf_counter() - start) / (rounds * len(hooks))
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="aops-gate-bench-") as tmp:
+        # Keep gate temp files and session state out of the real directories
+        os.environ["AOPS_SESSION_STATE_DIR"] = tmp
+        os.environ["AOPS_SESSIONS"] = tmp
+        timings = run(args.rounds)
+
+    print(f"{'engine':<14}{'per hook':>12}")
+    for name, seconds in timings.items():
+        print(f"{name:<14}{seconds * 1e6:>10.1f}us")
+    print(f"{'speedup':<14}{timings['interpreted'] / timings['compiled']:>11.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
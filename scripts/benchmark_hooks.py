@@ -0,0 +1,513 @@
+#!/usr/bin/env -S uv run python
+"""Hook latency benchmark.
+
+Replays recorded hook payloads (tests/hooks/fixtures/gate_scenarios_live.json
+by default) through the real router pipeline:
+
+    HookRouter.normalize_input -> execute_hooks -> output_for_claude/output_for_gemini
+
+for every event in hooks/hooks.json (Claude) and GEMINI_EVENT_MAP (Gemini).
+Events without recorded payloads (PostToolUse, SessionEnd, PreCompact, ...)
+are synthesized from the nearest recorded payload and flagged as such.
+
+Two modes:
+- warm: one process, registries already imported; many iterations per event.
+- cold: a fresh interpreter per invocation, as router.sh runs today.
+
+Each invocation is split into phases: import (cold only), fast_path,
+pipeline_import, normalize, state_load, handlers, gates (plus gate:<name>
+per gate), state_save, log, output and total. Invocations answered by the
+router's fast path (hooks/fast_path.py) only report import, fast_path and
+total. Reports p50/p95/p99 per (client, event, phase).
+
+Every run happens against throwaway session/data directories, starting from
+the same seeded SessionState, so results are comparable between commits.
+
+Usage:
+    uv run python scripts/benchmark_hooks.py                 # warm + cold
+    uv run python scripts/benchmark_hooks.py --mode warm --iterations 50
+    uv run python scripts/benchmark_hooks.py --save          # store .benchmarks/hooks/<sha>.json
+    uv run python scripts/benchmark_hooks.py --compare <sha|path>
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+AOPS_CORE_DIR = REPO_ROOT / "aops-core"
+DEFAULT_FIXTURE = REPO_ROOT / "tests" / "hooks" / "fixtures" / "gate_scenarios_live.json"
+BASELINE_DIR = REPO_ROOT / ".benchmarks" / "hooks"
+
+# Gate modes must exist before gate_config is imported (it has no defaults in
+# tests). Match the values in pyproject.toml's pytest env.
+DEFAULT_GATE_MODES = {
+    "HANDOVER_GATE_MODE": "warn",
+    "QA_GATE_MODE": "block",
+    "CUSTODIET_GATE_MODE": "block",
+    "HYDRATION_GATE_MODE": "warn",
+    "COMMIT_GATE_MODE": "deny",
+}
+
+# Phases shown in the summary table (gate:<name> phases are shown with -v)
+SUMMARY_PHASES = (
+    "import",
+    "fast_path",
+    "pipeline_import",
+    "normalize",
+    "state_load",
+    "handlers",
+    "gates",
+    "state_save",
+    "log",
+    "output",
+    "total",
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+# --- Statistics ---
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile (no numpy dependency)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    """Collapse per-invocation phase timings (seconds) into ms percentiles."""
+    phases: dict[str, list[float]] = {}
+    for sample in samples:
+        for phase, seconds in sample.items():
+            phases.setdefault(phase, []).append(seconds * 1000)
+    return {
+        phase: {"n": len(values), **{f"p{p}": round(percentile(values, p), 3) for p in PERCENTILES}}
+        for phase, values in sorted(phases.items())
+    }
+
+
+# --- Scenario loading ---
+
+
+def load_scenarios(fixture: Path) -> list[dict[str, Any]]:
+    """Load scenarios from a fixture file (dict of groups or flat list)."""
+    data = json.loads(fixture.read_text())
+    if isinstance(data, list):
+        return data
+    scenarios = []
+    for group, items in data.items():
+        for item in items:
+            scenarios.append({**item, "_group": group})
+    return scenarios
+
+
+def benchmark_targets() -> list[tuple[str, str, str]]:
+    """Return (client, client_event, internal_event) for every hooked event."""
+    from hooks.router_entry import GEMINI_EVENT_MAP
+
+    hooks_json = json.loads((AOPS_CORE_DIR / "hooks" / "hooks.json").read_text())
+    targets = [("claude", event, event) for event in hooks_json["hooks"]]
+    targets += [("gemini", g_event, event) for g_event, event in GEMINI_EVENT_MAP.items()]
+    return targets
+
+
+def scenarios_for_event(
+    scenarios: list[dict[str, Any]], event: str, limit: int
+) -> tuple[list[dict[str, Any]], bool]:
+    """Pick up to `limit` recorded scenarios for an event.
+
+    PostToolUse reuses PreToolUse payloads (same tool call, after execution);
+    events never recorded get a bare payload. Returns (scenarios, synthesized).
+    """
+    recorded = [s for s in scenarios if s.get("hook_event") == event]
+    if recorded:
+        return recorded[:limit], False
+    if event == "PostToolUse":
+        pre = [s for s in scenarios if s.get("hook_event") == "PreToolUse" and s.get("tool_name")]
+        return [{**s, "hook_event": event} for s in pre[:limit]], True
+    return [{"id": f"synthetic-{event}", "hook_event": event, "tool_input": {}}], True
+
+
+def build_payload(
+    scenario: dict[str, Any], client: str, client_event: str, session_id: str
+) -> dict:
+    """Build the raw stdin payload the CLI would send for a scenario."""
+    payload: dict[str, Any] = {
+        "hook_event_name": client_event,
+        "session_id": session_id,
+        "cwd": str(REPO_ROOT),
+    }
+    if scenario.get("tool_name"):
+        payload["tool_name"] = scenario["tool_name"]
+        payload["tool_input"] = scenario.get("tool_input") or {}
+    if scenario.get("subagent_type"):
+        payload["subagent_type"] = scenario["subagent_type"]
+    if scenario.get("is_subagent"):
+        payload["is_sidechain"] = True
+    if scenario["hook_event"] == "UserPromptSubmit":
+        payload["prompt"] = scenario.get("prompt") or "Summarise the open tasks for this project."
+    return payload
+
+
+def seed_state(session_id: str, scenario: dict[str, Any]) -> None:
+    """Write the starting SessionState for a scenario (outside timing)."""
+    from lib.gate_types import GateStatus
+    from lib.session_state import SessionState
+
+    state = SessionState.create(session_id)
+    for gate_name, overrides in (scenario.get("gate_overrides") or {}).items():
+        gate = state.get_gate(gate_name)
+        if "status" in overrides:
+            gate.status = GateStatus(overrides["status"])
+        for key, value in overrides.items():
+            if key == "metrics":
+                gate.metrics.update(value)
+            elif key != "status" and hasattr(gate, key):
+                setattr(gate, key, value)
+    state.save()
+
+
+# --- Timed pipeline ---
+
+
+class PhaseTimer:
+    """Accumulates wall-clock seconds per phase for one invocation."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def make_timed_router(timer: PhaseTimer):
+    """Build a HookRouter whose pipeline stages report into `timer`."""
+    import hooks.router as router_module
+
+    class TimedHookRouter(router_module.HookRouter):
+        def load_state(self, session_id):
+            with timer.phase("state_load"):
+                return super().load_state(session_id)
+
+        def save_state(self, state):
+            with timer.phase("state_save"):
+                super().save_state(state)
+
+        def _run_special_handlers(self, ctx, state, merged_result):
+            with timer.phase("handlers"):
+                super()._run_special_handlers(ctx, state, merged_result)
+
+        def _dispatch_gates(self, ctx, state):
+            with timer.phase("gates"):
+                return super()._dispatch_gates(ctx, state)
+
+        def _call_gate_method(self, gate, ctx, state):
+            with timer.phase(f"gate:{gate.name}"):
+                return super()._call_gate_method(gate, ctx, state)
+
+    router = TimedHookRouter()
+    # Never pick up the benchmark shell's real PID -> session map
+    router.session_data = {}
+    return router
+
+
+def _install_log_timer(holder: dict[str, PhaseTimer]) -> None:
+    """Wrap router.log_hook_event so its cost lands in the active timer."""
+    import hooks.router as router_module
+
+    if getattr(router_module.log_hook_event, "_benchmark_wrapped", False):
+        return
+    original = router_module.log_hook_event
+
+    def timed_log_hook_event(*args, **kwargs):
+        with holder["timer"].phase("log"):
+            return original(*args, **kwargs)
+
+    timed_log_hook_event._benchmark_wrapped = True  # type: ignore[attr-defined]
+    router_module.log_hook_event = timed_log_hook_event
+
+
+_LOG_TIMER: dict[str, PhaseTimer] = {}
+
+
+def run_once(payload: dict, client: str, client_event: str) -> dict[str, float]:
+    """Run one hook invocation through the timed pipeline."""
+    import hooks.router_entry as entry_module
+
+    timer = PhaseTimer()
+    args = argparse.Namespace(client=client, event=client_event if client == "gemini" else None)
+
+    with timer.phase("total"):
+        # ppid=0 never matches a PID session map entry (like session_data = {} below)
+        with timer.phase("fast_path"):
+            answered = entry_module.run_fast_path(args, json.dumps(payload), ppid=0)
+        if answered is not None:
+            return timer.phases
+
+        # Deferred pydantic/gate engine imports (near zero once warm)
+        with timer.phase("pipeline_import"):
+            import hooks.router  # noqa: F401
+        _LOG_TIMER["timer"] = timer
+        _install_log_timer(_LOG_TIMER)
+
+        router = make_timed_router(timer)
+        with timer.phase("normalize"):
+            ctx = router.normalize_input(
+                dict(payload), client_event if client == "gemini" else None
+            )
+        result = router.execute_hooks(ctx)
+        with timer.phase("output"):
+            if client == "gemini":
+                out = router.output_for_gemini(result, ctx.hook_event)
+            else:
+                out = router.output_for_claude(result, ctx.hook_event)
+            out.model_dump_json(exclude_none=True)
+    return timer.phases
+
+
+# --- Modes ---
+
+
+def run_warm(targets, scenarios, iterations: int, max_scenarios: int, quiet: bool) -> dict:
+    results = {}
+    for client, client_event, event in targets:
+        picked, synthesized = scenarios_for_event(scenarios, event, max_scenarios)
+        samples = []
+        for i in range(iterations):
+            scenario = picked[i % len(picked)]
+            session_id = str(uuid.uuid4())
+            seed_state(session_id, scenario)
+            payload = build_payload(scenario, client, client_event, session_id)
+            samples.append(run_once(payload, client, client_event))
+        key = f"{client}:{client_event}"
+        results[key] = {"synthesized": synthesized, "phases": summarize(samples)}
+        if not quiet:
+            print(f"  warm {key:<28} {results[key]['phases']['total']['p50']:>9.2f} ms p50")
+    return results
+
+
+def run_cold(targets, scenarios, iterations: int, max_scenarios: int, quiet: bool) -> dict:
+    results = {}
+    for client, client_event, event in targets:
+        picked, synthesized = scenarios_for_event(scenarios, event, max_scenarios)
+        samples = []
+        for i in range(iterations):
+            scenario = picked[i % len(picked)]
+            session_id = str(uuid.uuid4())
+            seed_state(session_id, scenario)
+            job = {
+                "client": client,
+                "client_event": client_event,
+                "payload": build_payload(scenario, client, client_event, session_id),
+            }
+            start = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, str(Path(__file__).resolve()), "--worker"],
+                input=json.dumps(job),
+                capture_output=True,
+                text=True,
+                check=True,
+                env=os.environ.copy(),
+                cwd=str(AOPS_CORE_DIR),
+            )
+            elapsed = time.perf_counter() - start
+            phases = json.loads(proc.stdout.strip().splitlines()[-1])
+            # "process" includes interpreter start-up, which "total" cannot see
+            phases["process"] = elapsed
+            samples.append(phases)
+        key = f"{client}:{client_event}"
+        results[key] = {"synthesized": synthesized, "phases": summarize(samples)}
+        if not quiet:
+            print(f"  cold {key:<28} {results[key]['phases']['process']['p50']:>9.2f} ms p50")
+    return results
+
+
+def worker_main() -> None:
+    """Cold-mode child: time the imports, run one invocation, print phases."""
+    job = json.loads(sys.stdin.read())
+    start = time.perf_counter()
+    import hooks.router_entry  # noqa: F401
+
+    import_seconds = time.perf_counter() - start
+    # Discard anything the pipeline printed; the last stdout line is ours
+    phases = run_once(job["payload"], job["client"], job["client_event"])
+    phases["import"] = import_seconds
+    print(json.dumps(phases))
+
+
+# --- Baselines ---
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=str(REPO_ROOT),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def resolve_baseline(ref: str) -> Path:
+    """Resolve a baseline reference (file path or commit sha) to a path."""
+    path = Path(ref)
+    if path.exists():
+        return path
+    matches = sorted(BASELINE_DIR.glob(f"{ref}*.json"))
+    if not matches:
+        raise FileNotFoundError(f"No baseline for '{ref}' in {BASELINE_DIR}")
+    return matches[0]
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Render p50/p95 deltas for the headline phase of each (mode, client:event)."""
+    lines = [
+        f"Comparing {current.get('commit')} against baseline {baseline.get('commit')}",
+        f"{'mode':<5} {'client:event':<28} {'phase':<8} {'p50 ms':>18} {'p95 ms':>18}",
+    ]
+    for mode in ("warm", "cold"):
+        headline = "process" if mode == "cold" else "total"
+        for key, result in current.get("results", {}).get(mode, {}).items():
+            base = baseline.get("results", {}).get(mode, {}).get(key)
+            if not base or headline not in base["phases"]:
+                continue
+            cur_p, base_p = result["phases"][headline], base["phases"][headline]
+            cells = []
+            for p in ("p50", "p95"):
+                delta = cur_p[p] - base_p[p]
+                pct = (delta / base_p[p] * 100) if base_p[p] else 0.0
+                cells.append(f"{cur_p[p]:>8.2f} ({pct:+5.0f}%)")
+            lines.append(f"{mode:<5} {key:<28} {headline:<8} {cells[0]:>18} {cells[1]:>18}")
+    return lines
+
+
+def format_report(report: dict, verbose: bool) -> list[str]:
+    lines = []
+    for mode, results in report["results"].items():
+        lines.append(f"\n== {mode} ==")
+        lines.append(f"{'client:event':<28} {'phase':<22} {'p50':>9} {'p95':>9} {'p99':>9}")
+        for key, result in results.items():
+            suffix = " (synthesized)" if result["synthesized"] else ""
+            lines.append(f"{key}{suffix}")
+            for phase, stats in result["phases"].items():
+                if not verbose and phase not in SUMMARY_PHASES and phase != "process":
+                    continue
+                lines.append(
+                    f"{'':<28} {phase:<22} {stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['p99']:>9.2f}"
+                )
+    return lines
+
+
+# --- Entry point ---
+
+
+def _isolate_environment(workdir: Path) -> None:
+    """Point every session/data path at a throwaway directory."""
+    for var, value in DEFAULT_GATE_MODES.items():
+        os.environ.setdefault(var, value)
+    for var, sub in (
+        ("AOPS_SESSIONS", "sessions"),
+        ("AOPS_SESSION_STATE_DIR", "status"),
+        ("ACA_DATA", "data"),
+    ):
+        path = workdir / sub
+        path.mkdir(parents=True, exist_ok=True)
+        os.environ[var] = str(path)
+    for var in ("AOPS_HOOK_LOG_PATH", "DEBUG_HOOKS", "CLAUDE_SESSION_ID", "CLAUDE_ENV_FILE"):
+        os.environ.pop(var, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hook router latency")
+    parser.add_argument("--mode", choices=["warm", "cold", "both"], default="both")
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--iterations", type=int, default=30, help="Warm samples per event")
+    parser.add_argument("--cold-iterations", type=int, default=5, help="Cold samples per event")
+    parser.add_argument("--max-scenarios", type=int, default=10, help="Recorded payloads per event")
+    parser.add_argument("--client", choices=["claude", "gemini"], help="Only benchmark one client")
+    parser.add_argument("--event", help="Only benchmark one internal event (e.g. PreToolUse)")
+    parser.add_argument("--save", action="store_true", help=f"Write baseline to {BASELINE_DIR}")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this path")
+    parser.add_argument("--compare", metavar="REF", help="Baseline commit sha or file to diff")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show per-gate phases")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if str(AOPS_CORE_DIR) not in sys.path:
+        sys.path.insert(0, str(AOPS_CORE_DIR))
+
+    if args.worker:
+        worker_main()
+        return
+
+    with tempfile.TemporaryDirectory(prefix="aops-hook-bench-") as workdir:
+        _isolate_environment(Path(workdir))
+
+        scenarios = load_scenarios(args.fixture)
+        targets = [
+            t
+            for t in benchmark_targets()
+            if (not args.client or t[0] == args.client) and (not args.event or t[2] == args.event)
+        ]
+
+        report: dict[str, Any] = {
+            "commit": current_commit(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": sys.version.split()[0],
+            "fixture": str(args.fixture.relative_to(REPO_ROOT))
+            if args.fixture.is_relative_to(REPO_ROOT)
+            else str(args.fixture),
+            "results": {},
+        }
+        if args.mode in ("warm", "both"):
+            report["results"]["warm"] = run_warm(
+                targets, scenarios, args.iterations, args.max_scenarios, quiet=False
+            )
+        if args.mode in ("cold", "both"):
+            report["results"]["cold"] = run_cold(
+                targets, scenarios, args.cold_iterations, args.max_scenarios, quiet=False
+            )
+
+    print("\n".join(format_report(report, args.verbose)))
+
+    outputs = [args.output] if args.output else []
+    if args.save:
+        outputs.append(BASELINE_DIR / f"{report['commit']}.json")
+    for path in outputs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nSaved report to {path}")
+
+    if args.compare:
+        baseline = json.loads(resolve_baseline(args.compare).read_text())
+        print()
+        print("\n".join(compare(report, baseline)))
+
+
+if __name__ == "__main__":
+    main()
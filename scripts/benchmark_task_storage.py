@@ -0,0 +1,203 @@
+#!/usr/bin/env -S uv run python
+"""TaskStorage lookup benchmark.
+
+Builds a synthetic $ACA_DATA tree of N markdown files (default 20,000) and
+times task lookups by ID (lib.task_storage.TaskStorage._find_task_path and
+the public calls built on it) and graph queries:
+
+    scan             _scan_for_task_path with no path index (the old lookup)
+    scan_slow        ...for a task outside any tasks/ directory
+    cold_miss        get_task with no index file: scan + index repair
+    lookup           _find_task_path with the path index warm (mean per call)
+    lookup_edited    ...after the file changed on disk (re-verified)
+    get_task         get_task with the path index (mean per call)
+    claim_task       claim_task (mean of 3 calls)
+    delete_task      delete_task (mean per call)
+    graph_build      get_ready_tasks in a fresh process: builds the task graph
+    ready            get_ready_tasks with the task graph built (mean of 5)
+    blocked          get_blocked_tasks (mean of 5)
+    descendants      get_descendants of a goal (mean of 5)
+    ancestors        get_ancestors of a task (mean per call)
+    claim_rebuild    claim_next_task with no ready queue: builds it from a scan
+    claim_next       claim_next_task in a fresh process, queue built (mean of 5)
+
+get_task and claim_task also parse the task. The scan phases build the
+process-wide task graph (lib.task_graph) on first use; later phases reuse it.
+
+The tree has 10 projects with 80% of the files as tasks in <project>/tasks/
+(each with a parent and some depends_on), 5% as goals outside any tasks/
+directory under a non-ID filename, and the rest as plain notes.
+
+Usage:
+    uv run python scripts/benchmark_task_storage.py
+    uv run python scripts/benchmark_task_storage.py --files 2000 --lookups 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+AOPS_CORE_DIR = REPO_ROOT / "aops-core"
+sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from lib.task_graph import clear_task_graphs  # noqa: E402
+from lib.task_storage import TaskStorage  # noqa: E402
+
+PROJECTS = 10
+
+
+def _frontmatter(task_id: str, title: str, project: str, **fields: str) -> str:
+    lines = [
+        "---",
+        f"id: {task_id}",
+        f"title: {title}",
+        f"project: {project}",
+        *(f"{key}: {value}" for key, value in fields.items()),
+        "created: 2026-01-01T00:00:00+00:00",
+        "modified: 2026-01-01T00:00:00+00:00",
+        "---",
+        "",
+        f"# {title}",
+        "",
+        "Some notes about the work.",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def build_task_tree(root: Path, files: int, seed: int = 0) -> list[str]:
+    """Write a synthetic data tree under root; returns the task IDs in tasks/ dirs."""
+    rng = random.Random(seed)
+    goals = files // 20
+    notes = files // 20 * 3
+    tasks = files - goals - notes
+    task_ids: list[str] = []
+
+    goal_ids = []
+    for i in range(goals):
+        project = f"proj{i % PROJECTS}"
+        goal_id = f"{project}-goal{i:05d}"
+        goal_ids.append(goal_id)
+        path = root / project / "goals" / f"goal-number-{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            _frontmatter(goal_id, f"Goal {i}", project, type="goal", status="active", leaf="false")
+        )
+
+    for i in range(tasks):
+        project = f"proj{i % PROJECTS}"
+        task_id = f"{project}-{i:08x}"
+        fields = {
+            "type": rng.choice(["task", "action", "bug", "feature"]),
+            "status": rng.choice(["active", "active", "active", "done", "blocked", "in_progress"]),
+            "priority": str(rng.randint(0, 4)),
+            "parent": rng.choice(goal_ids) if goal_ids else "null",
+        }
+        if task_ids and rng.random() < 0.3:
+            fields["depends_on"] = f"[{rng.choice(task_ids)}]"
+        path = root / project / "tasks" / f"{task_id}-task-{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_frontmatter(task_id, f"Task {i}", project, **fields))
+        task_ids.append(task_id)
+
+    for i in range(notes):
+        path = root / f"proj{i % PROJECTS}" / "notes" / f"note-{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# Note {i}\n\nNot a task.\n")
+
+    return task_ids
+
+
+def _timed(fn: Callable[[], object], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(files: int, lookups: int, workdir: Path) -> dict[str, float]:
+    """Time each lookup phase on a fresh tree; returns seconds per call."""
+    task_ids = build_task_tree(workdir, files)
+    rng = random.Random(1)
+    sample = rng.sample(task_ids, min(lookups, len(task_ids)))
+    goal_id = "proj0-goal00000"
+    timings: dict[str, float] = {}
+
+    timings["scan"] = _timed(lambda: TaskStorage(workdir)._scan_for_task_path(sample[0]))
+    # Scans commit their findings to the index: start each phase without one
+    storage = TaskStorage(workdir)
+    storage.path_index_file.unlink(missing_ok=True)
+    timings["scan_slow"] = _timed(lambda: TaskStorage(workdir)._scan_for_task_path(goal_id))
+    storage.path_index_file.unlink(missing_ok=True)
+
+    timings["cold_miss"] = _timed(lambda: TaskStorage(workdir).get_task(sample[0]))
+
+    storage = TaskStorage(workdir)
+    for task_id in sample:
+        storage._find_task_path(task_id)
+    storage = TaskStorage(workdir)
+    ids = iter(sample)
+    timings["lookup"] = _timed(lambda: storage._find_task_path(next(ids)), repeat=len(sample))
+
+    edited = sample[:10]
+    for task_id in edited:
+        path = storage._find_task_path(task_id)
+        path.write_text(path.read_text() + "\nEdited.\n")
+    ids = iter(edited)
+    timings["lookup_edited"] = _timed(
+        lambda: storage._find_task_path(next(ids)), repeat=len(edited)
+    )
+
+    ids = iter(sample)
+    timings["get_task"] = _timed(lambda: storage.get_task(next(ids)), repeat=len(sample))
+    ids = iter(sample)
+    timings["claim_task"] = _timed(lambda: storage.claim_task(next(ids), "bench"), repeat=3)
+    ids = iter(sample)
+    timings["delete_task"] = _timed(lambda: storage.delete_task(next(ids)), repeat=len(sample))
+
+    clear_task_graphs()
+    timings["graph_build"] = _timed(storage.get_ready_tasks)
+    timings["ready"] = _timed(storage.get_ready_tasks, repeat=5)
+    timings["blocked"] = _timed(storage.get_blocked_tasks, repeat=5)
+    timings["descendants"] = _timed(lambda: storage.get_descendants(goal_id), repeat=5)
+    remaining = [task_id for task_id in task_ids if task_id not in set(sample)]
+    ids = iter(remaining)
+    timings["ancestors"] = _timed(
+        lambda: storage.get_ancestors(next(ids)), repeat=min(lookups, len(remaining))
+    )
+
+    storage.ready_queue.path.unlink(missing_ok=True)
+    timings["claim_rebuild"] = _timed(lambda: storage.claim_next_task("bench"))
+
+    def claim_in_fresh_process() -> None:
+        clear_task_graphs()
+        TaskStorage(workdir).claim_next_task("bench")
+
+    timings["claim_next"] = _timed(claim_in_fresh_process, repeat=5)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--lookups", type=int, default=500, help="IDs sampled per phase")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="aops-task-bench-") as tmp:
+        timings = run(args.files, args.lookups, Path(tmp))
+
+    print(f"{'phase':<16}{f'{args.files} files':>16}")
+    for phase, seconds in timings.items():
+        print(f"{phase:<16}{seconds * 1000:>14.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
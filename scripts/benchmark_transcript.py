@@ -0,0 +1,173 @@
+#!/usr/bin/env -S uv run python
+"""Transcript processing benchmark.
+
+Generates a synthetic Claude session with N tool calls (default 10,000) and
+times the consumers of the tool_use_id -> tool_result index
+(lib.transcript_parser.ToolCallIndex):
+
+    parse            SessionProcessor.parse_session_file
+    group            SessionProcessor.group_entries_into_turns
+    markdown         SessionProcessor.format_session_as_markdown
+    extract_labor    LaborExtractor.extract_session_labor
+    error_analyzer   transcript_error_analyzer.extract_transcript_errors
+
+The synthetic session has a user prompt every 20 tool calls, one Agent call
+(with an agentId in its result) per prompt, and every 50th call failing.
+
+With --scaling, each phase is also timed at N/4 and N/2 tool calls and the
+growth factor per doubling is reported: ~2x is linear, ~4x is quadratic.
+
+Usage:
+    uv run python scripts/benchmark_transcript.py
+    uv run python scripts/benchmark_transcript.py --tool-calls 2000 --scaling
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+AOPS_CORE_DIR = REPO_ROOT / "aops-core"
+sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from lib.extract_labor import LaborExtractor  # noqa: E402
+from lib.transcript_error_analyzer import extract_transcript_errors  # noqa: E402
+from lib.transcript_parser import SessionProcessor  # noqa: E402
+
+CALLS_PER_PROMPT = 20
+ERROR_EVERY = 50
+
+
+def synthetic_session(tool_calls: int) -> list[dict]:
+    """Build JSONL records for a session with the given number of tool calls."""
+    base = datetime(2026, 1, 1, 9, 0, 0, tzinfo=UTC)
+    records: list[dict] = []
+    clock = 0
+
+    def stamp() -> str:
+        nonlocal clock
+        clock += 1
+        return (base + timedelta(seconds=clock)).isoformat().replace("+00:00", "Z")
+
+    for call in range(tool_calls):
+        if call % CALLS_PER_PROMPT == 0:
+            records.append(
+                {
+                    "type": "user",
+                    "uuid": f"prompt-{call}",
+                    "timestamp": stamp(),
+                    "message": {"content": [{"type": "text", "text": f"Step {call}: continue"}]},
+                }
+            )
+        tool_id = f"toolu_{call:06d}"
+        is_agent = call % CALLS_PER_PROMPT == 1
+        is_error = call % ERROR_EVERY == ERROR_EVERY - 1
+        if is_agent:
+            name, tool_input = "Agent", {"subagent_type": "worker", "prompt": f"Do part {call}"}
+        else:
+            name, tool_input = "Bash", {"command": f"echo {call}"}
+        records.append(
+            {
+                "type": "assistant",
+                "uuid": f"use-{call}",
+                "timestamp": stamp(),
+                "message": {
+                    "content": [
+                        {"type": "text", "text": f"Running call {call}."},
+                        {"type": "tool_use", "id": tool_id, "name": name, "input": tool_input},
+                    ],
+                    "usage": {"input_tokens": 100, "output_tokens": 20},
+                },
+            }
+        )
+        result: dict = {
+            "type": "user",
+            "uuid": f"result-{call}",
+            "timestamp": stamp(),
+            "message": {
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": tool_id,
+                        "content": "Exit code 1\nfailed" if is_error else f"output {call}",
+                        "is_error": is_error,
+                    }
+                ]
+            },
+        }
+        if is_agent:
+            result["toolUseResult"] = {"agentId": f"agent{call:05d}"}
+        records.append(result)
+    return records
+
+
+def time_phases(path: Path) -> dict[str, float]:
+    """Time each consumer once on the session file; returns seconds per phase."""
+    timings: dict[str, float] = {}
+
+    def timed(phase: str, fn: Callable[[], object]) -> object:
+        start = time.perf_counter()
+        result = fn()
+        timings[phase] = time.perf_counter() - start
+        return result
+
+    processor = SessionProcessor()
+    summary, entries, agent_entries = timed(
+        "parse", lambda: processor.parse_session_file(path, load_agents=False, load_hooks=False)
+    )
+    timed("group", lambda: SessionProcessor().group_entries_into_turns(entries))
+    timed(
+        "markdown",
+        lambda: SessionProcessor().format_session_as_markdown(summary, entries, agent_entries),
+    )
+    timed("extract_labor", lambda: LaborExtractor().extract_session_labor(path))
+    timed("error_analyzer", lambda: extract_transcript_errors(path))
+    return timings
+
+
+def run(tool_calls: int, workdir: Path) -> dict[str, float]:
+    path = workdir / f"synthetic-{tool_calls}.jsonl"
+    with path.open("w", encoding="utf-8") as f:
+        for record in synthetic_session(tool_calls):
+            f.write(json.dumps(record) + "\n")
+    return time_phases(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--tool-calls", type=int, default=10_000)
+    parser.add_argument(
+        "--scaling", action="store_true", help="Also run at N/4 and N/2 and report growth"
+    )
+    args = parser.parse_args()
+
+    sizes = [args.tool_calls]
+    if args.scaling:
+        sizes = [args.tool_calls // 4, args.tool_calls // 2, args.tool_calls]
+
+    with tempfile.TemporaryDirectory(prefix="aops-transcript-bench-") as tmp:
+        results = {size: run(size, Path(tmp)) for size in sizes}
+
+    phases = list(results[sizes[-1]])
+    header = f"{'phase':<16}" + "".join(f"{f'{size} calls':>14}" for size in sizes)
+    if args.scaling:
+        header += f"{'x/doubling':>12}"
+    print(header)
+    for phase in phases:
+        row = f"{phase:<16}" + "".join(f"{results[size][phase] * 1000:>12.1f}ms" for size in sizes)
+        if args.scaling and results[sizes[0]][phase] > 0:
+            growth = (results[sizes[-1]][phase] / results[sizes[0]][phase]) ** 0.5
+            row += f"{growth:>11.1f}x"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
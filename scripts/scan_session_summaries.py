@@ -29,6 +29,7 @@ _aops_core = Path(__file__).resolve().parent.parent / "aops-core"
 sys.path.insert(0, str(_aops_core))
 
 from lib.paths import get_summaries_dir
+from lib.summary_catalog import SummaryCatalog
 
 
 def parse_summary_filename(filename: str) -> dict[str, str | None] | None:
@@ -110,32 +111,22 @@ def scan_summaries(
 
     results = []
 
-    for json_file in summaries_dir.glob("*.json"):
-        # Skip non-summary files
-        if json_file.name.startswith("."):
+    catalog = SummaryCatalog.load(summaries_dir)
+    for entry in catalog.since(cutoff_str):
+        # Skip files the filename parser rejects, unreadable ones, and other projects
+        file_meta = parse_summary_filename(entry.name[: -len(".json")])
+        if not file_meta or not entry.readable:
             continue
-
-        # Parse filename for metadata
-        file_meta = parse_summary_filename(json_file.stem)
-        if not file_meta:
-            continue
-
-        # Date filter
-        date_val = file_meta["date"]
-        if date_val and date_val < cutoff_str:
-            continue
-
-        # Project filter
         if project_filter and file_meta["project"] != project_filter:
             continue
 
         # Load the summary
-        summary = load_summary(json_file)
+        summary = load_summary(summaries_dir / entry.name)
         if not summary:
             continue
 
         # Enrich with file metadata
-        summary["_file"] = json_file.name
+        summary["_file"] = entry.name
         summary["_file_date"] = file_meta["date"]
         summary["_file_hour"] = file_meta["hour"]
         summary["_file_project"] = file_meta["project"]
@@ -23,12 +23,14 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "aops-core"))
 
 from lib.paths import get_data_root, get_summaries_dir  # noqa: E402
+from lib.summary_catalog import SummaryCatalog  # noqa: E402
 
 
 def load_today_sessions(summaries_dir: Path, date_prefix: str) -> list[dict]:
     """Load all session summary JSONs matching today's date prefix."""
     sessions = []
-    for f in sorted(summaries_dir.glob(f"{date_prefix}*.json")):
+    catalog = SummaryCatalog.load(summaries_dir)
+    for f in catalog.paths(catalog.with_prefix(date_prefix)):
         try:
             with open(f) as fh:
                 data = json.load(fh)
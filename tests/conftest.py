@@ -164,6 +164,8 @@ def ensure_test_environment(monkeypatch, tmp_path):
     sessions_dir = tmp_path / "sessions"
     sessions_dir.mkdir(parents=True, exist_ok=True)
     monkeypatch.setenv("AOPS_SESSIONS", str(sessions_dir))
+    # Keep persisted caches (lib/cache_utils.py) out of ~/.cache
+    monkeypatch.setenv("AOPS_CACHE_DIR", str(tmp_path / "cache"))
 
     # Redirect UV cache to prevent PermissionError in /opt/suzor/cache/uv
     # This is required for hooks to run successfully under macOS Seatbelt
@@ -0,0 +1,68 @@
+"""Tests for the hook latency benchmark harness (scripts/benchmark_hooks.py)."""
+
+import pytest
+
+from scripts import benchmark_hooks as bench
+
+
+@pytest.fixture
+def isolated_env(monkeypatch, tmp_path):
+    """Let the harness redirect session paths without leaking into other tests."""
+    for var in ("AOPS_SESSIONS", "AOPS_SESSION_STATE_DIR", "ACA_DATA"):
+        monkeypatch.setenv(var, "")
+    for var in ("AOPS_HOOK_LOG_PATH", "DEBUG_HOOKS", "CLAUDE_SESSION_ID", "CLAUDE_ENV_FILE"):
+        monkeypatch.delenv(var, raising=False)
+    bench._isolate_environment(tmp_path)
+    return tmp_path
+
+
+def test_percentile_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+    assert bench.percentile(samples, 50) == 50.0
+    assert bench.percentile(samples, 95) == 95.0
+    assert bench.percentile(samples, 99) == 99.0
+    assert bench.percentile([], 50) == 0.0
+
+
+def test_targets_cover_every_hooked_event():
+    targets = bench.benchmark_targets()
+    claude_events = {event for client, event, _ in targets if client == "claude"}
+    gemini_events = {event for client, event, _ in targets if client == "gemini"}
+    assert {"PreToolUse", "PostToolUse", "UserPromptSubmit", "Stop"} <= claude_events
+    assert {"BeforeTool", "AfterTool", "BeforeAgent", "AfterAgent"} <= gemini_events
+
+
+def test_post_tool_use_synthesized_from_pre_tool_use():
+    scenarios = bench.load_scenarios(bench.DEFAULT_FIXTURE)
+    picked, synthesized = bench.scenarios_for_event(scenarios, "PostToolUse", 3)
+    assert synthesized
+    assert len(picked) == 3
+    assert all(s["hook_event"] == "PostToolUse" and s["tool_name"] for s in picked)
+
+
+def test_warm_run_reports_phase_percentiles(isolated_env):
+    scenarios = bench.load_scenarios(bench.DEFAULT_FIXTURE)
+    targets = [t for t in bench.benchmark_targets() if t[2] in ("PreToolUse", "PostToolUse")]
+
+    results = bench.run_warm(targets, scenarios, iterations=2, max_scenarios=2, quiet=True)
+
+    assert set(results) == {f"{client}:{event}" for client, event, _ in targets}
+    phases = results["claude:PreToolUse"]["phases"]
+    for phase in ("normalize", "state_load", "gates", "state_save", "log", "output", "total"):
+        assert phases[phase]["n"] == 2
+        assert phases[phase]["p50"] <= phases[phase]["p99"]
+    assert any(name.startswith("gate:") for name in phases)
+    assert phases["total"]["p50"] >= phases["gates"]["p50"]
+
+
+def test_compare_reports_relative_change():
+    def report(commit, p50):
+        phases = {"total": {"n": 1, "p50": p50, "p95": p50, "p99": p50}}
+        return {
+            "commit": commit,
+            "results": {"warm": {"claude:PreToolUse": {"synthesized": False, "phases": phases}}},
+        }
+
+    lines = bench.compare(report("new", 15.0), report("old", 10.0))
+    assert "baseline old" in lines[0]
+    assert "+50%" in lines[-1]
@@ -55,7 +55,7 @@ def _pin_gate_modes(monkeypatch):
 
 @pytest.fixture
 def router(monkeypatch):
-    monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+    monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
     return HookRouter()
 
 
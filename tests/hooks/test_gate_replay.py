@@ -97,7 +97,7 @@ def gate_mode(monkeypatch, request):
 @pytest.fixture
 def router(monkeypatch):
     """Create a HookRouter with mocked session data."""
-    monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+    monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
     return HookRouter()
 
 
@@ -164,7 +164,7 @@ def _deterministic_gate_modes(monkeypatch):
 @pytest.fixture
 def router(monkeypatch):
     """Create a HookRouter with mocked session data."""
-    monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+    monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
     return HookRouter()
 
 
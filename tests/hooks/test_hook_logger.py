@@ -16,6 +16,8 @@ import pytest
 aops_core_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(aops_core_dir))
 
+from hooks import hook_log
+from hooks.internal_models import HookLogEntry
 from hooks.schemas import CanonicalHookOutput, HookContext
 from hooks.unified_logger import log_hook_event
 
@@ -230,5 +232,116 @@ class TestLogHookEventEdgeCases:
         assert len(log_files) == 1
 
 
+class TestHookLogWriter:
+    """Test the record encoding and append path shared with the fast path."""
+
+    def test_record_matches_hook_log_entry(self, temp_claude_projects):
+        """The record has the same fields as a HookLogEntry dump, plus debug."""
+        ctx = HookContext(
+            session_id="test-shape",
+            hook_event="PreToolUse",
+            tool_name="Edit",
+            tool_input={"file": "test.py"},
+            raw_input={"key": "value"},
+        )
+        output = CanonicalHookOutput(metadata={"result": "ok"})
+        log_hook_event(ctx, output=output, exit_code=2)
+
+        projects_dir = Path(temp_claude_projects) / ".claude" / "projects"
+        entry = json.loads(next(projects_dir.rglob("*-hooks.jsonl")).read_text())
+        debug = entry.pop("debug")
+        expected = HookLogEntry(
+            logged_at=entry["logged_at"],
+            exit_code=2,
+            output=output.model_dump(),
+            **ctx.model_dump(exclude={"framework_content"}),
+        ).model_dump()
+        assert entry == expected
+        assert debug["pid"] > 0
+        assert debug["mem_rss_mb"] > 0
+
+    def test_concurrent_appends_do_not_interleave(self, tmp_path):
+        """Each record is one O_APPEND write, so lines stay intact."""
+        import threading
+
+        log_path = tmp_path / "hooks.jsonl"
+        payload = "x" * 20000
+
+        def write(worker: int) -> None:
+            for i in range(20):
+                hook_log.write_record(log_path, {"worker": worker, "i": i, "payload": payload})
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert len(records) == 80
+        for worker in range(4):
+            assert [r["i"] for r in records if r["worker"] == worker] == list(range(20))
+
+    def test_background_writer_batches_in_order(self, tmp_path, monkeypatch):
+        """Queued records are written in order, one write per log per batch."""
+        writes = []
+        real_append = hook_log.append_lines
+        monkeypatch.setattr(
+            hook_log,
+            "append_lines",
+            lambda path, data: writes.append(path.name) or real_append(path, data),
+        )
+        writer = hook_log.start_background_writer()
+        try:
+            for i in range(50):
+                hook_log.write_record(tmp_path / f"log-{i % 2}.jsonl", {"i": i})
+            writer.flush()
+        finally:
+            hook_log.stop_background_writer()
+
+        for n in range(2):
+            lines = (tmp_path / f"log-{n}.jsonl").read_text().splitlines()
+            assert [json.loads(line)["i"] for line in lines] == list(range(n, 50, 2))
+        assert len(writes) <= 50
+
+        # Stopped: back to writing inline
+        hook_log.write_record(tmp_path / "log-0.jsonl", {"i": 50})
+        assert len((tmp_path / "log-0.jsonl").read_text().splitlines()) == 26
+
+    def test_background_writer_ignores_request_cwd_and_stderr(self, tmp_path, monkeypatch):
+        """The daemon swaps the cwd and sys.stderr per request; queued writes don't follow."""
+        import io
+        import os
+        import threading
+
+        swapped = threading.Event()
+        real_append = hook_log.append_lines
+        monkeypatch.setattr(
+            hook_log,
+            "append_lines",
+            lambda path, data: swapped.wait(10) and real_append(path, data),
+        )
+        (tmp_path / "request").mkdir()
+        daemon_stderr = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", daemon_stderr)
+        monkeypatch.chdir(tmp_path / "request")
+        writer = hook_log.start_background_writer()
+        try:
+            hook_log.write_record(Path("hooks.jsonl"), {"i": 0})
+            hook_log.write_record(tmp_path / "missing" / "hooks.jsonl", {"i": 1})
+            os.chdir(tmp_path)
+            request_stderr = io.StringIO()
+            monkeypatch.setattr(sys, "stderr", request_stderr)
+            swapped.set()
+            writer.flush()
+        finally:
+            hook_log.stop_background_writer()
+
+        assert (tmp_path / "request" / "hooks.jsonl").exists()
+        assert not (tmp_path / "hooks.jsonl").exists()
+        assert "[hook_log] Error writing" in daemon_stderr.getvalue()
+        assert request_stderr.getvalue() == ""
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
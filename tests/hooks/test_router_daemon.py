@@ -0,0 +1,268 @@
+"""Tests for the hook router daemon and its thin client.
+
+The daemon runs in a background thread on a temporary socket; the client is
+invoked as a subprocess exactly as router.sh runs it.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+AOPS_CORE_DIR = Path(__file__).parent.parent.parent / "aops-core"
+if str(AOPS_CORE_DIR) not in sys.path:
+    sys.path.insert(0, str(AOPS_CORE_DIR))
+
+from hooks import router_daemon
+from hooks.router_client import (
+    EXIT_FALLBACK,
+    RESPONSE_TIMEOUT,
+    build_request,
+    get_event_name,
+    response_timeout,
+)
+from hooks.router_daemon import RouterDaemon, RouterServer
+from lib.session_state import SessionState
+
+CLIENT_PATH = AOPS_CORE_DIR / "hooks" / "router_client.py"
+
+
+@pytest.fixture
+def socket_path() -> Path:
+    # AF_UNIX paths are limited to ~108 bytes, so keep this short
+    return Path("/tmp") / f"aops-test-{uuid.uuid4().hex[:8]}.sock"
+
+
+@pytest.fixture
+def daemon_server(socket_path, monkeypatch):
+    monkeypatch.setenv("AOPS_ROUTER_SOCKET", str(socket_path))
+    daemon = RouterDaemon()
+    daemon.warm_up()
+    server = RouterServer(socket_path, daemon)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def run_client(payload: dict, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(CLIENT_PATH), "--client", "claude", *args],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        timeout=30,
+        env=os.environ.copy(),
+        cwd=str(AOPS_CORE_DIR),
+    )
+
+
+class TestRouterClient:
+    def test_no_daemon_requests_fallback(self, socket_path, monkeypatch):
+        """Without a listening daemon the client exits with EXIT_FALLBACK."""
+        monkeypatch.setenv("AOPS_ROUTER_SOCKET", str(socket_path))
+        result = run_client({"hook_event_name": "PreToolUse", "session_id": "x"})
+        assert result.returncode == EXIT_FALLBACK
+        assert result.stdout == ""
+
+    def test_pretooluse_through_daemon(self, daemon_server):
+        """The daemon returns the same Claude output shape as router.py."""
+        payload = {
+            "hook_event_name": "PreToolUse",
+            "session_id": f"daemon-{uuid.uuid4().hex[:8]}",
+            "tool_name": "TodoWrite",
+            "tool_input": {"todos": []},
+        }
+        result = run_client(payload)
+
+        assert result.returncode == 0, result.stderr
+        output = json.loads(result.stdout)
+        assert output["hookSpecificOutput"]["hookEventName"] == "PreToolUse"
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+        assert daemon_server.router_daemon.requests_served == 1
+
+    def test_environment_restored_after_request(self, daemon_server, monkeypatch):
+        """Request env is applied for the request only."""
+        monkeypatch.setenv("AOPS_TEST_MARKER", "daemon-side")
+        request = build_request(["--client", "claude"], "{}")
+        request["env"]["AOPS_TEST_MARKER"] = "client-side"
+
+        daemon_server.router_daemon.handle(request)
+
+        assert os.environ["AOPS_TEST_MARKER"] == "daemon-side"
+
+
+class TestResponseTimeout:
+    def test_follows_hooks_json(self):
+        assert response_timeout("PostToolUse") == pytest.approx(54.5)
+        assert response_timeout("PreToolUse") == pytest.approx(4.5)
+
+    def test_unknown_event_uses_default(self):
+        assert response_timeout("BeforeTool") == RESPONSE_TIMEOUT
+        assert response_timeout(None) == RESPONSE_TIMEOUT
+
+    def test_event_from_argument_or_payload(self):
+        assert get_event_name(["--client", "gemini", "BeforeTool"], "{}") == "BeforeTool"
+        payload = json.dumps({"hook_event_name": "Stop"})
+        assert get_event_name(["--client", "claude"], payload) == "Stop"
+        assert get_event_name(["--client", "claude"], "not json") is None
+
+
+def _request(session_id: str, timeout: float = RESPONSE_TIMEOUT) -> dict:
+    payload = json.dumps({"hook_event_name": "PreToolUse", "session_id": session_id})
+    return build_request(["--client", "claude"], payload, timeout)
+
+
+def _run_concurrently(daemon: RouterDaemon, requests: list[dict]) -> list[dict]:
+    responses: list[dict] = [{}] * len(requests)
+
+    def run(i: int) -> None:
+        responses[i] = daemon.handle(requests[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    return responses
+
+
+class TestRouterDaemonConcurrency:
+    def test_requests_run_one_at_a_time(self, monkeypatch):
+        running = []
+
+        def fake_run_router(router, args, payload):
+            running.append(1)
+            assert len(running) == 1, "requests overlapped"
+            time.sleep(0.05)
+            running.pop()
+            print(f"stderr of {json.loads(payload)['session_id']}", file=sys.stderr)
+            return json.loads(payload)["session_id"]
+
+        monkeypatch.setattr(router_daemon, "run_router", fake_run_router)
+        responses = _run_concurrently(RouterDaemon(), [_request("one"), _request("two")])
+
+        assert [r["stdout"] for r in responses] == ["one\n", "two\n"]
+        assert [r["stderr"] for r in responses] == ["stderr of one\n", "stderr of two\n"]
+
+    def test_different_environments_do_not_overlap(self, monkeypatch):
+        def fake_run_router(router, args, payload):
+            marker = os.environ["AOPS_TEST_MARKER"]
+            time.sleep(0.05)
+            return f"{marker} {os.environ['AOPS_TEST_MARKER']}"
+
+        monkeypatch.setattr(router_daemon, "run_router", fake_run_router)
+        requests = [_request("env-a"), _request("env-b")]
+        requests[0]["env"]["AOPS_TEST_MARKER"] = "a"
+        requests[1]["env"]["AOPS_TEST_MARKER"] = "b"
+        responses = _run_concurrently(RouterDaemon(), requests)
+
+        assert [r["stdout"] for r in responses] == ["a a\n", "b b\n"]
+        assert "AOPS_TEST_MARKER" not in os.environ
+
+    def test_one_session_runs_in_order(self, monkeypatch):
+        running = []
+
+        def fake_run_router(router, args, payload):
+            running.append(1)
+            assert len(running) == 1, "requests for one session overlapped"
+            time.sleep(0.05)
+            running.pop()
+            return "{}"
+
+        monkeypatch.setattr(router_daemon, "run_router", fake_run_router)
+        responses = _run_concurrently(RouterDaemon(), [_request("same")] * 3)
+        assert [r["exit_code"] for r in responses] == [0, 0, 0]
+
+    def test_busy_daemon_declines(self, monkeypatch):
+        started = threading.Event()
+        release = threading.Event()
+
+        def fake_run_router(router, args, payload):
+            started.set()
+            release.wait(10)
+            return "{}"
+
+        monkeypatch.setattr(router_daemon, "run_router", fake_run_router)
+        daemon = RouterDaemon()
+        thread = threading.Thread(target=daemon.handle, args=(_request("slow"),))
+        thread.start()
+        started.wait(10)
+        try:
+            response = daemon.handle(_request("other", timeout=0.2))
+        finally:
+            release.set()
+            thread.join(10)
+        assert response == {"fallback": True, "reason": "daemon busy"}
+
+    @pytest.mark.parametrize(("code", "exit_code"), [(None, 0), (0, 0), (2, 2), ("bad", 1)])
+    def test_system_exit_codes(self, monkeypatch, code, exit_code):
+        def fake_run_router(router, args, payload):
+            sys.exit(code)
+
+        monkeypatch.setattr(router_daemon, "run_router", fake_run_router)
+        assert RouterDaemon().handle(_request("exit"))["exit_code"] == exit_code
+
+
+class TestRouterDaemonFallback:
+    def test_different_plugin_dir_falls_back(self):
+        daemon = RouterDaemon()
+        request = build_request(["--client", "claude"], "{}")
+        request["hook_dir"] = "/somewhere/else/hooks"
+        assert daemon.handle(request)["fallback"] is True
+
+    def test_different_gate_mode_falls_back(self):
+        """Gate modes are frozen at import, so a mismatch must run in-process."""
+        daemon = RouterDaemon()
+        request = build_request(["--client", "claude"], "{}")
+        request["env"]["CUSTODIET_GATE_MODE"] = "something-else"
+        response = daemon.handle(request)
+        assert response["fallback"] is True
+        assert "CUSTODIET_GATE_MODE" in response["reason"]
+
+
+class TestSessionStateCache:
+    def _post_tool_use(self, daemon: RouterDaemon, session_id: str) -> None:
+        payload = {
+            "hook_event_name": "PostToolUse",
+            "session_id": session_id,
+            "tool_name": "Read",
+            "tool_input": {"file_path": "/etc/hostname"},
+        }
+        response = daemon.handle(build_request(["--client", "claude"], json.dumps(payload)))
+        assert response["exit_code"] == 0, response["stderr"]
+
+    def test_cached_state_tracks_ops(self):
+        daemon = RouterDaemon()
+        session_id = f"cache-{uuid.uuid4().hex[:8]}"
+
+        self._post_tool_use(daemon, session_id)
+        self._post_tool_use(daemon, session_id)
+
+        cached = daemon.state_cache.get(session_id)
+        assert cached is not None
+        assert cached.gates["custodiet"].ops_since_open == 2
+        assert SessionState.load(session_id).gates["custodiet"].ops_since_open == 2
+
+    def test_external_write_invalidates_cache(self):
+        daemon = RouterDaemon()
+        session_id = f"cache-{uuid.uuid4().hex[:8]}"
+        self._post_tool_use(daemon, session_id)
+
+        # Another process (e.g. custodiet_block.py) modifies the state file
+        state = SessionState.load(session_id)
+        state.gates["custodiet"].blocked = True
+        state.gates["custodiet"].block_reason = "external"
+        state.save()
+
+        assert daemon.state_cache.get(session_id) is None
+        self._post_tool_use(daemon, session_id)
+        assert SessionState.load(session_id).gates["custodiet"].block_reason == "external"
@@ -40,8 +40,8 @@ class TestTaskNotificationSilent:
         hookSpecificOutput with permissionDecision for every UPS event.
         For task-notifications this is noise — the output should be empty.
         """
-        monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
-        monkeypatch.setattr("hooks.router.persist_session_data", lambda data: None)
+        monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
+        monkeypatch.setattr("hooks.router.persist_session_data", lambda data, ppid=None: None)
         monkeypatch.setattr("hooks.router.log_event_to_session", lambda *a, **kw: None)
 
         router = HookRouter()
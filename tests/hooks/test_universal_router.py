@@ -18,7 +18,7 @@ class TestUniversalRouter:
     @pytest.fixture
     def router_instance(self, monkeypatch):
         # Mock get_session_data to avoid reading shared PID session map during xdist tests
-        monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+        monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
         return HookRouter()
 
     def test_normalize_input_basic(self, router_instance):
@@ -106,7 +106,7 @@ class TestToolInputNormalization:
     @pytest.fixture
     def router_instance(self, monkeypatch):
         # Mock get_session_data to avoid reading shared PID session map during xdist tests
-        monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+        monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
         return HookRouter()
 
     def test_normalize_json_field_string(self, router_instance):
@@ -182,7 +182,7 @@ class TestSubagentTypeExtraction:
     @pytest.fixture
     def router_instance(self, monkeypatch):
         # Mock get_session_data to avoid reading shared PID session map during xdist tests
-        monkeypatch.setattr("hooks.router.get_session_data", lambda: {})
+        monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
         return HookRouter()
 
     def test_claude_task_subagent_type(self, router_instance):
@@ -29,47 +29,32 @@ class TestHydrationPathResolution(unittest.TestCase):
     def tearDown(self):
         self.tmp_dir.cleanup()
 
-    @patch("lib.hydration.builder.load_template")
-    @patch("lib.hydration.builder.load_glossary")
+    @patch("lib.hydration.builder.get_static_context")
     @patch("lib.hydration.builder.load_framework_paths")
     @patch("lib.hydration.builder.load_mcp_tools_context")
     @patch("lib.hydration.builder.load_environment_variables_context")
-    @patch("lib.hydration.builder.load_project_paths_context")
-    @patch("lib.hydration.builder.load_workflows_index")
-    @patch("lib.hydration.builder.load_skills_index")
-    @patch("lib.hydration.builder.load_scripts_index")
-    @patch("lib.hydration.builder.load_project_rules")
     @patch("lib.hydration.builder.get_task_work_state")
     @patch("lib.hydration.builder.get_formatted_relevant_paths")
-    @patch("lib.hydration.builder.load_project_context_index")
     @patch("lib.hydration.builder.extract_router_context")
     @patch("lib.session_state.SessionState.load")
     def test_build_hydration_instruction_real_path_claude(
         self,
         mock_load,
         mock_extract,
-        mock_proj_idx,
         mock_rel_paths,
         mock_task_state,
-        mock_rules,
-        mock_scripts,
-        mock_skills,
-        mock_workflows,
-        mock_proj_paths,
         mock_env,
         mock_mcp,
         mock_framework,
-        mock_glossary,
-        mock_template,
+        mock_static,
     ):
         """Verify build_hydration_instruction uses real get_gate_file_path for Claude."""
         session_id = "07328230-44d4-414b-9fec-191a6eec0948"
         prompt = "Hello"
 
         # Setup mocks
-        mock_template.side_effect = lambda x: (
-            "{temp_path}" if "instruction" in str(x) else "{prompt}"
-        )
+        mock_static.return_value.context_template = "{prompt}"
+        mock_static.return_value.instruction_template = "{temp_path}"
         mock_state = MagicMock(spec=SessionState)
         mock_state.global_turn_count = 0
         mock_gate = MagicMock()
@@ -100,38 +85,24 @@ class TestHydrationPathResolution(unittest.TestCase):
             self.assertIn(str(expected_path), instruction)
             self.assertEqual(mock_gate.metrics["temp_path"], str(expected_path))
 
-    @patch("lib.hydration.builder.load_template")
-    @patch("lib.hydration.builder.load_glossary")
+    @patch("lib.hydration.builder.get_static_context")
     @patch("lib.hydration.builder.load_framework_paths")
     @patch("lib.hydration.builder.load_mcp_tools_context")
     @patch("lib.hydration.builder.load_environment_variables_context")
-    @patch("lib.hydration.builder.load_project_paths_context")
-    @patch("lib.hydration.builder.load_workflows_index")
-    @patch("lib.hydration.builder.load_skills_index")
-    @patch("lib.hydration.builder.load_scripts_index")
-    @patch("lib.hydration.builder.load_project_rules")
     @patch("lib.hydration.builder.get_task_work_state")
     @patch("lib.hydration.builder.get_formatted_relevant_paths")
-    @patch("lib.hydration.builder.load_project_context_index")
     @patch("lib.hydration.builder.extract_router_context")
     @patch("lib.session_state.SessionState.load")
     def test_build_hydration_instruction_real_path_gemini(
         self,
         mock_load,
         mock_extract,
-        mock_proj_idx,
         mock_rel_paths,
         mock_task_state,
-        mock_rules,
-        mock_scripts,
-        mock_skills,
-        mock_workflows,
-        mock_proj_paths,
         mock_env,
         mock_mcp,
         mock_framework,
-        mock_glossary,
-        mock_template,
+        mock_static,
     ):
         """Verify build_hydration_instruction uses real get_gate_file_path for Gemini."""
         session_id = "07328230-44d4-414b-9fec-191a6eec0948"
@@ -141,9 +112,8 @@ class TestHydrationPathResolution(unittest.TestCase):
         state_dir.mkdir(parents=True, exist_ok=True)
 
         # Setup mocks
-        mock_template.side_effect = lambda x: (
-            "{temp_path}" if "instruction" in str(x) else "{prompt}"
-        )
+        mock_static.return_value.context_template = "{prompt}"
+        mock_static.return_value.instruction_template = "{temp_path}"
         mock_state = MagicMock(spec=SessionState)
         mock_state.global_turn_count = 0
         mock_gate = MagicMock()
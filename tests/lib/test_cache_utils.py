@@ -0,0 +1,54 @@
+"""Tests for lib/cache_utils.py - cache root, switch and atomic writes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from lib import cache_utils
+
+
+def test_cache_root_from_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("AOPS_CACHE_DIR", str(tmp_path / "root"))
+    assert cache_utils.get_cache_dir("file-index") == tmp_path / "root" / "file-index"
+
+
+def test_cache_root_defaults_under_xdg_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("AOPS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache_utils.get_cache_root() == tmp_path / "aops"
+
+
+def test_caches_enabled(monkeypatch):
+    monkeypatch.delenv("AOPS_CACHE", raising=False)
+    assert cache_utils.caches_enabled()
+    monkeypatch.setenv("AOPS_CACHE", "0")
+    assert not cache_utils.caches_enabled()
+
+
+class TestAtomicWrite:
+    def test_replaces_file(self, tmp_path: Path):
+        path = tmp_path / "cache" / "data.bin"
+        cache_utils.atomic_write(path, b"one")
+        cache_utils.atomic_write(path, b"two")
+        assert path.read_bytes() == b"two"
+        assert [p.name for p in path.parent.iterdir()] == ["data.bin"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "cache" / "data.bin"
+        cache_utils.atomic_write(path, b"old")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cache_utils.os, "replace", fail)
+        with pytest.raises(OSError):
+            cache_utils.atomic_write(path, b"new")
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in path.parent.iterdir()] == ["data.bin"]
+
+    def test_unwritable_cache_is_not_an_error(self, tmp_path: Path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        assert not cache_utils.write_cache_file(blocker / "data.bin", b"x")
+        assert cache_utils.write_cache_file(tmp_path / "data.bin", b"x")
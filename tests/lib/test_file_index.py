@@ -0,0 +1,84 @@
+"""Tests for lib/file_index.py relevance scoring and lib/keyword_index.py.
+
+The indexed scoring must agree with scoring every entry by substring search
+(scripts/benchmark_file_index.py keeps that as the baseline).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from lib import file_index
+from lib.keyword_index import KeywordIndex
+
+from scripts import benchmark_file_index as bench
+
+PROMPTS = [
+    *bench.PROMPTS,
+    "Ship   the RELEASE checklist",
+    "the deploy-rollback runbook",
+    "",
+]
+
+
+@pytest.fixture(autouse=True)
+def project(tmp_path, monkeypatch) -> Path:
+    """A project with synthetic workflows, as cwd; no index loaded yet."""
+    monkeypatch.setattr(file_index, "_loaded", {})
+    monkeypatch.setattr(file_index, "_last_scores", None)
+    project_dir = tmp_path / "proj"
+    bench.build_project(project_dir, 100)
+    (project_dir / ".agent" / "workflows" / "release.md").write_text(
+        "---\ndescription: Ship it\ntriggers: [release, ship, checklist]\n---\nTag and push.\n"
+    )
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_indexed_scoring_matches_substring_scoring(prompt):
+    for max_files in (10, 20):
+        expected = bench.legacy_relevant_file_paths(prompt, max_files)
+        assert file_index.get_relevant_file_paths(prompt, max_files) == expected
+
+
+def test_index_is_reused_across_processes(monkeypatch):
+    first = file_index.get_relevant_file_paths("ship the release")
+    monkeypatch.setattr(file_index, "_loaded", {})
+    monkeypatch.setattr(file_index, "_last_scores", None)
+
+    def fail():
+        raise AssertionError("reparsed the workflows")
+
+    monkeypatch.setattr(file_index, "_get_project_workflow_entries", fail)
+    assert file_index.get_relevant_file_paths("ship the release") == first
+
+
+def test_changed_workflow_invalidates_index(project):
+    assert file_index.get_relevant_file_paths("the checklist")[0]["description"] == "Ship it"
+    workflow = project / ".agent" / "workflows" / "release.md"
+    workflow.write_text("---\ndescription: Cut it\ntriggers: [checklist]\n---\n")
+    stat = workflow.stat()
+    os.utime(workflow, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert file_index.get_relevant_file_paths("the checklist")[0]["description"] == "Cut it"
+
+
+def test_added_workflow_invalidates_index(project):
+    assert not file_index.get_relevant_file_paths("zebra crossing")
+    (project / ".agent" / "workflows" / "zebra.md").write_text("Stripes.\n")
+    assert file_index.get_relevant_file_paths("zebra crossing")[0]["path"].endswith("zebra.md")
+
+
+def test_cache_disabled_builds_without_disk(monkeypatch):
+    monkeypatch.setenv("AOPS_CACHE", "0")
+    assert file_index.get_relevant_file_paths("ship the release")
+    assert not file_index.get_index_path().exists()
+
+
+def test_keyword_index_finds_overlapping_substrings():
+    index = KeywordIndex(["he", "she", "his", "hers", "", "she"])
+    assert index.find("ushers") == {0, 1, 3, 5}
+    assert index.find("this") == {2}
+    assert index.find("xyz") == set()
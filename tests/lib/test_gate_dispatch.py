@@ -0,0 +1,87 @@
+"""Tests for lib/gates/dispatch.py - compiled gate conditions and dispatch tables.
+
+The compiled engine must agree with evaluating every condition from scratch
+(scripts/benchmark_gates.py keeps that interpreter as the baseline).
+"""
+
+from __future__ import annotations
+
+import pytest
+from lib.gate_types import GateCondition, GateStatus
+from lib.gates import dispatch
+from lib.gates.definitions import GATE_CONFIGS
+from lib.gates.engine import GenericGate
+from lib.session_state import SessionState
+
+from scripts import benchmark_gates as bench
+
+GATES = [GenericGate(config) for config in GATE_CONFIGS]
+
+STATES = [
+    pytest.param(GateStatus.OPEN, 0, id="open"),
+    pytest.param(GateStatus.OPEN, 500, id="open-busy"),
+    pytest.param(GateStatus.CLOSED, 0, id="closed"),
+    pytest.param(GateStatus.CLOSED, 500, id="closed-busy"),
+]
+
+
+def _session(status: GateStatus, ops: int) -> SessionState:
+    state = SessionState.create(bench.SESSION_ID)
+    for gate in GATES:
+        gate_state = gate._get_state(state)
+        gate_state.status = status
+        gate_state.ops_since_open = gate_state.ops_since_close = ops
+    return state
+
+
+@pytest.mark.parametrize(("status", "ops"), STATES)
+def test_compiled_conditions_match_interpreted(status, ops):
+    state = _session(status, ops)
+    for ctx in bench.build_hooks():
+        for gate in GATES:
+            gate_state = state.gates[gate.name]
+            facts, (triggers, policies) = gate._candidates(ctx)
+            candidates = {id(item[0]) for item in triggers + policies}
+            for rule in gate.config.triggers + gate.config.policies:
+                expected = bench.interpreted_matches(rule.condition, ctx, gate_state, state)
+                assert gate._evaluate_condition(rule.condition, ctx, gate_state, state) == expected
+                if expected:
+                    assert id(rule) in candidates, (gate.name, ctx.hook_event, ctx.tool_name)
+
+
+def test_regex_and_plain_hook_events():
+    compiled = dispatch.CompiledCondition(GateCondition(hook_event="^(Stop|SessionEnd)$"))
+    assert compiled.can_match("Stop", None)
+    assert not compiled.can_match("PreToolUse", None)
+    compiled = dispatch.CompiledCondition(GateCondition(hook_event="Stop"))
+    assert not compiled.can_match("StopFailure", None)
+
+
+def test_excluded_category_drops_candidates():
+    hydration = next(gate for gate in GATES if gate.name == "hydration")
+    assert hydration._table.uses_categories
+    _, write_policies = hydration._table.candidates("PreToolUse", "write")
+    _, policies = hydration._table.candidates("PreToolUse", "always_available")
+    assert len(policies) < len(write_policies)
+    assert not any(
+        "always_available" in (policy.condition.excluded_tool_categories or [])
+        for policy, _ in policies
+    )
+
+
+def test_tool_category_computed_once_per_hook(monkeypatch):
+    calls = []
+    real = dispatch._tool_category
+    monkeypatch.setattr(
+        dispatch, "_tool_category", lambda *args: calls.append(args[0]) or real(*args)
+    )
+    state = SessionState.create(bench.SESSION_ID)
+    ctx = bench.build_hooks()[4]  # PreToolUse Edit
+    for gate in GATES:
+        gate.check(ctx, state)
+    assert calls == ["Edit"]
+
+
+def test_benchmark_runs():
+    timings = bench.run(rounds=1)
+    assert set(timings) == {"interpreted", "compiled"}
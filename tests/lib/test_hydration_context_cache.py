@@ -0,0 +1,87 @@
+"""Tests for lib/hydration/context_cache.py - the cached static hydrator context."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from lib.hydration import builder, context_cache, context_loaders
+from lib.hydration.builder import build_hydration_instruction
+from lib.session_paths import get_gate_file_path
+
+PROMPTS = ["fix the failing tests with tdd and commit", "release checklist please", "hello"]
+
+
+@pytest.fixture(autouse=True)
+def project(tmp_path, monkeypatch) -> Path:
+    """A project directory with rules and workflows, as cwd; no bundles loaded yet."""
+    monkeypatch.setenv("AOPS_SESSION_STATE_DIR", str(tmp_path / "status"))
+    monkeypatch.setattr(context_cache, "_loaded", {})
+    project_dir = tmp_path / "proj"
+    (project_dir / ".agent" / "rules").mkdir(parents=True)
+    (project_dir / ".agent" / "workflows").mkdir()
+    (project_dir / ".agent" / "rules" / "style-guide.md").write_text("Use tabs.\n")
+    (project_dir / ".agent" / "workflows" / "release.md").write_text(
+        "---\ntitle: Release\ndescription: Ship it\ntriggers: [release]\n---\nTag and push.\n"
+    )
+    monkeypatch.chdir(project_dir)
+    return project_dir
+
+
+def _static():
+    return context_cache.get_static_context(
+        builder.CONTEXT_TEMPLATE_FILE, builder.INSTRUCTION_TEMPLATE_FILE
+    )
+
+
+def _hydrate(prompt: str) -> str:
+    session_id = str(uuid.uuid4())
+    build_hydration_instruction(session_id, prompt)
+    return get_gate_file_path("hydration", session_id).read_text()
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_cached_context_matches_uncached(prompt, monkeypatch):
+    cached = _hydrate(prompt)
+    monkeypatch.setenv("AOPS_CACHE", "0")
+    assert _hydrate(prompt) == cached
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_workflows_index_matches_loader(prompt):
+    assert _static().workflows_index(prompt) == context_loaders.load_workflows_index(prompt)
+
+
+def test_bundle_is_reused_across_processes(monkeypatch):
+    first = _static()
+    monkeypatch.setattr(context_cache, "_loaded", {})
+
+    def fail():
+        raise AssertionError("reread GLOSSARY.md")
+
+    monkeypatch.setattr(context_loaders, "load_glossary", fail)
+    assert _static() == first
+
+
+def test_changed_file_invalidates_bundle(project):
+    assert "Use tabs." in _static().project_rules
+    rule = project / ".agent" / "rules" / "style-guide.md"
+    rule.write_text("Use spaces.\n")
+    stat = rule.stat()
+    os.utime(rule, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert "Use spaces." in _static().project_rules
+
+
+def test_added_workflow_invalidates_bundle(project):
+    assert "deploy" not in _static().project_workflows["table"]
+    (project / ".agent" / "workflows" / "deploy.md").write_text("Deploy steps.\n")
+    assert "deploy" in _static().project_workflows["table"]
+
+
+def test_missing_framework_file_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(context_loaders, "get_plugin_root", lambda: tmp_path)
+    with pytest.raises(FileNotFoundError, match="GLOSSARY.md"):
+        _static()
+    assert not list(context_cache.get_bundle_path("x").parent.glob("*.json"))
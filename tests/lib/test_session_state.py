@@ -0,0 +1,190 @@
+"""Tests for SessionState saves from concurrent hooks.
+
+Parallel tool calls fire hooks concurrently, each loading, modifying and
+saving the same session state. Saves are compare-and-swap: a save made
+from a stale load merges its changes into the newer state.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from hooks.router import HookRouter, run_router
+from lib import session_paths
+from lib.gate_types import GateStatus
+from lib.session_paths import find_session_file
+from lib.session_state import SessionState, _merge
+
+CONCURRENT_HOOKS = 50
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch) -> Path:
+    status = tmp_path / "status"
+    monkeypatch.setenv("AOPS_SESSION_STATE_DIR", str(status))
+    return status
+
+
+def _read(session_id: str) -> dict:
+    path = find_session_file(session_id)
+    assert path is not None
+    return json.loads(path.read_text())
+
+
+class TestMerge:
+    def test_concurrent_increments_add_up(self):
+        base = {"global_turn_count": 3, "gate": {"ops_since_open": 1}}
+        mine = {"global_turn_count": 4, "gate": {"ops_since_open": 2}}
+        theirs = {"global_turn_count": 5, "gate": {"ops_since_open": 1}}
+        assert _merge(base, mine, theirs) == {
+            "global_turn_count": 6,
+            "gate": {"ops_since_open": 2},
+        }
+
+    def test_reset_counter_is_kept(self):
+        assert _merge({"ops_since_open": 3}, {"ops_since_open": 0}, {"ops_since_open": 5}) == {
+            "ops_since_open": 0
+        }
+
+    def test_increment_after_concurrent_reset(self):
+        assert _merge({"ops_since_open": 3}, {"ops_since_open": 4}, {"ops_since_open": 0}) == {
+            "ops_since_open": 1
+        }
+
+    def test_key_added_on_both_sides(self):
+        assert _merge({}, {"qa": {"ops_since_close": 1}}, {"qa": {"ops_since_close": 2}}) == {
+            "qa": {"ops_since_close": 3}
+        }
+
+    def test_same_snapshot_value_is_not_added_twice(self):
+        base = {"last_open_turn": 2, "todos_total": 3}
+        both = {"last_open_turn": 5, "todos_total": 5}
+        assert _merge(base, dict(both), dict(both)) == both
+
+    def test_conflicting_snapshots_go_to_the_later_save(self):
+        assert _merge({"todos_total": 3}, {"todos_total": 4}, {"todos_total": 6}) == {
+            "todos_total": 4
+        }
+
+    def test_conflicting_values_go_to_the_later_save(self):
+        assert _merge({"task": None}, {"task": "b"}, {"task": "a"}) == {"task": "b"}
+
+
+class TestSave:
+    def test_stale_save_merges_into_newer_state(self):
+        session_id = str(uuid.uuid4())
+        SessionState.create(session_id).save()
+
+        first = SessionState.load(session_id)
+        second = SessionState.load(session_id)
+        first.gates["custodiet"].ops_since_open += 1
+        first.main_agent.current_task = "task-1"
+        first.save()
+        second.gates["custodiet"].ops_since_open += 1
+        second.close_gate("hydration")
+        second.save()
+
+        data = _read(session_id)
+        assert data["revision"] == 3
+        assert data["gates"]["custodiet"]["ops_since_open"] == 2
+        assert data["gates"]["hydration"]["status"] == GateStatus.CLOSED.value
+        assert data["main_agent"]["current_task"] == "task-1"
+        # The stale instance now holds the merged state
+        assert second.main_agent.current_task == "task-1"
+        assert second.revision == 3
+
+    def test_gate_opened_concurrently_in_the_same_turn(self):
+        session_id = str(uuid.uuid4())
+        state = SessionState.create(session_id)
+        state.global_turn_count = 5
+        state.close_gate("custodiet")
+        state.gates["custodiet"].last_open_turn = 2
+        state.save()
+
+        first = SessionState.load(session_id)
+        second = SessionState.load(session_id)
+        first.open_gate("custodiet")
+        first.save()
+        second.open_gate("custodiet")
+        second.save()
+
+        gate = _read(session_id)["gates"]["custodiet"]
+        assert gate["status"] == "open"
+        assert gate["last_open_turn"] == 5
+        assert gate["ops_since_open"] == 0
+
+    def test_concurrently_created_states_merge(self):
+        session_id = str(uuid.uuid4())
+        first = SessionState.create(session_id)
+        second = SessionState.create(session_id)
+        first.global_turn_count += 1
+        first.save()
+        second.global_turn_count += 1
+        second.save()
+
+        assert _read(session_id)["global_turn_count"] == 2
+
+    def test_lookup_reads_pointer_instead_of_globbing(self, monkeypatch):
+        session_id = str(uuid.uuid4())
+        SessionState.create(session_id).save()
+
+        def fail(self, pattern):
+            raise AssertionError(f"globbed {pattern}")
+
+        monkeypatch.setattr(Path, "glob", fail)
+        assert SessionState.load(session_id).revision == 1
+
+    def test_stale_pointer_falls_back_to_globbing(self, state_dir):
+        session_id = str(uuid.uuid4())
+        SessionState.create(session_id).save()
+        session_paths.get_session_pointer_path(session_id).write_text("20000101-00-gone.json")
+
+        assert find_session_file(session_id) is not None
+
+
+def _post_tool_use(session_id: str) -> None:
+    payload = {
+        "hook_event_name": "PostToolUse",
+        "session_id": session_id,
+        "tool_name": "Read",
+        "tool_input": {"file_path": "/tmp/example.txt"},
+        "tool_response": {},
+    }
+    run_router(HookRouter(), SimpleNamespace(client="claude", event=None), json.dumps(payload))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork and fcntl")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_concurrent_hooks_lose_no_updates(monkeypatch):
+    monkeypatch.setattr("hooks.router.get_session_data", lambda ppid=None: {})
+    for gate in ("HANDOVER", "QA", "CUSTODIET", "HYDRATION", "COMMIT"):
+        monkeypatch.setenv(f"{gate}_GATE_MODE", "warn")
+    session_id = str(uuid.uuid4())
+    SessionState.create(session_id).save()
+
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Barrier(CONCURRENT_HOOKS)
+
+    def hook():
+        start.wait()
+        _post_tool_use(session_id)
+
+    processes = [ctx.Process(target=hook) for _ in range(CONCURRENT_HOOKS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+    assert [process.exitcode for process in processes] == [0] * CONCURRENT_HOOKS
+
+    data = _read(session_id)
+    assert data["revision"] == CONCURRENT_HOOKS + 1
+    for name in ("hydration", "custodiet", "handover"):
+        assert data["gates"][name]["ops_since_open"] == CONCURRENT_HOOKS
+    # Gates first used by the hooks themselves count every call too
+    assert data["gates"]["qa"]["ops_since_open"] == CONCURRENT_HOOKS
@@ -0,0 +1,235 @@
+"""Tests for lib/summary_catalog.py - the summaries/ index behind insights lookups."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from lib import summary_catalog
+from lib.insights_generator import find_existing_insights, write_insights_file
+from lib.path_reconstructor import reconstruct_path
+from lib.paths import get_summaries_dir
+from lib.summary_catalog import SummaryCatalog, parse_summary_name
+
+NAMES = [
+    "20260105-17-writing-3bf94f77-session.json",
+    "20260105-17-writing-3bf94f77-session-1.json",
+    "20260105-17-writing-3bf94f77-session-2.json",
+    "20260105-writing-a5234d3e-legacy-slug.json",  # v3.6.0, no hour
+    "20260105-a5234d3e-older.json",  # v3.5.0
+    "2026-01-05-abcdef12.json",  # Old format with dashes in date
+    "20260106-09-aops-core-abcdef12.json",  # Project with a dash, no slug
+    "20260106-09-proj-3bf94f77-next-day.json",
+]
+
+
+def _glob_insights(summaries_dir: Path, date: str, session_id: str, index=None):
+    """The per-session globbing the catalog replaces (find_existing_insights before it)."""
+    date_compact = date.replace("-", "")
+    patterns = [
+        f"{date_compact}-??-*-{session_id}-*.json",
+        f"{date_compact}-??-*-{session_id}.json",
+        f"{date_compact}-??-{session_id}-*.json",
+        f"{date_compact}-??-{session_id}.json",
+        f"{date_compact}-*-{session_id}-*.json",
+        f"{date_compact}-*-{session_id}.json",
+        f"{date_compact}-{session_id}-*.json",
+        f"{date_compact}-{session_id}.json",
+        f"{date_compact}-*{session_id}*.json",
+        f"{date[:10]}-{session_id}.json",
+    ]
+    for pattern in patterns:
+        matches = sorted(summaries_dir.glob(pattern))
+        if index is not None:
+            if index > 0:
+                matches = [p for p in matches if p.stem.endswith(f"-{index}")]
+            else:
+                matches = [p for p in matches if not re.search(r"-\d+$", p.stem)]
+        if matches:
+            return matches
+    return []
+
+
+@pytest.fixture(autouse=True)
+def fresh_process(monkeypatch):
+    """Don't reuse catalogs loaded by other tests."""
+    monkeypatch.setattr(summary_catalog, "_loaded", {})
+
+
+@pytest.fixture
+def summaries_dir() -> Path:
+    summaries_dir = get_summaries_dir()
+    summaries_dir.mkdir(parents=True, exist_ok=True)
+    for name in NAMES:
+        (summaries_dir / name).write_text(json.dumps({"session_id": name, "outcome": "success"}))
+    (summaries_dir / "notes.txt").write_text("not a summary")
+    return summaries_dir
+
+
+def _no_refresh(monkeypatch) -> None:
+    def fail(self):
+        raise AssertionError("rescanned summaries/")
+
+    monkeypatch.setattr(SummaryCatalog, "refresh", fail)
+
+
+class TestParseSummaryName:
+    def test_current_format(self):
+        fields = parse_summary_name("20260105-17-writing-3bf94f77-fix-tests-2")
+        assert fields == {
+            "date": "20260105",
+            "hour": "17",
+            "project": "writing",
+            "session_id": "3bf94f77",
+            "slug": "fix-tests",
+            "index": 2,
+        }
+
+    def test_legacy_format_without_hour(self):
+        fields = parse_summary_name("20260105-writing-a5234d3e-legacy-slug")
+        assert (fields["hour"], fields["project"], fields["session_id"]) == (
+            None,
+            "writing",
+            "a5234d3e",
+        )
+        assert fields["slug"] == "legacy-slug"
+
+    def test_not_a_summary_name(self):
+        assert parse_summary_name("notes")["date"] == ""
+
+
+class TestFindExistingInsights:
+    @pytest.mark.parametrize(
+        ("date", "session_id", "index"),
+        [
+            ("2026-01-05", "3bf94f77", None),
+            ("2026-01-05", "3bf94f77", 0),
+            ("2026-01-05", "3bf94f77", 2),
+            ("2026-01-05", "3bf94f77", 5),
+            ("2026-01-05", "a5234d3e", None),
+            ("2026-01-05", "abcdef12", None),
+            ("2026-01-06", "abcdef12", None),
+            ("2026-01-06", "3bf94f77", None),
+            ("2026-01-07", "3bf94f77", None),
+        ],
+    )
+    def test_matches_globbing(self, summaries_dir: Path, date, session_id, index):
+        found = find_existing_insights(date, session_id, index=index)
+        expected = _glob_insights(summaries_dir, date, session_id, index)
+        if expected:
+            assert found in expected
+        else:
+            assert found is None
+
+    def test_catalog_is_reused_while_unchanged(self, summaries_dir: Path, monkeypatch):
+        assert find_existing_insights("2026-01-05", "3bf94f77") is not None
+        _no_refresh(monkeypatch)
+        assert find_existing_insights("2026-01-06", "abcdef12") is not None
+
+
+class TestCatalogUpdates:
+    def test_written_file_is_recorded_without_rescan(self, summaries_dir: Path, monkeypatch):
+        catalog = SummaryCatalog.load(summaries_dir)
+        real_refresh = SummaryCatalog.refresh
+        _no_refresh(monkeypatch)
+
+        path = summaries_dir / "20260107-08-proj-deadbeef-new-work.json"
+        write_insights_file(
+            path, {"session_id": "deadbeef", "summary": "New work"}, catalog=catalog
+        )
+        entry = catalog.entries[path.name]
+        assert (entry.session_id, entry.summary, entry.slug) == ("deadbeef", "New work", "new-work")
+
+        # The next load refreshes (the directory changed) without rereading it
+        monkeypatch.setattr(SummaryCatalog, "refresh", real_refresh)
+        monkeypatch.setattr(summary_catalog, "_loaded", {})
+        monkeypatch.setattr(summary_catalog, "_read_entry", None)
+        assert SummaryCatalog.load(summaries_dir).entries[path.name] == entry
+
+    def test_interleaved_writers_keep_both_entries(self, summaries_dir: Path, monkeypatch):
+        first = SummaryCatalog.load(summaries_dir)
+        monkeypatch.setattr(summary_catalog, "_loaded", {})
+        second = SummaryCatalog.load(summaries_dir)
+
+        a = summaries_dir / "20261016-11-proj-aaaa1111-a.json"
+        b = summaries_dir / "20261016-11-proj-bbbb2222-b.json"
+        write_insights_file(a, {"session_id": "aaaa1111"}, catalog=first)
+        write_insights_file(b, {"session_id": "bbbb2222"}, catalog=second)
+
+        monkeypatch.setattr(summary_catalog, "_loaded", {})
+        monkeypatch.setattr(SummaryCatalog, "refresh", lambda self: None)
+        entries = SummaryCatalog.load(summaries_dir).entries
+        assert a.name in entries and b.name in entries
+
+    def test_file_written_after_load_is_not_taken_as_known(self, summaries_dir: Path, monkeypatch):
+        catalog = SummaryCatalog.load(summaries_dir)
+        # Written by another process between this one's load and save
+        other = summaries_dir / "20261016-11-proj-cccc3333-c.json"
+        other.write_text('{"session_id": "cccc3333"}')
+        catalog.save()
+
+        monkeypatch.setattr(summary_catalog, "_loaded", {})
+        assert other.name in SummaryCatalog.load(summaries_dir).entries
+
+    def test_external_changes_are_picked_up(self, summaries_dir: Path):
+        catalog = SummaryCatalog.load(summaries_dir)
+        assert len(catalog.entries) == len(NAMES)
+
+        # Synced in from another machine, and one removed
+        (summaries_dir / "20260108-10-proj-cafef00d.json").write_text('{"session_id": "x"}')
+        (summaries_dir / NAMES[0]).unlink()
+        stat = (summaries_dir / "20260108-10-proj-cafef00d.json").stat()
+        os.utime(summaries_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        catalog = SummaryCatalog.load(summaries_dir)
+        assert "20260108-10-proj-cafef00d.json" in catalog.entries
+        assert NAMES[0] not in catalog.entries
+
+    def test_unchanged_files_are_not_reread(self, summaries_dir: Path, monkeypatch):
+        SummaryCatalog.load(summaries_dir)
+        (summaries_dir / "20260108-10-proj-cafef00d.json").write_text("{broken")
+        monkeypatch.setattr(summary_catalog, "_loaded", {})
+
+        read = []
+        real_read_entry = summary_catalog._read_entry
+        monkeypatch.setattr(
+            summary_catalog,
+            "_read_entry",
+            lambda path, *args: read.append(path.name) or real_read_entry(path, *args),
+        )
+        catalog = SummaryCatalog.load(summaries_dir)
+        assert read == ["20260108-10-proj-cafef00d.json"]
+        assert not catalog.entries["20260108-10-proj-cafef00d.json"].readable
+
+    def test_since_is_newest_first(self, summaries_dir: Path):
+        catalog = SummaryCatalog.load(summaries_dir)
+        names = [entry.name for entry in catalog.since("20260105", "17")]
+        assert names[:2] == [
+            "20260106-09-proj-3bf94f77-next-day.json",
+            "20260106-09-aops-core-abcdef12.json",
+        ]
+        # No hour counts as "00", before the cutoff hour
+        assert "20260105-writing-a5234d3e-legacy-slug.json" not in names
+        assert "2026-01-05-abcdef12.json" not in names
+
+
+class TestReconstructPath:
+    def test_reads_recent_summaries_once_per_session(self):
+        summaries_dir = get_summaries_dir()
+        summaries_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now().astimezone()
+        recent = (now - timedelta(hours=1)).strftime("%Y%m%d-%H")
+        old = (now - timedelta(days=3)).strftime("%Y%m%d-%H")
+        summary = {"session_id": "aaaa1111", "project": "proj", "summary": "Did things"}
+        (summaries_dir / f"{recent}-proj-aaaa1111-work.json").write_text(json.dumps(summary))
+        (summaries_dir / f"{recent}-proj-aaaa1111-work-1.json").write_text(json.dumps(summary))
+        (summaries_dir / f"{old}-proj-bbbb2222-stale.json").write_text(
+            json.dumps({**summary, "session_id": "bbbb2222"})
+        )
+
+        path = reconstruct_path(hours=24)
+        assert [thread.session_id for thread in path.threads] == ["aaaa1111"]
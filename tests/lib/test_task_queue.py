@@ -0,0 +1,160 @@
+"""Tests for lib/task_queue.py - persistent ready queue behind claim_next_task."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from lib.task_model import Task, TaskStatus, TaskType
+from lib.task_queue import ReadyQueue
+from lib.task_storage import TaskStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> TaskStorage:
+    storage = TaskStorage(data_root=tmp_path)
+    goal = storage.create_task(title="Goal", project="proj", type=TaskType.GOAL)
+    storage.save_task(goal)
+    storage.goal_id = goal.id  # type: ignore[attr-defined]
+    return storage
+
+
+def _task(storage: TaskStorage, title: str, **kwargs) -> Task:
+    kwargs.setdefault("project", "proj")
+    task = storage.create_task(title=title, parent=storage.goal_id, **kwargs)  # type: ignore[attr-defined]
+    storage.save_task(task)
+    return task
+
+
+class TestClaimNextTask:
+    def test_claims_in_priority_order(self, storage: TaskStorage) -> None:
+        _task(storage, "Low", priority=3)
+        high = _task(storage, "High", priority=0)
+
+        claimed = storage.claim_next_task("worker-1")
+        assert claimed.id == high.id
+        assert claimed.status == TaskStatus.IN_PROGRESS
+        assert claimed.assignee == "worker-1"
+        assert storage.get_task(high.id).status == TaskStatus.IN_PROGRESS
+
+        assert storage.claim_next_task("worker-2").title == "Low"
+        assert storage.claim_next_task("worker-3") is None
+
+    def test_project_and_assignee_filters(self, storage: TaskStorage) -> None:
+        _task(storage, "Other project", project="other")
+        _task(storage, "Someone else's", assignee="worker-2")
+
+        assert storage.claim_next_task("worker-1", project="proj") is None
+        assert storage.claim_next_task("worker-2", project="proj").title == "Someone else's"
+
+    def test_skips_tasks_with_pr(self, storage: TaskStorage) -> None:
+        _task(storage, "Has PR", pr=12)
+        assert storage.claim_next_task("worker-1") is None
+
+    def test_depth(self, storage: TaskStorage) -> None:
+        assert storage.ready_queue.depth() == 0  # Not built yet
+        _task(storage, "One")
+        _task(storage, "Two")
+        storage.claim_next_task("worker-1")
+        assert storage.ready_queue.depth() == 1
+        assert storage.ready_queue.depth(project="other") == 0
+
+
+class TestQueueUpdates:
+    def test_saves_after_build_do_not_rescan(self, storage: TaskStorage, monkeypatch) -> None:
+        first = _task(storage, "First", priority=1)
+        storage.claim_next_task("worker-1")
+
+        def fail(self):
+            raise AssertionError("rebuilt the queue")
+
+        monkeypatch.setattr(ReadyQueue, "_rebuild", fail)
+        second = _task(storage, "Second", priority=0)
+        assert storage.claim_next_task("worker-2").id == second.id
+        assert first.id != second.id
+
+    def test_saves_that_keep_placement_skip_the_queue(
+        self, storage: TaskStorage, monkeypatch
+    ) -> None:
+        task = _task(storage, "Edited", priority=2)
+        storage.claim_next_task("worker-1", project="nothing")  # Build the queue
+
+        def fail(self):
+            raise AssertionError("loaded the queue")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ReadyQueue, "_load", fail)
+            task = storage.get_task(task.id)
+            task.body = "New notes"
+            storage.save_task(task)
+
+        task.priority = 0
+        storage.save_task(task)
+        assert storage.ready_queue._load()["ready"][task.id]["priority"] == 0
+
+    def test_claim_updates_modified(self, storage: TaskStorage) -> None:
+        task = _task(storage, "Claimed")
+        before = storage.get_task(task.id).modified
+
+        claimed = storage.claim_next_task("worker-1")
+        assert claimed.modified > before
+        assert storage.get_task(task.id).modified == claimed.modified
+
+    def test_completing_dependency_makes_dependent_ready(self, storage: TaskStorage) -> None:
+        blocker = _task(storage, "Blocker")
+        dependent = _task(storage, "Dependent", depends_on=[blocker.id], priority=0)
+
+        assert storage.claim_next_task("worker-1").id == blocker.id
+        assert storage.ready_queue.depth() == 0
+
+        blocker = storage.get_task(blocker.id)
+        blocker.status = TaskStatus.DONE
+        storage.save_task(blocker)
+
+        assert storage.ready_queue.depth() == 1
+        assert storage.claim_next_task("worker-2").id == dependent.id
+
+    def test_deleted_task_leaves_queue(self, storage: TaskStorage) -> None:
+        _task(storage, "Keep", priority=3)
+        gone = _task(storage, "Gone", priority=0)
+        storage.claim_next_task("worker-1", project="nothing")  # Build the queue
+        assert storage.ready_queue.depth() == 2
+
+        storage.delete_task(gone.id)
+        assert storage.ready_queue.depth() == 1
+
+    def test_stale_entry_is_rechecked_at_claim(self, storage: TaskStorage) -> None:
+        task = _task(storage, "Edited elsewhere")
+        storage.claim_next_task("worker-1", project="nothing")  # Build the queue
+
+        # Another tool marks it done without going through TaskStorage
+        path = storage._find_task_path(task.id)
+        path.write_text(path.read_text().replace("status: active", "status: done"))
+
+        assert storage.claim_next_task("worker-1") is None
+        assert storage.ready_queue.depth() == 0
+
+    def test_missing_queue_is_rebuilt(self, storage: TaskStorage) -> None:
+        task = _task(storage, "Queued")
+        storage.ready_queue.path.write_text("{not json")
+
+        assert storage.claim_next_task("worker-1").id == task.id
+
+    def test_claim_keeps_relationships_section(self, storage: TaskStorage) -> None:
+        blocker = _task(storage, "Blocker")
+        dependent = _task(storage, "Dependent", depends_on=[blocker.id])
+        # Re-save so the computed [blocks] line is rendered
+        storage.save_task(storage.get_task(blocker.id))
+
+        assert storage.claim_next_task("worker-1").id == blocker.id
+        path = storage._find_task_path(blocker.id)
+        assert f"- [blocks] [[{dependent.id}]]" in path.read_text()
+
+    def test_claim_renders_relationships_from_the_graph(self, storage: TaskStorage) -> None:
+        blocker = _task(storage, "Blocker")
+        # Saved after the blocker, so the blocker's file has no [blocks] line yet
+        dependent = _task(storage, "Dependent", depends_on=[blocker.id])
+
+        assert storage.claim_next_task("worker-1").id == blocker.id
+        path = storage._find_task_path(blocker.id)
+        assert f"- [blocks] [[{dependent.id}]]" in path.read_text()
@@ -0,0 +1,158 @@
+"""Tests for ToolCallIndex - tool_use_id -> tool_result lookup in transcript_parser.
+
+The SessionProcessor lookups must keep the semantics of the linear scans they
+replaced, and stay linear in the number of tool calls.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from lib.extract_labor import LaborExtractor
+from lib.transcript_error_analyzer import extract_transcript_errors
+from lib.transcript_parser import Entry, SessionProcessor, ToolCallIndex
+
+from scripts.benchmark_transcript import synthetic_session
+
+
+def _tool_use(tool_id: str, name: str = "Bash", ts: str = "2026-01-01T09:00:00Z") -> dict:
+    return {
+        "type": "assistant",
+        "timestamp": ts,
+        "message": {"content": [{"type": "tool_use", "id": tool_id, "name": name, "input": {}}]},
+    }
+
+
+def _tool_result(
+    tool_id: str,
+    content,
+    is_error: bool = False,
+    ts: str = "2026-01-01T09:00:05Z",
+    agent_id: str | None = None,
+) -> dict:
+    record = {
+        "type": "user",
+        "timestamp": ts,
+        "message": {
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": content,
+                    "is_error": is_error,
+                }
+            ]
+        },
+    }
+    if agent_id:
+        record["toolUseResult"] = {"agentId": agent_id}
+    return record
+
+
+def _entries(*records: dict) -> list[Entry]:
+    return [Entry.from_dict(record) for record in records]
+
+
+class TestToolCallIndex:
+    def test_pairs_use_and_result(self):
+        entries = _entries(_tool_use("t1", "Read"), _tool_result("t1", "contents"))
+        record = ToolCallIndex(entries).get("t1")
+
+        assert record is not None
+        assert record.name == "Read"
+        assert record.results[0][1]["content"] == "contents"
+        assert record.duration_seconds == 5.0
+
+    def test_raw_dicts(self):
+        records = [_tool_use("t1", "Agent"), _tool_result("t1", "done", agent_id="abc123")]
+        record = ToolCallIndex(records).get("t1")
+
+        assert record is not None
+        assert record.agent_id == "abc123"
+        assert record.use_timestamp == "2026-01-01T09:00:00Z"
+        assert record.duration_seconds is None
+
+    def test_update_indexes_appended_entries_only(self):
+        entries = _entries(_tool_use("t1"))
+        index = ToolCallIndex(entries)
+        assert index.get("t1").results == []
+
+        entries.extend(_entries(_tool_result("t1", "ok")))
+        index.update(entries)
+        assert len(index.get("t1").results) == 1
+        index.update(entries)
+        assert len(index.get("t1").results) == 1
+
+    def test_unknown_id(self):
+        assert ToolCallIndex(_entries(_tool_use("t1"))).get("t2") is None
+
+
+class TestSessionProcessorLookups:
+    def test_first_result_and_error_semantics(self):
+        entries = _entries(
+            _tool_use("t1"),
+            _tool_result("t1", "Exit code 2\nboom" + "!" * 600, is_error=True),
+            _tool_result("t1", [{"type": "text", "text": "retry"}, {"type": "text", "text": "ok"}]),
+        )
+        processor = SessionProcessor()
+
+        assert processor._get_tool_result("t1", entries) == "retry\nok"
+        assert len(processor._get_tool_error("t1", entries)) == 500
+        info = processor._get_tool_result_info("t1", entries)
+        assert info["is_error"] is True
+        assert info["exit_code"] == 2
+        assert processor._get_tool_result_info("missing", entries) is None
+
+    def test_agent_id(self):
+        entries = _entries(_tool_use("t1", "Agent"), _tool_result("t1", "done", agent_id="a1"))
+        assert SessionProcessor()._extract_agent_id_from_result("t1", entries) == "a1"
+
+    def test_index_follows_entries_list(self):
+        processor = SessionProcessor()
+        first = _entries(_tool_use("t1"), _tool_result("t1", "one"))
+        second = _entries(_tool_use("t1"), _tool_result("t1", "two"))
+
+        assert processor._get_tool_result("t1", first) == "one"
+        assert processor._get_tool_result("t1", second) == "two"
+
+        first.extend(_entries(_tool_use("t2"), _tool_result("t2", "three")))
+        assert processor._get_tool_result("t2", first) == "three"
+
+
+class TestSharedConsumers:
+    def test_labor_delegation_records_subagent(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        records = synthetic_session(40)
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        labor = LaborExtractor().extract_session_labor(path)
+        delegations = [unit for unit in labor.work_units if unit.unit_type == "delegation"]
+        assert [unit.subagent_id for unit in delegations] == ["agent00001", "agent00021"]
+
+    def test_error_analyzer_attributes_tool(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        records = synthetic_session(100)
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        errors = extract_transcript_errors(path)
+        assert [error.tool_name for error in errors] == ["Bash", "Bash"]
+        assert all(error.hydration_state.recent_prompts for error in errors)
+
+
+class TestScaling:
+    def _group_seconds(self, tool_calls: int) -> float:
+        entries = [Entry.from_dict(record) for record in synthetic_session(tool_calls)]
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            SessionProcessor().group_entries_into_turns(entries)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_grouping_is_linear_in_tool_calls(self):
+        # Linear grows 4x for 4x the tool calls, the old per-call scan 16x
+        small = self._group_seconds(500)
+        large = self._group_seconds(2000)
+        assert large < 8 * small, f"{large * 1000:.0f}ms vs {small * 1000:.0f}ms"
@@ -0,0 +1,284 @@
+"""Tests for lib/transcript_cache.py - incremental transcript reading.
+
+Every read_transcript() result must equal a from-scratch parse and grouping
+of the same file, however the file grew in between.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from lib import transcript_cache
+from lib.transcript_cache import read_transcript
+from lib.transcript_parser import SessionProcessor
+
+
+def _ts(offset: int) -> str:
+    base = datetime(2025, 1, 15, 10, 0, 0, tzinfo=UTC)
+    return (base + timedelta(seconds=offset)).isoformat().replace("+00:00", "Z")
+
+
+def _user(text: str, offset: int, is_meta: bool = False) -> dict:
+    return {
+        "type": "user",
+        "uuid": f"user-{offset}",
+        "timestamp": _ts(offset),
+        "isMeta": is_meta,
+        "message": {"content": [{"type": "text", "text": text}]},
+    }
+
+
+def _assistant_text(text: str, offset: int) -> dict:
+    return {
+        "type": "assistant",
+        "uuid": f"assistant-{offset}",
+        "timestamp": _ts(offset),
+        "message": {
+            "content": [{"type": "text", "text": text}],
+            "usage": {"input_tokens": 10, "output_tokens": offset},
+        },
+    }
+
+
+def _tool_use(tool_id: str, name: str, offset: int, **tool_input) -> dict:
+    return {
+        "type": "assistant",
+        "uuid": f"tool-{offset}",
+        "timestamp": _ts(offset),
+        "message": {
+            "content": [{"type": "tool_use", "id": tool_id, "name": name, "input": tool_input}]
+        },
+    }
+
+
+def _tool_result(tool_id: str, content: str, offset: int, is_error: bool = False) -> dict:
+    return {
+        "type": "user",
+        "uuid": f"result-{offset}",
+        "timestamp": _ts(offset),
+        "message": {
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_id,
+                    "content": content,
+                    "is_error": is_error,
+                }
+            ]
+        },
+    }
+
+
+def _session() -> list[dict]:
+    """A session exercising every grouping rule with cross-entry lookups."""
+    return [
+        {"type": "summary", "summary": "Fix the tests", "timestamp": _ts(0)},
+        _user("<command-name>/commit</command-name>", 1),
+        _user("ARGUMENTS: fix typo", 2, is_meta=True),
+        _assistant_text("Committing.", 3),
+        _tool_use("t1", "Bash", 4, command="git commit"),
+        _tool_result("t1", "Exit code 1\nnothing to commit", 5, is_error=True),
+        _user("Now run the tests", 6),
+        _tool_use("t2", "Bash", 7, command="pytest"),
+        # t3's result only arrives after the next prompt seals its turn
+        _tool_use("t3", "Read", 8, file_path="/x.py"),
+        _tool_result("t2", "5 passed", 9),
+        _user("And the linter   please", 10),
+        _tool_result("t3", "contents", 11),
+        _assistant_text("Done.", 12),
+        _user("Thanks", 13),
+    ]
+
+
+def _full(path: Path):
+    processor = SessionProcessor()
+    _, entries, _ = processor.parse_session_file(path, load_agents=False, load_hooks=False)
+    return entries, processor.group_entries_into_turns(entries, full_mode=True)
+
+
+def _write_lines(path: Path, records: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_cache():
+    transcript_cache.clear_memory_cache()
+    yield
+    transcript_cache.clear_memory_cache()
+
+
+class TestIncrementalEquivalence:
+    def test_line_by_line_appends_match_full_parse(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        path.touch()
+        for record in _session():
+            _write_lines(path, [record])
+            assert read_transcript(path) == _full(path)
+
+    @pytest.mark.parametrize("persisted", [False, True])
+    def test_partial_line_writes_match_full_parse(self, tmp_path: Path, persisted: bool):
+        """A reader may see a line half-written; it must pick it up once complete."""
+        path = tmp_path / "session.jsonl"
+        path.touch()
+        for record in _session():
+            line = json.dumps(record).encode() + b"\n"
+            for chunk in (line[:7], line[7:-1], line[-1:]):
+                with path.open("ab") as f:
+                    f.write(chunk)
+                if persisted:
+                    transcript_cache.clear_memory_cache()
+                assert read_transcript(path) == _full(path)
+
+    def test_late_tool_result_regroups_sealed_turn(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:11])
+        _, turns = read_transcript(path)
+        tool = turns[-2].assistant_sequence[-1]
+        assert tool["tool_name"] == "Read" and "result" not in tool
+
+        _write_lines(path, session[11:])
+        _, turns = read_transcript(path)
+        assert turns[-3].assistant_sequence[-1]["result"] == "contents"
+        assert turns == _full(path)[1]
+
+    def test_hook_log_as_main_file(self, tmp_path: Path):
+        path = tmp_path / "20250115-abcd1234-hooks.jsonl"
+        for i in range(5):
+            _write_lines(
+                path,
+                [{"hook_event": "PreToolUse", "logged_at": _ts(i), "exit_code": 0}],
+            )
+            assert read_transcript(path) == _full(path)
+
+
+class TestIncrementalParsing:
+    def test_only_appended_lines_are_parsed(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:10])
+        read_transcript(path)
+
+        parsed: list[str] = []
+        original = SessionProcessor.parse_jsonl_lines
+
+        def spy(self, file_path, lines):
+            lines = list(lines)
+            parsed.extend(line for line in lines if line.strip())
+            return original(self, file_path, lines)
+
+        monkeypatch.setattr(SessionProcessor, "parse_jsonl_lines", spy)
+        # Persisted cache, as seen by the next hook process
+        transcript_cache.clear_memory_cache()
+        _write_lines(path, session[10:])
+        entries, _ = read_transcript(path)
+
+        assert len(parsed) == len(session) - 10
+        assert len(entries) == len(session)
+
+    def test_cache_is_persisted(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        _write_lines(path, _session())
+        read_transcript(path)
+        assert list(transcript_cache.get_cache_dir().glob("*.pickle"))
+
+    def test_segments_are_appended(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:4])
+        read_transcript(path)
+        (cache_file,) = transcript_cache.get_cache_dir().glob("*.pickle")
+        persisted = cache_file.read_bytes()
+
+        _write_lines(path, session[4:6])
+        read_transcript(path)
+        assert cache_file.read_bytes().startswith(persisted)
+
+        transcript_cache.clear_memory_cache()
+        assert read_transcript(path) == _full(path)
+
+    @pytest.mark.parametrize("damage", [b"torn", b""])
+    def test_broken_segment_chain_is_rewritten(self, tmp_path: Path, damage: bytes):
+        """A torn write, or a segment appended twice by concurrent hooks."""
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:4])
+        read_transcript(path)
+        (cache_file,) = transcript_cache.get_cache_dir().glob("*.pickle")
+        before = cache_file.read_bytes()
+        _write_lines(path, session[4:6])
+        read_transcript(path)
+        segment = cache_file.read_bytes()[len(before) :]
+        with cache_file.open("ab") as f:
+            f.write(damage or segment)
+
+        for records in (session[6:8], session[8:]):
+            transcript_cache.clear_memory_cache()
+            _write_lines(path, records)
+            assert read_transcript(path) == _full(path)
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        _write_lines(path, _session())
+        read_transcript(path)
+        transcript_cache.clear_memory_cache()
+        for cache_file in transcript_cache.get_cache_dir().glob("*.pickle"):
+            cache_file.write_bytes(b"not a pickle")
+        assert read_transcript(path) == _full(path)
+
+
+class TestCacheInvalidation:
+    def test_truncated_file_is_reparsed(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session)
+        read_transcript(path)
+
+        path.write_text("")
+        _write_lines(path, session[:3])
+        assert read_transcript(path) == _full(path)
+
+    def test_rewritten_prefix_is_reparsed(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:6])
+        read_transcript(path)
+
+        # Same length, different content just before the cached offset
+        text = path.read_text().replace("nothing to commit", "nothing to COMMIT")
+        path.write_text(text)
+        _write_lines(path, session[6:])
+        assert read_transcript(path) == _full(path)
+
+    def test_rewritten_start_is_reparsed(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session)
+        read_transcript(path)
+
+        text = path.read_text().replace("Fix the tests", "Fix the specs")
+        path.write_text(text)
+        assert read_transcript(path) == _full(path)
+
+    def test_replaced_file_is_reparsed(self, tmp_path: Path):
+        path = tmp_path / "session.jsonl"
+        session = _session()
+        _write_lines(path, session[:6])
+        read_transcript(path)
+
+        replacement = tmp_path / "replacement.jsonl"
+        _write_lines(replacement, session[:8])
+        replacement.replace(path)
+        assert read_transcript(path) == _full(path)
+
+    def test_disabled_by_env(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("AOPS_CACHE", "0")
+        path = tmp_path / "session.jsonl"
+        _write_lines(path, _session())
+        assert read_transcript(path) == _full(path)
+        assert not list(transcript_cache.get_cache_dir().glob("*.pickle"))
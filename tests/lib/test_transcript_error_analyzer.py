@@ -914,3 +914,78 @@ class TestScanRecentSessions:
         assert "session_summaries" in d
         assert isinstance(d["investigation_queue"], list)
         assert d["investigation_queue"][0]["weighted_score"] > 0
+
+
+class TestScanCache:
+    """Test per-session report caching and the parallel scan."""
+
+    def _error_session(self, tmp_path: Path, name: str, file_path: str) -> Path:
+        path = tmp_path / f"{name}.jsonl"
+        _write_jsonl(
+            path,
+            [
+                _create_user_entry(f"Fix {file_path}", 0),
+                _create_tool_use_entry("Read", {"file_path": file_path}, 10, "tool-10"),
+                _create_tool_result_entry(
+                    "tool-10",
+                    "<tool_use_error>File does not exist.</tool_use_error>",
+                    is_error=True,
+                    offset=11,
+                ),
+            ],
+        )
+        return path
+
+    def test_unchanged_sessions_are_not_reanalysed(self, tmp_path: Path, monkeypatch) -> None:
+        from lib import transcript_error_analyzer
+        from lib.transcript_error_analyzer import scan_recent_sessions
+
+        self._error_session(tmp_path, "session-a", "/src/auth.py")
+        grown = self._error_session(tmp_path, "session-b", "/src/db.py")
+        first = scan_recent_sessions(tmp_path, hours=24, jobs=1)
+
+        analysed = []
+        real_analyze = transcript_error_analyzer.analyze_transcript
+        monkeypatch.setattr(
+            transcript_error_analyzer,
+            "analyze_transcript",
+            lambda path: analysed.append(path.name) or real_analyze(path),
+        )
+        with open(grown, "a") as f:
+            f.write(json.dumps(_create_assistant_entry("Done", 20)) + "\n")
+
+        second = scan_recent_sessions(tmp_path, hours=24, jobs=1)
+        assert analysed == ["session-b.jsonl"]
+        assert second.to_dict() == first.to_dict()
+
+    def test_version_bump_invalidates_cache(self, tmp_path: Path, monkeypatch) -> None:
+        from lib import transcript_error_analyzer
+        from lib.transcript_error_analyzer import scan_recent_sessions
+
+        self._error_session(tmp_path, "session-a", "/src/auth.py")
+        scan_recent_sessions(tmp_path, hours=24, jobs=1)
+
+        analysed = []
+        real_analyze = transcript_error_analyzer.analyze_transcript
+        monkeypatch.setattr(
+            transcript_error_analyzer,
+            "analyze_transcript",
+            lambda path: analysed.append(path.name) or real_analyze(path),
+        )
+        monkeypatch.setattr(transcript_error_analyzer, "ANALYZER_VERSION", 999)
+        scan_recent_sessions(tmp_path, hours=24, jobs=1)
+        assert analysed == ["session-a.jsonl"]
+
+    def test_parallel_scan_matches_serial(self, tmp_path: Path, monkeypatch) -> None:
+        from lib.transcript_error_analyzer import scan_recent_sessions
+
+        monkeypatch.setenv("AOPS_CACHE", "0")
+        for i, name in enumerate(["auth.py", "auth.py", "db.py"]):
+            self._error_session(tmp_path, f"session-{i}", f"/src/{name}")
+        (tmp_path / "session-corrupt.jsonl").write_text("{not json\n")
+
+        serial = scan_recent_sessions(tmp_path, hours=24, jobs=1)
+        parallel = scan_recent_sessions(tmp_path, hours=24, jobs=2)
+
+        assert parallel.sessions_scanned == 3
+        assert parallel.to_dict() == serial.to_dict()
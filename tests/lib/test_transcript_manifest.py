@@ -0,0 +1,162 @@
+"""Tests for lib/transcript_manifest.py - transcript freshness without globbing."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from lib.transcript_manifest import TranscriptManifest, source_fingerprint
+
+NAMES = [
+    "20260105-17-writing-3bf94f77-session-full.md",
+    "20260105-17-writing-3bf94f77-session-abridged.md",
+    "20260105-writing-3bf94f77-full.md",  # Legacy, no hour or slug
+    "20260106-09-aops-core-a5234d3e-fix-tests-full.md",
+    "20260106-09-aops-core-a5234d3e-fix-tests-abridged.md",
+    "20260107-10-3bf94f77-other-abcdef12-full.md",  # Project named like an ID
+    "3bf94f77-20260108-full.md",  # ID as the first field never matched
+    "20260109-11-proj-agent-a1-full.md",
+    "notes.md",
+]
+
+
+def _glob_transcripts(out_dir: Path, session_id: str) -> set[Path]:
+    """The per-session globbing the manifest replaces."""
+    matches: set[Path] = set()
+    for suffix in ("-full.md", "-abridged.md"):
+        matches.update(out_dir.glob(f"*-??-*-{session_id}-*{suffix}"))
+        matches.update(out_dir.glob(f"*-??-*-{session_id}{suffix}"))
+        matches.update(out_dir.glob(f"*-{session_id}-*{suffix}"))
+        matches.update(out_dir.glob(f"*-{session_id}{suffix}"))
+    return matches
+
+
+@pytest.fixture
+def out_dir(tmp_path: Path) -> Path:
+    out_dir = tmp_path / "transcripts"
+    out_dir.mkdir()
+    for name in NAMES:
+        (out_dir / name).write_text(name)
+    return out_dir
+
+
+def _session(tmp_path: Path, content: str = '{"type": "user"}\n') -> Path:
+    path = tmp_path / "3bf94f77-0000-4000-8000-000000000000.jsonl"
+    path.write_text(content)
+    return path
+
+
+class TestLookup:
+    @pytest.mark.parametrize(
+        "session_id", ["3bf94f77", "a5234d3e", "abcdef12", "20260108", "agent-a1", "missing0"]
+    )
+    def test_matches_globbing(self, out_dir: Path, session_id: str):
+        manifest = TranscriptManifest.load(out_dir)
+        assert set(manifest.transcripts(session_id)) == _glob_transcripts(out_dir, session_id)
+
+    def test_full_transcript(self, out_dir: Path):
+        manifest = TranscriptManifest.load(out_dir)
+        assert manifest.full_transcript("a5234d3e").name.endswith("-fix-tests-full.md")
+        assert manifest.full_transcript("missing0") is None
+
+
+class TestPersistence:
+    def test_unchanged_directory_is_not_rescanned(self, out_dir: Path, monkeypatch):
+        TranscriptManifest.load(out_dir).save()
+
+        def fail(self):
+            raise AssertionError("rescanned")
+
+        monkeypatch.setattr(TranscriptManifest, "rescan", fail)
+        manifest = TranscriptManifest.load(out_dir)
+        assert len(manifest.transcripts("3bf94f77")) == 4
+
+    def test_changed_directory_is_rescanned(self, out_dir: Path):
+        TranscriptManifest.load(out_dir).save()
+        (out_dir / "20260110-12-proj-feedbeef-new-full.md").write_text("new")
+        (out_dir / NAMES[3]).unlink()
+
+        manifest = TranscriptManifest.load(out_dir)
+        assert manifest.full_transcript("feedbeef") is not None
+        assert manifest.full_transcript("a5234d3e") is None
+
+    def test_files_added_by_others_during_a_batch_are_found(self, out_dir: Path):
+        manifest = TranscriptManifest.load(out_dir)
+        (out_dir / "20260110-12-proj-feedbeef-other-full.md").write_text("other process")
+        written = out_dir / "20260110-12-proj-0badcafe-mine-full.md"
+        written.write_text("this process")
+        manifest.update("0badcafe", removed=[], written=[written], source=None)
+        manifest.save()
+
+        reloaded = TranscriptManifest.load(out_dir)
+        assert reloaded.full_transcript("feedbeef") is not None
+        assert reloaded.full_transcript("0badcafe") == written
+
+    def test_corrupt_manifest_is_rebuilt(self, out_dir: Path):
+        manifest = TranscriptManifest.load(out_dir)
+        manifest.save()
+        manifest.path.write_text("{not json")
+        assert len(TranscriptManifest.load(out_dir).transcripts("3bf94f77")) == 4
+
+    def test_update_is_saved(self, out_dir: Path, tmp_path: Path):
+        session = _session(tmp_path)
+        manifest = TranscriptManifest.load(out_dir)
+        old = manifest.transcripts("3bf94f77")
+        for path in old:
+            path.unlink()
+        new = [out_dir / "20260111-08-writing-3bf94f77-renamed-full.md"]
+        new[0].write_text("regenerated")
+        source = source_fingerprint(session)
+        source.files = [new[0].name]
+        manifest.update("3bf94f77", removed=old, written=new, source=source)
+        manifest.save()
+
+        reloaded = TranscriptManifest.load(out_dir)
+        assert reloaded.transcripts("3bf94f77") == new
+        assert reloaded.sources["3bf94f77"] == source
+
+
+class TestFreshness:
+    def _recorded(self, out_dir: Path, session: Path) -> TranscriptManifest:
+        manifest = TranscriptManifest.load(out_dir)
+        source = source_fingerprint(session)
+        source.files = sorted(path.name for path in manifest.transcripts("3bf94f77"))
+        manifest.update("3bf94f77", removed=[], written=[], source=source)
+        return manifest
+
+    def test_unchanged_source_is_current(self, out_dir: Path, tmp_path: Path):
+        session = _session(tmp_path)
+        assert self._recorded(out_dir, session).is_current("3bf94f77", session)
+
+    def test_touched_source_with_same_content_is_current(self, out_dir: Path, tmp_path: Path):
+        session = _session(tmp_path)
+        manifest = self._recorded(out_dir, session)
+        stat = session.stat()
+        os.utime(session, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert manifest.is_current("3bf94f77", session)
+
+    def test_changed_source_is_stale(self, out_dir: Path, tmp_path: Path):
+        session = _session(tmp_path)
+        manifest = self._recorded(out_dir, session)
+        stat = session.stat()
+        session.write_text('{"type": "user!"}\n')
+        os.utime(session, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert not manifest.is_current("3bf94f77", session)
+
+    def test_changed_transcript_files_fall_back_to_mtimes(self, out_dir: Path, tmp_path: Path):
+        session = _session(tmp_path)
+        manifest = self._recorded(out_dir, session)
+        extra = out_dir / "20260112-08-writing-3bf94f77-extra-abridged.md"
+        extra.write_text("extra")
+        manifest.update("other", removed=[], written=[extra], source=None)
+
+        full = manifest.full_transcript("3bf94f77")
+        stat = session.stat()
+        os.utime(full, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        assert not manifest.is_current("3bf94f77", session)
+        os.utime(full, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert manifest.is_current("3bf94f77", session)
+
+    def test_no_transcript_is_stale(self, out_dir: Path, tmp_path: Path):
+        assert not TranscriptManifest.load(out_dir).is_current("missing0", _session(tmp_path))
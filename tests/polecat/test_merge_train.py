@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Tests for the Engineer's merge train, against local git repos.
+
+A bare repo stands in for origin; the project's local clone is where the
+refinery merges. Each task's polecat branch adds one file.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from engineer import Engineer  # noqa: E402
+from lib.task_model import TaskStatus, TaskType  # noqa: E402
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture()
+def local(tmp_path: Path) -> Path:
+    origin = tmp_path / "origin.git"
+    _git(["init", "--bare", "-b", "main", str(origin)], cwd=tmp_path)
+    local = tmp_path / "local"
+    _git(["clone", str(origin), str(local)], cwd=tmp_path)
+    _git(["checkout", "-b", "main"], cwd=local)
+    _git(["config", "user.email", "test@test.example"], cwd=local)
+    _git(["config", "user.name", "Test User"], cwd=local)
+    (local / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    (local / "shared.txt").write_text("original\n")
+    _git(["add", "."], cwd=local)
+    _git(["commit", "-m", "init"], cwd=local)
+    _git(["push", "-u", "origin", "main"], cwd=local)
+    return local
+
+
+@pytest.fixture()
+def runs(tmp_path: Path) -> Path:
+    """Log with a line per test command run."""
+    return tmp_path / "test-runs.log"
+
+
+def _run_count(runs: Path) -> int:
+    return len(runs.read_text().splitlines()) if runs.exists() else 0
+
+
+@pytest.fixture()
+def engineer(tmp_path: Path, local: Path, runs: Path, monkeypatch) -> Engineer:
+    data_dir = tmp_path / "aca_data"
+    data_dir.mkdir(exist_ok=True)
+    monkeypatch.setenv("ACA_DATA", str(data_dir))
+    home = tmp_path / "polecat_home"
+    home.mkdir()
+    config = {"projects": {"test": {"path": str(local), "default_branch": "main"}}}
+    (home / "polecat.yaml").write_text(yaml.dump(config))
+    monkeypatch.setenv("POLECAT_HOME", str(home))
+
+    engineer = Engineer()
+    # Fails when any merged task added bad.txt
+    engineer.test_cmd = [
+        sys.executable,
+        "-c",
+        f"import os, sys; open({str(runs)!r}, 'a').write('run\\n'); "
+        "sys.exit(os.path.exists('bad.txt'))",
+    ]
+    goal = engineer.storage.create_task(title="Goal", project="test", type=TaskType.GOAL)
+    engineer.storage.save_task(goal)
+    return engineer
+
+
+def _goal_id(engineer: Engineer) -> str:
+    return engineer.storage.list_tasks(type=TaskType.GOAL)[0].id
+
+
+def _merge_ready(engineer: Engineer, local: Path, title: str, files: dict[str, str]):
+    """Create a MERGE_READY task whose pushed branch writes files."""
+    task = engineer.storage.create_task(title=title, project="test", parent=_goal_id(engineer))
+    branch = f"polecat/{task.id}"
+    _git(["checkout", "-b", branch, "main"], cwd=local)
+    for name, content in files.items():
+        (local / name).write_text(content)
+    _git(["add", "."], cwd=local)
+    _git(["commit", "-m", title], cwd=local)
+    _git(["push", "origin", branch], cwd=local)
+    _git(["checkout", "main"], cwd=local)
+    task.status = TaskStatus.MERGE_READY
+    engineer.storage.save_task(task)
+    return task
+
+
+def _status(engineer: Engineer, task) -> TaskStatus:
+    return engineer.storage.get_task(task.id).status
+
+
+def _origin_files(local: Path) -> set[str]:
+    _git(["fetch", "origin"], cwd=local)
+    return set(_git(["ls-tree", "--name-only", "origin/main"], cwd=local).splitlines())
+
+
+class TestMergeTrain:
+    def test_passing_train_tests_once(
+        self, engineer: Engineer, local: Path, runs: Path, capsys
+    ) -> None:
+        tasks = [_merge_ready(engineer, local, f"Add {n}", {f"{n}.txt": n}) for n in "abc"]
+
+        engineer.merge_train(tasks)
+
+        assert _run_count(runs) == 1
+        assert all(_status(engineer, t) == TaskStatus.DONE for t in tasks)
+        assert {"a.txt", "b.txt", "c.txt"} <= _origin_files(local)
+        assert not _git(["ls-remote", "--heads", "origin", "polecat/*"], cwd=local)
+        assert capsys.readouterr().err.count("type=merge_attempt") == 3
+
+    def test_failing_task_is_bisected_out(self, engineer: Engineer, local: Path, capsys) -> None:
+        good = [_merge_ready(engineer, local, f"Add {n}", {f"{n}.txt": n}) for n in "ab"]
+        bad = _merge_ready(engineer, local, "Break", {"bad.txt": "x"})
+        last = _merge_ready(engineer, local, "Add d", {"d.txt": "d"})
+
+        engineer.merge_train([*good, bad, last])
+
+        assert _status(engineer, bad) == TaskStatus.REVIEW
+        assert "Tests failed" in engineer.storage.get_task(bad.id).body
+        for task in (*good, last):
+            assert _status(engineer, task) == TaskStatus.DONE
+        files = _origin_files(local)
+        assert {"a.txt", "b.txt", "d.txt"} <= files
+        assert "bad.txt" not in files
+        assert "failure_reason=tests_failed" in capsys.readouterr().err
+
+    def test_conflicting_task_is_dropped(self, engineer: Engineer, local: Path) -> None:
+        first = _merge_ready(engineer, local, "Edit one way", {"shared.txt": "one\n"})
+        second = _merge_ready(engineer, local, "Edit another way", {"shared.txt": "two\n"})
+
+        engineer.merge_train([first, second])
+
+        assert _status(engineer, first) == TaskStatus.DONE
+        assert _status(engineer, second) == TaskStatus.REVIEW
+        assert "Merge conflicts detected" in engineer.storage.get_task(second.id).body
+        assert _git(["show", "origin/main:shared.txt"], cwd=local) == "one"
+
+    def test_missing_branch_fails_only_that_task(self, engineer: Engineer, local: Path) -> None:
+        task = _merge_ready(engineer, local, "Add a", {"a.txt": "a"})
+        ghost = engineer.storage.create_task(
+            title="No branch", project="test", parent=_goal_id(engineer)
+        )
+        ghost.status = TaskStatus.MERGE_READY
+        engineer.storage.save_task(ghost)
+
+        engineer.merge_train([task, ghost])
+
+        assert _status(engineer, task) == TaskStatus.DONE
+        assert _status(engineer, ghost) == TaskStatus.REVIEW
+
+    def test_scan_limits_train_size(self, engineer: Engineer, local: Path, runs: Path) -> None:
+        tasks = [_merge_ready(engineer, local, f"Add {n}", {f"{n}.txt": n}) for n in "abc"]
+
+        engineer.scan_and_merge(train_size=2)
+
+        statuses = [_status(engineer, t) for t in tasks]
+        assert statuses.count(TaskStatus.DONE) == 2
+        assert statuses.count(TaskStatus.MERGE_READY) == 1
+        assert _run_count(runs) == 1
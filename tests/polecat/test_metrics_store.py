@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Tests for aggregated polecat metrics: MetricsStore, Prometheus output, summaries."""
+
+import io
+import json
+import sys
+from contextlib import redirect_stderr
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import yaml
+from click.testing import CliRunner
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from observability import (  # noqa: E402
+    MetricsStore,
+    PolecatMetrics,
+    percentile,
+    read_events,
+    summarize,
+)
+
+
+def _since_yesterday() -> datetime:
+    return datetime.now(UTC) - timedelta(days=1)
+
+
+class TestMetricsStore:
+    def test_flush_writes_prometheus_histogram(self, tmp_path: Path) -> None:
+        store = MetricsStore(tmp_path)
+        for ms in (3, 40, 40, 2000):
+            store.observe("operation", ms, operation="sync", project="aops", success=True)
+        store.flush()
+
+        prom = (tmp_path / "polecat.prom").read_text()
+        labels = 'operation="sync",project="aops",success="True"'
+        assert "# TYPE polecat_operation_duration_ms histogram" in prom
+        assert f'polecat_operation_duration_ms_bucket{{{labels},le="5"}} 1' in prom
+        assert f'polecat_operation_duration_ms_bucket{{{labels},le="50"}} 3' in prom
+        assert f'polecat_operation_duration_ms_bucket{{{labels},le="+Inf"}} 4' in prom
+        assert f"polecat_operation_duration_ms_count{{{labels}}} 4" in prom
+        assert f"polecat_operation_duration_ms_sum{{{labels}}} 2083" in prom
+
+    def test_totals_accumulate_across_processes(self, tmp_path: Path) -> None:
+        for _ in range(2):
+            # Each store stands in for a separate polecat process
+            store = MetricsStore(tmp_path)
+            store.observe("lock_timeout", 30000, lock="worktree_creation")
+            store.observe("queue_depth", 4, queue="ready", project="aops")
+            store.flush()
+
+        prom = (tmp_path / "polecat.prom").read_text()
+        assert 'polecat_lock_timeouts_total{lock="worktree_creation"} 2' in prom
+        assert 'polecat_queue_depth{project="aops",queue="ready"} 4' in prom
+        assert len(read_events(tmp_path, _since_yesterday())) == 4
+
+    def test_observe_flushes_when_due(self, tmp_path: Path) -> None:
+        store = MetricsStore(tmp_path, flush_interval=0)
+        store.observe("lock_wait", 12.5, lock="mirror_sync", acquired=True)
+        assert (tmp_path / "polecat.prom").exists()
+
+    def test_old_event_files_are_pruned(self, tmp_path: Path) -> None:
+        old = tmp_path / "events-2000-01-01.jsonl"
+        old.write_text("{}\n")
+        store = MetricsStore(tmp_path)
+        store.observe("merge", 100, success=True)
+        store.flush()
+        assert not old.exists()
+
+    def test_unwritable_directory_does_not_raise(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        store = MetricsStore(blocker / "metrics")
+        store.observe("merge", 100, success=True)
+        err = io.StringIO()
+        with redirect_stderr(err):
+            store.flush()
+        assert "Failed to flush metrics" in err.getvalue()
+
+
+class TestSummaries:
+    def test_percentile_interpolates(self) -> None:
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.5
+        assert percentile(values, 95) == 95.05
+        assert percentile([7.0], 99) == 7.0
+
+    def test_summarize_groups_by_name_and_project(self, tmp_path: Path) -> None:
+        store = MetricsStore(tmp_path)
+        for ms in range(1, 101):
+            store.observe("operation", ms, operation="sync", project="aops", success=True)
+        store.observe("operation", 5, operation="sync", project="other", success=True)
+        store.observe("queue_depth", 3, queue="ready", project="aops")
+        store.observe("queue_depth", 1, queue="ready", project="aops")
+        store.flush()
+
+        rows = summarize(read_events(tmp_path, _since_yesterday()))
+
+        sync_aops = next(r for r in rows if r["name"] == "sync" and r["project"] == "aops")
+        assert sync_aops["count"] == 100
+        assert sync_aops["p95"] == 95.05
+        assert sync_aops["max"] == 100
+        depth = next(r for r in rows if r["kind"] == "queue_depth")
+        assert (depth["last"], depth["max"]) == (1, 3)
+
+    def test_read_events_skips_torn_lines(self, tmp_path: Path) -> None:
+        today = datetime.now(UTC).date().isoformat()
+        event = {"ts": datetime.now(UTC).timestamp(), "kind": "merge", "value": 1}
+        (tmp_path / f"events-{today}.jsonl").write_text(json.dumps(event) + '\n{"ts": 1')
+        assert len(read_events(tmp_path, _since_yesterday())) == 1
+
+
+class TestPolecatMetricsStore:
+    def test_metrics_feed_the_store(self, tmp_path: Path) -> None:
+        metrics = PolecatMetrics()
+        store = metrics.enable_store(tmp_path)
+        with redirect_stderr(io.StringIO()):
+            with metrics.time_operation("sync", project="aops"):
+                pass
+            metrics.record_lock_wait("worktree_creation", 150.5)
+            metrics.record_merge_attempt("t-1", success=False, duration_ms=10, failure_reason="x")
+        store.flush()
+
+        kinds = [e["kind"] for e in read_events(tmp_path, _since_yesterday())]
+        assert kinds == ["operation", "lock_wait", "merge"]
+
+    def test_merges_are_grouped_by_project(self, tmp_path: Path) -> None:
+        metrics = PolecatMetrics()
+        store = metrics.enable_store(tmp_path)
+        with redirect_stderr(io.StringIO()):
+            metrics.record_merge_attempt("t-1", success=True, duration_ms=10, project="aops")
+            metrics.record_merge_attempt("t-2", success=True, duration_ms=20, project="site")
+        store.flush()
+
+        rows = summarize(read_events(tmp_path, _since_yesterday()))
+        merges = {r["project"]: r["count"] for r in rows if r["kind"] == "merge"}
+        assert merges == {"aops": 1, "site": 1}
+
+    def test_without_store_nothing_is_written(self, tmp_path: Path) -> None:
+        metrics = PolecatMetrics()
+        with redirect_stderr(io.StringIO()):
+            metrics.record_queue_depth("ready", 3)
+        assert metrics.store is None
+
+
+def test_metrics_command(tmp_path: Path, monkeypatch) -> None:
+    from cli import main
+
+    monkeypatch.setenv("ACA_DATA", str(tmp_path / "aca_data"))
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / "polecat.yaml").write_text(yaml.dump({"projects": {}}))
+    store = MetricsStore(home / "metrics")
+    for ms in (10, 20, 30):
+        store.observe("operation", ms, operation="sync", project="aops", success=True)
+    store.flush()
+
+    result = CliRunner().invoke(main, ["--home", str(home), "metrics", "-p", "aops"])
+
+    assert result.exit_code == 0, result.output
+    assert "Operation latency (ms)" in result.output
+    assert "sync" in result.output
+    assert "20.0" in result.output  # p50
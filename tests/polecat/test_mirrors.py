@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for concurrent mirror initialisation and sync in PolecatManager.
+
+Each project is a local clone of a bare repo that stands in for origin.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from manager import PolecatManager  # noqa: E402
+
+PROJECTS = ["alpha", "beta", "gamma"]
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, name: str) -> str:
+    (repo / name).write_text(f"{name}\n")
+    _git(["add", "."], cwd=repo)
+    _git(["-c", "user.name=Test", "-c", "user.email=t@example.com", "commit", "-m", name], repo)
+    return _git(["rev-parse", "HEAD"], cwd=repo)
+
+
+@pytest.fixture()
+def origins(tmp_path: Path) -> dict[str, Path]:
+    """A bare origin per project, each with one commit on main."""
+    origins = {}
+    for project in PROJECTS:
+        origin = tmp_path / "origins" / f"{project}.git"
+        _git(["init", "--bare", "-b", "main", str(origin)], cwd=tmp_path)
+        seed = tmp_path / "seeds" / project
+        _git(["clone", str(origin), str(seed)], cwd=tmp_path)
+        _git(["checkout", "-b", "main"], cwd=seed)
+        _commit(seed, "README.md")
+        _git(["push", "origin", "main"], cwd=seed)
+        origins[project] = origin
+    return origins
+
+
+@pytest.fixture()
+def manager(tmp_path: Path, origins: dict[str, Path], monkeypatch) -> PolecatManager:
+    data_dir = tmp_path / "aca_data"
+    data_dir.mkdir(exist_ok=True)
+    monkeypatch.setenv("ACA_DATA", str(data_dir))
+
+    projects = {}
+    for project, origin in origins.items():
+        local = tmp_path / "local" / project
+        _git(["clone", str(origin), str(local)], cwd=tmp_path)
+        projects[project] = {"path": str(local), "default_branch": "main"}
+    home = tmp_path / "polecat_home"
+    home.mkdir()
+    (home / "polecat.yaml").write_text(yaml.dump({"projects": projects}))
+    return PolecatManager(home_dir=home)
+
+
+class TestInitAllMirrors:
+    def test_clones_every_project_concurrently(self, manager: PolecatManager) -> None:
+        results = manager.init_all_mirrors(jobs=3)
+
+        assert set(results) == set(PROJECTS)
+        for project, path in results.items():
+            assert path == manager.repos_dir / f"{project}.git"
+            assert _git(["rev-parse", "--is-bare-repository"], cwd=path) == "true"
+
+    def test_failures_are_collected_not_raised(
+        self, manager: PolecatManager, tmp_path: Path, capsys
+    ) -> None:
+        manager.projects["beta"]["path"] = tmp_path / "missing"
+
+        results = manager.init_all_mirrors(jobs=2)
+
+        assert results["beta"] is None
+        assert results["alpha"] and results["gamma"]
+        err = capsys.readouterr().err
+        assert "1/3 mirrors failed" in err
+        assert "beta: Source repo not found" in err
+
+    def test_timeout_fails_project(self, manager: PolecatManager, capsys) -> None:
+        results = manager.init_all_mirrors(jobs=2, timeout=0)
+
+        assert all(path is None for path in results.values())
+        assert "timed out running git clone" in capsys.readouterr().err
+        # A timed-out clone leaves nothing behind
+        assert not any(manager.repos_dir.iterdir())
+
+    def test_emits_span_per_project(self, manager: PolecatManager, capsys) -> None:
+        manager.init_all_mirrors(jobs=3)
+
+        err = capsys.readouterr().err
+        assert "type=mirror_init_latency" in err
+        for project in PROJECTS:
+            assert f"project={project}" in err
+
+
+class TestSyncAllMirrors:
+    def test_fetches_new_commits(
+        self, manager: PolecatManager, origins: dict[str, Path], tmp_path: Path
+    ) -> None:
+        manager.init_all_mirrors(jobs=3)
+        pusher = tmp_path / "pusher"
+        _git(["clone", str(origins["alpha"]), str(pusher)], cwd=tmp_path)
+        head = _commit(pusher, "new.txt")
+        _git(["push", "origin", "main"], cwd=pusher)
+
+        results = manager.sync_all_mirrors(jobs=3)
+
+        assert results == dict.fromkeys(PROJECTS, True)
+        mirror = manager.repos_dir / "alpha.git"
+        assert _git(["rev-parse", "refs/heads/main"], cwd=mirror) == head
+
+    def test_missing_mirror_and_failed_fetch(self, manager: PolecatManager, capsys) -> None:
+        manager.init_all_mirrors(jobs=3)
+        subprocess.run(["rm", "-rf", str(manager.repos_dir / "gamma.git")], check=True)
+        _git(
+            ["remote", "set-url", "origin", "/nonexistent/repo.git"], manager.repos_dir / "beta.git"
+        )
+
+        results = manager.sync_all_mirrors(jobs=3)
+
+        assert results == {"alpha": True, "beta": False, "gamma": False}
+        out, err = capsys.readouterr()
+        assert "gamma: no mirror" in out
+        assert "1/2 mirrors failed" in err
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Tests for the supervisor loop's streaming dispatch and adaptive concurrency."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+import supervisor_loop  # noqa: E402
+from observability import MetricsStore  # noqa: E402
+from supervisor_loop import ConcurrencyController, WorkerPool  # noqa: E402
+
+
+class FakeProc:
+    """Stands in for a worker process that finishes after some polls."""
+
+    # task_id -> (polls before exit, exit code)
+    plan: dict[str, tuple[int, int]] = {}
+
+    def __init__(self, cmd, **kwargs):
+        self.task_id = cmd[cmd.index("-t") + 1]
+        self.remaining, self.exit_code = self.plan.get(self.task_id, (0, 0))
+        self.returncode = None
+
+    def poll(self):
+        if self.remaining > 0:
+            self.remaining -= 1
+            return None
+        self.returncode = self.exit_code
+        return self.returncode
+
+
+@pytest.fixture()
+def fake_workers(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("AOPS", str(tmp_path))
+    monkeypatch.setenv("POLECAT_HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(supervisor_loop.subprocess, "Popen", FakeProc)
+    monkeypatch.setattr(supervisor_loop, "POLL_INTERVAL", 0)
+    monkeypatch.setattr(supervisor_loop.os, "getloadavg", lambda: (0.0, 0.0, 0.0))
+    FakeProc.plan = {}
+    return FakeProc.plan
+
+
+def _pair(task_id: str) -> dict:
+    return {"task_id": task_id, "runner": "claude"}
+
+
+class TestWorkerPool:
+    def test_wait_any_returns_first_finished(self, fake_workers) -> None:
+        fake_workers.update({"slow": (50, 0), "fast": (1, 0)})
+        pool = WorkerPool("proj")
+        pool.start(_pair("slow"))
+        pool.start(_pair("fast"))
+
+        finished = pool.wait_any()
+
+        assert [r["task_id"] for r in finished] == ["fast"]
+        assert pool.in_flight() == [_pair("slow")]
+        assert [r["task_id"] for r in pool.wait_all()] == ["slow"]
+
+    def test_dry_run_finishes_immediately(self) -> None:
+        pool = WorkerPool("proj", dry_run=True)
+        pool.start(_pair("t1"))
+        assert pool.wait_any() == [
+            {"task_id": "t1", "runner": "claude", "exit_code": 0, "dry_run": True}
+        ]
+        assert pool.wait_any() == []
+
+
+class TestConcurrencyController:
+    def test_grows_to_max_without_pressure(self, fake_workers, tmp_path: Path) -> None:
+        controller = ConcurrencyController(3, metrics_dir=tmp_path)
+        controller.limit = 1
+        assert [controller.update() for _ in range(3)] == [2, 3, 3]
+
+    def test_halves_on_load(self, fake_workers, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(supervisor_loop.os, "getloadavg", lambda: (1e6, 0.0, 0.0))
+        controller = ConcurrencyController(8, metrics_dir=tmp_path)
+        assert controller.update() == 4
+        assert "load" in controller.pressure()
+
+    def test_halves_on_lock_contention(self, fake_workers, tmp_path: Path) -> None:
+        controller = ConcurrencyController(4, metrics_dir=tmp_path)
+        store = MetricsStore(tmp_path)
+        store.observe("lock_timeout", 30000, lock="worktree_creation")
+        store.flush()
+
+        assert controller.update() == 2
+        # Only metrics flushed since the last check count
+        assert controller.update() == 3
+
+    def test_long_lock_waits_are_pressure(self, fake_workers, tmp_path: Path) -> None:
+        controller = ConcurrencyController(4, metrics_dir=tmp_path)
+        store = MetricsStore(tmp_path)
+        for _ in range(5):
+            store.observe("lock_wait", 20000, lock="mirror_sync", acquired=True)
+        store.flush()
+        assert controller.pressure().startswith("p95 lock wait")
+
+
+class TestStreamingLoop:
+    def test_free_slots_are_refilled_while_slow_worker_runs(
+        self, fake_workers, monkeypatch
+    ) -> None:
+        fake_workers.update({"slow": (100, 0), "fast": (2, 0), "next": (2, 0)})
+        decisions = iter(
+            [
+                [_pair("slow"), _pair("fast")],
+                [_pair("next")],
+                [],
+                [],
+            ]
+        )
+        prompts = []
+
+        def build_prompt(project, max_pairs, previous, round_num, state, in_flight):
+            prompts.append((max_pairs, previous, [p["task_id"] for p in in_flight]))
+            return "prompt"
+
+        monkeypatch.setattr(supervisor_loop, "build_supervisor_prompt", build_prompt)
+        monkeypatch.setattr(
+            supervisor_loop,
+            "call_supervisor_llm",
+            lambda *a: {"safe_to_continue": True, "pairs": next(decisions), "reasoning": ""},
+        )
+        monkeypatch.setattr(supervisor_loop, "_install_signal_handlers", lambda: None)
+
+        with pytest.raises(SystemExit) as exc:
+            supervisor_loop.supervisor_loop("proj", 2, 10, "claude", None, dry_run=False)
+
+        # Exits cleanly once nothing is selected and nothing is running
+        assert exc.value.code == 0
+        # Round 2 was planned as soon as "fast" finished, with "slow" still running
+        assert prompts[1][0] == 1
+        assert [r["task_id"] for r in prompts[1][1]] == ["fast"]
+        assert prompts[1][2] == ["slow"]
+
+        history = supervisor_loop.load_state("proj")["history"]
+        recorded = [r["task_id"] for entry in history for r in entry["pairs"]]
+        assert sorted(recorded) == ["fast", "next", "slow"]
+
+    def test_run_of_failures_halts(self, fake_workers, monkeypatch) -> None:
+        fake_workers.update({"a": (0, 1), "b": (1, 1)})
+        monkeypatch.setattr(supervisor_loop, "build_supervisor_prompt", lambda *a: "prompt")
+        monkeypatch.setattr(
+            supervisor_loop,
+            "call_supervisor_llm",
+            lambda *a: {
+                "safe_to_continue": True,
+                "pairs": [_pair("a"), _pair("b")],
+                "reasoning": "",
+            },
+        )
+        monkeypatch.setattr(supervisor_loop, "_install_signal_handlers", lambda: None)
+
+        with pytest.raises(SystemExit) as exc:
+            supervisor_loop.supervisor_loop("proj", 2, 10, "claude", None, dry_run=False)
+
+        assert exc.value.code == 1
+        history = supervisor_loop.load_state("proj")["history"]
+        assert {r["task_id"] for entry in history for r in entry["pairs"]} == {"a", "b"}
+
+    def _lower_limit_after_first_round(self, fake_workers, monkeypatch, decisions) -> None:
+        fake_workers.update({"slow": (100, 1), "fast": (2, 1)})
+        decisions = iter(decisions)
+        monkeypatch.setattr(supervisor_loop, "build_supervisor_prompt", lambda *a: "prompt")
+        monkeypatch.setattr(
+            supervisor_loop,
+            "call_supervisor_llm",
+            lambda *a: {"safe_to_continue": True, "pairs": next(decisions), "reasoning": ""},
+        )
+        monkeypatch.setattr(supervisor_loop, "_install_signal_handlers", lambda: None)
+
+        # Concurrency drops to 1 with "slow" still running: no free slot
+        def update(self):
+            self.limit = 1
+            return self.limit
+
+        monkeypatch.setattr(ConcurrencyController, "update", update)
+
+    def test_workers_finishing_without_a_free_slot_are_recorded(
+        self, fake_workers, monkeypatch
+    ) -> None:
+        self._lower_limit_after_first_round(
+            fake_workers, monkeypatch, [[_pair("slow"), _pair("fast")], []]
+        )
+        fake_workers["slow"] = (100, 0)
+
+        with pytest.raises(SystemExit) as exc:
+            supervisor_loop.supervisor_loop("proj", 2, 10, "claude", None, dry_run=False)
+
+        assert exc.value.code == 0
+        history = supervisor_loop.load_state("proj")["history"]
+        recorded = [r["task_id"] for entry in history for r in entry["pairs"]]
+        assert sorted(recorded) == ["fast", "slow"]
+
+    def test_failures_finishing_without_a_free_slot_halt(self, fake_workers, monkeypatch) -> None:
+        self._lower_limit_after_first_round(
+            fake_workers, monkeypatch, [[_pair("slow"), _pair("fast")], []]
+        )
+
+        with pytest.raises(SystemExit) as exc:
+            supervisor_loop.supervisor_loop("proj", 2, 10, "claude", None, dry_run=False)
+
+        assert exc.value.code == 1
+        history = supervisor_loop.load_state("proj")["history"]
+        assert history[-1]["exit_reason"] == "all_workers_failed"
+        assert [r["task_id"] for r in history[-1]["pairs"]] == ["slow"]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for warm swarm workers that run polecat cycles in-process."""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+import swarm  # noqa: E402
+from lib.task_model import TaskType  # noqa: E402
+from observability import metrics  # noqa: E402
+from swarm import WarmRunner, format_phases, run_args  # noqa: E402
+
+
+@pytest.fixture()
+def home(tmp_path: Path) -> Path:
+    home = tmp_path / "polecat_home"
+    home.mkdir()
+    config = {"projects": {"test": {"path": str(tmp_path / "missing"), "default_branch": "main"}}}
+    (home / "polecat.yaml").write_text(yaml.dump(config))
+    return home
+
+
+class TestRunArgs:
+    def test_claude(self) -> None:
+        assert run_args("claude", None, "bot") == ["run", "-c", "bot"]
+
+    def test_gemini_with_project_and_home(self) -> None:
+        assert run_args("gemini", "aops", "bot", "/h") == [
+            "--home",
+            "/h",
+            "run",
+            "-c",
+            "bot",
+            "-g",
+            "-p",
+            "aops",
+        ]
+
+
+class TestWarmRunner:
+    def test_empty_queue_exits_3(self, home: Path) -> None:
+        runner = WarmRunner(str(home))
+        exit_code, phases = runner.run_cycle(run_args("claude", "test", "bot", str(home)))
+        assert exit_code == 3
+        assert phases == {}
+
+    def test_cycles_share_the_manager(self, home: Path, monkeypatch) -> None:
+        runner = WarmRunner(str(home))
+        seen = []
+        claim = runner.manager.claim_next_task
+
+        def record(caller, project=None):
+            seen.append(runner.manager)
+            return claim(caller, project)
+
+        monkeypatch.setattr(runner.manager, "claim_next_task", record)
+        for _ in range(2):
+            runner.run_cycle(run_args("claude", "test", "bot", str(home)))
+        assert seen == [runner.manager, runner.manager]
+
+    def test_setup_failure_reports_claim_phase(self, home: Path) -> None:
+        runner = WarmRunner(str(home))
+        storage = runner.manager.storage
+        goal = storage.create_task(title="Goal", project="test", type=TaskType.GOAL)
+        storage.save_task(goal)
+        storage.save_task(storage.create_task(title="Work", project="test", parent=goal.id))
+
+        # The project's repo doesn't exist, so worktree setup fails
+        exit_code, phases = runner.run_cycle(run_args("claude", "test", "bot", str(home)))
+
+        assert exit_code == 1
+        assert list(phases) == ["claim"]
+
+
+def test_warm_worker_cycles_use_the_swarm_home(home: Path, monkeypatch) -> None:
+    monkeypatch.setenv("AOPS", str(REPO_ROOT))
+    monkeypatch.setenv("POLECAT_DISABLE_STARTUP_STAGGER", "1")
+    monkeypatch.setattr(metrics, "store", None)
+
+    swarm.worker_loop("claude", None, "test", "bot", False, str(home), warm=True)
+
+    assert metrics.store is not None
+    assert metrics.store.directory == home / "metrics"
+
+
+def test_format_phases() -> None:
+    assert format_phases({"claim": 0.04, "setup": 2.26}) == "claim 0.0s, setup 2.3s"
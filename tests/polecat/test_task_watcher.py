@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the polecat task watcher behind `polecat watch`."""
+
+import queue
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add polecat to path
+TESTS_DIR = Path(__file__).parent.resolve()
+REPO_ROOT = TESTS_DIR.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+import task_watcher  # noqa: E402
+from lib.task_model import TaskStatus, TaskType  # noqa: E402
+from lib.task_storage import TaskStorage  # noqa: E402
+from task_watcher import TaskWatcher  # noqa: E402
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> TaskStorage:
+    return TaskStorage(data_root=tmp_path)
+
+
+def _save(storage: TaskStorage, title: str, project: str = "proj", **kwargs):
+    task = storage.create_task(title=title, project=project, type=TaskType.GOAL, **kwargs)
+    return task, storage.save_task(task)
+
+
+def _set_status(storage: TaskStorage, task_id: str, status: TaskStatus) -> Path:
+    task = storage.get_task(task_id)
+    task.status = status
+    return storage.save_task(task)
+
+
+class TestUpdate:
+    def test_reports_transition(self, storage: TaskStorage) -> None:
+        task, _ = _save(storage, "Work")
+        watcher = TaskWatcher(storage)
+        watcher.load()
+
+        path = _set_status(storage, task.id, TaskStatus.MERGE_READY)
+        change = watcher.update(path)
+        assert change.task_id == task.id
+        assert (change.old_status, change.new_status) == (
+            TaskStatus.ACTIVE,
+            TaskStatus.MERGE_READY,
+        )
+        assert change.is_transition
+        assert watcher.counts()[TaskStatus.MERGE_READY] == 1
+
+    def test_new_and_removed_tasks(self, storage: TaskStorage) -> None:
+        watcher = TaskWatcher(storage)
+        watcher.load()
+
+        task, path = _save(storage, "New")
+        assert watcher.update(path).old_status is None
+
+        storage.delete_task(task.id)
+        change = watcher.update(path)
+        assert (change.old_status, change.new_status) == (TaskStatus.ACTIVE, None)
+        assert watcher.tasks == {}
+
+    def test_ignores_other_projects_and_non_tasks(self, storage: TaskStorage, tmp_path) -> None:
+        watcher = TaskWatcher(storage, project="proj")
+        watcher.load()
+
+        _, other = _save(storage, "Elsewhere", project="other")
+        assert watcher.update(other) is None
+
+        note = tmp_path / "notes" / "note.md"
+        note.parent.mkdir()
+        note.write_text("# Just a note\n")
+        assert watcher.update(note) is None
+
+        archived = tmp_path / "archive" / "old.md"
+        archived.parent.mkdir()
+        archived.write_text(other.read_text())
+        assert watcher.update(archived) is None
+
+    def test_rescan_matches_update(self, storage: TaskStorage) -> None:
+        task, _ = _save(storage, "Work")
+        watcher = TaskWatcher(storage)
+        watcher.load()
+        assert watcher.rescan() == []
+
+        _set_status(storage, task.id, TaskStatus.REVIEW)
+        changes = watcher.rescan()
+        assert [(c.task_id, c.new_status) for c in changes] == [(task.id, TaskStatus.REVIEW)]
+
+
+class TestNotifications:
+    def test_poll_sees_writes(self, storage: TaskStorage) -> None:
+        pytest.importorskip("watchdog")
+        task, _ = _save(storage, "Work")
+        watcher = TaskWatcher(storage)
+        watcher.load()
+        assert watcher.start()
+        try:
+            _set_status(storage, task.id, TaskStatus.MERGE_READY)
+            deadline = time.monotonic() + 10
+            changes = []
+            while time.monotonic() < deadline and not changes:
+                changes = [c for c in watcher.poll(timeout=1.0) if c.is_transition]
+        finally:
+            watcher.stop()
+        assert [(c.task_id, c.new_status) for c in changes] == [(task.id, TaskStatus.MERGE_READY)]
+
+    def test_non_task_paths_are_not_queued(self, storage: TaskStorage) -> None:
+        watcher = TaskWatcher(storage)
+        watcher._notify(storage.data_root / "notes.txt")
+        watcher._notify(storage.data_root / ".git" / "index.md")
+        watcher._notify(storage.data_root / "proj" / "task.md")
+        assert watcher._pending.qsize() == 1
+
+    def test_steady_stream_is_batched_within_the_cap(self, storage: TaskStorage) -> None:
+        class Endless(queue.Queue):
+            def get(self, block=True, timeout=None):
+                time.sleep(0.01)
+                return storage.data_root / "proj" / "missing.md"
+
+        watcher = TaskWatcher(storage)
+        watcher._pending = Endless()
+        start = time.monotonic()
+        watcher.poll(timeout=1.0)
+        assert time.monotonic() - start < task_watcher.MAX_BATCH_SECONDS + 0.5
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Tests for worktree creation in PolecatManager: shared objects, scoped locks, pool.
+
+Worktrees are cloned from a bare mirror of a local bare repo that stands in
+for origin.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).parents[2].resolve()
+sys.path.insert(0, str(REPO_ROOT / "polecat"))
+sys.path.insert(0, str(REPO_ROOT / "aops-core"))
+
+from lib.task_model import Task  # noqa: E402
+from manager import PolecatManager  # noqa: E402
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def _commit(repo: Path, name: str) -> str:
+    (repo / name).write_text(f"{name}\n")
+    _git(["add", "."], cwd=repo)
+    _git(["-c", "user.name=Test", "-c", "user.email=t@example.com", "commit", "-m", name], repo)
+    return _git(["rev-parse", "HEAD"], cwd=repo)
+
+
+@pytest.fixture()
+def origin(tmp_path: Path) -> Path:
+    origin = tmp_path / "origin.git"
+    _git(["init", "--bare", "-b", "main", str(origin)], cwd=tmp_path)
+    seed = tmp_path / "seed"
+    _git(["clone", str(origin), str(seed)], cwd=tmp_path)
+    _git(["checkout", "-b", "main"], cwd=seed)
+    _commit(seed, "README.md")
+    _git(["push", "origin", "main"], cwd=seed)
+    return origin
+
+
+@pytest.fixture()
+def local(tmp_path: Path, origin: Path) -> Path:
+    local = tmp_path / "local"
+    _git(["clone", str(origin), str(local)], cwd=tmp_path)
+    _git(["config", "user.email", "test@test.example"], cwd=local)
+    _git(["config", "user.name", "Test User"], cwd=local)
+    return local
+
+
+@pytest.fixture()
+def manager(tmp_path: Path, local: Path, monkeypatch) -> PolecatManager:
+    data_dir = tmp_path / "aca_data"
+    data_dir.mkdir(exist_ok=True)
+    monkeypatch.setenv("ACA_DATA", str(data_dir))
+    home = tmp_path / "polecat_home"
+    home.mkdir()
+    config = {"projects": {"test": {"path": str(local), "default_branch": "main"}}}
+    (home / "polecat.yaml").write_text(yaml.dump(config))
+    manager = PolecatManager(home_dir=home)
+    manager.ensure_repo_mirror("test")
+    return manager
+
+
+def _task(task_id: str) -> Task:
+    return Task(id=task_id, title=task_id, project="test")
+
+
+class TestSharedObjects:
+    def test_clone_borrows_mirror_objects(self, manager: PolecatManager) -> None:
+        worktree = manager.setup_worktree(_task("test-shared"))
+
+        mirror = manager.repos_dir / "test.git"
+        alternates = (worktree / ".git" / "objects" / "info" / "alternates").read_text()
+        assert alternates.strip() == str(mirror / "objects")
+        assert _git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree) == "polecat/test-shared"
+
+    def test_gc_keeps_objects_live_clones_borrow(self, manager: PolecatManager) -> None:
+        worktree = manager.setup_worktree(_task("test-gc"))
+        mirror = manager.repos_dir / "test.git"
+
+        # The mirror drops all its own refs (fetch --prune) and gc prunes at once
+        for ref in _git(["for-each-ref", "--format=%(refname)"], mirror).split():
+            if not ref.startswith("refs/polecat-clones/"):
+                _git(["update-ref", "-d", ref], cwd=mirror)
+        _git(["gc", "--quiet", "--prune=now"], cwd=mirror)
+
+        assert _git(["cat-file", "-t", "HEAD^{tree}"], cwd=worktree) == "tree"
+
+    def test_refs_of_removed_clones_are_dropped(self, manager: PolecatManager) -> None:
+        mirror = manager.repos_dir / "test.git"
+        kept = manager.setup_worktree(_task("test-kept"))
+        gone = manager.setup_worktree(_task("test-gone"))
+        shutil.rmtree(gone)
+
+        manager._protect_borrowed_objects(mirror)
+
+        refs = _git(["for-each-ref", "--format=%(refname)", "refs/polecat-clones"], mirror)
+        assert f"refs/polecat-clones/tasks/{kept.name}/heads/polecat/test-kept" in refs.split()
+        assert "test-gone" not in refs
+
+    def test_nuke_drops_clone_refs_and_lock(self, manager: PolecatManager) -> None:
+        task = _task("test-nuke")
+        manager.storage.save_task(task)
+        manager.setup_worktree(task)
+        mirror = manager.repos_dir / "test.git"
+        assert (manager.locks_dir / "task-test-nuke.lock").exists()
+
+        manager.nuke_worktree("test-nuke", force=True)
+
+        assert _git(["for-each-ref", "refs/polecat-clones/tasks/test-nuke"], mirror) == ""
+        assert not (manager.locks_dir / "task-test-nuke.lock").exists()
+
+    def test_docker_run_mounts_borrowed_objects(self, manager: PolecatManager) -> None:
+        from cli import _build_docker_cmd
+
+        worktree = manager.setup_worktree(_task("test-docker"))
+        cmd = _build_docker_cmd("claude", worktree, {}, ["claude"], is_interactive=False)
+
+        objects = (manager.repos_dir / "test.git" / "objects").resolve()
+        assert f"{objects}:{objects}:ro" in cmd
+
+    def test_local_repo_source_is_not_shared(self, manager: PolecatManager) -> None:
+        # Without a mirror the worktree comes from the user's own repo
+        shutil.rmtree(manager.repos_dir / "test.git")
+        worktree = manager.setup_worktree(_task("test-local"))
+
+        assert not (worktree / ".git" / "objects" / "info" / "alternates").exists()
+
+
+class TestScopedLocks:
+    def test_other_tasks_are_not_blocked(self, manager: PolecatManager) -> None:
+        with manager._worktree_lock("task-test-busy", "worktree_creation", 1.0, "test"):
+            worktree = manager.setup_worktree(_task("test-free"), lock_timeout=0.5)
+            assert worktree.exists()
+
+            with pytest.raises(TimeoutError):
+                manager.setup_worktree(_task("test-busy"), lock_timeout=0.2)
+
+    def test_held_lock_file_is_not_removed(self, manager: PolecatManager) -> None:
+        lock_path = manager.locks_dir / "task-test-held.lock"
+        with manager._worktree_lock("task-test-held", "worktree_creation", 1.0, "test"):
+            manager._remove_lock_file("task-test-held")
+            assert lock_path.exists()
+        manager._remove_lock_file("task-test-held")
+        assert not lock_path.exists()
+
+        # Recreated on next use
+        with manager._worktree_lock("task-test-held", "worktree_creation", 1.0, "test"):
+            assert lock_path.exists()
+
+    def test_recent_sync_is_not_repeated(self, manager: PolecatManager, monkeypatch) -> None:
+        calls = []
+        monkeypatch.setattr(manager, "safe_sync_mirror", lambda project: calls.append(project))
+
+        manager.setup_worktree(_task("test-first"))
+        assert calls == ["test"]
+
+        # Another polecat starts a sync while this one waits for the mirror lock
+        stamp = manager.locks_dir / "mirror-test.synced"
+        future = time.time() + 60
+        os.utime(stamp, (future, future))
+        manager.setup_worktree(_task("test-second"))
+        assert calls == ["test"]
+
+
+class TestWorktreePool:
+    def test_warm_and_shrink(self, manager: PolecatManager) -> None:
+        assert manager.warm_worktree_pool("test", 2) == 2
+        assert len(manager._pooled_worktrees("test")) == 2
+        assert manager.warm_worktree_pool("test", 0) == 0
+        assert manager._pooled_worktrees("test") == []
+
+    def test_unknown_project(self, manager: PolecatManager) -> None:
+        with pytest.raises(ValueError, match="Unknown project"):
+            manager.warm_worktree_pool("nope", 1)
+
+    def test_setup_takes_pooled_clone_and_refreshes_it(
+        self, manager: PolecatManager, origin: Path, local: Path
+    ) -> None:
+        manager.warm_worktree_pool("test", 1)
+        # The mirror follows the local repo's main, which moves on after pooling
+        head = _commit(local, "later.txt")
+
+        worktree = manager.setup_worktree(_task("test-pooled"))
+
+        assert manager._pooled_worktrees("test") == []
+        assert _git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree) == "polecat/test-pooled"
+        assert _git(["rev-parse", "HEAD"], cwd=worktree) == head
+        assert _git(["remote", "get-url", "origin"], cwd=worktree) == str(origin)
+
+    def test_empty_pool_falls_back_to_clone(self, manager: PolecatManager) -> None:
+        worktree = manager.setup_worktree(_task("test-unpooled"))
+        assert _git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree) == "polecat/test-unpooled"
@@ -1,7 +1,7 @@
 """Tests for task_model.py - Task model with graph relationships."""
 
 import pytest
-from lib.task_model import Task, TaskStatus
+from lib.task_model import Task, TaskHeader, TaskStatus, TaskType, read_frontmatter
 
 
 class TestTaskStatusInbox:
@@ -76,3 +76,91 @@ class TestTaskTypeValidation:
             Task.from_frontmatter(fm)
         assert "missing 'type' field" in str(exc_info.value).lower()
         assert "not a task file" in str(exc_info.value).lower()
+
+
+class TestFrontmatterOnlyReading:
+    """Tests for read_frontmatter, TaskHeader, and streaming Task.from_file."""
+
+    def test_read_frontmatter_stops_at_closing_delimiter(self, tmp_path):
+        """Invalid UTF-8 deep in the body is never decoded."""
+        path = tmp_path / "task.md"
+        body = b"x" * 100_000 + b"\xff\xfe"
+        path.write_bytes(b"---\nid: t-1\ntitle: T\ntype: task\n---\n\n" + body)
+        assert read_frontmatter(path) == {"id": "t-1", "title": "T", "type": "task"}
+
+    def test_read_frontmatter_rejects_plain_notes(self, tmp_path):
+        """Files without a frontmatter block, or with an unclosed one, give None."""
+        plain = tmp_path / "note.md"
+        plain.write_text("# Note\n\n---\nid: not-frontmatter\n---\n")
+        unclosed = tmp_path / "unclosed.md"
+        unclosed.write_text("---\nid: t-1\ntitle: T\n")
+        assert read_frontmatter(plain) is None
+        assert read_frontmatter(unclosed) is None
+
+    def test_header_matches_full_parse(self, tmp_path):
+        """TaskHeader fields are coerced the same way as Task.from_file."""
+        path = tmp_path / "task.md"
+        Task(
+            id="t-2",
+            title="Header",
+            type=TaskType.BUG,
+            status=TaskStatus.BLOCKED,
+            priority=1,
+            parent="goal-1",
+            depends_on=["t-1"],
+            project="proj",
+        ).to_file(path)
+        header = TaskHeader.from_file(path)
+        task = Task.from_file(path)
+        for name in TaskHeader.__slots__:
+            if name != "path":
+                assert getattr(header, name) == getattr(task, name), name
+        assert header.path == path
+
+    def test_header_status_alias(self, tmp_path):
+        """Status aliases resolve as in from_frontmatter."""
+        path = tmp_path / "task.md"
+        path.write_text("---\nid: t-3\ntitle: T\ntype: task\nstatus: completed\n---\n")
+        assert TaskHeader.from_file(path).status == TaskStatus.DONE
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        [
+            "title: Note\ntype: note",
+            "id: n-1\ntitle: Note",
+            "id: n-1\ntype: task",
+            "id: n-1\ntitle: Note\ntype: [a, b]",
+        ],
+    )
+    def test_header_rejects_non_tasks(self, tmp_path, frontmatter):
+        """Unknown or missing type, or a missing title or ID, is not a task."""
+        path = tmp_path / "note.md"
+        path.write_text(f"---\n{frontmatter}\n---\n\nBody\n")
+        assert TaskHeader.from_file(path) is None
+
+    @pytest.mark.parametrize(
+        ("frontmatter", "message"),
+        [
+            (b"id: n-1\ntitle: Note", "Missing 'type' field for item n-1"),
+            (b"id: n-1\ntitle: Note\ntype: note", "Invalid type 'note' for item n-1"),
+            (b"id: n-1\ntitle: Note\ntype: [a, b]", "Invalid type"),
+        ],
+    )
+    def test_from_file_rejects_non_task_before_body(self, tmp_path, frontmatter, message):
+        """A note with frontmatter but no task type fails without reading its body."""
+        path = tmp_path / "note.md"
+        body = b"x" * 100_000 + b"\xff\xfe"
+        path.write_bytes(b"---\n" + frontmatter + b"\n---\n\n" + body)
+        with pytest.raises(ValueError, match=message):
+            Task.from_file(path)
+
+    def test_from_file_matches_from_markdown(self, tmp_path):
+        """Streaming from_file gives the same task as parsing the whole content."""
+        path = tmp_path / "task.md"
+        Task(id="t-4", title="Same", type=TaskType.TASK, body="Body text\n\n---\n\nMore").to_file(
+            path
+        )
+        streamed = Task.from_file(path)
+        parsed = Task.from_markdown(path.read_text())
+        assert streamed.to_frontmatter() == parsed.to_frontmatter()
+        assert streamed.body == parsed.body
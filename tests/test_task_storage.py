@@ -154,3 +154,207 @@ class TestAtomicWriteVerification:
         assert path.exists()
         content = path.read_text()
         assert task.id in content
+
+
+class TestPathIndex:
+    """Test the persistent task ID -> (path, mtime) index behind _find_task_path."""
+
+    def _no_scan(self, monkeypatch) -> None:
+        def fail(self, task_id):
+            raise AssertionError(f"scanned for {task_id}")
+
+        monkeypatch.setattr(TaskStorage, "_scan_for_task_path", fail)
+
+    def _saved_goal(self, tmp_path: Path, title: str = "Indexed Goal"):
+        storage = TaskStorage(data_root=tmp_path)
+        task = storage.create_task(title=title, project="myproject", type=TaskType.GOAL)
+        path = storage.save_task(task)
+        return storage, task, path
+
+    def test_saved_task_is_found_without_scanning(self, tmp_path: Path, monkeypatch) -> None:
+        _, task, path = self._saved_goal(tmp_path)
+        self._no_scan(monkeypatch)
+
+        # A fresh instance, as in another process, reads the persisted index
+        storage = TaskStorage(data_root=tmp_path)
+        assert storage._find_task_path(task.id) == path
+        assert storage.get_task(task.id).title == "Indexed Goal"
+
+    def test_claim_keeps_index_current(self, tmp_path: Path, monkeypatch) -> None:
+        storage, task, path = self._saved_goal(tmp_path)
+        claimed = storage.claim_task(task.id, "polecat")
+        assert claimed is not None
+
+        index = TaskStorage(data_root=tmp_path)._get_path_index()
+        stat = path.stat()
+        assert index[task.id] == (str(path.relative_to(tmp_path)), stat.st_mtime_ns, stat.st_size)
+
+    def test_externally_edited_file_is_reverified(self, tmp_path: Path, monkeypatch) -> None:
+        _, task, path = self._saved_goal(tmp_path)
+        path.write_text(path.read_text() + "\nEdited by hand.\n")
+        self._no_scan(monkeypatch)
+
+        assert TaskStorage(data_root=tmp_path)._find_task_path(task.id) == path
+
+    def test_moved_file_is_found_by_scan_and_repaired(self, tmp_path: Path) -> None:
+        _, task, path = self._saved_goal(tmp_path)
+        moved = tmp_path / "elsewhere" / "renamed-goal.md"
+        moved.parent.mkdir()
+        path.rename(moved)
+
+        storage = TaskStorage(data_root=tmp_path)
+        assert storage._find_task_path(task.id) == moved
+        assert TaskStorage(data_root=tmp_path)._get_path_index()[task.id][0] == str(
+            moved.relative_to(tmp_path)
+        )
+
+    def test_path_reused_by_other_task_is_not_returned(self, tmp_path: Path) -> None:
+        # Outside tasks/ and not named by ID, so only the index or a scan finds it
+        goals = tmp_path / "goals"
+        goals.mkdir()
+        storage = TaskStorage(data_root=tmp_path)
+        first = storage.create_task(title="First Goal", type=TaskType.GOAL)
+        path = goals / "goal.md"
+        path.write_text(first.to_markdown())
+        assert storage._find_task_path(first.id) == path
+
+        second = storage.create_task(title="Second Goal", type=TaskType.GOAL)
+        path.write_text(second.to_markdown())
+
+        storage = TaskStorage(data_root=tmp_path)
+        assert storage.get_task(first.id) is None
+        assert storage.get_task(second.id).title == "Second Goal"
+
+    def test_delete_removes_entry(self, tmp_path: Path) -> None:
+        storage, task, _ = self._saved_goal(tmp_path)
+        assert storage.delete_task(task.id)
+
+        assert task.id not in TaskStorage(data_root=tmp_path)._get_path_index()
+        assert TaskStorage(data_root=tmp_path).get_task(task.id) is None
+
+    def test_corrupt_index_falls_back_to_scan(self, tmp_path: Path) -> None:
+        storage, task, path = self._saved_goal(tmp_path)
+        storage.path_index_file.write_text("{not json")
+
+        assert TaskStorage(data_root=tmp_path)._find_task_path(task.id) == path
+
+    def test_scan_indexes_tasks_it_passes(self, tmp_path: Path, monkeypatch) -> None:
+        # Tasks outside tasks/ directories are only reachable by the slow scan
+        goals = tmp_path / "goals"
+        goals.mkdir()
+        storage = TaskStorage(data_root=tmp_path)
+        ids = []
+        for i in range(3):
+            task = storage.create_task(title=f"Goal {i}", type=TaskType.GOAL)
+            path = goals / f"goal-{i}.md"
+            path.write_text(task.to_markdown())
+            ids.append(task.id)
+        storage.path_index_file.unlink(missing_ok=True)
+
+        assert TaskStorage(data_root=tmp_path).get_task("missing-id") is None
+        self._no_scan(monkeypatch)
+        storage = TaskStorage(data_root=tmp_path)
+        assert [storage.get_task(task_id).title for task_id in ids] == [
+            "Goal 0",
+            "Goal 1",
+            "Goal 2",
+        ]
+
+
+class TestTaskGraphQueries:
+    """Test graph queries served from the in-memory task graph snapshot."""
+
+    def _tree(self, tmp_path: Path):
+        storage = TaskStorage(data_root=tmp_path)
+        goal = storage.create_task(title="Goal", project="proj", type=TaskType.GOAL)
+        storage.save_task(goal)
+        first = storage.create_task(title="First", project="proj", parent=goal.id)
+        storage.save_task(first)
+        second = storage.create_task(
+            title="Second", project="proj", parent=goal.id, depends_on=[first.id]
+        )
+        storage.save_task(second)
+        leaf = storage.create_task(title="Leaf", project="proj", parent=first.id)
+        storage.save_task(leaf)
+        return storage, goal, first, second, leaf
+
+    def test_hierarchy_queries(self, tmp_path: Path) -> None:
+        storage, goal, first, second, leaf = self._tree(tmp_path)
+
+        assert {t.id for t in storage.get_children(goal.id)} == {first.id, second.id}
+        assert {t.id for t in storage.get_descendants(goal.id)} == {first.id, second.id, leaf.id}
+        assert [t.id for t in storage.get_ancestors(leaf.id)] == [first.id, goal.id]
+
+        loaded = storage.get_task(first.id)
+        storage._populate_inverse_relationships(loaded)
+        assert loaded.children == [leaf.id]
+        assert loaded.blocks == [second.id]
+
+    def test_ready_and_blocked(self, tmp_path: Path) -> None:
+        storage, _, first, second, leaf = self._tree(tmp_path)
+
+        assert second.id in {t.id for t in storage.get_blocked_tasks()}
+        assert second.id not in {t.id for t in storage.get_ready_tasks()}
+
+        first = storage.get_task(first.id)
+        first.status = TaskStatus.DONE
+        storage.save_task(first)
+
+        assert second.id not in {t.id for t in storage.get_blocked_tasks()}
+        assert second.id in {t.id for t in storage.get_ready_tasks()}
+
+    def test_repeated_queries_do_not_reparse(self, tmp_path: Path, monkeypatch) -> None:
+        storage, goal, *_ = self._tree(tmp_path)
+        storage.get_ready_tasks()
+
+        from lib.task_model import Task
+
+        def fail(path):
+            raise AssertionError(f"parsed {path}")
+
+        monkeypatch.setattr(Task, "from_file", staticmethod(fail))
+        storage.get_ready_tasks()
+        storage.get_blocked_tasks()
+        storage.get_descendants(goal.id)
+
+    def test_new_file_is_picked_up(self, tmp_path: Path) -> None:
+        storage, goal, *_ = self._tree(tmp_path)
+        assert len(storage.get_children(goal.id)) == 2
+
+        # Written by another process: not through this storage's save_task
+        other = TaskStorage(data_root=tmp_path).create_task(
+            title="Third", project="proj", parent=goal.id
+        )
+        (tmp_path / "proj" / "tasks" / f"{other.id}.md").write_text(other.to_markdown())
+
+        assert other.id in {t.id for t in storage.get_children(goal.id)}
+
+    def test_refresh_picks_up_in_place_edits(self, tmp_path: Path) -> None:
+        storage, _, first, *_ = self._tree(tmp_path)
+        storage.list_tasks()
+
+        path = storage._find_task_path(first.id)
+        path.write_text(path.read_text().replace("title: First", "title: Renamed"))
+        storage.refresh()
+
+        assert {t.title for t in storage.list_tasks()} >= {"Renamed"}
+
+    def test_returned_tasks_are_copies(self, tmp_path: Path) -> None:
+        storage, goal, *_ = self._tree(tmp_path)
+
+        for child in storage.get_children(goal.id):
+            child.title = "Mutated"
+            child.tags.append("mutated")
+
+        assert all(t.title != "Mutated" for t in storage.get_children(goal.id))
+        assert all("mutated" not in t.tags for t in storage.list_tasks())
+
+    def test_notes_with_unhashable_type_are_skipped(self, tmp_path: Path) -> None:
+        storage, *_ = self._tree(tmp_path)
+        (tmp_path / "proj" / "tasks" / "note.md").write_text(
+            "---\nid: note-1\ntitle: Note\ntype: [a, b]\n---\n\nBody\n"
+        )
+        storage.refresh()
+
+        assert "note-1" not in {t.id for t in storage.list_tasks()}
+        assert "note-1" not in {t.id for t in storage.get_ready_tasks()}
@@ -135,3 +135,95 @@ Some conversation...
                 print(f"Failed to extract from {md_file.name}")
 
         assert successful_extractions > 0, "Failed to extract meaningful data from any live log"
+
+
+class TestBatchJobs:
+    """Batch mode (--all) gives the same output serially and on a process pool."""
+
+    @pytest.fixture
+    def transcript_script(self, monkeypatch):
+        # Import by module name so pool workers can unpickle its functions
+        monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / "aops-core" / "scripts"))
+        import transcript
+
+        monkeypatch.setattr(transcript, "_find_dprint", lambda: None)
+        return transcript
+
+    def _write_sessions(self, projects_dir: Path) -> list[Path]:
+        import json
+
+        from scripts.benchmark_transcript import synthetic_session
+
+        paths = []
+        for i, tool_calls in enumerate((3, 5, 8)):
+            path = (
+                projects_dir / f"-home-user-proj{i}" / f"{i:08d}-0000-4000-8000-000000000000.jsonl"
+            )
+            path.parent.mkdir(parents=True)
+            path.write_text("".join(json.dumps(r) + "\n" for r in synthetic_session(tool_calls)))
+            paths.append(path)
+        # Fewer than two meaningful entries: skipped
+        empty = projects_dir / "-home-user-empty" / "ffffffff-0000-4000-8000-000000000000.jsonl"
+        empty.parent.mkdir(parents=True)
+        empty.write_text(json.dumps({"type": "summary", "summary": "nothing"}) + "\n")
+        paths.append(empty)
+        return paths
+
+    def _outputs(self, out_dir: Path) -> dict[str, str]:
+        return {p.name: p.read_text() for p in sorted(out_dir.glob("*.md"))}
+
+    def test_jobs_match_serial_output(self, transcript_script, tmp_path: Path) -> None:
+        sessions = self._write_sessions(tmp_path / "projects")
+        serial_dir = tmp_path / "serial"
+        pooled_dir = tmp_path / "pooled"
+        serial_dir.mkdir()
+        pooled_dir.mkdir()
+
+        serial = transcript_script._run_batch(sessions, serial_dir, jobs=1)
+        pooled = transcript_script._run_batch(sessions, pooled_dir, jobs=2)
+
+        assert serial == pooled == {"processed": 3, "skipped": 1, "error": 0}
+        assert len(self._outputs(serial_dir)) == 6
+        assert self._outputs(pooled_dir) == self._outputs(serial_dir)
+
+        # A second run finds every transcript current
+        again = transcript_script._run_batch(sessions, pooled_dir, jobs=2)
+        assert again == {"processed": 0, "skipped": 4, "error": 0}
+
+    def test_dprint_runs_once_per_batch(
+        self, transcript_script, tmp_path: Path, monkeypatch
+    ) -> None:
+        sessions = self._write_sessions(tmp_path / "projects")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        calls: list[list[Path]] = []
+        monkeypatch.setattr(transcript_script, "format_markdown_files", calls.append)
+
+        transcript_script._run_batch(sessions, out_dir, jobs=2)
+
+        assert len(calls) == 1
+        assert sorted(p.name for p in calls[0]) == sorted(self._outputs(out_dir))
+
+    def test_changed_session_is_regenerated(self, transcript_script, tmp_path: Path) -> None:
+        import json
+        import os
+
+        sessions = self._write_sessions(tmp_path / "projects")
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        transcript_script._run_batch(sessions, out_dir, jobs=1)
+        before = self._outputs(out_dir)
+
+        # Touched only: still current. Appended to: regenerated in place.
+        touched, appended = sessions[0], sessions[1]
+        for path in (touched, appended):
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with appended.open("a") as f:
+            f.write(json.dumps({"type": "user", "message": {"content": "more"}}) + "\n")
+
+        counts = transcript_script._run_batch(sessions, out_dir, jobs=1)
+        assert counts == {"processed": 1, "skipped": 3, "error": 0}
+        after = self._outputs(out_dir)
+        assert after.keys() == before.keys()
+        assert [name for name in after if after[name] != before[name]]